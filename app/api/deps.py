@@ -1,6 +1,6 @@
 import uuid
 import logging
-from typing import AsyncGenerator, Optional
+from typing import AsyncContextManager, AsyncGenerator, Callable, Optional
 from contextlib import asynccontextmanager
 
 from fastapi import Depends, HTTPException, status, Request
@@ -10,7 +10,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud
 from app.core.security import decode_access_token
-from app.db.session import AsyncSessionLocal
+from app.db.routing import prefers_primary, track_writes
+from app.db.session import HAS_READ_REPLICA, AsyncSessionLocal, ReadSessionLocal
 from app.models.enums import StaffRole
 from app.models.staff import Staff
 from app.schemas.token import TokenData
@@ -23,12 +24,25 @@ logger = logging.getLogger(__name__)
 reusable_oauth2 = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token", auto_error=False)
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
     各APIリクエストに対して、独立したDBセッションを提供する依存性注入関数。
     セッションはリクエスト処理の完了後に自動的にクローズされます。
     """
     async with AsyncSessionLocal() as session:
+        if HAS_READ_REPLICA:
+            track_writes(session, request)
+        yield session
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    読み取り専用エンドポイント向けのDBセッション（読み取りレプリカ）。
+    直前に書き込みを行ったクライアントにはプライマリのセッションを返す。
+    このセッションで書き込みを行ってはいけない。
+    """
+    session_factory = AsyncSessionLocal if prefers_primary(request) else ReadSessionLocal
+    async with session_factory() as session:
         yield session
 
 
@@ -192,6 +206,20 @@ async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+def get_session_factory() -> Callable[[], AsyncContextManager[AsyncSession]]:
+    """
+    ストリーミングレスポンスの本文生成中に使うDBセッションのファクトリを提供する。
+    get_db のセッションはレスポンス送信前にクローズされるため、
+    送信中もカーソルを読み続ける処理はこのファクトリで自前のセッションを作る。
+    """
+    return AsyncSessionLocal
+
+
+def get_read_session_factory(request: Request) -> Callable[[], AsyncContextManager[AsyncSession]]:
+    """get_session_factory の読み取りレプリカ版（振り分けは get_read_db と同じ）"""
+    return AsyncSessionLocal if prefers_primary(request) else ReadSessionLocal
+
+
 # --- 権限チェック依存関数 ---
 
 async def require_manager_or_owner(
@@ -323,6 +351,9 @@ async def require_active_billing(
 
     free または active の場合は制限なし。
 
+    ステータスは billing_status_cache に office_id 単位で保持し、
+    課金ステータスを書き換えたトランザクションのCOMMIT後に invalidate される（TTL経過でも再取得）。
+
     使用方法:
     - 書き込み操作（CRUD create/update/delete, PDFアップロード等）のエンドポイントで使用
     - 読み取り専用操作（GET）では使用しない
@@ -339,6 +370,7 @@ async def require_active_billing(
     """
     from app import crud
     from app.models.enums import BillingStatus
+    from app.services.billing.status_cache import billing_status_cache
 
     # app_adminは課金チェックをスキップ
     from app.models.enums import StaffRole
@@ -358,17 +390,23 @@ async def require_active_billing(
     )
     office_id = primary_association.office_id
 
-    # Billing情報を取得
-    billing = await crud.billing.get_by_office_id(db=db, office_id=office_id)
+    # 課金ステータスを取得（キャッシュ優先、ミス時のみDB参照）
+    billing_status = billing_status_cache.get(office_id)
+
+    if billing_status is None:
+        billing = await crud.billing.get_by_office_id(db=db, office_id=office_id)
+
+        if not billing:
+            # Billing情報がない場合は自動作成（マイグレーション後の過渡期対応）
+            logger.warning("Billing not found, creating new billing")
+            billing = await crud.billing.create_for_office(db=db, office_id=office_id)
+            await db.commit()
 
-    if not billing:
-        # Billing情報がない場合は自動作成（マイグレーション後の過渡期対応）
-        logger.warning("Billing not found, creating new billing")
-        billing = await crud.billing.create_for_office(db=db, office_id=office_id)
-        await db.commit()
+        billing_status = billing.billing_status
+        billing_status_cache.set(office_id, billing_status)
 
     # 課金ステータスチェック
-    if billing.billing_status in [
+    if billing_status in [
         BillingStatus.past_due,
         BillingStatus.trial_expired,
         BillingStatus.payment_failed,
@@ -376,7 +414,7 @@ async def require_active_billing(
     ]:
         logger.warning(
             f"Billing restriction: office_id={office_id}, "
-            f"status={billing.billing_status}, staff_id={current_staff.id}"
+            f"status={billing_status}, staff_id={current_staff.id}"
         )
         raise HTTPException(
             status_code=status.HTTP_402_PAYMENT_REQUIRED,
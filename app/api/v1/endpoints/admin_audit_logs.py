@@ -2,14 +2,15 @@
 app_admin用監査ログAPIエンドポイント
 """
 from typing import Optional
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, require_app_admin
+from app.api.deps import get_read_db, require_app_admin
 from app.models.staff import Staff
 from app.models.office import Office
 from app.crud.crud_audit_log import audit_log as crud_audit_log
+from app.crud.pagination import decode_cursor, encode_cursor
 from app.utils.privacy_utils import mask_sensitive_details_for_display
 
 router = APIRouter()
@@ -18,11 +19,13 @@ router = APIRouter()
 @router.get("")
 async def get_audit_logs(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: Staff = Depends(require_app_admin),
     target_type: Optional[str] = Query(None, description="対象リソースタイプでフィルタ（staff, office, withdrawal_request, terms_agreement）"),
     skip: int = Query(0, ge=0, description="スキップ数"),
-    limit: int = Query(50, ge=1, le=50, description="取得数上限（最大50）")
+    limit: int = Query(50, ge=1, le=50, description="取得数上限（最大50）"),
+    cursor: Optional[str] = Query(None, description="次ページのカーソル（前回レスポンスのnext_cursor）"),
+    count: str = Query("auto", description="総件数の取得方法（exact | estimated | auto）")
 ):
     """
     監査ログ一覧を取得（app_admin専用）
@@ -30,14 +33,56 @@ async def get_audit_logs(
     - **target_type**: 対象リソースタイプでフィルタ
     - **skip**: ページネーション用オフセット
     - **limit**: 取得件数（デフォルト50件、最大50件）
+    - **cursor**: 次ページのカーソル（指定時はskipを無視）
+    - **count**: 総件数の取得方法（exact: 正確な件数, estimated: 推定値, auto: 少件数なら正確な件数）
+
+    skipを指定しない場合は (timestamp, id) のキーセットで取得し、
+    続きのページは next_cursor で取得する。
     """
+    if count not in ["exact", "estimated", "auto"]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="件数の取得方法は exact, estimated, auto のいずれかを指定してください"
+        )
+
+    decoded_cursor = None
+    if cursor is not None:
+        try:
+            decoded_cursor = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="カーソルが不正です"
+            )
+
     # 監査ログを取得
-    logs, total = await crud_audit_log.get_logs(
+    next_cursor = None
+    if decoded_cursor is not None or skip == 0:
+        logs, next_key = await crud_audit_log.get_logs_keyset(
+            db=db,
+            target_type=target_type,
+            cursor=decoded_cursor,
+            limit=limit,
+            include_test_data=False
+        )
+        if next_key is not None:
+            next_cursor = encode_cursor(*next_key)
+    else:
+        # 総件数は下で条件ごとのキャッシュ付きで取得するため、ここでは数えない
+        logs, _ = await crud_audit_log.get_logs(
+            db=db,
+            target_type=target_type,
+            skip=skip,
+            limit=limit,
+            include_test_data=False,
+            count_mode=None
+        )
+
+    total, total_is_estimate = await crud_audit_log.count_logs(
         db=db,
         target_type=target_type,
-        skip=skip,
-        limit=limit,
-        include_test_data=False
+        include_test_data=False,
+        count_mode=count
     )
 
     staff_ids = {log.staff_id for log in logs if log.staff_id is not None}
@@ -83,6 +128,8 @@ async def get_audit_logs(
     return {
         "logs": items,  # フロントエンドの期待値に合わせて "logs" を使用
         "total": total,
+        "total_is_estimate": total_is_estimate,
         "skip": skip,
-        "limit": limit
+        "limit": limit,
+        "next_cursor": next_cursor
     }
@@ -6,12 +6,14 @@ InquiryDetailとMessageを使った問い合わせ管理機能
 from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import status as http_status  # クエリパラメータ status と区別するため
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db, require_app_admin
 from app.models.staff import Staff
 from app.models.enums import InquiryStatus, InquiryPriority
 from app.crud.crud_inquiry import crud_inquiry
+from app.crud.pagination import decode_cursor, encode_cursor
 from app.schemas.inquiry import (
     InquiryListResponse,
     InquiryListItem,
@@ -39,9 +41,11 @@ async def get_inquiries(
     priority: Optional[InquiryPriority] = Query(None, description="優先度フィルタ"),
     search: Optional[str] = Query(None, max_length=200, description="キーワード検索（件名・本文）"),
     skip: int = Query(0, ge=0, description="オフセット"),
+    cursor: Optional[str] = Query(None, description="前ページのnext_cursor（指定時はskipを無視）"),
     limit: int = Query(20, ge=1, le=100, description="取得件数"),
     sort: str = Query("created_at", description="ソートキー（created_at | updated_at | priority）"),
     order: str = Query("desc", description="ソート順（asc | desc）"),
+    count: str = Query("exact", description="総件数の取得方法（exact | estimated）"),
     include_test_data: bool = Query(False, description="テストデータを含めるか")
 ) -> InquiryListResponse:
     """
@@ -52,38 +56,82 @@ async def get_inquiries(
     - **priority**: 優先度フィルタ (low, normal, high)
     - **search**: 検索キーワード（件名・本文を対象）
     - **skip**: ページネーション用オフセット
+    - **cursor**: 前ページのレスポンスの next_cursor（sort=created_at のみ）
     - **limit**: 取得件数（デフォルト20件、最大100件）
     - **sort**: ソートキー（created_at, updated_at, priority）
     - **order**: ソート順（asc, desc）
+    - **count**: 総件数の取得方法（exact: 正確な件数, estimated: 実行計画の推定値）
     - **include_test_data**: テストデータを含めるか（デフォルトfalse）
+
+    sort=created_at でskipを指定しない場合は (created_at, id) のキーセットで取得し、
+    next_cursor を返す。2ページ目以降は cursor を指定するとページ位置に関わらず一定のコストで取得できる。
     """
     # バリデーション
     if sort not in ["created_at", "updated_at", "priority"]:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=http_status.HTTP_400_BAD_REQUEST,
             detail="ソートキーは created_at, updated_at, priority のいずれかを指定してください"
         )
 
     if order not in ["asc", "desc"]:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=http_status.HTTP_400_BAD_REQUEST,
             detail="ソート順は asc または desc を指定してください"
         )
 
-    # CRUD層から取得
-    inquiries, total = await crud_inquiry.get_inquiries(
-        db=db,
+    if count not in ["exact", "estimated"]:
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail="件数の取得方法は exact または estimated を指定してください"
+        )
+
+    decoded_cursor = None
+    if cursor is not None:
+        if sort != "created_at":
+            raise HTTPException(
+                status_code=http_status.HTTP_400_BAD_REQUEST,
+                detail="カーソルによるページングはソートキー created_at でのみ利用できます"
+            )
+        try:
+            decoded_cursor = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=http_status.HTTP_400_BAD_REQUEST,
+                detail="カーソルが不正です"
+            )
+
+    filters = dict(
         status=status,
         assigned_staff_id=assigned,
         priority=priority,
         search=search,
-        skip=skip,
-        limit=limit,
-        sort=sort,
-        order=order,
-        include_test_data=include_test_data
+        include_test_data=include_test_data,
     )
 
+    # CRUD層から取得
+    next_cursor = None
+    if sort == "created_at" and (decoded_cursor is not None or skip == 0):
+        inquiries, next_key = await crud_inquiry.get_inquiries_cursor(
+            db=db,
+            cursor=decoded_cursor,
+            limit=limit,
+            order=order,
+            **filters
+        )
+        if next_key is not None:
+            next_cursor = encode_cursor(*next_key)
+        total = await crud_inquiry.count_inquiries(db=db, count_mode=count, **filters)
+    else:
+        inquiries, total = await crud_inquiry.get_inquiries(
+            db=db,
+            skip=skip,
+            limit=limit,
+            sort=sort,
+            order=order,
+            count_mode=count,
+            **filters
+        )
+
     # レスポンス変換
     items = []
     for inquiry in inquiries:
@@ -115,7 +163,9 @@ async def get_inquiries(
 
     return InquiryListResponse(
         inquiries=items,
-        total=total
+        total=total,
+        total_is_estimate=count == "estimated",
+        next_cursor=next_cursor
     )
 
 
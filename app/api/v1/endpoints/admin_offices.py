@@ -4,12 +4,14 @@ app_admin用事務所管理エンドポイント
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
-from app.api.deps import get_db, require_app_admin
+from app.api.deps import get_read_db, require_app_admin
+from app.crud.crud_office import crud_office
+from app.crud.pagination import decode_cursor, encode_cursor
 from app.models.staff import Staff
 from app.models.office import Office, OfficeStaff
 from app.schemas.office import OfficeListItemResponse, OfficeDetailResponse, StaffInOffice
@@ -21,11 +23,13 @@ router = APIRouter()
 @router.get("", response_model=List[OfficeListItemResponse])
 async def get_offices(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: Staff = Depends(require_app_admin),
+    response: Response,
     search: Optional[str] = None,
     skip: int = 0,
-    limit: int = 30
+    limit: int = 30,
+    cursor: Optional[str] = Query(None, description="次ページのカーソル（前回レスポンスのX-Next-Cursorヘッダ）")
 ) -> List[Office]:
     """
     事務所一覧を取得（app_admin専用）
@@ -33,18 +37,30 @@ async def get_offices(
     - **search**: 事務所名で検索（部分一致）
     - **skip**: ページネーション用オフセット
     - **limit**: 取得件数（デフォルト30件）
-    """
-    query = select(Office)
-
-    # 名前検索
-    if search:
-        query = query.where(Office.name.ilike(f"%{search}%"))
+    - **cursor**: 次ページのカーソル（指定時はskipを無視）
 
-    # ページネーション
-    query = query.offset(skip).limit(limit).order_by(Office.created_at.desc())
+    続きのページがある場合は X-Next-Cursor ヘッダにカーソルを返す。
+    """
+    decoded_cursor = None
+    if cursor is not None:
+        try:
+            decoded_cursor = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="カーソルが不正です"
+            )
+
+    offices, next_key = await crud_office.get_admin_list(
+        db,
+        search=search,
+        skip=skip,
+        cursor=decoded_cursor,
+        limit=limit
+    )
 
-    result = await db.execute(query)
-    offices = result.scalars().all()
+    if next_key is not None:
+        response.headers["X-Next-Cursor"] = encode_cursor(*next_key)
 
     return offices
 
@@ -52,7 +68,7 @@ async def get_offices(
 @router.get("/{office_id}", response_model=OfficeDetailResponse)
 async def get_office_detail(
     *,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: Staff = Depends(require_app_admin),
     office_id: UUID
 ) -> dict:
@@ -13,18 +13,16 @@ from typing import Optional
 from app import crud, schemas, models
 from app.api import deps
 from app.api.deps import get_current_user
-from app.core.limiter import limiter
+from app.core.limiter import limiter, get_client_ip
 from app.core.config import settings
-from app.core.security import (
-    verify_password, create_access_token, create_refresh_token, ALGORITHM
-)
 from app.messages import ja
 
 from app.core.security import (
-    verify_password, create_access_token, create_refresh_token, ALGORITHM,
+    create_access_token, create_refresh_token, ALGORITHM,
     create_email_verification_token, verify_email_verification_token,
     create_temporary_token, verify_temporary_token, verify_temporary_token_with_session, verify_totp,
-    generate_totp_uri, get_password_hash, get_jwt_secret
+    generate_totp_uri, get_jwt_secret,
+    get_password_hash_async, verify_password_async, verify_and_update_password,
 )
 from app.core.auth_cookie import (
     build_access_cookie_options,
@@ -34,6 +32,12 @@ from app.core.password_breach_check import check_password_breach
 from app.core.mail import send_verification_email
 from pydantic import BaseModel
 from app.models.office import OfficeStaff
+from app.services.attempt_throttle import (
+    AttemptThrottle,
+    RateLimitExceededError,
+    mfa_verify_throttle,
+    password_reset_verify_throttle,
+)
 
 class MFAVerifyRequest(BaseModel):
     temporary_token: str
@@ -48,6 +52,30 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+async def _save_rehashed_password(db: AsyncSession, user: models.Staff, rehashed_password: str) -> None:
+    """ログイン時の再ハッシュを保存（失敗してもログインは継続する）"""
+    try:
+        user.hashed_password = rehashed_password
+        await db.commit()
+        logger.info("[LOGIN] Password hash upgraded to current work factor")
+    except Exception as e:
+        await db.rollback()
+        await db.refresh(user)
+        logger.warning("[LOGIN] Password rehash failed: %s", type(e).__name__)
+
+
+async def _check_attempts(throttle: AttemptThrottle, db: AsyncSession, subject: str) -> int:
+    """試行回数の上限を確認し、超過していれば429を返す（戻り値は窓内の失敗回数）"""
+    try:
+        return await throttle.check(db, subject)
+    except RateLimitExceededError as e:
+        logger.warning("[ATTEMPT THROTTLE] Attempts exceeded scope=%s", throttle.scope)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+        )
+
+
 @router.post(
     "/register-admin",
     response_model=schemas.staff.Staff,
@@ -189,12 +217,24 @@ async def login_for_access_token(
     from app.models.enums import StaffRole
 
     user = await staff_crud.get_by_email(db, email=username)
-    if not user or not verify_password(password, user.hashed_password):
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=ja.AUTH_INCORRECT_CREDENTIALS,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    is_valid_password, rehashed_password = await verify_and_update_password(
+        password, user.hashed_password
+    )
+    if not is_valid_password:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=ja.AUTH_INCORRECT_CREDENTIALS,
             headers={"WWW-Authenticate": "Bearer"},
         )
+    if rehashed_password:
+        # bcryptのコスト設定が変わっている場合は、平文が手元にあるこの時点で再ハッシュする
+        await _save_rehashed_password(db, user, rehashed_password)
     if not user.is_email_verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -248,7 +288,7 @@ async def login_for_access_token(
                 headers={"WWW-Authenticate": "Bearer"},
             )
         # 合言葉を検証
-        if not verify_password(passphrase, user.hashed_passphrase):
+        if not await verify_password_async(passphrase, user.hashed_passphrase):
             logger.warning("[LOGIN] Invalid passphrase attempt for app_admin")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -431,6 +471,9 @@ async def verify_mfa_for_login(
             status_code=status.HTTP_401_UNAUTHORIZED, detail=ja.AUTH_MFA_NOT_CONFIGURED
         )
 
+    # 総当たり対策: 直近の失敗回数が上限に達していれば検証しない
+    failed_attempts = await _check_attempts(mfa_verify_throttle, db, str(user.id))
+
     # Verify either TOTP code or recovery code
     verification_successful = False
 
@@ -480,11 +523,15 @@ async def verify_mfa_for_login(
 
     if not verification_successful:
         logger.error(f"[MFA VERIFY] Verification failed")
+        await mfa_verify_throttle.record_failure(db, str(user.id))
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=ja.AUTH_INVALID_MFA_CODE
         )
 
+    if failed_attempts:
+        await mfa_verify_throttle.reset(db, str(user.id), auto_commit=True)
+
     access_token = create_access_token(
         subject=str(user.id),
         expires_delta_seconds=session_duration,
@@ -590,6 +637,9 @@ async def verify_mfa_first_time(
             detail="2段階認証の設定にエラーがあります。管理者に連絡してください。",
         )
 
+    # 総当たり対策: 直近の失敗回数が上限に達していれば検証しない
+    await _check_attempts(mfa_verify_throttle, db, str(user.id))
+
     # シークレットを復号化して認証アプリの6桁コードを確認
     try:
         decrypted_secret = user.get_mfa_secret()
@@ -598,6 +648,7 @@ async def verify_mfa_first_time(
 
         if not totp_result:
             logger.error(f"[MFA FIRST TIME VERIFY] Invalid TOTP code")
+            await mfa_verify_throttle.record_failure(db, str(user.id))
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail=ja.AUTH_INVALID_MFA_CODE,
@@ -609,8 +660,9 @@ async def verify_mfa_first_time(
             detail="2段階認証の設定にエラーがあります。管理者に連絡してください。",
         )
 
-    # 検証成功: is_mfa_verified_by_user フラグを True に設定
+    # 検証成功: is_mfa_verified_by_user フラグを True に設定（失敗回数のクリアと同じCOMMITで確定）
     user.is_mfa_verified_by_user = True
+    await mfa_verify_throttle.reset(db, str(user.id))
     await db.commit()
     await db.refresh(user)
     logger.info(f"[MFA FIRST TIME VERIFY] User verification flag set to True")
@@ -768,6 +820,10 @@ async def verify_reset_token(
     """
     from app.crud import password_reset as crud_password_reset
 
+    # 総当たり対策: クライアントIPごとの失敗回数を確認
+    client_ip = get_client_ip(request)
+    await _check_attempts(password_reset_verify_throttle, db, client_ip)
+
     # トークンの有効性を確認
     db_token = await crud_password_reset.get_valid_token(db, token=token)
 
@@ -777,6 +833,7 @@ async def verify_reset_token(
             message=ja.AUTH_RESET_TOKEN_VALID
         )
     else:
+        await password_reset_verify_throttle.record_failure(db, client_ip)
         return schemas.token.TokenValidityResponse(
             valid=False,
             message=ja.AUTH_RESET_TOKEN_INVALID_OR_EXPIRED
@@ -801,6 +858,9 @@ async def verify_reset_token_post(
     """
     from app.crud import password_reset as crud_password_reset
 
+    client_ip = get_client_ip(request)
+    await _check_attempts(password_reset_verify_throttle, db, client_ip)
+
     db_token = await crud_password_reset.get_valid_token(db, token=data.token)
 
     if db_token:
@@ -809,6 +869,7 @@ async def verify_reset_token_post(
             message=ja.AUTH_RESET_TOKEN_VALID
         )
 
+    await password_reset_verify_throttle.record_failure(db, client_ip)
     return schemas.token.TokenValidityResponse(
         valid=False,
         message=ja.AUTH_RESET_TOKEN_INVALID_OR_EXPIRED
@@ -835,10 +896,15 @@ async def reset_password(
     from app.crud import password_reset as crud_password_reset
     from datetime import datetime, timezone
 
+    # 総当たり対策: クライアントIPごとの失敗回数を確認
+    client_ip = get_client_ip(request)
+    await _check_attempts(password_reset_verify_throttle, db, client_ip)
+
     # トークンの有効性を確認
     db_token = await crud_password_reset.get_valid_token(db, token=data.token)
 
     if not db_token:
+        await password_reset_verify_throttle.record_failure(db, client_ip)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=ja.AUTH_RESET_TOKEN_INVALID_OR_EXPIRED,
@@ -879,7 +945,7 @@ async def reset_password(
             )
 
         # パスワードを更新
-        staff.hashed_password = get_password_hash(data.new_password)
+        staff.hashed_password = await get_password_hash_async(data.new_password)
         staff.password_changed_at = datetime.now(timezone.utc)
 
         # 監査ログを記録（同一トランザクション内）
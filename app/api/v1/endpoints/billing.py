@@ -243,7 +243,7 @@ async def create_portal_session(
 
     # Customer Portal Sessionを作成
     try:
-        portal_session = stripe.billing_portal.Session.create(
+        portal_session = await billing_service.stripe_gateway.create_billing_portal_session(
             customer=billing.stripe_customer_id,
             return_url=f"{settings.FRONTEND_URL}/admin/plan",
         )
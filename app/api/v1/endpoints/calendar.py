@@ -3,11 +3,11 @@ from datetime import date, timedelta
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import JSONResponse, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app import models
+from app import crud, models
 from app.api import deps
 from app.services.calendar_service import calendar_service
 from app.services.ics_export_service import ics_export_service
@@ -16,11 +16,14 @@ from app.schemas.calendar_account import (
     CalendarSetupResponse,
     OfficeCalendarAccountResponse
 )
-from app.schemas.calendar_event import CalendarEventResponse
+from app.schemas.calendar_event import CalendarEventResponse, CalendarFeedTokenResponse
 from app.messages import ja
 
 router = APIRouter()
 
+# 購読フィードの出力期間（過去30日〜1年後）
+ICS_FEED_PAST_DAYS = 30
+
 
 def _get_primary_office_id(current_user: models.Staff) -> UUID:
     office_associations = getattr(current_user, "office_associations", None)
@@ -57,6 +60,47 @@ def _resolve_export_range(from_date: date | None, to_date: date | None) -> tuple
     return resolved_from, resolved_to
 
 
+async def _ics_response(
+    *,
+    request: Request,
+    db: AsyncSession,
+    session_factory,
+    office_id: UUID,
+    from_date: date,
+    to_date: date,
+    event_type: models.CalendarEventType | None = None,
+    recipient_id: UUID | None = None,
+    filename: str | None = None,
+) -> Response:
+    """ETagが一致すれば304、そうでなければ .ics 本文をストリーミングで返す。"""
+    etag = await ics_export_service.build_etag(
+        db,
+        office_id=office_id,
+        from_date=from_date,
+        to_date=to_date,
+        event_type=event_type,
+        recipient_id=recipient_id,
+    )
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if ics_export_service.etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if filename:
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return StreamingResponse(
+        ics_export_service.stream_calendar(
+            session_factory=session_factory,
+            office_id=office_id,
+            from_date=from_date,
+            to_date=to_date,
+            event_type=event_type,
+            recipient_id=recipient_id,
+        ),
+        media_type="text/calendar; charset=utf-8",
+        headers=headers,
+    )
+
+
 @router.post("/setup", response_model=CalendarSetupResponse, status_code=status.HTTP_201_CREATED)
 async def setup_calendar(
     *,
@@ -188,7 +232,7 @@ async def get_calendar_by_office(
 @router.get("/events", response_model=list[CalendarEventResponse])
 async def get_calendar_events(
     *,
-    db: AsyncSession = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_read_db),
     current_user: models.Staff = Depends(deps.get_current_user),
     from_date: date | None = Query(default=None),
     to_date: date | None = Query(default=None),
@@ -211,7 +255,9 @@ async def get_calendar_events(
 @router.get("/export.ics", response_class=Response)
 async def export_calendar_ics(
     *,
-    db: AsyncSession = Depends(deps.get_db),
+    request: Request,
+    db: AsyncSession = Depends(deps.get_read_db),
+    session_factory=Depends(deps.get_read_session_factory),
     current_user: models.Staff = Depends(deps.get_current_user),
     from_date: date | None = Query(default=None),
     to_date: date | None = Query(default=None),
@@ -222,22 +268,102 @@ async def export_calendar_ics(
     office_id = _get_primary_office_id(current_user)
     resolved_from, resolved_to = _resolve_export_range(from_date, to_date)
 
-    events = await calendar_service.get_deadline_events(
+    return await _ics_response(
+        request=request,
         db=db,
+        session_factory=session_factory,
         office_id=office_id,
         from_date=resolved_from,
         to_date=resolved_to,
         event_type=event_type,
         recipient_id=recipient_id,
+        filename=ics_export_service.build_filename(today=date.today()),
     )
-    ics_body = ics_export_service.build_calendar(events=events)
-    filename = ics_export_service.build_filename(today=date.today())
-    return Response(
-        content=ics_body,
-        media_type="text/calendar; charset=utf-8",
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-        },
+
+
+@router.post("/feed-token", response_model=CalendarFeedTokenResponse, status_code=status.HTTP_201_CREATED)
+async def issue_calendar_feed_token(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: models.Staff = Depends(deps.get_current_user),
+) -> Any:
+    """
+    期限カレンダーの購読URLを発行する（既存のURLは無効になる）
+
+    カレンダーアプリは認証ヘッダーを送れないため、URLに推測できないトークンを含める。
+    トークンはこのレスポンスでのみ返す。
+    """
+    if current_user.role not in [models.StaffRole.manager, models.StaffRole.owner]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=ja.PERM_MANAGER_OR_OWNER_REQUIRED,
+        )
+
+    token = await crud.calendar_feed_token.issue(
+        db,
+        office_id=_get_primary_office_id(current_user),
+        created_by=current_user.id,
+    )
+    feed_url = str(request.url_for("get_calendar_feed", token=token))
+    return CalendarFeedTokenResponse(
+        feed_url=feed_url,
+        webcal_url="webcal://" + feed_url.split("://", 1)[1],
+    )
+
+
+@router.delete("/feed-token", status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_calendar_feed_token(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    current_user: models.Staff = Depends(deps.get_current_user),
+) -> Response:
+    """期限カレンダーの購読URLを無効化する"""
+    if current_user.role not in [models.StaffRole.manager, models.StaffRole.owner]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=ja.PERM_MANAGER_OR_OWNER_REQUIRED,
+        )
+
+    revoked = await crud.calendar_feed_token.revoke(
+        db, office_id=_get_primary_office_id(current_user)
+    )
+    if not revoked:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=ja.CALENDAR_FEED_TOKEN_NOT_FOUND,
+        )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/feed/{token}.ics", response_class=Response, name="get_calendar_feed")
+async def get_calendar_feed(
+    *,
+    request: Request,
+    token: str,
+    db: AsyncSession = Depends(deps.get_read_db),
+    session_factory=Depends(deps.get_read_session_factory),
+) -> Response:
+    """
+    購読URL: カレンダーアプリから定期的に取得される期限カレンダー
+
+    変更がなければ件数と最終更新日時の集計1クエリだけで304を返す。
+    """
+    office_id = await crud.calendar_feed_token.get_office_id(db, token=token)
+    if office_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=ja.CALENDAR_FEED_NOT_FOUND,
+        )
+
+    from_date = date.today() - timedelta(days=ICS_FEED_PAST_DAYS)
+    return await _ics_response(
+        request=request,
+        db=db,
+        session_factory=session_factory,
+        office_id=office_id,
+        from_date=from_date,
+        to_date=from_date + timedelta(days=365),
     )
 
 
@@ -7,7 +7,7 @@ from app import schemas, crud, models
 from app.api import deps
 from app.services.dashboard_service import DashboardService
 from app.messages import ja
-from app.core.limiter import limiter
+from app.core.limiter import limiter, get_staff_or_ip_key
 from app.core.config import settings
 
 router = APIRouter()
@@ -20,10 +20,11 @@ MIN_LIMIT = 1
 
 
 @router.get("/", response_model=schemas.dashboard.DashboardData)
-@limiter.limit(settings.RATE_LIMIT_DASHBOARD)  # レート制限: 設定ファイルから読み込み（DoS対策）
+@limiter.limit(settings.RATE_LIMIT_DASHBOARD, key_func=get_staff_or_ip_key)  # レート制限: 設定ファイルから読み込み（DoS対策）
 async def get_dashboard(
     request: Request,
-    db: AsyncSession = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_read_db),
+    primary_db: AsyncSession = Depends(deps.get_db),
     current_user: models.Staff = Depends(deps.get_current_user),
     search_term: Annotated[
         Optional[str],
@@ -126,8 +127,9 @@ async def get_dashboard(
     # Billing情報が存在しない場合、自動的に作成（既存Officeの救済措置）
     if not billing:
         logger.warning(f"Billing not found for office {office.id}, auto-creating with 180-day trial")
+        # 書き込みは読み取り専用セッションではなくプライマリで行う
         billing = await crud.billing.create_for_office(
-            db=db,
+            db=primary_db,
             office_id=office.id,
             trial_days=180
         )
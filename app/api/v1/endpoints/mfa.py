@@ -13,6 +13,7 @@ from app.core.security import (
     generate_recovery_codes,
 )
 from app.services.mfa import MfaService
+from app.services.attempt_throttle import RateLimitExceededError, mfa_verify_throttle
 from app.messages import ja
 
 
@@ -98,6 +99,14 @@ async def verify_mfa(
             detail=ja.MFA_ALREADY_ENABLED,
         )
 
+    # 総当たり対策: 直近の失敗回数が上限に達していれば検証しない
+    try:
+        await mfa_verify_throttle.check(db, str(current_user.id))
+    except RateLimitExceededError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(e)
+        )
+
     mfa_service = MfaService(db)
 
     # オプション2: トランザクション境界をエンドポイント層で管理
@@ -107,13 +116,15 @@ async def verify_mfa(
     )
 
     if not is_valid:
+        await mfa_verify_throttle.record_failure(db, str(current_user.id))
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=ja.MFA_INVALID_CODE
         )
 
-    # 検証成功後、エンドポイント層で2段階認証を有効化してコミット
+    # 検証成功後、エンドポイント層で2段階認証を有効化してコミット（失敗回数のクリアも同じCOMMITで確定）
     current_user.is_mfa_enabled = True
     current_user.is_mfa_verified_by_user = True  # ← 追加: ユーザー自身が検証完了
+    await mfa_verify_throttle.reset(db, str(current_user.id))
     await db.commit()
 
     return {"message": ja.MFA_VERIFICATION_SUCCESS}
@@ -20,7 +20,8 @@ from app.schemas.staff_profile import (
     EmailChangeConfirm,
     EmailChangeConfirmResponse
 )
-from app.services.staff_profile_service import staff_profile_service, RateLimitExceededError
+from app.services.staff_profile_service import staff_profile_service
+from app.services.attempt_throttle import RateLimitExceededError
 from app.messages import ja
 
 router = APIRouter()
@@ -2,25 +2,28 @@ from typing import Any, List
 from uuid import UUID
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile
 from fastapi.responses import JSONResponse
 from psycopg import errors as psycopg_errors
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app import crud
 from app.crud.crud_welfare_recipient import crud_welfare_recipient
 from app.models.staff import Staff
-from app.models.enums import ResourceType, ActionType
+from app.models.enums import ResourceType, ActionType, StaffRole
 from app.schemas.welfare_recipient import (
     WelfareRecipientResponse,
     WelfareRecipientCreate,
     WelfareRecipientUpdate,
     WelfareRecipientListResponse,
     UserRegistrationRequest,
-    UserRegistrationResponse
+    UserRegistrationResponse,
+    RecipientImportJobResponse
 )
 from app.schemas.deadline_alert import DeadlineAlertResponse
 from app.services.welfare_recipient_service import WelfareRecipientService
+from app.services.recipient_import_service import open_import_rows, recipient_import_service
 from app.core.exceptions import (
     NotFoundException,
     ForbiddenException,
@@ -131,6 +134,67 @@ async def create_welfare_recipient(
             detail=ja.RECIPIENT_CREATE_FAILED.format(error=type(e).__name__)
         )
 
+@router.post("/import", response_model=RecipientImportJobResponse, status_code=status.HTTP_201_CREATED)
+async def import_welfare_recipients(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    file: UploadFile = File(...),
+    current_staff: Staff = Depends(deps.require_active_billing)
+) -> Any:
+    """
+    CSV/Excelファイルから利用者を一括登録する。
+    管理者および所有者のみ実行できます（Employeeの承認フローは対象外）。
+
+    ファイルは1行ずつ読み込み、チャンク単位で検証・登録・COMMITします。
+    検証エラーや登録エラーの行はスキップされ、ジョブの errors に行番号付きで記録されます。
+    処理中の進捗は GET /import-jobs/{job_id} で確認できます。
+    """
+    if current_staff.role not in (StaffRole.owner, StaffRole.manager):
+        raise ForbiddenException(ja.RECIPIENT_IMPORT_PERMISSION_DENIED)
+
+    office_associations = getattr(current_staff, 'office_associations', None)
+    if not office_associations:
+        raise ForbiddenException(ja.RECIPIENT_MUST_HAVE_OFFICE)
+
+    office_id = office_associations[0].office_id
+    staff_id = current_staff.id
+
+    # ヘッダー検証までをジョブ作成前に行い、ファイル自体の不備は400で返す
+    rows = open_import_rows(file.file, file.filename)
+    job_id = await recipient_import_service.import_recipients(
+        db,
+        rows=rows,
+        office_id=office_id,
+        staff_id=staff_id,
+        file_name=file.filename
+    )
+
+    job = await crud.recipient_import_job.get_by_office(db, job_id=job_id, office_id=office_id)
+    return job
+
+
+@router.get("/import-jobs/{job_id}", response_model=RecipientImportJobResponse)
+async def get_welfare_recipient_import_job(
+    *,
+    db: AsyncSession = Depends(deps.get_db),
+    job_id: UUID,
+    current_staff: Staff = Depends(deps.get_current_user)
+) -> Any:
+    """
+    利用者一括インポートジョブの進捗と行単位のエラーを取得する。
+    """
+    office_associations = getattr(current_staff, 'office_associations', None)
+    if not office_associations:
+        raise ForbiddenException(ja.RECIPIENT_MUST_HAVE_OFFICE)
+
+    office_id = office_associations[0].office_id
+    job = await crud.recipient_import_job.get_by_office(db, job_id=job_id, office_id=office_id)
+    if not job:
+        raise NotFoundException(ja.RECIPIENT_IMPORT_JOB_NOT_FOUND)
+
+    return job
+
+
 @router.get("/", response_model=WelfareRecipientListResponse)
 async def list_welfare_recipients(
     db: AsyncSession = Depends(deps.get_db),
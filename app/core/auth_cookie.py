@@ -3,6 +3,8 @@ from typing import Any
 
 
 ACCESS_COOKIE_KEY = "access_token"
+# 書き込み直後の読み取りをプライマリに向ける期限（UNIX時刻）
+PRIMARY_STICKY_COOKIE_KEY = "db_primary_until"
 VALID_SAMESITE_VALUES = {"none", "lax", "strict"}
 
 
@@ -73,3 +75,16 @@ def build_delete_access_cookie_options() -> dict[str, Any]:
     }
     options.update(_cookie_domain_option())
     return options
+
+
+def build_primary_sticky_cookie_options(value: str, max_age: int) -> dict[str, Any]:
+    options: dict[str, Any] = {
+        "key": PRIMARY_STICKY_COOKIE_KEY,
+        "value": value,
+        "httponly": True,
+        "secure": _is_production(),
+        "max_age": max_age,
+        "samesite": _resolve_samesite(),
+    }
+    options.update(_cookie_domain_option())
+    return options
@@ -27,6 +27,10 @@ class Settings(BaseSettings):
     # --- データベースURL ---
     # Alembicやアプリケーション本体が使用する本番/開発用DBのURL
     DATABASE_URL: str
+    # 読み取りレプリカのURL（任意、app/db/session.py が環境変数から読む）
+    DATABASE_REPLICA_URL: Optional[str] = None
+    # 書き込み後、この秒数は同じクライアントの読み取りもプライマリで行う（レプリカ遅延への対策）
+    DB_PRIMARY_STICKY_SECONDS: int = 5
 
     # --- メール設定 ---
     MAIL_USERNAME: Optional[str] = None
@@ -61,6 +65,12 @@ class Settings(BaseSettings):
     S3_BUCKET_NAME: Optional[str] = None
     S3_REGION: Optional[str] = None
 
+    # --- パスワードハッシュ設定 ---
+    # bcryptのコスト（2^rounds回の反復）。変更すると既存ハッシュは次回ログイン時に再ハッシュされる
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    # bcrypt計算専用のスレッド数（イベントループとDB用スレッドプールを塞がない）
+    PASSWORD_HASH_WORKERS: int = 4
+
     # --- パスワードリセット設定 ---
     # トークン有効期限（分単位） - Phase 1セキュリティレビューで30分推奨
     PASSWORD_RESET_TOKEN_EXPIRE_MINUTES: int = 30
@@ -68,12 +78,85 @@ class Settings(BaseSettings):
     RATE_LIMIT_FORGOT_PASSWORD: str = "5/10minute"
     RATE_LIMIT_RESEND_EMAIL: str = "3/10minute"
     RATE_LIMIT_DASHBOARD: str = "60/minute"  # ダッシュボードAPI: 1分間に60リクエスト
+    # レート制限カウンタの共有ストレージ（"memory://" でプロセス内メモリ）
+    RATE_LIMIT_STORAGE_URI: str = "postgresql+ratelimit://"
+    # X-Forwarded-For を付与する信頼済みプロキシの段数（Cloud Runは1、0で接続元IPのみ使用）
+    RATE_LIMIT_TRUSTED_PROXY_HOPS: int = 1
 
     # --- Stripe決済設定 ---
     STRIPE_SECRET_KEY: Optional[SecretStr] = None
     STRIPE_PUBLISHABLE_KEY: Optional[str] = None
     STRIPE_WEBHOOK_SECRET: Optional[SecretStr] = None
     STRIPE_PRICE_ID: Optional[str] = None  # 月額6,000円プランのPrice ID
+    # Stripe API呼び出し（専用スレッドプールで実行）
+    STRIPE_API_TIMEOUT_SECONDS: float = 20.0
+    STRIPE_API_MAX_NETWORK_RETRIES: int = 2
+    STRIPE_API_MAX_WORKERS: int = 8
+
+    # --- 課金ステータスキャッシュ設定 ---
+    # require_active_billing 用。他プロセスでの遷移はTTL経過後に反映される（0で無効化）
+    BILLING_STATUS_CACHE_TTL_SECONDS: int = 60
+    BILLING_STATUS_CACHE_MAX_ENTRIES: int = 10000
+
+    # --- 管理画面一覧の件数設定 ---
+    # 正確な件数（COUNT(*)）をプロセス内に保持する秒数（0で無効化）
+    ADMIN_LIST_COUNT_CACHE_TTL_SECONDS: int = 30
+    # count=auto で推定件数がこの値未満なら正確な件数を数える
+    ADMIN_LIST_EXACT_COUNT_THRESHOLD: int = 10000
+
+    # --- SQL計測設定 ---
+    # この時間（ミリ秒）以上かかったSQLを正規化して警告ログに出す
+    DB_SLOW_QUERY_MS: int = 500
+    # 1リクエストで同じ形のSQLがこの回数以上実行されたらN+1の疑いとして警告する（0で無効）
+    DB_N_PLUS_ONE_THRESHOLD: int = 10
+    # レスポンスに Server-Timing ヘッダー（SQL件数・DB時間）を付ける
+    SERVER_TIMING_ENABLED: bool = True
+
+    # --- メトリクス設定 ---
+    # /metrics（Prometheusテキスト形式）を公開する
+    METRICS_ENABLED: bool = True
+    # 設定時は Authorization: Bearer <token> を要求する（本番で未設定の場合は /metrics を返さない）
+    METRICS_TOKEN: Optional[SecretStr] = None
+
+    # --- トレース設定 ---
+    # スパンを記録・出力する（app/core/tracing.py）
+    TRACING_ENABLED: bool = False
+    TRACING_SERVICE_NAME: str = "keikakun-api"
+    # 出力先: file（OTLP/JSONを1行ずつ追記）/ otlp（OTLP/HTTPでCollectorに送信）
+    TRACING_EXPORTER: str = "file"
+    TRACING_FILE_PATH: str = "traces.jsonl"
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    # 新しく始めるトレースのうち記録する割合（0.0〜1.0）
+    TRACING_SAMPLE_RATIO: float = 1.0
+    # 全トレースを記録し、エラーを含むか TRACING_TAIL_LATENCY_MS 以上かかったものだけ出力する
+    TRACING_TAIL_SAMPLING: bool = False
+    TRACING_TAIL_LATENCY_MS: int = 1000
+
+    # --- カレンダー同期キュー設定 ---
+    # 1回のクレームで確保する同期待ちイベント数
+    CALENDAR_SYNC_BATCH_SIZE: int = 100
+    # クレームの有効期間（秒）。ワーカーが異常終了した場合、経過後に他のワーカーが再取得する
+    CALENDAR_SYNC_LEASE_SECONDS: int = 300
+    # 同期失敗時の再試行間隔（秒）。失敗するたびに2倍にし、上限で打ち止め
+    CALENDAR_SYNC_RETRY_BASE_SECONDS: int = 60
+    CALENDAR_SYNC_RETRY_MAX_SECONDS: int = 6 * 60 * 60
+    # この回数失敗したイベントは自動再試行しない
+    CALENDAR_SYNC_MAX_ATTEMPTS: int = 8
+    # 通知パターンのシリーズ・インスタンスを定期ジョブで展開・同期するか。
+    # ledger（CalendarEvent）側も同じ期限を同期しているため、重複登録を避けて既定は無効
+    CALENDAR_SERIES_SYNC_ENABLED: bool = False
+
+    # --- 物理削除クリーンアップ設定 ---
+    # 1バッチで削除する親レコード数（バッチごとにCOMMIT）
+    CLEANUP_BATCH_SIZE: int = 200
+    # 1回の実行で使う時間予算（秒）。超過した場合はチェックポイントから次回再開する
+    CLEANUP_TIME_BUDGET_SECONDS: float = 600.0
+
+    # --- 利用者一括インポート設定 ---
+    # 1チャンクで検証・登録する行数（チャンクごとにCOMMIT）
+    RECIPIENT_IMPORT_CHUNK_SIZE: int = 100
+    # 1ファイルで受け付ける最大行数（ヘッダー行を除く）
+    RECIPIENT_IMPORT_MAX_ROWS: int = 1000
 
     # --- Web Push通知設定 (VAPID) ---
     VAPID_PRIVATE_KEY_DER: Optional[str] = None  # VAPID秘密鍵（Base64エンコード済みDER形式）
@@ -1,5 +1,85 @@
+import os
+from typing import Optional
+
 from slowapi import Limiter
-from slowapi.util import get_remote_address
+from starlette.requests import Request
+
+from app.core.config import settings
+from app.core.rate_limit_storage import LocalPrecheckFixedWindowRateLimiter
+
+
+def get_client_ip(request: Request) -> str:
+    """
+    プロキシを考慮したクライアントIPを返す
+
+    X-Forwarded-For は各プロキシが右端に追記するため、信頼するプロキシ段数
+    （RATE_LIMIT_TRUSTED_PROXY_HOPS）分だけ右から数えた要素を採用する。
+    クライアントが付与した偽の値は左側に残るため採用されない。
+    """
+    hops = settings.RATE_LIMIT_TRUSTED_PROXY_HOPS
+    if hops > 0:
+        forwarded_for = request.headers.get("x-forwarded-for")
+        if forwarded_for:
+            addresses = [address.strip() for address in forwarded_for.split(",") if address.strip()]
+            if addresses:
+                return addresses[-min(hops, len(addresses))]
+
+    if not request.client or not request.client.host:
+        return "127.0.0.1"
+    return request.client.host
+
+
+def _get_staff_id(request: Request) -> Optional[str]:
+    from app.core.security import decode_access_token
+
+    token = request.cookies.get("access_token")
+    if not token:
+        authorization = request.headers.get("authorization", "")
+        scheme, _, credentials = authorization.partition(" ")
+        if scheme.lower() == "bearer":
+            token = credentials
+    if not token:
+        return None
+
+    payload = decode_access_token(token)
+    return payload.get("sub") if payload else None
+
+
+def get_staff_or_ip_key(request: Request) -> str:
+    """
+    認証済みならスタッフID、未認証ならクライアントIPをキーにする
+
+    同一NAT配下の複数スタッフが互いの上限を消費しないよう、
+    ログイン後のエンドポイントで使用する。
+    """
+    staff_id = _get_staff_id(request)
+    if staff_id:
+        return f"staff:{staff_id}"
+    return f"ip:{get_client_ip(request)}"
+
+
+def _storage_uri() -> str:
+    # テストはプロセス内メモリで代替する（DBを必要としない）
+    if os.getenv("TESTING") == "1":
+        return "memory://"
+    return settings.RATE_LIMIT_STORAGE_URI
+
+
+class SharedLimiter(Limiter):
+    """reset() でストラテジーのプロセス内状態も合わせてクリアするLimiter"""
+
+    def reset(self) -> None:
+        super().reset()
+        for strategy in (self._limiter, self._fallback_limiter):
+            if isinstance(strategy, LocalPrecheckFixedWindowRateLimiter):
+                strategy.local.clear()
+
 
 # アプリケーション全体で共有するLimiterインスタンス
-limiter = Limiter(key_func=get_remote_address)
+# 共有ストレージが使えない場合はプロセス内メモリにフォールバックする
+limiter = SharedLimiter(
+    key_func=get_client_ip,
+    storage_uri=_storage_uri(),
+    strategy="local-precheck-fixed-window",
+    in_memory_fallback_enabled=True,
+)
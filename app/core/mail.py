@@ -3,6 +3,7 @@ from typing import Dict, Any, List
 
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
 from app.core.config import settings
+from app.core.metrics import track_external_call
 
 # --- ConnectionConfigの生成 ---
 # .envファイルから読み込んだ設定を基に、メールサーバーへの接続設定を作成します。
@@ -45,7 +46,8 @@ async def send_email(
     )
 
     fm = FastMail(conf)
-    await fm.send_message(message, template_name=template_name)
+    with track_external_call("smtp", "send_message"):
+        await fm.send_message(message, template_name=template_name)
 
 
 # --- 具体的なメール送信処理 ---
@@ -0,0 +1,341 @@
+"""
+プロセス内メトリクス
+
+外部ライブラリを使わずに、Prometheusと同じ形（カウンター・ゲージ・累積バケットのヒストグラム）で
+値を集計し、/metrics でテキスト形式（text/plain; version=0.0.4）として返す。
+各ワーカープロセスが自分の値を保持する（WEB_CONCURRENCY > 1 の場合はワーカーごとの値になる）。
+
+- カーディナリティ: ラベルの組み合わせは max_series 件までに制限し、超えた分は
+  全ラベルを OVERFLOW_LABEL にまとめる。HTTPのラベルにはURLではなくルートのテンプレートを使う
+- track_job: スケジューラーのジョブの所要時間と結果（success / failure）
+- track_external_call: SMTP・Web Push・Google Calendar・Stripe・S3 の呼び出し時間とエラー件数
+  （どちらもトレースのスパンを兼ねる。app/core/tracing.py）
+"""
+import logging
+import math
+import time
+from contextlib import contextmanager
+from threading import Lock
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from app.core.tracing import SpanKind, start_span
+
+logger = logging.getLogger(__name__)
+
+LabelValues = Tuple[str, ...]
+
+# 上限を超えたラベルの組み合わせをまとめる値
+OVERFLOW_LABEL = "__overflow__"
+DEFAULT_MAX_SERIES = 200
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+# 外部サービス・ジョブの所要時間（秒）のバケット
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class _Metric:
+    """ラベルの検証とシリーズ数の上限を持つメトリクスの共通部分"""
+
+    type_name = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        *,
+        label_names: Iterable[str] = (),
+        max_series: int = DEFAULT_MAX_SERIES,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.max_series = max_series
+        self._series: Dict[LabelValues, object] = {}
+        self._lock = Lock()
+        self._overflow_logged = False
+
+    def _series_key(self, label_values: LabelValues) -> LabelValues:
+        """ラベル数を検証し、上限を超える新しい組み合わせはオーバーフロー用のキーにまとめる（ロック内で呼ぶ）"""
+        if len(label_values) != len(self.label_names):
+            raise ValueError(f"{self.name}: expected labels {self.label_names}")
+        if label_values in self._series or len(self._series) < self.max_series:
+            return label_values
+        if not self._overflow_logged:
+            self._overflow_logged = True
+            logger.warning("metric %s exceeded %d label sets", self.name, self.max_series)
+        return (OVERFLOW_LABEL,) * len(self.label_names)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+            self._overflow_logged = False
+
+    def samples(self) -> List[Tuple[str, LabelValues, Tuple[Tuple[str, str], ...], float]]:
+        """(サフィックス, ラベル値, 追加ラベル, 値) の一覧"""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """ラベル付きカウンター（単調増加）"""
+
+    type_name = "counter"
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError(f"{self.name}: counters can only increase")
+        with self._lock:
+            key = self._series_key(label_values)
+            self._series[key] = self._series.get(key, 0.0) + amount
+
+    def collect(self) -> Dict[LabelValues, float]:
+        with self._lock:
+            return dict(self._series)
+
+    def samples(self):
+        return [("", labels, (), value) for labels, value in self.collect().items()]
+
+
+class Gauge(_Metric):
+    """
+    ラベル付きゲージ
+
+    callback を渡した場合は、収集のたびに callback() が返す {ラベル値: 値} を使う
+    （プールの使用中接続数など、その時点の状態を読むもの）。
+    """
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        *,
+        label_names: Iterable[str] = (),
+        max_series: int = DEFAULT_MAX_SERIES,
+        callback: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ):
+        super().__init__(name, documentation, label_names=label_names, max_series=max_series)
+        self.callback = callback
+
+    def set(self, value: float, *label_values: str) -> None:
+        with self._lock:
+            self._series[self._series_key(label_values)] = value
+
+    def collect(self) -> Dict[LabelValues, float]:
+        if self.callback is not None:
+            return dict(self.callback())
+        with self._lock:
+            return dict(self._series)
+
+    def samples(self):
+        return [("", labels, (), value) for labels, value in self.collect().items()]
+
+
+class Histogram(_Metric):
+    """ラベル付きヒストグラム（observe はスレッドセーフ）"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        *,
+        buckets: Sequence[float],
+        label_names: Iterable[str] = (),
+        max_series: int = DEFAULT_MAX_SERIES,
+    ):
+        super().__init__(name, documentation, label_names=label_names, max_series=max_series)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, *label_values: str) -> None:
+        with self._lock:
+            key = self._series_key(label_values)
+            series = self._series.get(key)
+            if series is None:
+                # [バケットごとの件数..., 合計, 件数]
+                series = self._series[key] = [0] * len(self.buckets) + [0.0, 0]
+            for index, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    series[index] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    def collect(self) -> Dict[LabelValues, Tuple[Tuple[int, ...], float, int]]:
+        """ラベルごとの (累積バケット件数, 合計, 件数)"""
+        with self._lock:
+            snapshot = {labels: list(series) for labels, series in self._series.items()}
+
+        result = {}
+        for labels, series in snapshot.items():
+            cumulative = []
+            running = 0
+            for count in series[:len(self.buckets)]:
+                running += count
+                cumulative.append(running)
+            result[labels] = (tuple(cumulative), series[-2], series[-1])
+        return result
+
+    def samples(self):
+        result = []
+        for labels, (cumulative, total, count) in self.collect().items():
+            for upper_bound, bucket_count in zip(self.buckets, cumulative):
+                result.append(("_bucket", labels, (("le", _format_value(upper_bound)),), bucket_count))
+            result.append(("_sum", labels, (), total))
+            result.append(("_count", labels, (), count))
+        return result
+
+
+class MetricsRegistry:
+    """/metrics で出力するメトリクスの一覧"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Prometheusのテキスト形式で全メトリクスを出力する"""
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            for suffix, label_values, extra_labels, value in metric.samples():
+                pairs = list(zip(metric.label_names, label_values)) + list(extra_labels)
+                label_text = ",".join(f'{key}="{_escape_label(val)}"' for key, val in pairs)
+                label_part = f"{{{label_text}}}" if label_text else ""
+                lines.append(f"{metric.name}{suffix}{label_part} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value)) if abs(value) < 1e15 else repr(value)
+    return repr(value)
+
+
+REGISTRY = MetricsRegistry()
+
+# DBコネクションプールからの取得待ち時間（秒）
+DB_POOL_CHECKOUT_WAIT_SECONDS = REGISTRY.register(Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the SQLAlchemy pool",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+    label_names=("engine",),
+))
+
+# HTTPリクエストの処理時間（秒）。route はテンプレート（/api/v1/recipients/{recipient_id}）
+HTTP_REQUEST_DURATION_SECONDS = REGISTRY.register(Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method, route template and status class",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    label_names=("method", "route", "status"),
+    max_series=1000,
+))
+
+SCHEDULER_JOB_DURATION_SECONDS = REGISTRY.register(Histogram(
+    "scheduler_job_duration_seconds",
+    "Duration of scheduled background jobs",
+    buckets=DURATION_BUCKETS + (120.0, 300.0, 600.0, 1800.0),
+    label_names=("job",),
+))
+
+SCHEDULER_JOB_RUNS_TOTAL = REGISTRY.register(Counter(
+    "scheduler_job_runs_total",
+    "Scheduled background job runs by outcome",
+    label_names=("job", "outcome"),
+))
+
+SCHEDULER_JOB_LAST_SUCCESS_TIMESTAMP = REGISTRY.register(Gauge(
+    "scheduler_job_last_success_timestamp_seconds",
+    "Unix time of the last successful run of each scheduled job",
+    label_names=("job",),
+))
+
+EXTERNAL_CALL_DURATION_SECONDS = REGISTRY.register(Histogram(
+    "external_call_duration_seconds",
+    "Latency of calls to external services (SMTP, Web Push, Google Calendar, Stripe, S3)",
+    buckets=DURATION_BUCKETS,
+    label_names=("service", "operation"),
+))
+
+EXTERNAL_CALL_ERRORS_TOTAL = REGISTRY.register(Counter(
+    "external_call_errors_total",
+    "Failed calls to external services by exception type",
+    label_names=("service", "operation", "error"),
+))
+
+_HTTP_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+
+
+def observe_http_request(method: str, route: Optional[str], status_code: int, duration: float) -> None:
+    """
+    HTTPリクエストの処理時間を記録する
+
+    ルートに一致しなかったリクエスト（スキャナーの404など）は route="unmatched" にまとめ、
+    ステータスは 2xx / 4xx のようにクラス単位で記録する。
+    """
+    HTTP_REQUEST_DURATION_SECONDS.observe(
+        duration,
+        method if method in _HTTP_METHODS else "OTHER",
+        route or "unmatched",
+        f"{status_code // 100}xx",
+    )
+
+
+@contextmanager
+def track_job(job: str) -> Iterator[None]:
+    """スケジューラーのジョブの所要時間と結果を記録する（例外はそのまま送出する）"""
+    started_at = time.perf_counter()
+    try:
+        with start_span(f"job {job}", attributes={"job.name": job}, new_trace=True):
+            yield
+    except BaseException:
+        SCHEDULER_JOB_RUNS_TOTAL.inc(job, "failure")
+        raise
+    else:
+        SCHEDULER_JOB_RUNS_TOTAL.inc(job, "success")
+        SCHEDULER_JOB_LAST_SUCCESS_TIMESTAMP.set(time.time(), job)
+    finally:
+        SCHEDULER_JOB_DURATION_SECONDS.observe(time.perf_counter() - started_at, job)
+
+
+@contextmanager
+def track_external_call(service: str, operation: str) -> Iterator[None]:
+    """外部サービス呼び出しの所要時間と、失敗時は例外の型ごとのエラー件数を記録する"""
+    started_at = time.perf_counter()
+    try:
+        with start_span(
+            f"{service} {operation}",
+            kind=SpanKind.CLIENT,
+            attributes={"peer.service": service, "operation": operation},
+        ):
+            yield
+    except Exception as e:
+        EXTERNAL_CALL_ERRORS_TOTAL.inc(service, operation, type(e).__name__)
+        raise
+    finally:
+        EXTERNAL_CALL_DURATION_SECONDS.observe(time.perf_counter() - started_at, service, operation)
@@ -9,6 +9,7 @@ from typing import Optional, Dict, Any
 from pywebpush import webpush, WebPushException
 
 from app.core.config import settings
+from app.core.metrics import track_external_call
 
 logger = logging.getLogger(__name__)
 
@@ -72,12 +73,13 @@ async def send_push_notification(
         if actions:
             payload["actions"] = actions
 
-        webpush(
-            subscription_info=subscription_info,
-            data=json.dumps(payload),
-            vapid_private_key=settings.VAPID_PRIVATE_KEY,
-            vapid_claims={"sub": settings.VAPID_SUBJECT}
-        )
+        with track_external_call("web_push", "send"):
+            webpush(
+                subscription_info=subscription_info,
+                data=json.dumps(payload),
+                vapid_private_key=settings.VAPID_PRIVATE_KEY,
+                vapid_claims={"sub": settings.VAPID_SUBJECT}
+            )
 
         logger.info("[PUSH] Notification sent successfully")
         return (True, False)
@@ -0,0 +1,309 @@
+"""
+レート制限のストレージとストラテジー
+
+slowapi（limits）のデフォルトはプロセス内メモリのため、gunicornワーカーや
+Cloud Runインスタンスが増えるほど制限が緩くなり、デプロイのたびにリセットされる。
+ここでは次の2つを提供する:
+
+- PostgresRateLimitStorage: UNLOGGEDテーブル rate_limit_counters で固定窓カウンタを共有する
+  （INCRはUPSERT 1文 = 1往復）。DB障害時はサーキットブレーカーで即座に失敗し、
+  slowapiのプロセス内メモリへのフォールバックに切り替えさせる
+- LocalPrecheckFixedWindowRateLimiter: 共有ストレージに問い合わせる前に
+  プロセス内のスライディングウィンドウで判定し、明らかに超過している呼び出しや
+  共有カウンタで超過済みのキーは往復なしで拒否する
+"""
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from limits import RateLimitItem
+from limits.storage import Storage
+from limits.strategies import STRATEGIES, FixedWindowRateLimiter
+
+# 共有ストレージのURIスキーム（ホスト省略時は DATABASE_URL に接続する）
+POSTGRES_RATE_LIMIT_SCHEME = "postgresql+ratelimit"
+
+# プロセス内で保持するキー数の上限（超過分は古いものから破棄）
+LOCAL_MAX_KEYS = 10000
+
+# 期限切れカウンタを掃除する間隔（秒）。掃除はINCRと同じ文に相乗りさせる
+PURGE_INTERVAL_SECONDS = 300
+
+# 接続の取得を待つ上限（秒）。イベントループ上で同期的に待つため1秒未満に抑える
+DEFAULT_TIMEOUT_SECONDS = 0.5
+
+# 失敗後に共有ストレージへの問い合わせを止める期間（秒）
+DEFAULT_CIRCUIT_OPEN_SECONDS = 30
+
+INCR_SQL = """
+WITH purge AS (
+    DELETE FROM rate_limit_counters
+    WHERE %(purge)s AND expires_at < now() AND key <> %(key)s
+)
+INSERT INTO rate_limit_counters AS c (key, count, expires_at)
+VALUES (%(key)s, %(amount)s, now() + make_interval(secs => %(expiry)s::double precision))
+ON CONFLICT (key) DO UPDATE SET
+    count = CASE WHEN c.expires_at <= now() THEN EXCLUDED.count ELSE c.count + EXCLUDED.count END,
+    expires_at = CASE WHEN c.expires_at <= now() THEN EXCLUDED.expires_at ELSE c.expires_at END
+RETURNING count, extract(epoch FROM expires_at)
+"""
+
+
+class RateLimitStorageUnavailable(Exception):
+    """サーキットブレーカーが開いている間、共有ストレージに問い合わせずに送出する例外"""
+
+
+def _to_libpq_dsn(database_url: str) -> str:
+    """SQLAlchemy形式のURL（postgresql+psycopg:// 等）をlibpqが解釈できる形式にする"""
+    parts = urlsplit(database_url)
+    return urlunsplit(("postgresql",) + tuple(parts[1:]))
+
+
+class PostgresRateLimitStorage(Storage):
+    """
+    Postgres共有の固定窓カウンタストレージ
+
+    URI:
+        postgresql+ratelimit://                 DATABASE_URL に接続
+        postgresql+ratelimit://user:pw@host/db  指定先に接続
+
+    Options:
+        pool_size: 接続プールの最大接続数（デフォルト4）
+        timeout: 接続の取得を待つ上限秒数（デフォルト0.5）
+        circuit_open_seconds: 失敗後に問い合わせを止める秒数（デフォルト30）
+
+    Note:
+        slowapiはレート制限を同期的に評価するため、ここでのDB呼び出しは同期I/Oになる。
+        autocommitの1文のみで往復は1回、プールのチェックアウト時の疎通確認も行わない。
+        待ち時間は timeout で打ち切り、失敗した後は circuit_open_seconds の間
+        DBに触れずに RateLimitStorageUnavailable を送出する（slowapiがメモリに切り替える）。
+        その後の check() が成功すると共有ストレージに戻る。
+    """
+
+    STORAGE_SCHEME = [POSTGRES_RATE_LIMIT_SCHEME]
+    DEPENDENCIES = ["psycopg", "psycopg_pool"]
+
+    def __init__(self, uri: Optional[str] = None, wrap_exceptions: bool = False, **options):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        parts = urlsplit(uri or "")
+        if parts.netloc:
+            self._dsn = _to_libpq_dsn(uri)
+        else:
+            from app.core.config import settings
+            self._dsn = _to_libpq_dsn(settings.DATABASE_URL)
+        self._pool_size = int(options.get("pool_size", 4))
+        self._timeout = float(options.get("timeout", DEFAULT_TIMEOUT_SECONDS))
+        self._circuit_open_seconds = float(options.get("circuit_open_seconds", DEFAULT_CIRCUIT_OPEN_SECONDS))
+        self._circuit_open_until = 0.0
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._expiries: "OrderedDict[str, float]" = OrderedDict()
+        self._last_purge = time.monotonic()
+
+    @property
+    def base_exceptions(self):
+        return (self.dependencies["psycopg"].module.Error, RateLimitStorageUnavailable)
+
+    def _get_pool(self):
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    pool_module = self.dependencies["psycopg_pool"].module
+                    self._pool = pool_module.ConnectionPool(
+                        self._dsn,
+                        min_size=1,
+                        max_size=self._pool_size,
+                        timeout=self._timeout,
+                        kwargs={
+                            "autocommit": True,
+                            # libpqの connect_timeout は整数秒（2秒未満は2秒として扱われる）
+                            "connect_timeout": max(2, math.ceil(self._timeout)),
+                        },
+                        open=True,
+                    )
+        return self._pool
+
+    @property
+    def circuit_open(self) -> bool:
+        return time.monotonic() < self._circuit_open_until
+
+    @contextmanager
+    def _connection(self):
+        """サーキットブレーカー付きで接続を借りる（失敗したら一定期間問い合わせを止める）"""
+        if self.circuit_open:
+            raise RateLimitStorageUnavailable("rate limit storage circuit is open")
+        try:
+            with self._get_pool().connection() as conn:
+                yield conn
+        except Exception:
+            self._circuit_open_until = time.monotonic() + self._circuit_open_seconds
+            raise
+
+    def _remember_expiry(self, key: str, expires_at: float) -> None:
+        self._expiries[key] = expires_at
+        self._expiries.move_to_end(key)
+        while len(self._expiries) > LOCAL_MAX_KEYS:
+            self._expiries.popitem(last=False)
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        now = time.monotonic()
+        purge = now - self._last_purge >= PURGE_INTERVAL_SECONDS
+        if purge:
+            self._last_purge = now
+
+        with self._connection() as conn:
+            count, expires_at = conn.execute(
+                INCR_SQL,
+                {"key": key, "amount": amount, "expiry": expiry, "purge": purge},
+            ).fetchone()
+        self._remember_expiry(key, float(expires_at))
+        return int(count)
+
+    def get(self, key: str) -> int:
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT count FROM rate_limit_counters WHERE key = %s AND expires_at > now()",
+                (key,),
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def get_expiry(self, key: str) -> float:
+        # 直近のINCRで受け取った期限が有効なら往復しない
+        cached = self._expiries.get(key)
+        if cached is not None and cached > time.time():
+            return cached
+
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT extract(epoch FROM expires_at) FROM rate_limit_counters WHERE key = %s",
+                (key,),
+            ).fetchone()
+        return float(row[0]) if row else time.time()
+
+    def check(self) -> bool:
+        # 開いている間は問い合わせない（slowapiはメモリのまま）
+        if self.circuit_open:
+            return False
+        try:
+            with self._connection() as conn:
+                conn.execute("SELECT 1")
+            return True
+        except Exception:
+            return False
+
+    def reset(self) -> Optional[int]:
+        self._expiries.clear()
+        with self._connection() as conn:
+            return conn.execute("DELETE FROM rate_limit_counters").rowcount
+
+    def clear(self, key: str) -> None:
+        self._expiries.pop(key, None)
+        with self._connection() as conn:
+            conn.execute("DELETE FROM rate_limit_counters WHERE key = %s", (key,))
+
+
+class LocalRateLimitWindow:
+    """
+    プロセス内のスライディングウィンドウと共有カウンタ超過キーの記録
+
+    - hits: キーごとの直近の許可時刻（単調時計）
+    - blocked_until: 共有カウンタで超過したキーの窓の終了時刻（UNIX時刻）
+    """
+
+    def __init__(self, max_keys: int = LOCAL_MAX_KEYS):
+        self.max_keys = max_keys
+        self._hits: "OrderedDict[str, Deque[float]]" = OrderedDict()
+        self._blocked_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def precheck(self, key: str, amount: int, expiry: int, cost: int) -> bool:
+        """共有ストレージに問い合わせずに拒否できる場合はFalse"""
+        with self._lock:
+            blocked_until = self._blocked_until.get(key)
+            if blocked_until is not None:
+                if blocked_until > time.time():
+                    return False
+                del self._blocked_until[key]
+
+            hits = self._hits.get(key)
+            if hits is None:
+                return True
+            window_start = time.monotonic() - expiry
+            while hits and hits[0] <= window_start:
+                hits.popleft()
+            return len(hits) + cost <= amount
+
+    def record_hit(self, key: str, cost: int) -> None:
+        with self._lock:
+            hits = self._hits.get(key)
+            if hits is None:
+                hits = self._hits[key] = deque()
+            else:
+                self._hits.move_to_end(key)
+            now = time.monotonic()
+            hits.extend([now] * cost)
+            while len(self._hits) > self.max_keys:
+                evicted, _ = self._hits.popitem(last=False)
+                self._blocked_until.pop(evicted, None)
+
+    def block(self, key: str, until: float) -> None:
+        with self._lock:
+            self._blocked_until[key] = until
+            if len(self._blocked_until) > self.max_keys:
+                now = time.time()
+                for blocked_key in [k for k, v in self._blocked_until.items() if v <= now]:
+                    del self._blocked_until[blocked_key]
+                while len(self._blocked_until) > self.max_keys:
+                    del self._blocked_until[next(iter(self._blocked_until))]
+
+    def clear(self, key: Optional[str] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._hits.clear()
+                self._blocked_until.clear()
+            else:
+                self._hits.pop(key, None)
+                self._blocked_until.pop(key, None)
+
+
+class LocalPrecheckFixedWindowRateLimiter(FixedWindowRateLimiter):
+    """
+    プロセス内スライディングウィンドウで事前判定する固定窓ストラテジー
+
+    1. 共有カウンタで超過済み（窓の終了前）のキー → 往復なしで拒否
+    2. このプロセスだけで直近 expiry 秒に上限まで許可済み → 往復なしで拒否
+    3. それ以外は共有ストレージでINCR（1往復）し、超過した場合は窓の終了まで
+       ローカルで拒否するよう記録する
+
+    プロセス内の判定は共有カウンタより厳しくなることはあっても緩くなることはないため、
+    制限はインスタンス数に依らず全体で保たれる。
+    """
+
+    def __init__(self, storage):
+        super().__init__(storage)
+        self.local = LocalRateLimitWindow()
+
+    def hit(self, item: RateLimitItem, *identifiers: str, cost: int = 1) -> bool:
+        key = item.key_for(*identifiers)
+        expiry = item.get_expiry()
+        if not self.local.precheck(key, item.amount, expiry, cost):
+            return False
+
+        count = self.storage.incr(key, expiry, amount=cost)
+        if count > item.amount:
+            self.local.block(key, self.storage.get_expiry(key))
+            return False
+
+        self.local.record_hit(key, cost)
+        return True
+
+    def clear(self, item: RateLimitItem, *identifiers: str) -> None:
+        self.local.clear(item.key_for(*identifiers))
+        super().clear(item, *identifiers)
+
+
+STRATEGIES["local-precheck-fixed-window"] = LocalPrecheckFixedWindowRateLimiter
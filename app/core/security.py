@@ -1,10 +1,12 @@
 import os
+import asyncio
 import secrets
 import string
 import base64
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Union, Optional, List
+from typing import Any, Union, Optional, List, Iterable, Tuple
 from io import BytesIO
 
 from jose import jwt
@@ -15,7 +17,19 @@ from cryptography.fernet import Fernet
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcryptのコストは設定値で管理する。設定と異なるコストのハッシュは needs_update() が
+# Trueを返すため、ログイン時に verify_and_update_password() で再ハッシュされる
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+)
+
+# bcrypt計算専用のスレッドプール（bcryptはGILを解放するため複数の検証が並列に進む）
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
 
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
@@ -76,6 +90,55 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
+
+async def _run_password_task(func, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, func, *args)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password をイベントループ外で実行する"""
+    return await _run_password_task(pwd_context.verify, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash をイベントループ外で実行する"""
+    return await _run_password_task(pwd_context.hash, password)
+
+
+async def verify_and_update_password(
+    plain_password: str,
+    hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    パスワードを検証し、ハッシュのコストが現在の設定と異なれば新しいハッシュも返す
+
+    Returns:
+        (検証結果, 再ハッシュ後の値。再ハッシュ不要または検証失敗時はNone)
+    """
+    return await _run_password_task(pwd_context.verify_and_update, plain_password, hashed_password)
+
+
+async def verify_password_any(plain_password: str, hashed_passwords: Iterable[str]) -> bool:
+    """
+    複数のハッシュのいずれかに一致するかを並列に検証する
+
+    全ハッシュの検証を同時に投入し、最初に一致した時点で残りを取り消して返す。
+    （実行中のbcrypt計算は止まらないが、結果は待たない）
+    """
+    futures = [
+        asyncio.ensure_future(verify_password_async(plain_password, hashed_password))
+        for hashed_password in hashed_passwords
+    ]
+    try:
+        for future in asyncio.as_completed(futures):
+            if await future:
+                return True
+        return False
+    finally:
+        for future in futures:
+            future.cancel()
+
 def hash_reset_token(token: str) -> str:
     """
     パスワードリセットトークンをSHA-256でハッシュ化
@@ -4,6 +4,7 @@ import logging
 from typing import BinaryIO
 
 from app.core.config import settings
+from app.core.metrics import track_external_call
 
 logger = logging.getLogger(__name__)
 
@@ -29,15 +30,16 @@ async def upload_file(file: BinaryIO, object_name: str) -> str | None:
     )
     try:
         # PDFファイルとして正しく認識されるよう、Content-Typeを明示的に設定
-        s3_client.upload_fileobj(
-            file,
-            settings.S3_BUCKET_NAME,
-            object_name,
-            ExtraArgs={
-                'ContentType': 'application/pdf',
-                'ContentDisposition': 'inline'
-            }
-        )
+        with track_external_call("s3", "upload_fileobj"):
+            s3_client.upload_fileobj(
+                file,
+                settings.S3_BUCKET_NAME,
+                object_name,
+                ExtraArgs={
+                    'ContentType': 'application/pdf',
+                    'ContentDisposition': 'inline'
+                }
+            )
         s3_url = f"s3://{settings.S3_BUCKET_NAME}/{object_name}"
         logger.info("File uploaded to S3 object_name_present=%s", bool(object_name))
         return s3_url
@@ -0,0 +1,449 @@
+"""
+リクエスト・バックグラウンドジョブのトレース
+
+OpenTelemetry と互換の形（W3C traceparent、OTLP/JSON）でスパンを記録する軽量な実装。
+SDKに依存せず、出力先はファイル（1行1バッチのOTLP/JSON。Collector の otlpjsonfile で読める）か
+OTLP/HTTP のエンドポイントを選ぶ。
+
+- スパン: HTTPリクエスト（main.py）、SQL（app/db/instrumentation.py）、外部呼び出し・スケジューラーの
+  ジョブ（app.core.metrics の track_external_call / track_job）
+- 伝播: 現在のスパンは contextvar で受け渡すため、asyncio.gather のタスクにも引き継がれる。
+  リクエストで作った同期待ちのカレンダーイベントには traceparent を保存し、同期ジョブのスパンから
+  リンクする（アップロード → ステータス更新 → イベント作成 → 同期 を辿れる）
+- サンプリング: TRACING_SAMPLE_RATIO の割合で trace_id から決める（親がある場合は親の判定に従う）。
+  TRACING_TAIL_SAMPLING=True では全トレースを記録し、ローカルのルートスパン終了時に
+  エラーを含むか TRACING_TAIL_LATENCY_MS 以上かかったトレースだけを出力する
+
+無効時（TRACING_ENABLED=False）の start_span は何も記録しないスパンを返すだけ。
+"""
+import json
+import logging
+import queue
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_TRACEPARENT = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+# テール・サンプリングで1トレースあたり保持するスパン数の上限
+MAX_SPANS_PER_TRACE = 512
+# ルート終了後に届いたスパンに判定を適用するため、判定済みのトレースを覚えておく件数
+DECIDED_TRACES_CACHE_SIZE = 4096
+
+
+class SpanKind:
+    """OTLPの span kind"""
+
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    trace_id: int
+    span_id: int
+    sampled: bool
+    is_remote: bool = False
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id:032x}-{self.span_id:016x}-{'01' if self.sampled else '00'}"
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[SpanContext]:
+    """W3C traceparent ヘッダーを読む（不正な値は None）"""
+    if not value:
+        return None
+    match = _TRACEPARENT.match(value.strip().lower())
+    if match is None or match.group(1) == "ff":
+        return None
+    trace_id = int(match.group(2), 16)
+    span_id = int(match.group(3), 16)
+    if trace_id == 0 or span_id == 0:
+        return None
+    return SpanContext(trace_id, span_id, sampled=bool(int(match.group(4), 16) & 1), is_remote=True)
+
+
+@dataclass
+class Span:
+    name: str
+    context: SpanContext
+    parent: Optional[SpanContext] = None
+    kind: int = SpanKind.INTERNAL
+    recording: bool = True
+    start_time_ns: int = 0
+    end_time_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    links: Sequence[SpanContext] = ()
+    error: Optional[str] = None
+
+    @property
+    def is_local_root(self) -> bool:
+        return self.parent is None or self.parent.is_remote
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_time_ns - self.start_time_ns) / 1_000_000
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self.recording and value is not None:
+            self.attributes[key] = value
+
+    def set_error(self, description: str) -> None:
+        if self.recording:
+            self.error = description
+
+    def record_exception(self, exc: BaseException) -> None:
+        # 例外メッセージには個人情報が含まれうるため型名だけを残す
+        self.set_attribute("exception.type", type(exc).__name__)
+        self.set_error(type(exc).__name__)
+
+
+# 無効時・親のない子スパン用（何も記録しない）
+_NON_RECORDING_SPAN = Span(name="", context=SpanContext(0, 0, sampled=False), recording=False)
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def current_traceparent() -> Optional[str]:
+    """記録中のスパンがあればその traceparent（保存してジョブ側からリンクする用）"""
+    span = _current_span.get()
+    if span is None or not span.recording:
+        return None
+    return span.context.traceparent
+
+
+def _random_id(bits: int) -> int:
+    value = 0
+    while value == 0:
+        value = random.getrandbits(bits)
+    return value
+
+
+def encode_otlp_json(spans: Sequence[Span], *, service_name: str) -> Dict[str, Any]:
+    """スパンを OTLP/JSON（ExportTraceServiceRequest）にする"""
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [_otlp_attribute("service.name", service_name)]},
+            "scopeSpans": [{
+                "scope": {"name": __name__},
+                "spans": [_otlp_span(span) for span in spans],
+            }],
+        }],
+    }
+
+
+def _otlp_span(span: Span) -> Dict[str, Any]:
+    encoded = {
+        "traceId": f"{span.context.trace_id:032x}",
+        "spanId": f"{span.context.span_id:016x}",
+        "name": span.name,
+        "kind": span.kind,
+        "startTimeUnixNano": str(span.start_time_ns),
+        "endTimeUnixNano": str(span.end_time_ns),
+        "attributes": [_otlp_attribute(key, value) for key, value in span.attributes.items()],
+        "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+    }
+    if span.parent is not None:
+        encoded["parentSpanId"] = f"{span.parent.span_id:016x}"
+    if span.links:
+        encoded["links"] = [
+            {"traceId": f"{link.trace_id:032x}", "spanId": f"{link.span_id:016x}"}
+            for link in span.links
+        ]
+    return encoded
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        encoded = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    else:
+        encoded = {"stringValue": str(value)}
+    return {"key": key, "value": encoded}
+
+
+class FileSpanExporter:
+    """1バッチを1行のOTLP/JSONとしてファイルに追記する"""
+
+    def __init__(self, path: str, *, service_name: str):
+        self.path = path
+        self.service_name = service_name
+
+    def export(self, spans: Sequence[Span]) -> None:
+        line = json.dumps(encode_otlp_json(spans, service_name=self.service_name), ensure_ascii=False)
+        # 複数ワーカーが同じファイルに書いても行が混ざらないよう、1回の write で追記する
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+    def shutdown(self) -> None:
+        pass
+
+
+class OTLPHttpSpanExporter:
+    """OTLP/HTTP（JSON）でCollectorに送る"""
+
+    def __init__(self, endpoint: str, *, service_name: str, timeout_seconds: float = 5.0):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self._client = httpx.Client(timeout=timeout_seconds)
+
+    def export(self, spans: Sequence[Span]) -> None:
+        response = self._client.post(
+            self.endpoint,
+            json=encode_otlp_json(spans, service_name=self.service_name),
+        )
+        response.raise_for_status()
+
+    def shutdown(self) -> None:
+        self._client.close()
+
+
+class BatchSpanProcessor:
+    """
+    終了したスパンをキューに溜め、バックグラウンドのスレッドでまとめて出力する
+
+    キューが一杯のときはスパンを捨てる（リクエスト処理を出力で待たせない）。
+    """
+
+    def __init__(
+        self,
+        exporter,
+        *,
+        max_queue_size: int = 2048,
+        max_batch_size: int = 256,
+        schedule_delay_seconds: float = 2.0,
+    ):
+        self.exporter = exporter
+        self.max_batch_size = max_batch_size
+        self.schedule_delay_seconds = schedule_delay_seconds
+        self.dropped_spans = 0
+        self._queue: "queue.Queue[Optional[Span]]" = queue.Queue(maxsize=max_queue_size)
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def on_end(self, spans: Sequence[Span]) -> None:
+        for span in spans:
+            try:
+                self._queue.put_nowait(span)
+            except queue.Full:
+                self.dropped_spans += 1
+
+    def _run(self) -> None:
+        while True:
+            batch: List[Span] = []
+            deadline = time.monotonic() + self.schedule_delay_seconds
+            stop = False
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    span = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if span is None:
+                    stop = True
+                    break
+                batch.append(span)
+            if batch:
+                self._export(batch)
+            if stop:
+                return
+
+    def _export(self, batch: List[Span]) -> None:
+        try:
+            self.exporter.export(batch)
+        except Exception as e:
+            logger.warning("span export failed (%d spans): %s", len(batch), type(e).__name__)
+
+    def shutdown(self, timeout_seconds: float = 5.0) -> None:
+        """残りのスパンを出力してスレッドを止める"""
+        self._queue.put(None)
+        self._thread.join(timeout_seconds)
+        self.exporter.shutdown()
+
+
+class Tracer:
+    """スパンの生成・サンプリング判定・出力"""
+
+    def __init__(
+        self,
+        *,
+        processor=None,
+        sample_ratio: float = 1.0,
+        tail_sampling: bool = False,
+        tail_latency_ms: int = 1000,
+    ):
+        self.processor = processor
+        self.sample_ratio = sample_ratio
+        self.tail_sampling = tail_sampling
+        self.tail_latency_ms = tail_latency_ms
+        self._pending: Dict[int, List[Span]] = {}
+        self._decided: "OrderedDict[int, bool]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.processor is not None
+
+    def _head_sampled(self, trace_id: int) -> bool:
+        return (trace_id & 0xFFFFFFFFFFFFFFFF) < self.sample_ratio * 2 ** 64
+
+    def create_span(
+        self,
+        name: str,
+        *,
+        kind: int = SpanKind.INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+        parent: Optional[SpanContext] = None,
+        links: Sequence[SpanContext] = (),
+        new_trace: bool = False,
+    ) -> Span:
+        """スパンを開始する（現在のスパンには設定しない。終了は end_span）"""
+        if not self.enabled:
+            return _NON_RECORDING_SPAN
+
+        if parent is None and not new_trace:
+            current = _current_span.get()
+            parent = current.context if current is not None and current.context.trace_id else None
+
+        if parent is not None:
+            trace_id = parent.trace_id
+            sampled = parent.sampled
+        else:
+            trace_id = _random_id(128)
+            sampled = self._head_sampled(trace_id)
+        # テール・サンプリングでは終了時に判定するため、すべて記録する
+        recording = sampled or self.tail_sampling
+
+        return Span(
+            name=name,
+            context=SpanContext(trace_id, _random_id(64), sampled=sampled),
+            parent=parent,
+            kind=kind,
+            recording=recording,
+            start_time_ns=time.time_ns() if recording else 0,
+            attributes=dict(attributes) if recording and attributes else {},
+            links=tuple(link for link in links if link is not None) if recording else (),
+        )
+
+    def create_child_span(self, name: str, *, kind: int = SpanKind.INTERNAL) -> Optional[Span]:
+        """記録中のスパンの中にいる場合だけ子スパンを作る（SQLなど、単独ではトレースを始めないもの）"""
+        current = _current_span.get()
+        if current is None or not current.recording:
+            return None
+        return self.create_span(name, kind=kind, parent=current.context)
+
+    def end_span(self, span: Span) -> None:
+        if not span.recording:
+            return
+        span.end_time_ns = time.time_ns()
+        if not self.tail_sampling:
+            self.processor.on_end((span,))
+            return
+
+        trace_id = span.context.trace_id
+        with self._lock:
+            decision = self._decided.get(trace_id)
+            if decision is None:
+                spans = self._pending.setdefault(trace_id, [])
+                if len(spans) < MAX_SPANS_PER_TRACE:
+                    spans.append(span)
+                if not span.is_local_root:
+                    return
+                spans = self._pending.pop(trace_id)
+                keep = span.duration_ms >= self.tail_latency_ms or any(s.error for s in spans)
+                self._decided[trace_id] = keep
+                if len(self._decided) > DECIDED_TRACES_CACHE_SIZE:
+                    self._decided.popitem(last=False)
+            else:
+                # ルートの終了後に届いたスパン（待ち合わせていないタスクなど）
+                keep, spans = decision, [span]
+        if keep:
+            self.processor.on_end(spans)
+
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        *,
+        kind: int = SpanKind.INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+        parent: Optional[SpanContext] = None,
+        links: Sequence[SpanContext] = (),
+        new_trace: bool = False,
+    ) -> Iterator[Span]:
+        """ブロックの間、スパンを現在のスパンにする（例外は型名をエラーとして記録して送出する）"""
+        if not self.enabled:
+            yield _NON_RECORDING_SPAN
+            return
+
+        span = self.create_span(
+            name, kind=kind, attributes=attributes, parent=parent, links=links, new_trace=new_trace
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span)
+
+    def shutdown(self) -> None:
+        if self.processor is not None:
+            self.processor.shutdown()
+            self.processor = None
+
+
+tracer = Tracer()
+
+
+def start_span(name: str, **kwargs: Any):
+    """tracer.start_span のショートカット"""
+    return tracer.start_span(name, **kwargs)
+
+
+def configure_tracing(settings) -> None:
+    """設定（TRACING_*）に従って tracer に出力先とサンプリングを設定する"""
+    if not settings.TRACING_ENABLED or tracer.enabled:
+        return
+
+    if settings.TRACING_EXPORTER == "otlp":
+        exporter = OTLPHttpSpanExporter(
+            settings.TRACING_OTLP_ENDPOINT,
+            service_name=settings.TRACING_SERVICE_NAME,
+        )
+    else:
+        exporter = FileSpanExporter(
+            settings.TRACING_FILE_PATH,
+            service_name=settings.TRACING_SERVICE_NAME,
+        )
+    tracer.sample_ratio = settings.TRACING_SAMPLE_RATIO
+    tracer.tail_sampling = settings.TRACING_TAIL_SAMPLING
+    tracer.tail_latency_ms = settings.TRACING_TAIL_LATENCY_MS
+    tracer.processor = BatchSpanProcessor(exporter)
+
+
+def shutdown_tracing() -> None:
+    tracer.shutdown()
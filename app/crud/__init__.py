@@ -3,6 +3,9 @@ from .crud_archived_staff import crud_archived_staff as archived_staff
 from .crud_office import crud_office as office
 from .crud_billing import billing
 from .crud_webhook_event import webhook_event
+from .crud_cleanup_checkpoint import crud_cleanup_checkpoint as cleanup_checkpoint
+from .crud_recipient_import_job import crud_recipient_import_job as recipient_import_job
+from .crud_attempt_counter import crud_attempt_counter as attempt_counter
 from .crud_office_staff import office_staff
 from .crud_dashboard import crud_dashboard as dashboard
 from .crud_welfare_recipient import crud_welfare_recipient as welfare_recipient
@@ -10,6 +13,8 @@ from .crud_support_plan import crud_support_plan_cycle as support_plan
 from .crud_office_calendar_account import crud_office_calendar_account as office_calendar_account
 from .crud_staff_calendar_account import crud_staff_calendar_account as staff_calendar_account
 from .crud_calendar_event import crud_calendar_event as calendar_event
+from .crud_calendar_feed_token import crud_calendar_feed_token as calendar_feed_token
+from .crud_calendar_event_series import crud_calendar_event_series as calendar_event_series
 from .crud_notice import crud_notice as notice
 from .crud_message import crud_message as message
 from .crud_family_member import crud_family_member as family_member
@@ -7,9 +7,9 @@
 import uuid
 import hashlib
 from datetime import datetime, timezone
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, func, insert
 
 from app.models.archived_staff import ArchivedStaff
 from app.models.staff import Staff
@@ -32,27 +32,18 @@ class CRUDArchivedStaff:
         hash_hex = hashlib.sha256(str(staff_id).encode()).hexdigest()
         return hash_hex[:9].upper()
 
-    async def create_from_staff(
+    def _build_archive_values(
         self,
-        db: AsyncSession,
         *,
         staff: Staff,
         reason: str,
-        deleted_by: uuid.UUID
-    ) -> ArchivedStaff:
+        deleted_by: uuid.UUID,
+        now: Optional[datetime] = None
+    ) -> dict:
         """
-        Staffレコードからアーカイブを作成
-
-        個人識別情報を匿名化し、法定保存が必要なデータのみを保存する。
+        Staffレコードからアーカイブのカラム値を組み立てる
 
-        Args:
-            db: データベースセッション
-            staff: アーカイブ対象のスタッフ
-            reason: アーカイブ理由（staff_deletion/staff_withdrawal/office_withdrawal）
-            deleted_by: 削除実行者のスタッフID
-
-        Returns:
-            作成されたアーカイブレコード
+        個人識別情報を匿名化し、法定保存が必要なデータのみを含める。
         """
         # 匿名化ID生成
         anon_id = self._generate_anonymized_id(staff.id)
@@ -81,7 +72,7 @@ class CRUDArchivedStaff:
             pass
 
         # 退職日（deleted_atまたは現在日時）
-        terminated_at = staff.deleted_at or datetime.now(timezone.utc)
+        terminated_at = staff.deleted_at or now or datetime.now(timezone.utc)
 
         # 法定保存期限を計算（退職日 + 5年）
         retention_until = ArchivedStaff.calculate_retention_until(terminated_at, years=5)
@@ -94,20 +85,45 @@ class CRUDArchivedStaff:
             "is_email_verified": staff.is_email_verified,
         }
 
-        # アーカイブレコード作成
+        return {
+            "original_staff_id": staff.id,
+            "anonymized_full_name": f"スタッフ-{anon_id}",
+            "anonymized_email": f"archived-{anon_id}@deleted.local",
+            "role": staff.role.value,
+            "office_id": office_id,
+            "office_name": office_name,
+            "hired_at": staff.created_at,
+            "terminated_at": terminated_at,
+            "archive_reason": reason,
+            "legal_retention_until": retention_until,
+            "metadata_": metadata_dict,
+            "is_test_data": staff.is_test_data if hasattr(staff, 'is_test_data') else False,
+        }
+
+    async def create_from_staff(
+        self,
+        db: AsyncSession,
+        *,
+        staff: Staff,
+        reason: str,
+        deleted_by: uuid.UUID
+    ) -> ArchivedStaff:
+        """
+        Staffレコードからアーカイブを作成
+
+        個人識別情報を匿名化し、法定保存が必要なデータのみを保存する。
+
+        Args:
+            db: データベースセッション
+            staff: アーカイブ対象のスタッフ
+            reason: アーカイブ理由（staff_deletion/staff_withdrawal/office_withdrawal）
+            deleted_by: 削除実行者のスタッフID
+
+        Returns:
+            作成されたアーカイブレコード
+        """
         archived_staff = ArchivedStaff(
-            original_staff_id=staff.id,
-            anonymized_full_name=f"スタッフ-{anon_id}",
-            anonymized_email=f"archived-{anon_id}@deleted.local",
-            role=staff.role.value,
-            office_id=office_id,
-            office_name=office_name,
-            hired_at=staff.created_at,
-            terminated_at=terminated_at,
-            archive_reason=reason,
-            legal_retention_until=retention_until,
-            metadata_=metadata_dict,
-            is_test_data=staff.is_test_data if hasattr(staff, 'is_test_data') else False
+            **self._build_archive_values(staff=staff, reason=reason, deleted_by=deleted_by)
         )
 
         db.add(archived_staff)
@@ -116,6 +132,49 @@ class CRUDArchivedStaff:
 
         return archived_staff
 
+    async def bulk_create_from_staffs(
+        self,
+        db: AsyncSession,
+        *,
+        staffs: List[Staff],
+        reason: str,
+        deleted_by: uuid.UUID
+    ) -> Dict[uuid.UUID, Tuple[uuid.UUID, datetime]]:
+        """
+        複数のStaffレコードから1回の multi-row INSERT でアーカイブを作成
+
+        Args:
+            db: データベースセッション
+            staffs: アーカイブ対象のスタッフ（office_associations をロード済みであること）
+            reason: アーカイブ理由
+            deleted_by: 削除実行者のスタッフID
+
+        Returns:
+            original_staff_id → (archive_id, legal_retention_until)
+        """
+        if not staffs:
+            return {}
+
+        now = datetime.now(timezone.utc)
+        rows = [
+            self._build_archive_values(staff=staff, reason=reason, deleted_by=deleted_by, now=now)
+            for staff in staffs
+        ]
+
+        result = await db.execute(
+            insert(ArchivedStaff)
+            .values(rows)
+            .returning(
+                ArchivedStaff.id,
+                ArchivedStaff.original_staff_id,
+                ArchivedStaff.legal_retention_until,
+            )
+        )
+        return {
+            original_staff_id: (archive_id, retention_until)
+            for archive_id, original_staff_id, retention_until in result.all()
+        }
+
     async def get(
         self,
         db: AsyncSession,
@@ -0,0 +1,121 @@
+"""
+AttemptCounter CRUD操作
+"""
+from datetime import timedelta
+
+from sqlalchemy import select, delete, func, case
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.attempt_counter import AttemptCounter
+
+
+class CRUDAttemptCounter:
+    """AttemptCounter CRUD操作クラス"""
+
+    async def hit(
+        self,
+        db: AsyncSession,
+        *,
+        scope: str,
+        subject: str,
+        window_seconds: int,
+        amount: int = 1,
+        auto_commit: bool = False
+    ) -> int:
+        """
+        試行を記録して現在の窓内の試行回数を返す（UPSERT 1文）
+
+        窓が終了していれば、カウントと窓の終了時刻をリセットしてから数える。
+
+        Args:
+            db: データベースセッション
+            scope: 制限の種類
+            subject: 制限の対象
+            window_seconds: 窓の長さ（秒）
+            amount: 加算する回数
+            auto_commit: Trueの場合はcommitする（呼び出し側が失敗時にロールバックしても記録を残す）
+
+        Returns:
+            記録後の試行回数
+        """
+        window_expires_at = func.now() + timedelta(seconds=window_seconds)
+        stmt = pg_insert(AttemptCounter).values(
+            scope=scope,
+            subject=subject,
+            count=amount,
+            window_expires_at=window_expires_at,
+        )
+        expired = AttemptCounter.window_expires_at <= func.now()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AttemptCounter.scope, AttemptCounter.subject],
+            set_={
+                "count": case(
+                    (expired, stmt.excluded.count),
+                    else_=AttemptCounter.count + stmt.excluded.count,
+                ),
+                "window_expires_at": case(
+                    (expired, stmt.excluded.window_expires_at),
+                    else_=AttemptCounter.window_expires_at,
+                ),
+            },
+        ).returning(AttemptCounter.count)
+
+        result = await db.execute(stmt)
+        count = result.scalar()
+        if auto_commit:
+            await db.commit()
+        return count
+
+    async def get_count(
+        self,
+        db: AsyncSession,
+        *,
+        scope: str,
+        subject: str
+    ) -> int:
+        """現在の窓内の試行回数を取得（窓が終了していれば0）"""
+        result = await db.execute(
+            select(AttemptCounter.count).where(
+                AttemptCounter.scope == scope,
+                AttemptCounter.subject == subject,
+                AttemptCounter.window_expires_at > func.now(),
+            )
+        )
+        return result.scalar() or 0
+
+    async def clear(
+        self,
+        db: AsyncSession,
+        *,
+        scope: str,
+        subject: str,
+        auto_commit: bool = False
+    ) -> None:
+        """試行回数をクリア"""
+        await db.execute(
+            delete(AttemptCounter).where(
+                AttemptCounter.scope == scope,
+                AttemptCounter.subject == subject,
+            )
+        )
+        if auto_commit:
+            await db.commit()
+
+    async def purge_expired(self, db: AsyncSession) -> int:
+        """
+        窓が終了したカウンタを削除
+
+        Note:
+            - トランザクション管理は呼び出し側で行う
+
+        Returns:
+            削除件数
+        """
+        result = await db.execute(
+            delete(AttemptCounter).where(AttemptCounter.window_expires_at < func.now())
+        )
+        return result.rowcount
+
+
+crud_attempt_counter = CRUDAttemptCounter()
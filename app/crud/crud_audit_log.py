@@ -6,10 +6,11 @@
 import uuid
 import datetime
 from typing import Optional, Dict, Any, List, Tuple
-from sqlalchemy import select, func, and_, or_, delete
+from sqlalchemy import select, func, and_, or_, delete, insert, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.base import CRUDBase
+from app.crud.pagination import CountMode, count_rows
 from app.models.staff_profile import AuditLog
 from app.utils.privacy_utils import sanitize_audit_log_details_for_storage
 
@@ -70,6 +71,8 @@ class CRUDAuditLog(CRUDBase[AuditLog, Dict[str, Any], Dict[str, Any]]):
     - create_log: 監査ログ作成
     - get_logs: フィルタベースページネーション（Option A）
     - get_logs_cursor: カーソルベースページネーション（Option B）
+    - get_logs_keyset: (timestamp, id) キーセットページネーション（app_admin監査ログ画面）
+    - count_logs: 総件数の取得（推定値・キャッシュ付き）
     - get_logs_by_target: 特定リソースの監査ログ取得
     - get_admin_important_logs: app_admin向け重要アクションフィルタリング
     - cleanup_old_logs: 保持期間ベースの古いログ削除
@@ -144,6 +147,62 @@ class CRUDAuditLog(CRUDBase[AuditLog, Dict[str, Any], Dict[str, Any]]):
 
         return audit_log
 
+    async def create_logs_bulk(
+        self,
+        db: AsyncSession,
+        *,
+        entries: List[Dict[str, Any]],
+        auto_commit: bool = False
+    ) -> int:
+        """
+        監査ログを1回のmulti-row INSERTでまとめて作成
+
+        Args:
+            db: データベースセッション
+            entries: create_log と同じキーワード（actor_id, action, target_type,
+                target_id, office_id, actor_role, ip_address, user_agent,
+                details, is_test_data）を持つdictのリスト
+            auto_commit: 自動コミット（デフォルト: False）
+
+        Returns:
+            作成件数
+
+        Note:
+            - バッチ処理向け。作成したAuditLogオブジェクトは返さない
+            - details は create_log と同様に保存前にsanitizeする
+        """
+        if not entries:
+            return 0
+
+        rows = []
+        for entry in entries:
+            actor_id = entry.get("actor_id")
+            action = entry["action"]
+            details = entry.get("details")
+            rows.append({
+                "staff_id": actor_id,
+                "actor_role": entry.get("actor_role") or ("system" if actor_id is None else None),
+                "action": action,
+                "target_type": entry.get("target_type"),
+                "target_id": entry.get("target_id"),
+                "office_id": entry.get("office_id"),
+                "ip_address": entry.get("ip_address"),
+                "user_agent": entry.get("user_agent"),
+                "details": (
+                    sanitize_audit_log_details_for_storage(details, action=action)
+                    if details is not None
+                    else None
+                ),
+                "is_test_data": entry.get("is_test_data", False),
+            })
+
+        await db.execute(insert(AuditLog).values(rows))
+
+        if auto_commit:
+            await db.commit()
+
+        return len(rows)
+
     async def get_logs(
         self,
         db: AsyncSession,
@@ -157,8 +216,9 @@ class CRUDAuditLog(CRUDBase[AuditLog, Dict[str, Any], Dict[str, Any]]):
         end_date: Optional[datetime.datetime] = None,
         skip: int = 0,
         limit: int = 50,
-        include_test_data: bool = False
-    ) -> Tuple[List[AuditLog], int]:
+        include_test_data: bool = False,
+        count_mode: Optional[CountMode] = "exact"
+    ) -> Tuple[List[AuditLog], Optional[int]]:
         """
         フィルタベースページネーション（Option A）
 
@@ -176,11 +236,58 @@ class CRUDAuditLog(CRUDBase[AuditLog, Dict[str, Any], Dict[str, Any]]):
             skip: スキップする件数
             limit: 取得する最大件数
             include_test_data: テストデータを含めるか
+            count_mode: 総件数の取得方法（exact / estimated / auto）。
+                Noneの場合は件数を取得しない（呼び出し側で count_logs を使う場合）
 
         Returns:
-            (監査ログリスト, 総件数)のタプル
+            (監査ログリスト, 総件数)のタプル。count_mode が None の場合、総件数は None
         """
-        # 基本クエリ
+        conditions = self._build_filter_conditions(
+            office_id=office_id,
+            target_type=target_type,
+            action=action,
+            actor_id=actor_id,
+            target_id=target_id,
+            start_date=start_date,
+            end_date=end_date,
+            include_test_data=include_test_data,
+        )
+        where_clause = and_(*conditions) if conditions else True
+
+        total = None
+        if count_mode is not None:
+            total, _ = await count_rows(
+                db,
+                select(AuditLog.id).where(where_clause),
+                mode=count_mode,
+            )
+
+        # データ取得クエリ
+        query = (
+            select(AuditLog)
+            .where(where_clause)
+            .order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await db.execute(query)
+        logs = list(result.scalars().all())
+
+        return logs, total
+
+    def _build_filter_conditions(
+        self,
+        *,
+        office_id: Optional[uuid.UUID] = None,
+        target_type: Optional[str] = None,
+        action: Optional[str] = None,
+        actor_id: Optional[uuid.UUID] = None,
+        target_id: Optional[uuid.UUID] = None,
+        start_date: Optional[datetime.datetime] = None,
+        end_date: Optional[datetime.datetime] = None,
+        include_test_data: bool = False
+    ) -> list:
+        """get_logs / get_logs_keyset / count_logs 共通のフィルタ条件を構築"""
         conditions = []
 
         if not include_test_data:
@@ -207,25 +314,100 @@ class CRUDAuditLog(CRUDBase[AuditLog, Dict[str, Any], Dict[str, Any]]):
         if end_date:
             conditions.append(AuditLog.timestamp <= end_date)
 
-        where_clause = and_(*conditions) if conditions else True
+        return conditions
 
-        # カウントクエリ
-        count_query = select(func.count()).select_from(AuditLog).where(where_clause)
-        total_result = await db.execute(count_query)
-        total = total_result.scalar() or 0
+    async def get_logs_keyset(
+        self,
+        db: AsyncSession,
+        *,
+        office_id: Optional[uuid.UUID] = None,
+        target_type: Optional[str] = None,
+        action: Optional[str] = None,
+        cursor: Optional[Tuple[datetime.datetime, uuid.UUID]] = None,
+        limit: int = 50,
+        include_test_data: bool = False
+    ) -> Tuple[List[AuditLog], Optional[Tuple[datetime.datetime, uuid.UUID]]]:
+        """
+        (timestamp, id) のキーセットページネーション
+
+        get_logs_cursor と異なり同一timestampの行を読み飛ばさない。
+        (office_id, target_type, timestamp, id) の複合インデックスを降順に辿るため、
+        ページが進んでも読み取り量は limit 件程度で一定。
+
+        Args:
+            db: データベースセッション
+            office_id: 事務所IDでフィルタ
+            target_type: 対象タイプでフィルタ
+            action: アクションでフィルタ（部分一致）
+            cursor: 前ページ末尾の (timestamp, id)。Noneなら先頭ページ
+            limit: 取得する最大件数
+            include_test_data: テストデータを含めるか
+
+        Returns:
+            (監査ログリスト, 次ページのキー)のタプル
+            次ページのキーがNoneの場合、これ以上データがない
+        """
+        conditions = self._build_filter_conditions(
+            office_id=office_id,
+            target_type=target_type,
+            action=action,
+            include_test_data=include_test_data,
+        )
+
+        if cursor is not None:
+            conditions.append(tuple_(AuditLog.timestamp, AuditLog.id) < tuple_(*cursor))
 
-        # データ取得クエリ
         query = (
             select(AuditLog)
-            .where(where_clause)
+            .where(and_(*conditions) if conditions else True)
             .order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())
-            .offset(skip)
-            .limit(limit)
+            .limit(limit + 1)  # 次ページの有無を確認するため+1
         )
         result = await db.execute(query)
         logs = list(result.scalars().all())
 
-        return logs, total
+        next_key = None
+        if len(logs) > limit:
+            logs = logs[:limit]
+            next_key = (logs[-1].timestamp, logs[-1].id)
+
+        return logs, next_key
+
+    async def count_logs(
+        self,
+        db: AsyncSession,
+        *,
+        office_id: Optional[uuid.UUID] = None,
+        target_type: Optional[str] = None,
+        action: Optional[str] = None,
+        include_test_data: bool = False,
+        count_mode: CountMode = "auto"
+    ) -> Tuple[int, bool]:
+        """
+        監査ログの総件数を取得
+
+        正確な件数は条件ごとに count_cache に保持し、ページ送りのたびに
+        COUNT(*) を実行しない。フィルタなしの場合の推定値は pg_class.reltuples を使う
+        （テストデータ除外分の誤差は推定値として許容する）。
+
+        Returns:
+            (件数, 推定値かどうか)
+        """
+        conditions = self._build_filter_conditions(
+            office_id=office_id,
+            target_type=target_type,
+            action=action,
+            include_test_data=include_test_data,
+        )
+        has_filter = bool(office_id or target_type or action)
+
+        return await count_rows(
+            db,
+            select(AuditLog.id).where(and_(*conditions) if conditions else True),
+            mode=count_mode,
+            table_name=None if has_filter else AuditLog.__tablename__,
+            cache_key=("audit_logs", office_id, target_type, action, include_test_data),
+        )
 
     async def get_logs_cursor(
         self,
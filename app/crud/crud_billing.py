@@ -1,23 +1,46 @@
 """
 Billing CRUD操作
 """
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Union
 from uuid import UUID
 from datetime import datetime, timedelta, timezone
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, func, Row, ColumnElement
 from sqlalchemy.orm import selectinload
 
 from app.crud.base import CRUDBase
 from app.models.billing import Billing
+from app.models.office import Office
 from app.models.enums import BillingStatus
 from app.schemas.billing import BillingCreate, BillingUpdate
 
 
+def _invalidate_status_cache_on_commit(db: AsyncSession, office_ids) -> None:
+    """課金ステータスを書き換えた事業所のキャッシュをCOMMIT後に破棄する"""
+    # services層の __init__ が crud を読み込むため、ここでは遅延インポートする
+    from app.services.billing.status_cache import billing_status_cache
+
+    billing_status_cache.invalidate_on_commit(db, office_ids)
+
+
 class CRUDBilling(CRUDBase[Billing, BillingCreate, BillingUpdate]):
     """Billing CRUD操作クラス"""
 
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: Billing,
+        obj_in: Union[BillingUpdate, Dict[str, Any]],
+        auto_commit: bool = True
+    ) -> Billing:
+        """Billing情報を更新（課金ステータスを変更する場合はCOMMIT後にキャッシュを破棄）"""
+        update_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+        if "billing_status" in update_data:
+            _invalidate_status_cache_on_commit(db, [db_obj.office_id])
+        return await super().update(db=db, db_obj=db_obj, obj_in=obj_in, auto_commit=auto_commit)
+
     async def get_by_office_id(
         self,
         db: AsyncSession,
@@ -164,6 +187,56 @@ class CRUDBilling(CRUDBase[Billing, BillingCreate, BillingUpdate]):
         )
         return await self.update(db=db, db_obj=billing, obj_in=update_data, auto_commit=auto_commit)
 
+    async def bulk_transition_status(
+        self,
+        db: AsyncSession,
+        *,
+        from_status: BillingStatus,
+        to_status: BillingStatus,
+        conditions: Sequence[ColumnElement[bool]] = ()
+    ) -> List[Row]:
+        """
+        from_status かつ conditions を満たすBillingを1回の UPDATE ... RETURNING で遷移させる
+
+        commitは呼び出し側で行う（COMMIT後に該当事業所のステータスキャッシュを破棄する）。
+
+        Returns:
+            更新した行の (id, office_id, is_test_data) のリスト
+            is_test_data は所属Officeのテストデータフラグ
+        """
+        stmt = (
+            update(self.model)
+            .where(
+                self.model.billing_status == from_status,
+                self.model.office_id == Office.id,
+                *conditions
+            )
+            .values(billing_status=to_status)
+            .returning(self.model.id, self.model.office_id, Office.is_test_data)
+            .execution_options(synchronize_session="fetch")
+        )
+        result = await db.execute(stmt)
+        rows = list(result.all())
+        _invalidate_status_cache_on_commit(db, [row.office_id for row in rows])
+        return rows
+
+    async def count_by_status(
+        self,
+        db: AsyncSession,
+        *,
+        statuses: Sequence[BillingStatus],
+        conditions: Sequence[ColumnElement[bool]] = ()
+    ) -> Dict[BillingStatus, int]:
+        """statuses ごとに conditions を満たすBilling件数を返す（対象がないstatusは0）"""
+        result = await db.execute(
+            select(self.model.billing_status, func.count(self.model.id))
+            .where(self.model.billing_status.in_(statuses), *conditions)
+            .group_by(self.model.billing_status)
+        )
+        counts = {billing_status: 0 for billing_status in statuses}
+        counts.update({billing_status: count for billing_status, count in result.all()})
+        return counts
+
     # ========================================
     # ステータス判定メソッド
     # ========================================
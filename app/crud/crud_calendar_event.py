@@ -1,13 +1,14 @@
-from datetime import date, datetime, time
-from typing import List, Optional
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional, Tuple
 from uuid import UUID
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
 from sqlalchemy.orm import selectinload
-from sqlalchemy import select
+from sqlalchemy import func, or_, select, update
 
 from app.crud.base import CRUDBase
 from app.models.calendar_events import CalendarEvent
 from app.models.enums import CalendarEventType, CalendarSyncStatus
+from app.models.welfare_recipient import WelfareRecipient
 from app.schemas.calendar_event import CalendarEventCreate, CalendarEventUpdate
 
 
@@ -34,7 +35,11 @@ class CRUDCalendarEvent(CRUDBase[CalendarEvent, CalendarEventCreate, CalendarEve
         self,
         db: AsyncSession
     ) -> List[CalendarEvent]:
-        """同期待ちのイベント一覧を取得"""
+        """
+        同期待ちのイベント一覧を取得
+
+        全件を読み込むため、同期処理には claim_pending_sync_events を使う。
+        """
         result = await db.execute(
             select(self.model)
             .where(self.model.sync_status == CalendarSyncStatus.pending)
@@ -46,6 +51,76 @@ class CRUDCalendarEvent(CRUDBase[CalendarEvent, CalendarEventCreate, CalendarEve
         )
         return list(result.scalars().all())
 
+    async def claim_pending_sync_events(
+        self,
+        db: AsyncSession,
+        *,
+        limit: int,
+        lease_seconds: int,
+        max_attempts: int,
+        office_id: Optional[UUID] = None,
+        auto_commit: bool = True
+    ) -> List[CalendarEvent]:
+        """
+        同期待ちイベントを最大limit件クレーム（事業所順）
+
+        対象:
+        - sync_status が pending、または failed かつ失敗回数が max_attempts 未満
+        - 再試行時刻（next_sync_attempt_at）を過ぎている
+        - 他のワーカーのクレームがない、または有効期限（sync_lease_expires_at）切れ
+
+        SELECT ... FOR UPDATE SKIP LOCKED で候補を選ぶため、同時に実行された
+        ワーカー同士が同じ行を取り合わない。クレームした行にはリース期限を書き込み、
+        COMMIT後も期限までは他のワーカーから見えないようにする。
+        同期結果の反映（CalendarSyncResultService）でリースは解除される。
+
+        Args:
+            limit: クレームする最大件数
+            lease_seconds: クレームの有効期間（秒）
+            max_attempts: failed の行を再試行する上限回数
+            office_id: 指定時はその事業所のイベントのみ
+            auto_commit: 自動コミット（デフォルト: True）。
+                Falseの場合、呼び出し側がCOMMITするまで行ロックが残る
+
+        Returns:
+            クレームしたイベント（事業所ID・作成日時順）
+        """
+        now = func.now()
+        conditions = [
+            or_(
+                self.model.sync_status == CalendarSyncStatus.pending,
+                (self.model.sync_status == CalendarSyncStatus.failed)
+                & (self.model.sync_attempts < max_attempts),
+            ),
+            or_(self.model.next_sync_attempt_at.is_(None), self.model.next_sync_attempt_at <= now),
+            or_(self.model.sync_lease_expires_at.is_(None), self.model.sync_lease_expires_at <= now),
+        ]
+        if office_id is not None:
+            conditions.append(self.model.office_id == office_id)
+
+        candidates = (
+            select(self.model.id)
+            .where(*conditions)
+            .order_by(self.model.office_id, self.model.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(self.model)
+            .where(self.model.id.in_(candidates.scalar_subquery()))
+            .values(sync_lease_expires_at=now + timedelta(seconds=lease_seconds))
+            .returning(self.model)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await db.execute(stmt)
+        events = list(result.scalars().all())
+
+        if auto_commit:
+            await db.commit()
+
+        events.sort(key=lambda event: (str(event.office_id), event.created_at))
+        return events
+
     async def get_by_cycle_id(
         self,
         db: AsyncSession,
@@ -70,6 +145,33 @@ class CRUDCalendarEvent(CRUDBase[CalendarEvent, CalendarEventCreate, CalendarEve
         )
         return list(result.scalars().all())
 
+    def _deadline_event_filters(
+        self,
+        *,
+        office_id: UUID,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        event_type: Optional[CalendarEventType] = None,
+        recipient_id: Optional[UUID] = None,
+    ) -> list:
+        conditions = [self.model.office_id == office_id]
+
+        if from_date is not None:
+            start_datetime = datetime.combine(from_date, time.min)
+            conditions.append(self.model.event_end_datetime >= start_datetime)
+
+        if to_date is not None:
+            end_datetime = datetime.combine(to_date, time.max)
+            conditions.append(self.model.event_start_datetime <= end_datetime)
+
+        if event_type is not None:
+            conditions.append(self.model.event_type == event_type)
+
+        if recipient_id is not None:
+            conditions.append(self.model.welfare_recipient_id == recipient_id)
+
+        return conditions
+
     async def get_deadline_events(
         self,
         db: AsyncSession,
@@ -83,7 +185,13 @@ class CRUDCalendarEvent(CRUDBase[CalendarEvent, CalendarEventCreate, CalendarEve
         """期限カレンダー用のイベント一覧を取得する。"""
         stmt = (
             select(self.model)
-            .where(self.model.office_id == office_id)
+            .where(*self._deadline_event_filters(
+                office_id=office_id,
+                from_date=from_date,
+                to_date=to_date,
+                event_type=event_type,
+                recipient_id=recipient_id,
+            ))
             .options(
                 selectinload(self.model.welfare_recipient),
                 selectinload(self.model.support_plan_cycle),
@@ -92,22 +200,83 @@ class CRUDCalendarEvent(CRUDBase[CalendarEvent, CalendarEventCreate, CalendarEve
             .order_by(self.model.event_start_datetime.asc(), self.model.created_at.asc())
         )
 
-        if from_date is not None:
-            start_datetime = datetime.combine(from_date, time.min)
-            stmt = stmt.where(self.model.event_end_datetime >= start_datetime)
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
 
-        if to_date is not None:
-            end_datetime = datetime.combine(to_date, time.max)
-            stmt = stmt.where(self.model.event_start_datetime <= end_datetime)
+    async def get_deadline_feed_version(
+        self,
+        db: AsyncSession,
+        *,
+        office_id: UUID,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        event_type: Optional[CalendarEventType] = None,
+        recipient_id: Optional[UUID] = None,
+    ) -> Tuple[int, Optional[datetime]]:
+        """
+        .ics 出力の版を判定するための (件数, 最終更新日時) を取得する。
 
-        if event_type is not None:
-            stmt = stmt.where(self.model.event_type == event_type)
+        イベントの追加・変更・削除、利用者名の変更のいずれかで値が変わる。
+        """
+        stmt = (
+            select(
+                func.count(),
+                func.max(func.greatest(self.model.updated_at, WelfareRecipient.updated_at)),
+            )
+            .select_from(self.model)
+            .outerjoin(WelfareRecipient, WelfareRecipient.id == self.model.welfare_recipient_id)
+            .where(*self._deadline_event_filters(
+                office_id=office_id,
+                from_date=from_date,
+                to_date=to_date,
+                event_type=event_type,
+                recipient_id=recipient_id,
+            ))
+        )
+        count, last_updated_at = (await db.execute(stmt)).one()
+        return count, last_updated_at
 
-        if recipient_id is not None:
-            stmt = stmt.where(self.model.welfare_recipient_id == recipient_id)
+    async def stream_deadline_event_rows(
+        self,
+        db: AsyncSession,
+        *,
+        office_id: UUID,
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None,
+        event_type: Optional[CalendarEventType] = None,
+        recipient_id: Optional[UUID] = None,
+        batch_size: int = 500,
+    ) -> AsyncResult:
+        """
+        .ics 出力用にイベントをサーバーサイドカーソルで取得する。
 
-        result = await db.execute(stmt)
-        return list(result.scalars().all())
+        ORMオブジェクトやリレーションは読み込まず、出力に必要な列と利用者名だけを
+        batch_size 行ずつ取得する（result.partitions() で1バッチずつ取り出す）。
+        """
+        stmt = (
+            select(
+                self.model.id,
+                self.model.event_type,
+                self.model.event_title,
+                self.model.event_description,
+                self.model.event_start_datetime,
+                self.model.event_end_datetime,
+                self.model.updated_at,
+                WelfareRecipient.last_name,
+                WelfareRecipient.first_name,
+            )
+            .outerjoin(WelfareRecipient, WelfareRecipient.id == self.model.welfare_recipient_id)
+            .where(*self._deadline_event_filters(
+                office_id=office_id,
+                from_date=from_date,
+                to_date=to_date,
+                event_type=event_type,
+                recipient_id=recipient_id,
+            ))
+            .order_by(self.model.event_start_datetime.asc(), self.model.created_at.asc())
+            .execution_options(yield_per=batch_size)
+        )
+        return await db.stream(stmt)
 
 
 # インスタンス化
@@ -0,0 +1,624 @@
+"""
+CalendarEventSeries / CalendarEventInstance CRUD操作
+
+通知パターン（NotificationPattern）を期限ごとのシリーズ・インスタンスへ展開する処理を
+INSERT ... SELECT / UPDATE ... FROM の集合演算で行う。利用者数 × パターン数 × 通知日数の
+行をPythonでループせずに作成・更新できる。
+
+- シリーズ: 期限（サイクルの更新期限 / ステータスの期限）× 採用する通知パターン（イベント種別ごとに1つ）で1行
+- インスタンス: シリーズ × reminder_days_before の各日数で1行（期限日のN日前 9:00 JST）
+
+Note:
+    CASE式で返すENUM値は型を推論できないため、DB上のENUM型名
+    （マイグレーションで作成した名前。モデルの既定名とは異なる）へ明示的にキャストする。
+"""
+import enum
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import (
+    DateTime, Integer, String, and_, any_, case, cast, exists, func, literal, not_, null,
+    or_, select, tuple_, union_all, update,
+)
+from sqlalchemy.dialects.postgresql import ENUM, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.calendar_account import OfficeCalendarAccount
+from app.models.calendar_events import CalendarEventInstance, CalendarEventSeries, NotificationPattern
+from app.models.enums import (
+    CalendarConnectionStatus,
+    CalendarEventType,
+    CalendarSyncStatus,
+    EventInstanceStatus,
+    ReminderPatternType,
+    SupportPlanStep,
+)
+from app.models.support_plan_cycle import SupportPlanCycle, SupportPlanStatus
+from app.models.welfare_recipient import WelfareRecipient
+
+# 期限日の何時にインスタンスを置くか（JST）
+REMINDER_TIME = timedelta(hours=9)
+
+# アセスメント未完了・期限未設定のモニタリングは、ledgerと同じくサイクル開始日の7日後を期限とする
+DEFAULT_STEP_DEADLINE_DAYS = 7
+
+
+def _enum_literal(value: enum.Enum, type_name: str):
+    return cast(literal(value.value, String()), ENUM(name=type_name, create_type=False))
+
+
+def _sync_status(value: CalendarSyncStatus):
+    return _enum_literal(value, "calendar_sync_status")
+
+
+def _instance_status(value: EventInstanceStatus):
+    return _enum_literal(value, "event_instance_status")
+
+
+class CRUDCalendarEventSeries:
+    """CalendarEventSeries / CalendarEventInstance CRUD操作クラス"""
+
+    def _live_deadlines(self, *, today: date, office_id: Optional[UUID] = None):
+        """
+        通知対象の期限（CTE）
+
+        - renewal_deadline: 最新サイクルの次回更新期限（本計画の署名完了まで）
+        - assessment_incomplete: 最新サイクルの未完了アセスメント（サイクル開始日 + 7日）
+        - next_plan_start_date: 最新サイクルの未完了モニタリング（due_date、未設定なら2回目以降のサイクルのみ開始日 + 7日）
+        """
+        cycle = SupportPlanCycle
+        status = SupportPlanStatus
+
+        signed = exists().where(
+            status.plan_cycle_id == cycle.id,
+            status.step_type == SupportPlanStep.final_plan_signed,
+            status.completed == True,  # noqa: E712
+        )
+        renewal = (
+            select(
+                cycle.office_id.label("office_id"),
+                cycle.welfare_recipient_id.label("welfare_recipient_id"),
+                cycle.id.label("support_plan_cycle_id"),
+                cast(null(), Integer).label("support_plan_status_id"),
+                _enum_literal(CalendarEventType.renewal_deadline, "calendar_event_type").label("event_type"),
+                cycle.next_renewal_deadline.label("deadline_date"),
+            )
+            .where(
+                cycle.is_latest_cycle == True,  # noqa: E712
+                cycle.next_renewal_deadline >= today,
+                ~signed,
+            )
+        )
+
+        default_deadline = cycle.plan_cycle_start_date + DEFAULT_STEP_DEADLINE_DAYS
+        is_assessment = status.step_type == SupportPlanStep.assessment
+        step_deadline = case(
+            (is_assessment, default_deadline),
+            (status.due_date.is_not(None), status.due_date),
+            (cycle.cycle_number > 1, default_deadline),
+            else_=null(),
+        )
+        steps = (
+            select(
+                cycle.office_id.label("office_id"),
+                cycle.welfare_recipient_id.label("welfare_recipient_id"),
+                cast(null(), Integer).label("support_plan_cycle_id"),
+                status.id.label("support_plan_status_id"),
+                case(
+                    (is_assessment, _enum_literal(CalendarEventType.assessment_incomplete, "calendar_event_type")),
+                    else_=_enum_literal(CalendarEventType.next_plan_start_date, "calendar_event_type"),
+                ).label("event_type"),
+                step_deadline.label("deadline_date"),
+            )
+            .join(cycle, cycle.id == status.plan_cycle_id)
+            .where(
+                cycle.is_latest_cycle == True,  # noqa: E712
+                status.completed == False,  # noqa: E712
+                status.step_type.in_([SupportPlanStep.assessment, SupportPlanStep.monitoring]),
+                step_deadline >= today,
+            )
+        )
+
+        if office_id is not None:
+            renewal = renewal.where(cycle.office_id == office_id)
+            steps = steps.where(cycle.office_id == office_id)
+
+        return union_all(renewal, steps).cte("live_deadlines")
+
+    def _resolved_pattern_ids(self):
+        """
+        展開に使う通知パターンのID（イベント種別ごとに1つ）
+
+        有効なシステムデフォルトのパターンを採用する。同じ種別にデフォルトが複数ある場合は
+        作成日時の古いものを使い、期限1件に対してシリーズが重複しないようにする。
+        事業所ごとのパターン選択は現状のスキーマにないため、全事業所で共通。
+        """
+        return (
+            select(NotificationPattern.id)
+            .where(
+                NotificationPattern.is_active == True,  # noqa: E712
+                NotificationPattern.is_system_default == True,  # noqa: E712
+            )
+            .distinct(NotificationPattern.event_type)
+            .order_by(NotificationPattern.event_type, NotificationPattern.created_at, NotificationPattern.id)
+        )
+
+    async def upsert_series(
+        self,
+        db: AsyncSession,
+        *,
+        today: date,
+        office_id: Optional[UUID] = None
+    ) -> int:
+        """
+        採用する通知パターンを期限ごとのシリーズへ展開（INSERT ... SELECT ... ON CONFLICT）
+
+        期限日・タイトル・通知日数・連携先が変わったシリーズのみ更新する。
+        終了済み（cancelled）のシリーズは、期限が再び対象になった場合に復活させる。
+
+        Returns:
+            作成・更新したシリーズ数
+        """
+        deadlines = self._live_deadlines(today=today, office_id=office_id)
+        recipient_name = WelfareRecipient.last_name + " " + WelfareRecipient.first_name
+        series_title = func.replace(
+            func.replace(NotificationPattern.title_template, "{recipient_name}", recipient_name),
+            "{deadline_date}",
+            func.to_char(deadlines.c.deadline_date, "YYYY-MM-DD"),
+        )
+        rows = (
+            select(
+                deadlines.c.office_id,
+                deadlines.c.welfare_recipient_id,
+                deadlines.c.support_plan_cycle_id,
+                deadlines.c.support_plan_status_id,
+                deadlines.c.event_type,
+                series_title,
+                deadlines.c.deadline_date,
+                _enum_literal(ReminderPatternType.multiple_fixed, "reminder_pattern_type"),
+                NotificationPattern.id,
+                NotificationPattern.reminder_days_before,
+                OfficeCalendarAccount.google_calendar_id,
+                case(
+                    (OfficeCalendarAccount.google_calendar_id.is_not(None), _sync_status(CalendarSyncStatus.pending)),
+                    else_=_sync_status(CalendarSyncStatus.local_only),
+                ),
+            )
+            .select_from(deadlines)
+            .join(WelfareRecipient, WelfareRecipient.id == deadlines.c.welfare_recipient_id)
+            .join(
+                NotificationPattern,
+                and_(
+                    NotificationPattern.event_type == deadlines.c.event_type,
+                    NotificationPattern.id.in_(self._resolved_pattern_ids()),
+                ),
+            )
+            .outerjoin(
+                OfficeCalendarAccount,
+                and_(
+                    OfficeCalendarAccount.office_id == deadlines.c.office_id,
+                    OfficeCalendarAccount.connection_status == CalendarConnectionStatus.connected,
+                    OfficeCalendarAccount.google_calendar_id.is_not(None),
+                ),
+            )
+        )
+        columns = [
+            "office_id",
+            "welfare_recipient_id",
+            "support_plan_cycle_id",
+            "support_plan_status_id",
+            "event_type",
+            "series_title",
+            "base_deadline_date",
+            "pattern_type",
+            "notification_pattern_id",
+            "reminder_days_before",
+            "google_calendar_id",
+            "series_status",
+        ]
+
+        total = 0
+        for key_column in (CalendarEventSeries.support_plan_cycle_id, CalendarEventSeries.support_plan_status_id):
+            stmt = pg_insert(CalendarEventSeries).from_select(
+                columns,
+                rows.where(deadlines.c[key_column.key].is_not(None)),
+            )
+            excluded = stmt.excluded
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[key_column, CalendarEventSeries.event_type, CalendarEventSeries.notification_pattern_id],
+                index_where=key_column.is_not(None),
+                set_={
+                    "series_title": excluded.series_title,
+                    "base_deadline_date": excluded.base_deadline_date,
+                    "reminder_days_before": excluded.reminder_days_before,
+                    "google_calendar_id": excluded.google_calendar_id,
+                    "series_status": excluded.series_status,
+                    "updated_at": func.now(),
+                },
+                where=or_(
+                    CalendarEventSeries.series_status == CalendarSyncStatus.cancelled,
+                    tuple_(
+                        CalendarEventSeries.series_title,
+                        CalendarEventSeries.base_deadline_date,
+                        CalendarEventSeries.reminder_days_before,
+                        CalendarEventSeries.google_calendar_id,
+                    ).is_distinct_from(
+                        tuple_(
+                            excluded.series_title,
+                            excluded.base_deadline_date,
+                            excluded.reminder_days_before,
+                            excluded.google_calendar_id,
+                        )
+                    ),
+                ),
+            )
+            result = await db.execute(stmt)
+            total += result.rowcount
+        return total
+
+    async def finish_inactive_series(
+        self,
+        db: AsyncSession,
+        *,
+        today: date,
+        office_id: Optional[UUID] = None
+    ) -> int:
+        """
+        対象外になったシリーズを終了（cancelled）にする
+
+        ステップの完了・期限の経過・通知パターンの無効化（デフォルトの変更を含む）などで、
+        現在の期限一覧に対応する行がなくなったシリーズが対象。
+
+        Returns:
+            終了したシリーズ数
+        """
+        deadlines = self._live_deadlines(today=today, office_id=office_id)
+        still_live = (
+            select(1)
+            .select_from(deadlines)
+            .join(
+                NotificationPattern,
+                and_(
+                    NotificationPattern.event_type == deadlines.c.event_type,
+                    NotificationPattern.id.in_(self._resolved_pattern_ids()),
+                ),
+            )
+            .where(
+                NotificationPattern.id == CalendarEventSeries.notification_pattern_id,
+                deadlines.c.event_type == CalendarEventSeries.event_type,
+                or_(
+                    deadlines.c.support_plan_cycle_id == CalendarEventSeries.support_plan_cycle_id,
+                    deadlines.c.support_plan_status_id == CalendarEventSeries.support_plan_status_id,
+                ),
+            )
+            .exists()
+        )
+        stmt = (
+            update(CalendarEventSeries)
+            .where(
+                CalendarEventSeries.series_status != CalendarSyncStatus.cancelled,
+                ~still_live,
+            )
+            .values(series_status=CalendarSyncStatus.cancelled, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        if office_id is not None:
+            stmt = stmt.where(CalendarEventSeries.office_id == office_id)
+        result = await db.execute(stmt)
+        return result.rowcount
+
+    async def cancel_stale_instances(
+        self,
+        db: AsyncSession,
+        *,
+        office_id: Optional[UUID] = None
+    ) -> int:
+        """
+        不要になったインスタンスを取り消す
+
+        - 終了したシリーズ: 通知日時を過ぎたものは completed、未来のものは cancelled
+        - 通知日数から外れた日のインスタンス: cancelled
+
+        Google Calendarに登録済みの行は、削除のため sync_status を pending に戻す。
+
+        Returns:
+            更新したインスタンス数
+        """
+        series = CalendarEventSeries
+        instance = CalendarEventInstance
+        series_finished = series.series_status == CalendarSyncStatus.cancelled
+        becomes_completed = and_(series_finished, instance.event_datetime <= func.now())
+
+        stmt = (
+            update(instance)
+            .where(
+                instance.event_series_id == series.id,
+                instance.instance_status.not_in([EventInstanceStatus.cancelled, EventInstanceStatus.completed]),
+                or_(
+                    series_finished,
+                    not_(instance.days_before_deadline == any_(series.reminder_days_before)),
+                ),
+            )
+            .values(
+                instance_status=case(
+                    (becomes_completed, _instance_status(EventInstanceStatus.completed)),
+                    else_=_instance_status(EventInstanceStatus.cancelled),
+                ),
+                sync_status=case(
+                    (becomes_completed, instance.sync_status),
+                    (instance.google_event_id.is_not(None), _sync_status(CalendarSyncStatus.pending)),
+                    else_=_sync_status(CalendarSyncStatus.cancelled),
+                ),
+                sync_attempts=0,
+                next_sync_attempt_at=None,
+                updated_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if office_id is not None:
+            stmt = stmt.where(series.office_id == office_id)
+        result = await db.execute(stmt)
+        return result.rowcount
+
+    async def upsert_instances(
+        self,
+        db: AsyncSession,
+        *,
+        today: date,
+        office_id: Optional[UUID] = None
+    ) -> int:
+        """
+        有効なシリーズの今日以降の通知日をインスタンスへ展開（INSERT ... SELECT ... ON CONFLICT）
+
+        期限の変更などで日時・タイトル・説明が変わったインスタンスのみ更新し、
+        Google Calendarに登録済みなら modified（更新待ち）にする。
+
+        Returns:
+            作成・更新したインスタンス数
+        """
+        series = CalendarEventSeries
+        instance = CalendarEventInstance
+        days_before = func.unnest(series.reminder_days_before, type_=Integer).column_valued("days_before")
+        reminder_date = series.base_deadline_date - days_before
+        recipient_name = WelfareRecipient.last_name + " " + WelfareRecipient.first_name
+
+        description = NotificationPattern.description_template
+        for placeholder, value in (
+            ("{recipient_name}", recipient_name),
+            ("{deadline_date}", func.to_char(series.base_deadline_date, "YYYY-MM-DD")),
+            ("{days_before}", cast(days_before, String)),
+        ):
+            description = func.replace(description, placeholder, value)
+
+        rows = (
+            select(
+                series.id,
+                func.replace(series.series_title, "{days_before}", cast(days_before, String)),
+                description,
+                func.timezone(
+                    "Asia/Tokyo",
+                    cast(reminder_date, DateTime) + REMINDER_TIME,
+                    type_=DateTime(timezone=True),
+                ),
+                days_before,
+                _instance_status(EventInstanceStatus.pending),
+                case(
+                    (series.google_calendar_id.is_not(None), _sync_status(CalendarSyncStatus.pending)),
+                    else_=_sync_status(CalendarSyncStatus.local_only),
+                ),
+            )
+            .select_from(series)
+            .join(NotificationPattern, NotificationPattern.id == series.notification_pattern_id)
+            .join(WelfareRecipient, WelfareRecipient.id == series.welfare_recipient_id)
+            .where(
+                series.series_status != CalendarSyncStatus.cancelled,
+                reminder_date >= today,
+            )
+        )
+        if office_id is not None:
+            rows = rows.where(series.office_id == office_id)
+
+        stmt = pg_insert(instance).from_select(
+            [
+                "event_series_id",
+                "instance_title",
+                "instance_description",
+                "event_datetime",
+                "days_before_deadline",
+                "instance_status",
+                "sync_status",
+            ],
+            rows,
+        )
+        excluded = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[instance.event_series_id, instance.days_before_deadline],
+            set_={
+                "instance_title": excluded.instance_title,
+                "instance_description": excluded.instance_description,
+                "event_datetime": excluded.event_datetime,
+                "instance_status": case(
+                    (instance.google_event_id.is_(None), _instance_status(EventInstanceStatus.pending)),
+                    else_=_instance_status(EventInstanceStatus.modified),
+                ),
+                "sync_status": excluded.sync_status,
+                "sync_attempts": 0,
+                "next_sync_attempt_at": None,
+                "last_error_message": None,
+                "updated_at": func.now(),
+            },
+            where=and_(
+                instance.instance_status != EventInstanceStatus.completed,
+                or_(
+                    instance.instance_status == EventInstanceStatus.cancelled,
+                    tuple_(
+                        instance.event_datetime,
+                        instance.instance_title,
+                        instance.instance_description,
+                        instance.sync_status == CalendarSyncStatus.local_only,
+                    ).is_distinct_from(
+                        tuple_(
+                            excluded.event_datetime,
+                            excluded.instance_title,
+                            excluded.instance_description,
+                            excluded.sync_status == CalendarSyncStatus.local_only,
+                        )
+                    ),
+                ),
+            ),
+        )
+        result = await db.execute(stmt)
+        return result.rowcount
+
+    async def complete_past_instances(
+        self,
+        db: AsyncSession,
+        *,
+        office_id: Optional[UUID] = None
+    ) -> int:
+        """通知日時を過ぎた同期済み・アプリ内のみのインスタンスを completed にする"""
+        instance = CalendarEventInstance
+        stmt = (
+            update(instance)
+            .where(
+                instance.instance_status.in_([EventInstanceStatus.pending, EventInstanceStatus.created]),
+                instance.sync_status.in_([CalendarSyncStatus.synced, CalendarSyncStatus.local_only]),
+                instance.event_datetime <= func.now(),
+            )
+            .values(instance_status=EventInstanceStatus.completed, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        if office_id is not None:
+            stmt = stmt.where(
+                instance.event_series_id.in_(
+                    select(CalendarEventSeries.id).where(CalendarEventSeries.office_id == office_id)
+                )
+            )
+        result = await db.execute(stmt)
+        return result.rowcount
+
+    async def refresh_series_progress(
+        self,
+        db: AsyncSession,
+        *,
+        office_id: Optional[UUID] = None
+    ) -> int:
+        """
+        シリーズの件数（total_instances / completed_instances）と状態をインスタンスから集計して更新
+
+        状態: 終了済みは cancelled のまま、未連携は local_only、
+        同期待ち・再試行待ちのインスタンスがあれば pending、なければ synced。
+        """
+        series = CalendarEventSeries
+        instance = CalendarEventInstance
+        progress = select(
+            instance.event_series_id,
+            func.count().filter(instance.instance_status != EventInstanceStatus.cancelled).label("total"),
+            func.count().filter(instance.instance_status == EventInstanceStatus.completed).label("completed"),
+            func.bool_or(
+                instance.sync_status.in_([CalendarSyncStatus.pending, CalendarSyncStatus.failed])
+            ).label("unsynced"),
+        ).group_by(instance.event_series_id)
+        if office_id is not None:
+            progress = progress.where(
+                instance.event_series_id.in_(select(series.id).where(series.office_id == office_id))
+            )
+        progress = progress.subquery()
+
+        new_status = case(
+            (series.series_status == CalendarSyncStatus.cancelled, series.series_status),
+            (series.google_calendar_id.is_(None), _sync_status(CalendarSyncStatus.local_only)),
+            (progress.c.unsynced, _sync_status(CalendarSyncStatus.pending)),
+            else_=_sync_status(CalendarSyncStatus.synced),
+        )
+        stmt = (
+            update(series)
+            .where(
+                series.id == progress.c.event_series_id,
+                tuple_(series.total_instances, series.completed_instances, series.series_status).is_distinct_from(
+                    tuple_(progress.c.total, progress.c.completed, new_status)
+                ),
+            )
+            .values(
+                total_instances=progress.c.total,
+                completed_instances=progress.c.completed,
+                series_status=new_status,
+                updated_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(stmt)
+        return result.rowcount
+
+    async def claim_pending_instances(
+        self,
+        db: AsyncSession,
+        *,
+        limit: int,
+        lease_seconds: int,
+        max_attempts: int,
+        office_id: Optional[UUID] = None,
+        auto_commit: bool = True
+    ) -> List[CalendarEventInstance]:
+        """
+        Google Calendarへの反映待ちインスタンスを最大limit件クレーム（事業所・通知日時順）
+
+        対象・クレームの方式は crud.calendar_event.claim_pending_sync_events と同じ。
+        連携先のない（google_calendar_id がNULLの）シリーズのインスタンスは対象外。
+        """
+        instance = CalendarEventInstance
+        series = CalendarEventSeries
+        now = func.now()
+        candidates = (
+            select(instance.id)
+            .join(series, series.id == instance.event_series_id)
+            .where(
+                or_(
+                    instance.sync_status == CalendarSyncStatus.pending,
+                    (instance.sync_status == CalendarSyncStatus.failed)
+                    & (instance.sync_attempts < max_attempts),
+                ),
+                or_(instance.next_sync_attempt_at.is_(None), instance.next_sync_attempt_at <= now),
+                or_(instance.sync_lease_expires_at.is_(None), instance.sync_lease_expires_at <= now),
+                series.google_calendar_id.is_not(None),
+            )
+            .order_by(series.office_id, instance.event_datetime)
+            .limit(limit)
+            .with_for_update(of=instance, skip_locked=True)
+        )
+        if office_id is not None:
+            candidates = candidates.where(series.office_id == office_id)
+
+        stmt = (
+            update(instance)
+            .where(instance.id.in_(candidates.scalar_subquery()))
+            .values(sync_lease_expires_at=now + timedelta(seconds=lease_seconds))
+            .returning(instance)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await db.execute(stmt)
+        instances = list(result.scalars().all())
+
+        if auto_commit:
+            await db.commit()
+
+        instances.sort(key=lambda row: row.event_datetime)
+        return instances
+
+    async def get_series_map(
+        self,
+        db: AsyncSession,
+        *,
+        series_ids: set
+    ) -> Dict[UUID, CalendarEventSeries]:
+        """シリーズIDからシリーズを1クエリで取得"""
+        if not series_ids:
+            return {}
+        result = await db.execute(
+            select(CalendarEventSeries).where(CalendarEventSeries.id.in_(series_ids))
+        )
+        return {row.id: row for row in result.scalars().all()}
+
+
+crud_calendar_event_series = CRUDCalendarEventSeries()
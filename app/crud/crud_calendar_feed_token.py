@@ -0,0 +1,81 @@
+"""
+CalendarFeedToken CRUD操作
+"""
+import hashlib
+import secrets
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.calendar_feed_token import CalendarFeedToken
+
+
+def _hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class CRUDCalendarFeedToken:
+    """CalendarFeedToken CRUD操作クラス"""
+
+    async def issue(
+        self,
+        db: AsyncSession,
+        *,
+        office_id: UUID,
+        created_by: Optional[UUID] = None,
+        auto_commit: bool = True
+    ) -> str:
+        """
+        購読トークンを発行する（既存のトークンは無効になる）
+
+        Returns:
+            生のトークン（DBにはハッシュのみ保存するため、再表示はできない）
+        """
+        token = secrets.token_urlsafe(32)
+        stmt = pg_insert(CalendarFeedToken).values(
+            office_id=office_id,
+            token_hash=_hash_token(token),
+            created_by=created_by,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CalendarFeedToken.office_id],
+            set_={
+                "token_hash": stmt.excluded.token_hash,
+                "created_by": stmt.excluded.created_by,
+                "created_at": func.now(),
+            },
+        )
+        await db.execute(stmt)
+        if auto_commit:
+            await db.commit()
+        return token
+
+    async def get_office_id(self, db: AsyncSession, *, token: str) -> Optional[UUID]:
+        """トークンに対応する事業所IDを取得（無効なトークンはNone）"""
+        result = await db.execute(
+            select(CalendarFeedToken.office_id).where(
+                CalendarFeedToken.token_hash == _hash_token(token)
+            )
+        )
+        return result.scalar()
+
+    async def revoke(
+        self,
+        db: AsyncSession,
+        *,
+        office_id: UUID,
+        auto_commit: bool = True
+    ) -> bool:
+        """購読トークンを無効化する"""
+        result = await db.execute(
+            delete(CalendarFeedToken).where(CalendarFeedToken.office_id == office_id)
+        )
+        if auto_commit:
+            await db.commit()
+        return result.rowcount > 0
+
+
+crud_calendar_feed_token = CRUDCalendarFeedToken()
@@ -0,0 +1,90 @@
+"""
+CleanupCheckpoint CRUD操作
+"""
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.cleanup_checkpoint import CleanupCheckpoint
+
+
+class CRUDCleanupCheckpoint:
+    """CleanupCheckpoint CRUD操作クラス"""
+
+    async def get_cursor(
+        self,
+        db: AsyncSession,
+        *,
+        name: str
+    ) -> Optional[Tuple[datetime, str]]:
+        """
+        フェーズの再開位置を取得
+
+        Args:
+            db: データベースセッション
+            name: フェーズ名
+
+        Returns:
+            (deleted_at, id) のタプル。未保存またはクリア済みの場合はNone
+        """
+        result = await db.execute(
+            select(
+                CleanupCheckpoint.cursor_deleted_at,
+                CleanupCheckpoint.cursor_id
+            ).where(CleanupCheckpoint.name == name)
+        )
+        row = result.first()
+        if row is None or row.cursor_deleted_at is None or row.cursor_id is None:
+            return None
+        return row.cursor_deleted_at, row.cursor_id
+
+    async def save_cursor(
+        self,
+        db: AsyncSession,
+        *,
+        name: str,
+        cursor_deleted_at: datetime,
+        cursor_id: str
+    ) -> None:
+        """
+        フェーズの再開位置を保存（UPSERT）
+
+        Note:
+            - トランザクション管理は呼び出し側で行う（削除バッチと同じCOMMITで確定させる）
+        """
+        stmt = pg_insert(CleanupCheckpoint).values(
+            name=name,
+            cursor_deleted_at=cursor_deleted_at,
+            cursor_id=cursor_id,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CleanupCheckpoint.name],
+            set_={
+                "cursor_deleted_at": stmt.excluded.cursor_deleted_at,
+                "cursor_id": stmt.excluded.cursor_id,
+                "updated_at": func.now(),
+            },
+        )
+        await db.execute(stmt)
+
+    async def clear_cursor(
+        self,
+        db: AsyncSession,
+        *,
+        name: str
+    ) -> None:
+        """
+        フェーズの再開位置をクリア（次回は先頭から走査）
+
+        Note:
+            - トランザクション管理は呼び出し側で行う
+        """
+        await db.execute(
+            delete(CleanupCheckpoint).where(CleanupCheckpoint.name == name)
+        )
+
+
+crud_cleanup_checkpoint = CRUDCleanupCheckpoint()
@@ -9,9 +9,10 @@ from uuid import UUID
 from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from sqlalchemy import select, update, delete, func, and_, or_
+from sqlalchemy import select, update, delete, and_, or_, tuple_
 
 from app.crud.base import CRUDBase
+from app.crud.pagination import CountMode, count_rows
 from app.models.inquiry import InquiryDetail
 from app.models.message import Message, MessageRecipient
 from app.models.enums import (
@@ -119,6 +120,50 @@ class CRUDInquiry(CRUDBase[InquiryDetail, dict, dict]):
 
         return inquiry_detail
 
+    def _build_list_conditions(
+        self,
+        *,
+        status: Optional[InquiryStatus],
+        assigned_staff_id: Optional[UUID],
+        priority: Optional[InquiryPriority],
+        search: Optional[str],
+        include_test_data: bool
+    ) -> list:
+        """一覧取得のフィルタ条件を構築（searchがある場合はMessageとのJOINが必要）"""
+        conditions = []
+
+        # テストデータフィルタ
+        if not include_test_data:
+            conditions.append(InquiryDetail.is_test_data == False)  # noqa: E712
+
+        if status is not None:
+            conditions.append(InquiryDetail.status == status)
+
+        if assigned_staff_id is not None:
+            conditions.append(InquiryDetail.assigned_staff_id == assigned_staff_id)
+
+        if priority is not None:
+            conditions.append(InquiryDetail.priority == priority)
+
+        # 検索条件（SQLインジェクション対策）
+        if search:
+            # ワイルドカード文字をエスケープ
+            escaped_search = search.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            # message_type 条件は部分trigramインデックス（問い合わせのみ）を使わせるため
+            conditions.append(Message.message_type == MessageType.inquiry)
+            conditions.append(or_(
+                Message.title.ilike(f"%{escaped_search}%", escape='\\'),
+                Message.content.ilike(f"%{escaped_search}%", escape='\\')
+            ))
+
+        return conditions
+
+    def _list_query(self, columns, conditions: list, *, search: Optional[str]):
+        query = select(*columns)
+        if search:
+            query = query.join(Message, InquiryDetail.message_id == Message.id)
+        return query.where(and_(*conditions) if conditions else True)
+
     async def get_inquiries(
         self,
         db: AsyncSession,
@@ -131,10 +176,11 @@ class CRUDInquiry(CRUDBase[InquiryDetail, dict, dict]):
         limit: int = 20,
         sort: str = "created_at",
         order: str = "desc",
-        include_test_data: bool = False
+        include_test_data: bool = False,
+        count_mode: CountMode = "exact"
     ) -> Tuple[List[InquiryDetail], int]:
         """
-        問い合わせ一覧を取得
+        問い合わせ一覧を取得（オフセットベース）
 
         Args:
             db: データベースセッション
@@ -147,61 +193,31 @@ class CRUDInquiry(CRUDBase[InquiryDetail, dict, dict]):
             sort: ソートカラム（created_at, updated_at, priority）
             order: ソート順（asc, desc）
             include_test_data: テストデータを含めるか
+            count_mode: 総件数の取得方法（exact: 正確な件数, estimated: 推定値）
 
         Returns:
             (問い合わせリスト, 総件数)
         """
-        # フィルタ条件を構築
-        conditions = []
-
-        # テストデータフィルタ
-        if not include_test_data:
-            conditions.append(InquiryDetail.is_test_data == False)  # noqa: E712
-
-        if status is not None:
-            conditions.append(InquiryDetail.status == status)
-
-        if assigned_staff_id is not None:
-            conditions.append(InquiryDetail.assigned_staff_id == assigned_staff_id)
-
-        if priority is not None:
-            conditions.append(InquiryDetail.priority == priority)
-
-        # 検索条件（SQLインジェクション対策）
-        if search:
-            # ワイルドカード文字をエスケープ
-            escaped_search = search.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
-            search_condition = or_(
-                Message.title.ilike(f"%{escaped_search}%", escape='\\'),
-                Message.content.ilike(f"%{escaped_search}%", escape='\\')
-            )
-            conditions.append(search_condition)
-
-        where_clause = and_(*conditions) if conditions else True
-
-        # 総件数を取得（効率的なカウント）
-        count_query = select(func.count()).select_from(InquiryDetail)
-        if search:
-            count_query = count_query.join(Message, InquiryDetail.message_id == Message.id)
-        count_query = count_query.where(where_clause)
+        conditions = self._build_list_conditions(
+            status=status,
+            assigned_staff_id=assigned_staff_id,
+            priority=priority,
+            search=search,
+            include_test_data=include_test_data,
+        )
 
-        total_result = await db.execute(count_query)
-        total = total_result.scalar() or 0
+        total = await self.count_inquiries(
+            db, conditions=conditions, search=search, count_mode=count_mode
+        )
 
         # データ取得クエリ
-        query = (
-            select(InquiryDetail)
-            .options(
-                selectinload(InquiryDetail.message),
-                selectinload(InquiryDetail.assigned_staff)
-            )
+        query = self._list_query(
+            [InquiryDetail], conditions, search=search
+        ).options(
+            selectinload(InquiryDetail.message),
+            selectinload(InquiryDetail.assigned_staff)
         )
 
-        if search:
-            query = query.join(Message, InquiryDetail.message_id == Message.id)
-
-        query = query.where(where_clause)
-
         # ソート（決定的な順序のため id を副次ソートキーに追加）
         sort_column = getattr(InquiryDetail, sort, InquiryDetail.created_at)
         if order == "asc":
@@ -218,6 +234,105 @@ class CRUDInquiry(CRUDBase[InquiryDetail, dict, dict]):
 
         return inquiries, total
 
+    async def get_inquiries_cursor(
+        self,
+        db: AsyncSession,
+        *,
+        status: Optional[InquiryStatus] = None,
+        assigned_staff_id: Optional[UUID] = None,
+        priority: Optional[InquiryPriority] = None,
+        search: Optional[str] = None,
+        cursor: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 20,
+        order: str = "desc",
+        include_test_data: bool = False
+    ) -> Tuple[List[InquiryDetail], Optional[Tuple[datetime, UUID]]]:
+        """
+        問い合わせ一覧を取得（(created_at, id) のキーセットページネーション）
+
+        前ページ末尾の (created_at, id) より後ろを ix_inquiry_details_status_created /
+        ix_inquiry_details_created_id で辿るため、ページ位置に関わらずコストが一定。
+
+        Args:
+            cursor: 前ページ末尾の (created_at, id)。Noneの場合は先頭から
+            limit: 取得件数
+            order: ソート順（asc, desc）
+            その他のフィルタは get_inquiries と同じ
+
+        Returns:
+            (問い合わせリスト, 次のカーソル)。次のカーソルがNoneの場合、これ以上データがない
+        """
+        conditions = self._build_list_conditions(
+            status=status,
+            assigned_staff_id=assigned_staff_id,
+            priority=priority,
+            search=search,
+            include_test_data=include_test_data,
+        )
+
+        sort_key = tuple_(InquiryDetail.created_at, InquiryDetail.id)
+        if cursor is not None:
+            if order == "asc":
+                conditions.append(sort_key > tuple_(*cursor))
+            else:
+                conditions.append(sort_key < tuple_(*cursor))
+
+        query = self._list_query(
+            [InquiryDetail], conditions, search=search
+        ).options(
+            selectinload(InquiryDetail.message),
+            selectinload(InquiryDetail.assigned_staff)
+        )
+        if order == "asc":
+            query = query.order_by(InquiryDetail.created_at.asc(), InquiryDetail.id.asc())
+        else:
+            query = query.order_by(InquiryDetail.created_at.desc(), InquiryDetail.id.desc())
+        query = query.limit(limit + 1)  # 次ページの有無を確認するため+1
+
+        result = await db.execute(query)
+        inquiries = list(result.scalars().unique().all())
+
+        next_cursor = None
+        if len(inquiries) > limit:
+            inquiries = inquiries[:limit]
+            next_cursor = (inquiries[-1].created_at, inquiries[-1].id)
+
+        return inquiries, next_cursor
+
+    async def count_inquiries(
+        self,
+        db: AsyncSession,
+        *,
+        status: Optional[InquiryStatus] = None,
+        assigned_staff_id: Optional[UUID] = None,
+        priority: Optional[InquiryPriority] = None,
+        search: Optional[str] = None,
+        include_test_data: bool = False,
+        conditions: Optional[list] = None,
+        count_mode: CountMode = "exact"
+    ) -> int:
+        """
+        問い合わせ一覧の総件数を取得
+
+        Args:
+            conditions: 構築済みのフィルタ条件（指定時は他のフィルタ引数を無視）
+            count_mode: exact=COUNT(*)、estimated=実行計画の推定行数（大量データ向け）
+        """
+        if conditions is None:
+            conditions = self._build_list_conditions(
+                status=status,
+                assigned_staff_id=assigned_staff_id,
+                priority=priority,
+                search=search,
+                include_test_data=include_test_data,
+            )
+        total, _ = await count_rows(
+            db,
+            self._list_query([InquiryDetail.id], conditions, search=search),
+            mode=count_mode,
+        )
+        return total
+
     async def get_inquiry_by_id(
         self,
         db: AsyncSession,
@@ -1,9 +1,9 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Union
 from uuid import UUID
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from sqlalchemy import select, update, delete, func
+from sqlalchemy import select, update, delete, insert, func
 
 from app.crud.base import CRUDBase
 from app.models.notice import Notice
@@ -211,6 +211,70 @@ class CRUDNotice(CRUDBase[Notice, NoticeCreate, NoticeUpdate]):
         result = await db.execute(stmt)
         return result.rowcount
 
+    async def bulk_create(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: Sequence[Union[NoticeCreate, Dict[str, Any]]],
+        auto_commit: bool = False
+    ) -> List[UUID]:
+        """
+        複数の通知を1回のINSERTで作成
+
+        Args:
+            db: データベースセッション
+            objs_in: 作成する通知データのリスト
+            auto_commit: Trueの場合はcommitする（デフォルトは呼び出し側のトランザクションに参加）
+
+        Returns:
+            作成された通知IDのリスト（objs_inと同じ順序）
+        """
+        if not objs_in:
+            return []
+
+        values = [
+            obj_in.model_dump() if isinstance(obj_in, NoticeCreate) else dict(obj_in)
+            for obj_in in objs_in
+        ]
+        result = await db.execute(
+            insert(self.model).values(values).returning(self.model.id)
+        )
+        notice_ids = list(result.scalars().all())
+
+        if auto_commit:
+            await db.commit()
+        return notice_ids
+
+    async def bulk_delete_by_link(
+        self,
+        db: AsyncSession,
+        *,
+        link_url: str,
+        notice_types: Optional[Sequence[str]] = None
+    ) -> int:
+        """
+        link_urlに紐づく通知を1回のDELETEで削除
+
+        Args:
+            db: データベースセッション
+            link_url: 削除対象のlink_url
+            notice_types: 削除対象のtype（オプション）。指定した場合、このtypeの通知のみ削除
+
+        Returns:
+            削除された件数
+
+        Note:
+            このメソッドはcommitしない。親メソッドで最後に1回だけcommitする。
+        """
+        stmt = delete(self.model).where(self.model.link_url == link_url)
+        if notice_types is not None:
+            stmt = stmt.where(self.model.type.in_(list(notice_types)))
+
+        result = await db.execute(
+            stmt.execution_options(synchronize_session="fetch")
+        )
+        return int(result.rowcount or 0)
+
     async def delete_old_notices_over_limit(
         self,
         db: AsyncSession,
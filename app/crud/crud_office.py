@@ -1,11 +1,11 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 import datetime
 import os
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import and_
+from sqlalchemy import and_, tuple_
 from fastapi import HTTPException
 
 from app.crud.base import CRUDBase
@@ -161,6 +161,52 @@ class CRUDOffice(CRUDBase[Office, OfficeCreate, OfficeUpdate]):
         result = await db.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_admin_list(
+        self,
+        db: AsyncSession,
+        *,
+        search: Optional[str] = None,
+        skip: int = 0,
+        cursor: Optional[Tuple[datetime.datetime, UUID]] = None,
+        limit: int = 30
+    ) -> Tuple[List[Office], Optional[Tuple[datetime.datetime, UUID]]]:
+        """
+        app_admin向け事務所一覧を取得（作成日時の新しい順）
+
+        cursor（前ページ末尾の (created_at, id)）指定時は (created_at, id) の
+        インデックスを辿るキーセット方式で取得し、skipは無視する。
+        名前の部分一致検索は trigram インデックス（ix_offices_name_trgm）で処理する。
+
+        Returns:
+            (事務所リスト, 次ページのキー)。次ページがない場合キーはNone
+        """
+        stmt = select(Office)
+
+        if search:
+            # ワイルドカード文字をエスケープ
+            escaped_search = search.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            stmt = stmt.where(Office.name.ilike(f"%{escaped_search}%", escape='\\'))
+
+        if cursor is not None:
+            stmt = stmt.where(tuple_(Office.created_at, Office.id) < tuple_(*cursor))
+        elif skip:
+            stmt = stmt.offset(skip)
+
+        stmt = (
+            stmt
+            .order_by(Office.created_at.desc(), Office.id.desc())
+            .limit(limit + 1)  # 次ページの有無を確認するため+1
+        )
+        result = await db.execute(stmt)
+        offices = list(result.scalars().all())
+
+        next_key = None
+        if len(offices) > limit:
+            offices = offices[:limit]
+            next_key = (offices[-1].created_at, offices[-1].id)
+
+        return offices, next_key
+
     async def get_active_by_id(
         self,
         db: AsyncSession,
@@ -0,0 +1,133 @@
+"""
+RecipientImportJob CRUD操作
+"""
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import select, update, func, cast
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.enums import RecipientImportStatus
+from app.models.recipient_import_job import RecipientImportJob
+
+
+class CRUDRecipientImportJob:
+    """RecipientImportJob CRUD操作クラス"""
+
+    async def create(
+        self,
+        db: AsyncSession,
+        *,
+        office_id: UUID,
+        created_by: UUID,
+        file_name: Optional[str] = None,
+        auto_commit: bool = True
+    ) -> RecipientImportJob:
+        """
+        インポートジョブを作成
+
+        Args:
+            db: データベースセッション
+            office_id: インポート先事務所ID
+            created_by: 実行スタッフID
+            file_name: アップロードされたファイル名
+            auto_commit: Trueの場合はcommitする（進捗を他セッションから参照可能にする）
+
+        Returns:
+            作成されたジョブ
+        """
+        job = RecipientImportJob(
+            office_id=office_id,
+            created_by=created_by,
+            file_name=file_name,
+            status=RecipientImportStatus.pending,
+            errors=[],
+        )
+        db.add(job)
+        if auto_commit:
+            await db.commit()
+            await db.refresh(job)
+        else:
+            await db.flush()
+        return job
+
+    async def get_by_office(
+        self,
+        db: AsyncSession,
+        *,
+        job_id: UUID,
+        office_id: UUID
+    ) -> Optional[RecipientImportJob]:
+        """事務所に属するインポートジョブを取得"""
+        result = await db.execute(
+            select(RecipientImportJob).where(
+                RecipientImportJob.id == job_id,
+                RecipientImportJob.office_id == office_id,
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def record_chunk(
+        self,
+        db: AsyncSession,
+        *,
+        job_id: UUID,
+        processed: int,
+        succeeded: int,
+        failed: int,
+        errors: List[dict]
+    ) -> None:
+        """
+        チャンクの処理結果を加算（UPDATE 1文）
+
+        件数は現在値への加算、エラーは JSONB 配列への追記で更新するため、
+        ジョブ行を読み直さずに済む。
+
+        Note:
+            - トランザクション管理は呼び出し側で行う（チャンクの登録と同じCOMMITで確定させる）
+        """
+        await db.execute(
+            update(RecipientImportJob)
+            .where(RecipientImportJob.id == job_id)
+            .values(
+                status=RecipientImportStatus.running,
+                processed_rows=RecipientImportJob.processed_rows + processed,
+                succeeded_rows=RecipientImportJob.succeeded_rows + succeeded,
+                failed_rows=RecipientImportJob.failed_rows + failed,
+                errors=RecipientImportJob.errors.op("||")(cast(errors, JSONB)),
+                updated_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def mark_finished(
+        self,
+        db: AsyncSession,
+        *,
+        job_id: UUID,
+        status: RecipientImportStatus,
+        errors: Optional[List[dict]] = None
+    ) -> None:
+        """
+        ジョブを終了状態にする
+
+        Note:
+            - トランザクション管理は呼び出し側で行う
+        """
+        values = {
+            "status": status,
+            "updated_at": func.now(),
+            "finished_at": func.now(),
+        }
+        if errors:
+            values["errors"] = RecipientImportJob.errors.op("||")(cast(errors, JSONB))
+        await db.execute(
+            update(RecipientImportJob)
+            .where(RecipientImportJob.id == job_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+
+crud_recipient_import_job = CRUDRecipientImportJob()
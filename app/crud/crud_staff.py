@@ -2,7 +2,7 @@ import uuid
 import os
 from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, update
 from sqlalchemy.orm import selectinload
 
 from app.core.security import get_password_hash
@@ -177,4 +177,40 @@ class CRUDStaff:
         return staff
 
 
+    async def bulk_soft_delete(
+        self,
+        db: AsyncSession,
+        *,
+        staff_ids: list[uuid.UUID],
+        deleted_by: uuid.UUID
+    ) -> int:
+        """
+        複数スタッフを1回のUPDATEで論理削除
+
+        Args:
+            db: データベースセッション
+            staff_ids: 削除対象スタッフIDのリスト
+            deleted_by: 削除実行者ID
+
+        Returns:
+            更新件数
+
+        Note:
+            - トランザクション管理は呼び出し側で行う
+        """
+        if not staff_ids:
+            return 0
+
+        result = await db.execute(
+            update(Staff)
+            .where(Staff.id.in_(staff_ids))
+            .values(
+                is_deleted=True,
+                deleted_at=datetime.now(timezone.utc),
+                deleted_by=deleted_by,
+            )
+            .execution_options(synchronize_session="fetch")
+        )
+        return result.rowcount
+
 staff = CRUDStaff()
\ No newline at end of file
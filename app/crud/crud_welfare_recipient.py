@@ -1,9 +1,10 @@
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from uuid import uuid4, UUID
 import logging
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert
 
 from app.crud.base import CRUDBase
 from app.models.welfare_recipient import (
@@ -14,6 +15,7 @@ from app.models.welfare_recipient import (
     DisabilityDetail,
     OfficeWelfareRecipient
 )
+from app.models.assessment import MedicalMatters
 from app.schemas.welfare_recipient import (
     WelfareRecipientCreate,
     WelfareRecipientUpdate,
@@ -23,6 +25,71 @@ from app.schemas.welfare_recipient import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class WelfareRecipientBulkRow:
+    """利用者1名分の一括作成データ（各テーブルの列値）"""
+    recipient: Dict[str, Any]
+    detail: Optional[Dict[str, Any]] = None
+    emergency_contacts: List[Dict[str, Any]] = field(default_factory=list)
+    disability_status: Optional[Dict[str, Any]] = None
+    disability_details: List[Dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def from_registration(cls, registration_data: UserRegistrationRequest) -> "WelfareRecipientBulkRow":
+        """利用者登録リクエストから一括作成データを組み立てる"""
+        basic_info = registration_data.basic_info
+        contact_address = registration_data.contact_address
+        disability_info = registration_data.disability_info
+
+        return cls(
+            recipient={
+                "first_name": basic_info.firstName,
+                "last_name": basic_info.lastName,
+                "first_name_furigana": basic_info.firstNameFurigana,
+                "last_name_furigana": basic_info.lastNameFurigana,
+                "birth_day": basic_info.birthDay,
+                "gender": basic_info.gender,
+            },
+            detail={
+                "address": contact_address.address,
+                "form_of_residence": contact_address.formOfResidence,
+                "form_of_residence_other_text": contact_address.formOfResidenceOtherText,
+                "means_of_transportation": contact_address.meansOfTransportation,
+                "means_of_transportation_other_text": contact_address.meansOfTransportationOtherText,
+                "tel": contact_address.tel,
+            },
+            emergency_contacts=[
+                {
+                    "first_name": contact_data.first_name,
+                    "last_name": contact_data.last_name,
+                    "first_name_furigana": contact_data.first_name_furigana,
+                    "last_name_furigana": contact_data.last_name_furigana,
+                    "relationship": contact_data.relationship,
+                    "tel": contact_data.tel,
+                    "address": contact_data.address,
+                    "notes": contact_data.notes,
+                    "priority": contact_data.priority,
+                }
+                for contact_data in registration_data.emergency_contacts
+            ],
+            disability_status={
+                "disability_or_disease_name": disability_info.disabilityOrDiseaseName,
+                "livelihood_protection": disability_info.livelihoodProtection,
+                "special_remarks": disability_info.specialRemarks,
+            },
+            disability_details=[
+                {
+                    "category": detail_data.category,
+                    "grade_or_level": detail_data.grade_or_level,
+                    "physical_disability_type": detail_data.physical_disability_type,
+                    "physical_disability_type_other_text": detail_data.physical_disability_type_other_text,
+                    "application_status": detail_data.application_status,
+                }
+                for detail_data in registration_data.disability_details
+            ],
+        )
+
+
 class CRUDWelfareRecipient(CRUDBase[WelfareRecipient, WelfareRecipientCreate, WelfareRecipientUpdate]):
 
     async def get_with_office_associations(self, db: AsyncSession, recipient_id: UUID) -> Optional[WelfareRecipient]:
@@ -51,6 +118,50 @@ class CRUDWelfareRecipient(CRUDBase[WelfareRecipient, WelfareRecipientCreate, We
         result = await db.execute(stmt)
         return result.scalars().first()
 
+    async def get_assessment_aggregate(
+        self,
+        db: AsyncSession,
+        recipient_id: UUID
+    ) -> Optional[Tuple[WelfareRecipient, Optional[UUID]]]:
+        """
+        アセスメント画面の表示データ一式を1回のSELECTで取得
+
+        家族構成・サービス利用歴・医療基本情報（通院歴を含む）・就労関係・課題分析を
+        LEFT OUTER JOINで読み込み、権限確認用に所属事業所IDも同じ文で取得する。
+        1利用者分の件数は少ないため、コレクション同士のJOINで行が掛け合わされても
+        往復回数を減らす方が速い。
+
+        Returns:
+            (利用者, 所属事業所ID)。利用者が存在しない場合はNone。
+            事業所に所属していない場合、所属事業所IDはNone。
+            コレクションの並び順は保証しないため、表示順は呼び出し側で整える。
+        """
+        office_id = (
+            select(OfficeWelfareRecipient.office_id)
+            .where(OfficeWelfareRecipient.welfare_recipient_id == WelfareRecipient.id)
+            .limit(1)
+            .correlate(WelfareRecipient)
+            .scalar_subquery()
+        )
+        stmt = (
+            select(WelfareRecipient, office_id)
+            .where(WelfareRecipient.id == recipient_id)
+            .options(
+                joinedload(WelfareRecipient.family_members),
+                joinedload(WelfareRecipient.service_history),
+                joinedload(WelfareRecipient.medical_matters).joinedload(MedicalMatters.hospital_visits),
+                joinedload(WelfareRecipient.employment_related),
+                joinedload(WelfareRecipient.issue_analysis),
+            )
+            # 同一セッションで読み込み済みの利用者でも関連データを取り直す
+            .execution_options(populate_existing=True)
+        )
+        result = await db.execute(stmt)
+        row = result.unique().first()
+        if row is None:
+            return None
+        return row[0], row[1]
+
     async def get_by_office(self, db: AsyncSession, office_id: UUID, skip: int = 0, limit: int = 100) -> List[WelfareRecipient]:
         """Get all welfare recipients for a specific office"""
         stmt = (
@@ -67,70 +178,121 @@ class CRUDWelfareRecipient(CRUDBase[WelfareRecipient, WelfareRecipientCreate, We
         result = await db.execute(stmt)
         return list(result.scalars().all())
 
-    async def create_related_data(
+    async def bulk_create_with_related(
         self,
         db: AsyncSession,
         *,
-        welfare_recipient: WelfareRecipient,
-        registration_data: UserRegistrationRequest,
+        rows: Sequence[WelfareRecipientBulkRow],
         office_id: UUID
-    ) -> None:
-        """Create related data for a welfare recipient."""
+    ) -> List[UUID]:
+        """
+        複数の利用者を関連データごと一括作成
 
-        contact_address = registration_data.contact_address
-        detail = ServiceRecipientDetail(
-            welfare_recipient_id=welfare_recipient.id,
-            address=contact_address.address,
-            form_of_residence=contact_address.formOfResidence,
-            form_of_residence_other_text=contact_address.formOfResidenceOtherText,
-            means_of_transportation=contact_address.meansOfTransportation,
-            means_of_transportation_other_text=contact_address.meansOfTransportationOtherText,
-            tel=contact_address.tel
-        )
-        db.add(detail)
-        await db.flush()
+        利用者IDは事前に採番し、各テーブルを複数行INSERT 1文ずつで作成する。
+        詳細情報・障害情報のIDは INSERT ... RETURNING で受け取り、子テーブルに渡す。
 
-        for contact_data in registration_data.emergency_contacts:
-            emergency_contact = EmergencyContact(
-                service_recipient_detail_id=detail.id,
-                first_name=contact_data.first_name,
-                last_name=contact_data.last_name,
-                first_name_furigana=contact_data.first_name_furigana,
-                last_name_furigana=contact_data.last_name_furigana,
-                relationship=contact_data.relationship,
-                tel=contact_data.tel,
-                address=contact_data.address,
-                notes=contact_data.notes,
-                priority=contact_data.priority
-            )
-            db.add(emergency_contact)
+        Args:
+            db: データベースセッション
+            rows: 利用者ごとの作成データ
+            office_id: 所属事務所ID
 
-        disability_info = registration_data.disability_info
-        disability_status = DisabilityStatus(
-            welfare_recipient_id=welfare_recipient.id,
-            disability_or_disease_name=disability_info.disabilityOrDiseaseName,
-            livelihood_protection=disability_info.livelihoodProtection,
-            special_remarks=disability_info.specialRemarks
+        Returns:
+            作成された利用者IDのリスト（rowsと同じ順序）
+
+        Note:
+            - commitしない（トランザクション管理は呼び出し側で行う）
+        """
+        if not rows:
+            return []
+
+        recipient_ids = [row.recipient.get("id") or uuid4() for row in rows]
+        await db.execute(
+            insert(WelfareRecipient).values([
+                {**row.recipient, "id": recipient_id}
+                for recipient_id, row in zip(recipient_ids, rows)
+            ])
         )
-        db.add(disability_status)
-        await db.flush()
+        await self._bulk_create_office_associations(
+            db,
+            recipient_ids=recipient_ids,
+            office_id=office_id
+        )
+        await self._bulk_create_related(
+            db,
+            rows_by_recipient_id=dict(zip(recipient_ids, rows))
+        )
+        return recipient_ids
 
-        for detail_data in registration_data.disability_details:
-            disability_detail = DisabilityDetail(
-                disability_status_id=disability_status.id,
-                category=detail_data.category,
-                grade_or_level=detail_data.grade_or_level,
-                physical_disability_type=detail_data.physical_disability_type,
-                physical_disability_type_other_text=detail_data.physical_disability_type_other_text,
-                application_status=detail_data.application_status
+    async def _bulk_create_office_associations(
+        self,
+        db: AsyncSession,
+        *,
+        recipient_ids: Sequence[UUID],
+        office_id: UUID
+    ) -> None:
+        await db.execute(
+            insert(OfficeWelfareRecipient).values([
+                {
+                    "id": uuid4(),
+                    "welfare_recipient_id": recipient_id,
+                    "office_id": office_id,
+                }
+                for recipient_id in recipient_ids
+            ])
+        )
+
+    async def _bulk_create_related(
+        self,
+        db: AsyncSession,
+        *,
+        rows_by_recipient_id: Dict[UUID, WelfareRecipientBulkRow]
+    ) -> None:
+        """詳細・緊急連絡先・障害情報・障害詳細をテーブルごとに1文で作成"""
+        # 詳細情報 → 緊急連絡先
+        detail_rows = [
+            {**row.detail, "welfare_recipient_id": recipient_id}
+            for recipient_id, row in rows_by_recipient_id.items()
+            if row.detail
+        ]
+        if detail_rows:
+            result = await db.execute(
+                insert(ServiceRecipientDetail)
+                .values(detail_rows)
+                .returning(ServiceRecipientDetail.id, ServiceRecipientDetail.welfare_recipient_id)
             )
-            db.add(disability_detail)
+            detail_ids = {row.welfare_recipient_id: row.id for row in result}
+
+            contact_rows = [
+                {**contact, "service_recipient_detail_id": detail_ids[recipient_id]}
+                for recipient_id, row in rows_by_recipient_id.items()
+                if recipient_id in detail_ids
+                for contact in row.emergency_contacts
+            ]
+            if contact_rows:
+                await db.execute(insert(EmergencyContact).values(contact_rows))
+
+        # 障害情報 → 障害詳細
+        status_rows = [
+            {**row.disability_status, "welfare_recipient_id": recipient_id}
+            for recipient_id, row in rows_by_recipient_id.items()
+            if row.disability_status
+        ]
+        if status_rows:
+            result = await db.execute(
+                insert(DisabilityStatus)
+                .values(status_rows)
+                .returning(DisabilityStatus.id, DisabilityStatus.welfare_recipient_id)
+            )
+            status_ids = {row.welfare_recipient_id: row.id for row in result}
 
-        office_association = OfficeWelfareRecipient(
-            welfare_recipient_id=welfare_recipient.id,
-            office_id=office_id
-        )
-        db.add(office_association)
+            detail_rows = [
+                {**detail, "disability_status_id": status_ids[recipient_id]}
+                for recipient_id, row in rows_by_recipient_id.items()
+                if recipient_id in status_ids
+                for detail in row.disability_details
+            ]
+            if detail_rows:
+                await db.execute(insert(DisabilityDetail).values(detail_rows))
 
     async def search_by_name(self, db: AsyncSession, office_id: UUID, search_term: str, skip: int = 0, limit: int = 100) -> List[WelfareRecipient]:
         """Search welfare recipients by name (supports both kanji and furigana)"""
@@ -202,106 +364,58 @@ class CRUDWelfareRecipient(CRUDBase[WelfareRecipient, WelfareRecipientCreate, We
         - カレンダーイベントが存在しない利用者の削除
         - テストデータのクリーンアップ
         - Google Calendar との同期が不要な場合
+
+        配下のテーブル（事務所紐付け・詳細・障害情報・支援計画・アセスメント・カレンダー）は
+        外部キーの ON DELETE CASCADE で削除されるため、DELETE 1文で完結する。
         """
-        from sqlalchemy import delete as sql_delete
+        deleted_count = await self.bulk_delete_with_cascade(
+            db,
+            recipient_ids=[recipient_id]
+        )
 
-        try:
-            # Delete related records first to avoid foreign key constraint violations
+        # 削除された行数が0の場合はFalse
+        return deleted_count > 0
 
-            # 1. Delete office associations (office_welfare_recipients)
-            await db.execute(
-                sql_delete(OfficeWelfareRecipient).where(
-                    OfficeWelfareRecipient.welfare_recipient_id == recipient_id
-                )
-            )
+    async def bulk_delete_with_cascade(
+        self,
+        db: AsyncSession,
+        *,
+        recipient_ids: List[UUID],
+        auto_commit: bool = True
+    ) -> int:
+        """複数の利用者を配下のデータごと1回のDELETEで削除
 
-            # 2. Delete support plan cycles and their related data
-            from app.models.support_plan_cycle import SupportPlanCycle, SupportPlanStatus, PlanDeliverable
+        事務所退会時やE2Eテストのクリーンアップなど、まとめて削除する場合に使用する。
+        `delete_with_cascade` と同様にGoogle Calendar側のイベントは削除しない。
 
-            # Get all support plan cycles for this recipient
-            cycles_stmt = select(SupportPlanCycle.id).where(
-                SupportPlanCycle.welfare_recipient_id == recipient_id
-            )
-            cycles_result = await db.execute(cycles_stmt)
-            cycle_ids = [row[0] for row in cycles_result.fetchall()]
-
-            if cycle_ids:
-                # Delete plan deliverables first (foreign key constraint)
-                await db.execute(
-                    sql_delete(PlanDeliverable).where(
-                        PlanDeliverable.plan_cycle_id.in_(cycle_ids)
-                    )
-                )
-
-                # Delete support plan statuses
-                await db.execute(
-                    sql_delete(SupportPlanStatus).where(
-                        SupportPlanStatus.plan_cycle_id.in_(cycle_ids)
-                    )
-                )
-
-            # Delete support plan cycles
-            await db.execute(
-                sql_delete(SupportPlanCycle).where(
-                    SupportPlanCycle.welfare_recipient_id == recipient_id
-                )
-            )
+        Args:
+            db: データベースセッション
+            recipient_ids: 削除する利用者IDのリスト
+            auto_commit: Trueの場合はcommitする（Falseの場合は呼び出し側でcommitする）
 
-            # 3. Delete emergency contacts (via service_recipient_detail)
-            detail_stmt = select(ServiceRecipientDetail.id).where(
-                ServiceRecipientDetail.welfare_recipient_id == recipient_id
-            )
-            detail_result = await db.execute(detail_stmt)
-            detail_id_row = detail_result.fetchone()
-
-            if detail_id_row:
-                detail_id = detail_id_row[0]
-                await db.execute(
-                    sql_delete(EmergencyContact).where(
-                        EmergencyContact.service_recipient_detail_id == detail_id
-                    )
-                )
-
-            # 4. Delete service recipient detail
-            await db.execute(
-                sql_delete(ServiceRecipientDetail).where(
-                    ServiceRecipientDetail.welfare_recipient_id == recipient_id
-                )
-            )
+        Returns:
+            削除された利用者数
+        """
+        from sqlalchemy import delete as sql_delete
 
-            # 5. Delete disability details (via disability_status)
-            disability_status_stmt = select(DisabilityStatus.id).where(
-                DisabilityStatus.welfare_recipient_id == recipient_id
-            )
-            disability_status_result = await db.execute(disability_status_stmt)
-            disability_status_id_row = disability_status_result.fetchone()
-
-            if disability_status_id_row:
-                disability_status_id = disability_status_id_row[0]
-                await db.execute(
-                    sql_delete(DisabilityDetail).where(
-                        DisabilityDetail.disability_status_id == disability_status_id
-                    )
-                )
-
-            # 6. Delete disability status
-            await db.execute(
-                sql_delete(DisabilityStatus).where(
-                    DisabilityStatus.welfare_recipient_id == recipient_id
-                )
-            )
+        if not recipient_ids:
+            return 0
 
-            # 7. Finally, delete the welfare recipient
-            stmt = sql_delete(WelfareRecipient).where(WelfareRecipient.id == recipient_id)
-            result = await db.execute(stmt)
+        try:
+            result = await db.execute(
+                sql_delete(WelfareRecipient)
+                .where(WelfareRecipient.id.in_(recipient_ids))
+                .execution_options(synchronize_session="fetch")
+            )
 
-            await db.commit()
+            if auto_commit:
+                await db.commit()
 
-            # 削除された行数が0の場合はFalse
-            return result.rowcount > 0
+            return int(result.rowcount or 0)
 
         except Exception as e:
-            await db.rollback()
+            if auto_commit:
+                await db.rollback()
             raise e
 
     async def _create_initial_support_plan(self, db: AsyncSession, recipient_id: UUID, office_id: UUID) -> None:
@@ -0,0 +1,193 @@
+"""
+キーセットページネーションと件数取得の共通処理
+
+- encode_cursor / decode_cursor: (作成日時, id) を不透明なカーソル文字列に変換する
+- count_rows: 一覧の総件数を取得する
+    - exact: COUNT(*)（cache_key 指定時は結果をTTL付きでプロセス内に保持）
+    - estimated: テーブル全体なら pg_class.reltuples、条件付きなら実行計画の推定行数
+    - auto: 推定件数が閾値未満なら exact、それ以上なら推定値
+
+OFFSETはページが進むほど読み飛ばす行が増えるため、管理画面の一覧は
+直前のページ末尾の (created_at, id) より後ろを索引で辿るキーセット方式で取得する。
+"""
+import base64
+import datetime
+import json
+import time
+import uuid
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Hashable, Literal, Optional, Tuple
+
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.core.config import settings
+
+CountMode = Literal["exact", "estimated", "auto"]
+
+
+def encode_cursor(sort_value: datetime.datetime, row_id: uuid.UUID) -> str:
+    """ページ末尾の行のソートキーとIDからカーソル文字列を作る"""
+    payload = json.dumps([sort_value.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime.datetime, uuid.UUID]:
+    """
+    カーソル文字列を (ソートキー, ID) に戻す
+
+    Raises:
+        ValueError: 不正なカーソル文字列の場合
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.datetime.fromisoformat(sort_value), uuid.UUID(row_id)
+    except (TypeError, ValueError, UnicodeError) as e:
+        raise ValueError("invalid cursor") from e
+
+
+class CountCache:
+    """TTL付き・件数上限付きの 一覧の条件 → 正確な件数 キャッシュ"""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_entries: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, tuple[int, float]]" = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(self, key: Hashable) -> Optional[int]:
+        """有効期限内の件数を返す。未登録・期限切れの場合はNone"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            count, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return count
+
+    def set(self, key: Hashable, count: int) -> None:
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[key] = (count, self._clock() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# アプリケーション全体で共有する件数キャッシュ
+count_cache = CountCache(ttl_seconds=settings.ADMIN_LIST_COUNT_CACHE_TTL_SECONDS)
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) <statement>（バインドパラメータは元の文と同じ規則で処理される）"""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def estimate_row_count(db: AsyncSession, stmt: Select) -> int:
+    """
+    実行計画の推定行数を返す（文は実行しない）
+
+    統計情報に基づく推定のため、正確な件数が不要な大量データの一覧表示に使う。
+    """
+    result = await db.execute(_Explain(stmt))
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def approximate_table_count(db: AsyncSession, table_name: str) -> Optional[int]:
+    """
+    pg_class.reltuples（直近のVACUUM/ANALYZE時点の行数）を返す
+
+    Returns:
+        推定行数。一度もANALYZEされていない場合はNone
+    """
+    result = await db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+        {"table_name": table_name},
+    )
+    reltuples = result.scalar()
+    if reltuples is None or reltuples < 0:
+        return None
+    return int(reltuples)
+
+
+async def count_rows(
+    db: AsyncSession,
+    stmt: Select,
+    *,
+    mode: CountMode = "exact",
+    table_name: Optional[str] = None,
+    cache_key: Optional[Hashable] = None
+) -> Tuple[int, bool]:
+    """
+    一覧クエリの総件数を取得
+
+    Args:
+        db: データベースセッション
+        stmt: 件数を数える対象のSELECT（ORDER BY / LIMITなし）
+        mode: exact / estimated / auto（モジュールdocstring参照）
+        table_name: 条件なしでテーブル全体を数える場合のテーブル名（reltuplesを使う）
+        cache_key: 指定時は正確な件数を count_cache に保持する
+
+    Returns:
+        (件数, 推定値かどうか)
+    """
+    if mode != "exact":
+        estimate = None
+        if table_name is not None:
+            estimate = await approximate_table_count(db, table_name)
+        if estimate is None:
+            estimate = await estimate_row_count(db, stmt)
+        if mode == "estimated" or estimate >= settings.ADMIN_LIST_EXACT_COUNT_THRESHOLD:
+            return estimate, True
+
+    if cache_key is not None:
+        cached = count_cache.get(cache_key)
+        if cached is not None:
+            return cached, False
+
+    result = await db.execute(select(func.count()).select_from(stmt.subquery()))
+    total = result.scalar() or 0
+    if cache_key is not None:
+        count_cache.set(cache_key, total)
+    return total, False
@@ -0,0 +1,154 @@
+"""
+SQLの実行件数・DB時間の計測
+
+- track_queries(): このコンテキスト内で実行されたSQLの件数と合計時間を QueryStats に集計する
+  （入れ子にした場合は外側にも加算される。リクエスト単位の集計とテストの上限チェックを併用できる）
+- 閾値（DB_SLOW_QUERY_MS）以上かかったSQLは、リテラルを ? に置き換えた形で警告ログに出す
+- 同じ形のSQLが DB_N_PLUS_ONE_THRESHOLD 回以上実行されたリクエストはN+1の疑いとして警告する
+- トレースの記録中は、SQLごとに子スパン（db.statement は正規化したSQL）を作る
+
+集計先は contextvar で受け渡す。SQLAlchemyの非同期エンジンは呼び出し元のコンテキストで
+イベントを実行するため、リクエスト処理中に発行したSQLはそのリクエストの QueryStats に入る。
+"""
+import logging
+import re
+import time
+import weakref
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple, Union
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.tracing import Span, SpanKind, tracer
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAMETER = re.compile(r"%\(\w+\)s|%s|\$\d+")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(statement: str) -> str:
+    """リテラル・バインド変数を ? に、IN (?, ?, ...) を IN (?) にまとめ、空白を詰める"""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAMETER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _VALUE_LIST.sub("(?)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+@dataclass
+class QueryStats:
+    """SQLの実行件数・合計時間（秒）・形ごとの実行回数"""
+
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+    parent: Optional["QueryStats"] = field(default=None, repr=False)
+
+    def record(self, statement: str, duration: float) -> None:
+        stats = self
+        while stats is not None:
+            stats.count += 1
+            stats.duration += duration
+            stats.statements[statement] += 1
+            stats = stats.parent
+
+    def repeated_statements(self, threshold: int) -> List[Tuple[str, int]]:
+        """threshold 回以上実行された形のSQL（回数の多い順）"""
+        return [(sql, count) for sql, count in self.statements.most_common() if count >= threshold]
+
+    def summary(self, limit: int = 10) -> str:
+        lines = [f"{self.count} queries, {self.duration * 1000:.1f}ms"]
+        for sql, count in self.statements.most_common(limit):
+            lines.append(f"  {count}x {sql[:200]}")
+        return "\n".join(lines)
+
+
+_instrumented_engines: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("db_query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """ブロック内で実行されたSQLを集計する"""
+    stats = QueryStats(parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def warn_repeated_statements(stats: QueryStats, *, label: str) -> None:
+    """同じ形のSQLが閾値以上実行されていればN+1の疑いとして警告する"""
+    threshold = settings.DB_N_PLUS_ONE_THRESHOLD
+    if threshold <= 0:
+        return
+    for sql, count in stats.repeated_statements(threshold):
+        logger.warning("possible N+1 in %s: %dx %s", label, count, sql[:500])
+
+
+def install_query_instrumentation(engine: Union[AsyncEngine, Engine]) -> None:
+    """エンジンにSQLの計測イベントを登録する"""
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    if sync_engine in _instrumented_engines:
+        return
+    _instrumented_engines.add(sync_engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+        conn.info.setdefault("query_spans", []).append(
+            tracer.create_child_span("db.query", kind=SpanKind.CLIENT)
+        )
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        started = conn.info.get("query_started_at")
+        if not started:
+            return
+        duration = time.perf_counter() - started.pop()
+        span = _pop_span(conn)
+
+        stats = _current_stats.get()
+        slow = duration * 1000 >= settings.DB_SLOW_QUERY_MS
+        if stats is None and not slow and span is None:
+            return
+
+        normalized = normalize_sql(statement)
+        if span is not None:
+            span.name = normalized.split(" ", 1)[0].upper() or "db.query"
+            span.set_attribute("db.system", "postgresql")
+            span.set_attribute("db.statement", normalized[:2000])
+            tracer.end_span(span)
+        if stats is not None:
+            stats.record(normalized, duration)
+        if slow:
+            logger.warning("slow query %.1fms: %s", duration * 1000, normalized[:1000])
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _handle_error(exception_context) -> None:
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_started_at"):
+            conn.info["query_started_at"].pop()
+            span = _pop_span(conn)
+            if span is not None:
+                span.record_exception(exception_context.original_exception)
+                tracer.end_span(span)
+
+
+def _pop_span(conn) -> Optional[Span]:
+    spans = conn.info.get("query_spans")
+    return spans.pop() if spans else None
@@ -0,0 +1,238 @@
+"""
+DBエンジン・コネクションプールの設定
+
+サーバーレスPostgres（Neon）向けに、プロセスごとのプール設定を環境変数から決める。
+
+- プールサイズ: DB全体の接続数予算（DB_CONNECTION_BUDGET）を
+  インスタンス数 × ワーカー数で割り、バッチ用エンジンの分を引いた残りをリクエスト用に使う
+- 生存確認: 取得のたびのpre-pingではなく、一定時間（DB_IDLE_PING_SECONDS）以上
+  プールで待機していた接続だけを取得時に確認する
+- プリペアドステートメント: psycopg の prepare_threshold / prepared_max を設定する
+  （PgBouncerのtransactionモードで問題がある場合は DB_PREPARE_THRESHOLD=off）
+- 取得待ち時間: app.core.metrics.DB_POOL_CHECKOUT_WAIT_SECONDS に記録する
+- 使用中・超過・待機中の接続数: /metrics の収集時にエンジンごとのプールから読む
+
+環境変数を直接読むのは、Alembicなど設定（app.core.config）を読み込まない経路からも
+app.db.session を使うため。
+"""
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.metrics import DB_POOL_CHECKOUT_WAIT_SECONDS, REGISTRY, Gauge, LabelValues
+
+logger = logging.getLogger(__name__)
+
+# 取得待ちがこの秒数を超えたら警告ログを出す（プール枯渇の兆候）
+SLOW_CHECKOUT_WARNING_SECONDS = 1.0
+
+# create_pooled_engine で作ったエンジン（名前 → エンジン）。プールのゲージの収集対象
+_metered_engines: Dict[str, AsyncEngine] = {}
+
+
+def _int_env(environ: Mapping[str, str], key: str, default: int) -> int:
+    raw_value = environ.get(key)
+    return int(raw_value) if raw_value not in (None, "") else default
+
+
+def _optional_int_env(environ: Mapping[str, str], key: str) -> Optional[int]:
+    raw_value = environ.get(key)
+    return int(raw_value) if raw_value not in (None, "") else None
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """プール設定の元になる値（環境変数から読む）"""
+
+    # DB側で許容する接続数のうち、このアプリ全体で使ってよい数
+    connection_budget: int = 50
+    # 1インスタンスあたりのワーカープロセス数（gunicorn -w と同じ値）
+    workers: int = 1
+    # アプリのインスタンス（コンテナ）数
+    instances: int = 1
+    # スケジューラー用エンジンの接続数（1プロセスあたり）
+    batch_pool_size: int = 3
+    # 明示指定（未指定時は接続数予算から算出）
+    pool_size: Optional[int] = None
+    max_overflow: Optional[int] = None
+    pool_timeout: int = 30
+    # 接続を作り直す間隔（秒）。Neonのauto-suspendより短くする
+    pool_recycle: int = 300
+    # この秒数以上待機していた接続は取得時に生存確認する（0で毎回）
+    idle_ping_seconds: int = 60
+    # 同じSQLをこの回数実行したらサーバー側でプリペアする（Noneで無効）
+    prepare_threshold: Optional[int] = 5
+    # 接続ごとに保持するプリペアドステートメント数
+    prepared_max: int = 100
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] = os.environ) -> "PoolConfig":
+        raw_threshold = environ.get("DB_PREPARE_THRESHOLD", "").strip().lower()
+        if raw_threshold in ("off", "none", "disable"):
+            prepare_threshold = None
+        else:
+            prepare_threshold = int(raw_threshold) if raw_threshold else cls.prepare_threshold
+
+        return cls(
+            connection_budget=_int_env(environ, "DB_CONNECTION_BUDGET", cls.connection_budget),
+            workers=_int_env(environ, "WEB_CONCURRENCY", cls.workers),
+            instances=_int_env(environ, "DB_APP_INSTANCES", cls.instances),
+            batch_pool_size=_int_env(environ, "DB_BATCH_POOL_SIZE", cls.batch_pool_size),
+            pool_size=_optional_int_env(environ, "DB_POOL_SIZE"),
+            max_overflow=_optional_int_env(environ, "DB_MAX_OVERFLOW"),
+            pool_timeout=_int_env(environ, "DB_POOL_TIMEOUT_SECONDS", cls.pool_timeout),
+            pool_recycle=_int_env(environ, "DB_POOL_RECYCLE_SECONDS", cls.pool_recycle),
+            idle_ping_seconds=_int_env(environ, "DB_IDLE_PING_SECONDS", cls.idle_ping_seconds),
+            prepare_threshold=prepare_threshold,
+            prepared_max=_int_env(environ, "DB_PREPARED_MAX", cls.prepared_max),
+        )
+
+
+@dataclass(frozen=True)
+class PoolSizing:
+    pool_size: int
+    max_overflow: int
+
+
+def request_pool_sizing(config: PoolConfig) -> PoolSizing:
+    """
+    リクエスト用エンジンのプールサイズ
+
+    1プロセスの持ち分（予算 ÷ (インスタンス数 × ワーカー数)）からバッチ用を引いた残りを、
+    常駐（pool_size）と一時的な超過分（max_overflow）に半分ずつ割り当てる。
+    """
+    per_process = config.connection_budget // max(config.workers * config.instances, 1)
+    available = max(per_process - config.batch_pool_size, 2)
+    pool_size = config.pool_size if config.pool_size is not None else max(available // 2, 1)
+    max_overflow = (
+        config.max_overflow if config.max_overflow is not None else max(available - pool_size, 0)
+    )
+    return PoolSizing(pool_size=pool_size, max_overflow=max_overflow)
+
+
+def batch_pool_sizing(config: PoolConfig) -> PoolSizing:
+    """スケジューラー用エンジンのプールサイズ（超過なしの固定数）"""
+    return PoolSizing(pool_size=max(config.batch_pool_size, 1), max_overflow=0)
+
+
+def timed_pool_class(engine_name: str) -> type:
+    """接続の取得待ち時間を engine_name ラベルで記録するプールクラス"""
+
+    class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+        def _do_get(self):
+            started_at = time.perf_counter()
+            try:
+                return super()._do_get()
+            finally:
+                waited = time.perf_counter() - started_at
+                DB_POOL_CHECKOUT_WAIT_SECONDS.observe(waited, engine_name)
+                if waited >= SLOW_CHECKOUT_WARNING_SECONDS:
+                    logger.warning(
+                        "db pool checkout waited %.3fs (engine=%s, checked_out=%s)",
+                        waited,
+                        engine_name,
+                        self.checkedout(),
+                    )
+
+    TimedAsyncAdaptedQueuePool.__name__ = f"TimedAsyncAdaptedQueuePool[{engine_name}]"
+    return TimedAsyncAdaptedQueuePool
+
+
+def install_idle_liveness_check(engine: AsyncEngine, *, idle_seconds: int) -> None:
+    """
+    一定時間以上プールで待機していた接続だけ、取得時に SELECT 1 で生存確認する
+
+    失敗した接続は DisconnectionError でプールに破棄させ、新しい接続で取得をやり直す。
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "checkin")
+    def _record_checkin(dbapi_connection, connection_record) -> None:
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(sync_engine, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy) -> None:
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        try:
+            sync_engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            raise exc.DisconnectionError(f"idle connection failed liveness check: {type(e).__name__}") from e
+
+
+def install_prepared_statement_cache(engine: AsyncEngine, *, prepared_max: int) -> None:
+    """psycopg の接続ごとのプリペアドステートメント保持数を設定する"""
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_prepared_max(dbapi_connection, connection_record) -> None:
+        driver_connection = getattr(dbapi_connection, "driver_connection", dbapi_connection)
+        if hasattr(driver_connection, "prepared_max"):
+            driver_connection.prepared_max = prepared_max
+
+
+def _pool_gauge_values(read) -> Dict[LabelValues, float]:
+    return {(name,): read(engine.sync_engine.pool) for name, engine in list(_metered_engines.items())}
+
+
+REGISTRY.register(Gauge(
+    "db_pool_connections_in_use",
+    "Connections currently checked out from the SQLAlchemy pool",
+    label_names=("engine",),
+    callback=lambda: _pool_gauge_values(lambda pool: pool.checkedout()),
+))
+
+REGISTRY.register(Gauge(
+    "db_pool_connections_idle",
+    "Connections currently idle in the SQLAlchemy pool",
+    label_names=("engine",),
+    callback=lambda: _pool_gauge_values(lambda pool: pool.checkedin()),
+))
+
+# QueuePool.overflow() は pool_size 分だけ負の値から始まるため、0未満は0として出す
+REGISTRY.register(Gauge(
+    "db_pool_overflow_connections",
+    "Connections opened beyond pool_size (max_overflow in use)",
+    label_names=("engine",),
+    callback=lambda: _pool_gauge_values(lambda pool: max(pool.overflow(), 0)),
+))
+
+REGISTRY.register(Gauge(
+    "db_pool_max_connections",
+    "Configured pool_size + max_overflow",
+    label_names=("engine",),
+    callback=lambda: _pool_gauge_values(lambda pool: pool.size() + pool._max_overflow),
+))
+
+
+def create_pooled_engine(
+    url: str,
+    *,
+    name: str,
+    sizing: PoolSizing,
+    config: PoolConfig,
+) -> AsyncEngine:
+    """プール設定・生存確認・取得待ちメトリクスを適用した非同期エンジンを作る"""
+    engine = create_async_engine(
+        url,
+        poolclass=timed_pool_class(name),
+        pool_size=sizing.pool_size,
+        max_overflow=sizing.max_overflow,
+        pool_timeout=config.pool_timeout,
+        pool_recycle=config.pool_recycle,
+        pool_pre_ping=config.idle_ping_seconds <= 0,
+        connect_args={"prepare_threshold": config.prepare_threshold},
+        echo=False,
+    )
+    if config.idle_ping_seconds > 0:
+        install_idle_liveness_check(engine, idle_seconds=config.idle_ping_seconds)
+    if config.prepare_threshold is not None:
+        install_prepared_statement_cache(engine, prepared_max=config.prepared_max)
+    _metered_engines[name] = engine
+    return engine
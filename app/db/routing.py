@@ -0,0 +1,47 @@
+"""
+プライマリ / 読み取りレプリカの振り分け
+
+- 読み取り専用のエンドポイントは deps.get_read_db でレプリカのセッションを受け取る
+- 書き込みを行ったリクエストには、DB_PRIMARY_STICKY_SECONDS 秒間有効な
+  db_primary_until Cookie を付ける（main.py のミドルウェア）
+- Cookieが有効な間は get_read_db もプライマリを返す（自分の書き込みが直後の読み取りで見える）
+
+レプリカ未設定の環境では振り分け・Cookieの付与とも行わない。
+"""
+import time
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState
+
+from app.core.auth_cookie import PRIMARY_STICKY_COOKIE_KEY
+
+
+def track_writes(session: AsyncSession, request: Request) -> None:
+    """セッションが書き込み（flush / INSERT・UPDATE・DELETE文）を行ったら request.state.db_wrote を立てる"""
+
+    def _mark(*_args) -> None:
+        request.state.db_wrote = True
+
+    def _on_execute(orm_execute_state: ORMExecuteState) -> None:
+        if (
+            orm_execute_state.is_insert
+            or orm_execute_state.is_update
+            or orm_execute_state.is_delete
+        ):
+            _mark()
+
+    event.listen(session.sync_session, "after_flush", _mark)
+    event.listen(session.sync_session, "do_orm_execute", _on_execute)
+
+
+def prefers_primary(request: Request) -> bool:
+    """直前の書き込みから DB_PRIMARY_STICKY_SECONDS 秒以内のリクエストか"""
+    raw_value = request.cookies.get(PRIMARY_STICKY_COOKIE_KEY)
+    if not raw_value:
+        return False
+    try:
+        return float(raw_value) > time.time()
+    except ValueError:
+        return False
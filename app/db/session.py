@@ -2,9 +2,11 @@ import os
 import dotenv
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import declarative_base
 
+from app.db.pool import PoolConfig, batch_pool_sizing, create_pooled_engine, request_pool_sizing
+
 dotenv.load_dotenv()
 
 
@@ -40,13 +42,15 @@ ASYNC_DATABASE_URL = _to_async_database_url(ASYNC_DATABASE_URL)
 # For synchronous operations
 SYNC_DATABASE_URL = _to_sync_database_url(ASYNC_DATABASE_URL)
 
-async_engine = create_async_engine(
+# プール設定（app/db/pool.py）: 接続数予算から算出したサイズ・待機時間ベースの生存確認
+POOL_CONFIG = PoolConfig.from_env()
+
+# リクエスト処理用
+async_engine = create_pooled_engine(
     ASYNC_DATABASE_URL,
-    pool_size=20,           # 同時接続数を増やす
-    max_overflow=30,        # プールサイズを超えた場合の追加接続数
-    pool_pre_ping=True,     # 接続の有効性を事前確認
-    pool_recycle=300,       # 5分後に接続を再利用（Neon auto-suspendに対応）
-    echo=False,             # 本番環境ではSQLログを無効化
+    name="request",
+    sizing=request_pool_sizing(POOL_CONFIG),
+    config=POOL_CONFIG,
 )
 AsyncSessionLocal = async_sessionmaker(
     autocommit=False,
@@ -57,12 +61,55 @@ AsyncSessionLocal = async_sessionmaker(
 # Alias for backward compatibility
 async_session_maker = AsyncSessionLocal
 
+# 読み取りレプリカ（任意）
+# 未設定の場合は読み取り専用セッションもプライマリに接続する
+if os.getenv("TESTING") == "1":
+    REPLICA_DATABASE_URL = os.getenv("TEST_DATABASE_REPLICA_URL")
+else:
+    REPLICA_DATABASE_URL = os.getenv("DATABASE_REPLICA_URL")
+
+HAS_READ_REPLICA = bool(REPLICA_DATABASE_URL)
+
+if HAS_READ_REPLICA:
+    replica_async_engine = create_pooled_engine(
+        _to_async_database_url(REPLICA_DATABASE_URL),
+        name="replica",
+        sizing=request_pool_sizing(POOL_CONFIG),
+        config=POOL_CONFIG,
+    )
+else:
+    replica_async_engine = async_engine
+
+# 読み取り専用エンドポイント・バッチの集計用（書き込みには使わない）
+ReadSessionLocal = async_sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=replica_async_engine,
+    expire_on_commit=False
+)
+
+# スケジューラー・バッチ処理用（小さな固定サイズのプール。リクエスト用の接続を奪わない）
+batch_async_engine = create_pooled_engine(
+    ASYNC_DATABASE_URL,
+    name="batch",
+    sizing=batch_pool_sizing(POOL_CONFIG),
+    config=POOL_CONFIG,
+)
+BatchSessionLocal = async_sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=batch_async_engine,
+    expire_on_commit=False
+)
+# バッチの読み取り専用の集計（レプリカがあればレプリカ、なければバッチ用エンジン）
+BatchReadSessionLocal = ReadSessionLocal if HAS_READ_REPLICA else BatchSessionLocal
+
 sync_engine = create_engine(
     SYNC_DATABASE_URL,
-    pool_size=20,
-    max_overflow=30,
+    pool_size=batch_pool_sizing(POOL_CONFIG).pool_size,
+    max_overflow=0,
     pool_pre_ping=True,
-    pool_recycle=300,  # 5分後に接続を再利用（Neon auto-suspendに対応）
+    pool_recycle=POOL_CONFIG.pool_recycle,  # Neon auto-suspendに対応
     echo=False,
 )
 SyncSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
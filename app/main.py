@@ -1,7 +1,7 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from fastapi_csrf_protect.exceptions import CsrfProtectError
@@ -12,10 +12,21 @@ import sys
 import atexit
 import os
 import html
+import secrets
+import time
+from typing import Tuple
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.limiter import limiter  # 新しいファイルからインポート
 from app.core.config import settings # settingsをインポート
 from app.api.v1.api import api_router
+from app.core.auth_cookie import build_primary_sticky_cookie_options
+from app.core.metrics import CONTENT_TYPE_LATEST, REGISTRY, observe_http_request
+from app.core.tracing import SpanKind, configure_tracing, parse_traceparent, shutdown_tracing, start_span
+from app.db.instrumentation import install_query_instrumentation, track_queries, warn_repeated_statements
+from app.db.session import HAS_READ_REPLICA, async_engine, batch_async_engine, replica_async_engine
 from app.scheduler.calendar_sync_scheduler import calendar_sync_scheduler
 from app.scheduler.cleanup_scheduler import cleanup_scheduler
 from app.scheduler import billing_scheduler
@@ -42,11 +53,15 @@ logger = logging.getLogger(__name__)
 logger.info(f"Application starting... (Environment: {settings.ENVIRONMENT}, Log Level: {logging.getLevelName(log_level)})")
 
 app = FastAPI()
+
+# SQLの件数・DB時間の計測、遅いSQLの警告ログ（app/db/instrumentation.py）
+for _engine in (async_engine, replica_async_engine, batch_async_engine):
+    install_query_instrumentation(_engine)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 
-CSRF_EXEMPT_PATHS = {
+CSRF_EXEMPT_PATHS = frozenset({
     "/api/v1/csrf-token",
     "/api/v1/csrf-token/",
     "/api/v1/auth/token",
@@ -61,7 +76,7 @@ CSRF_EXEMPT_PATHS = {
     "/api/v1/auth/refresh-token/",
     "/api/v1/billing/webhook",
     "/api/v1/billing/webhook/",
-}
+})
 
 SECURITY_HEADERS = {
     "Content-Security-Policy": (
@@ -87,34 +102,174 @@ if is_production := os.getenv("ENVIRONMENT") == "production":
     SECURITY_HEADERS["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
 
 
-@app.middleware("http")
-async def security_headers_middleware(request: Request, call_next):
-    """Add baseline security headers to API responses."""
-    response = await call_next(request)
-    for header, value in SECURITY_HEADERS.items():
-        response.headers.setdefault(header, value)
-    return response
+# ASGIの http.response.start に追加するヘッダー（起動時にバイト列へ変換しておく）
+SECURITY_HEADER_ITEMS: Tuple[Tuple[bytes, bytes], ...] = tuple(
+    (header.lower().encode("latin-1"), value.encode("latin-1"))
+    for header, value in SECURITY_HEADERS.items()
+)
+SECURITY_HEADER_NAMES = frozenset(header for header, _ in SECURITY_HEADER_ITEMS)
+
+# 以下のミドルウェアはBaseHTTPMiddleware（@app.middleware("http")）ではなく素のASGIで書く。
+# リクエストごとのタスク・ストリームの生成がなく、StreamingResponse（export.ics など）も
+# バッファせずにそのまま流れる。
+
+
+def security_headers_middleware(app: ASGIApp) -> ASGIApp:
+    """Add baseline security headers to API responses (headers set by the endpoint win)."""
+
+    async def middleware(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await app(scope, receive, send)
+            return
+
+        async def send_with_security_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                present = {header.lower() for header, _ in headers}
+                if present.isdisjoint(SECURITY_HEADER_NAMES):
+                    headers.extend(SECURITY_HEADER_ITEMS)
+                else:
+                    headers.extend(item for item in SECURITY_HEADER_ITEMS if item[0] not in present)
+                message["headers"] = headers
+            await send(message)
+
+        await app(scope, receive, send_with_security_headers)
+
+    return middleware
+
+
+def _primary_sticky_cookie_header() -> Tuple[bytes, bytes]:
+    # Cookie属性の組み立ては Response.set_cookie に任せる
+    response = Response()
+    response.set_cookie(
+        **build_primary_sticky_cookie_options(
+            value=str(int(time.time()) + settings.DB_PRIMARY_STICKY_SECONDS),
+            max_age=settings.DB_PRIMARY_STICKY_SECONDS,
+        )
+    )
+    return response.raw_headers[-1]
+
+
+def primary_sticky_middleware(app: ASGIApp) -> ASGIApp:
+    """書き込みを行ったクライアントの直後の読み取りをプライマリに向ける（app/db/routing.py）"""
+    if not HAS_READ_REPLICA:
+        return app
+
+    async def middleware(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await app(scope, receive, send)
+            return
+
+        # request.state の実体（deps.get_db が db_wrote を立てる）
+        state = scope.setdefault("state", {})
+
+        async def send_with_sticky_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and state.get("db_wrote"):
+                message["headers"] = [*message.get("headers", ()), _primary_sticky_cookie_header()]
+            await send(message)
 
+        await app(scope, receive, send_with_sticky_cookie)
 
-@app.middleware("http")
-async def csrf_cookie_auth_middleware(request: Request, call_next):
+    return middleware
+
+
+def csrf_cookie_auth_middleware(app: ASGIApp) -> ASGIApp:
     """Apply CSRF validation consistently for cookie-authenticated state changes."""
-    if (
-        request.method in {"POST", "PUT", "PATCH", "DELETE"}
-        and request.url.path not in CSRF_EXEMPT_PATHS
-        and request.cookies.get("access_token")
-    ):
-        auth_header = request.headers.get("Authorization")
-        if not (auth_header and auth_header.startswith("Bearer ")):
+
+    async def middleware(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        if (
+            request.method in {"POST", "PUT", "PATCH", "DELETE"}
+            and scope["path"] not in CSRF_EXEMPT_PATHS
+            and request.cookies.get("access_token")
+        ):
+            auth_header = request.headers.get("Authorization")
+            if not (auth_header and auth_header.startswith("Bearer ")):
+                try:
+                    await CsrfProtect().validate_csrf(request)
+                except CsrfProtectError:
+                    response = JSONResponse(
+                        status_code=403,
+                        content={"detail": ja.SECURITY_REQUEST_EXPIRED},
+                    )
+                    await response(scope, receive, send)
+                    return
+
+        await app(scope, receive, send)
+
+    return middleware
+
+
+def query_metrics_middleware(app: ASGIApp) -> ASGIApp:
+    """
+    リクエストごとのSQL件数・DB時間を Server-Timing ヘッダーで返し、N+1の疑いを警告する
+    あわせて処理時間をルートのテンプレート単位で http_request_duration_seconds に記録し、
+    リクエスト全体のトレースのスパンを作る（受け取った traceparent があれば親にする）
+
+    Server-Timing はレスポンスの開始時点の値（ストリーミング中のSQLはヘッダーに含まれない）。
+    処理時間・スパンはレスポンス本文の送信完了まで。
+    """
+
+    async def middleware(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        started_at = time.perf_counter()
+        with start_span(
+            method,
+            kind=SpanKind.SERVER,
+            parent=parse_traceparent(Headers(scope=scope).get("traceparent")),
+            attributes={"http.request.method": method, "url.path": scope["path"]},
+        ) as span, track_queries() as stats:
+
+            async def send_with_server_timing(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    if settings.SERVER_TIMING_ENABLED:
+                        headers = list(message.get("headers", ()))
+                        headers.append((
+                            b"server-timing",
+                            f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"'.encode("latin-1"),
+                        ))
+                        if span.recording:
+                            headers.append((
+                                b"server-timing",
+                                f'traceparent;desc="{span.context.traceparent}"'.encode("latin-1"),
+                            ))
+                        message["headers"] = headers
+                await send(message)
+
             try:
-                await CsrfProtect().validate_csrf(request)
-            except CsrfProtectError:
-                return JSONResponse(
-                    status_code=403,
-                    content={"detail": ja.SECURITY_REQUEST_EXPIRED},
-                )
+                await app(scope, receive, send_with_server_timing)
+            finally:
+                route_path = getattr(scope.get("route"), "path", None)
+                if route_path and span.recording:
+                    span.name = f"{method} {route_path}"
+                span.set_attribute("http.route", route_path)
+                span.set_attribute("http.response.status_code", status_code)
+                span.set_attribute("db.query_count", stats.count)
+                if status_code >= 500:
+                    span.set_error(f"HTTP {status_code}")
+                observe_http_request(method, route_path, status_code, time.perf_counter() - started_at)
+
+        warn_repeated_statements(stats, label=f"{method} {route_path or scope['path']}")
 
-    return await call_next(request)
+    return middleware
+
+
+# 内側から順に追加する（最後に追加したものが最も外側。CORSMiddlewareはさらに外側）
+app.add_middleware(security_headers_middleware)
+app.add_middleware(primary_sticky_middleware)
+app.add_middleware(csrf_cookie_auth_middleware)
+app.add_middleware(query_metrics_middleware)
 
 
 @app.exception_handler(CsrfProtectError)
@@ -174,6 +329,8 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 @app.on_event("startup")
 async def startup_event():
     """アプリケーション起動時の処理"""
+    configure_tracing(settings)
+
     # テスト環境ではスケジューラーを起動しない
     if os.getenv("TESTING") != "1":
         logger.info("Starting calendar sync scheduler...")
@@ -214,6 +371,8 @@ async def shutdown_event():
     deadline_notification_scheduler.shutdown()
     logger.info("Deadline notification scheduler stopped successfully")
 
+    shutdown_tracing()
+
 if is_production:
     # 本番環境: 必要最小限のオリジン・メソッド・ヘッダーのみ許可
     allowed_origins = [
@@ -252,6 +411,7 @@ app.add_middleware(
     allow_credentials=True,  # Cookie送信のために必要
     allow_methods=allowed_methods,
     allow_headers=allowed_headers,
+    expose_headers=["X-Next-Cursor"],  # 事務所一覧のキーセットページング用
 )
 
 
@@ -260,6 +420,23 @@ async def read_root():
     return {"message": "ケイカくんAPIは稼働中です"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def read_metrics(request: Request):
+    """
+    Prometheusテキスト形式のメトリクス（app/core/metrics.py）
+
+    METRICS_TOKEN 設定時は Bearer トークンを要求し、本番でトークン未設定の場合は公開しない。
+    """
+    token = settings.METRICS_TOKEN.get_secret_value() if settings.METRICS_TOKEN else None
+    if not settings.METRICS_ENABLED or (is_production and not token):
+        return Response(status_code=404)
+    if token:
+        auth_header = request.headers.get("Authorization", "")
+        if not secrets.compare_digest(auth_header.encode(), f"Bearer {token}".encode()):
+            return Response(status_code=401, headers={"WWW-Authenticate": "Bearer"})
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE_LATEST)
+
+
 app.include_router(api_router, prefix="/api/v1")
 
 
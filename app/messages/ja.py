@@ -118,6 +118,15 @@ RECIPIENT_ACCESS_DENIED = "この利用者にアクセスする権限があり
 RECIPIENT_UPDATE_NOT_FOUND = "利用者の更新に失敗しました"
 RECIPIENT_DELETED_SUCCESS = "利用者を削除しました"
 RECIPIENT_REPAIR_PERMISSION_DENIED = "管理者または事業所管理者のみが個別支援計画の修復を実行できます"
+RECIPIENT_IMPORT_PERMISSION_DENIED = "利用者の一括インポートは管理者または事業所管理者のみ実行できます"
+RECIPIENT_IMPORT_UNSUPPORTED_FORMAT = "CSV（.csv）またはExcel（.xlsx）ファイルを指定してください"
+RECIPIENT_IMPORT_EXCEL_UNAVAILABLE = "Excelファイルの読み込みに対応していません。CSV形式で保存して再度アップロードしてください"
+RECIPIENT_IMPORT_INVALID_FILE = "ファイルを読み込めませんでした"
+RECIPIENT_IMPORT_MISSING_COLUMNS = "必須の列がありません: {columns}"
+RECIPIENT_IMPORT_ROW_LIMIT_EXCEEDED = "1回にインポートできるのは{limit}行までです。以降の行は処理されていません"
+RECIPIENT_IMPORT_ROW_FAILED = "利用者の登録に失敗しました"
+RECIPIENT_IMPORT_JOB_FAILED = "インポート処理中にエラーが発生しました"
+RECIPIENT_IMPORT_JOB_NOT_FOUND = "インポートジョブが見つかりません"
 
 # ==========================================
 # 権限変更申請 (role_change_requests.py)
@@ -231,6 +240,12 @@ SERVICE_CLIENT_EMAIL_NOT_FOUND = "設定ファイルにメールアドレス情
 SERVICE_INVALID_JSON = "設定ファイルの形式が正しくありません: {error}"
 SERVICE_ACCOUNT_KEY_NOT_FOUND = "カレンダー連携用の設定情報が見つかりません"
 
+# 試行回数制限
+SERVICE_PASSWORD_CHANGE_ATTEMPTS_EXCEEDED = "パスワード変更の試行回数が上限に達しました。1時間後に再度お試しください。"
+SERVICE_EMAIL_CHANGE_ATTEMPTS_EXCEEDED = "メールアドレスの変更回数が上限に達しています。24時間後に再度お試しください。"
+SERVICE_MFA_VERIFY_ATTEMPTS_EXCEEDED = "認証コードの試行回数が上限に達しました。15分後に再度お試しください。"
+SERVICE_PASSWORD_RESET_VERIFY_ATTEMPTS_EXCEEDED = "パスワードリセットの試行回数が上限に達しました。1時間後に再度お試しください。"
+
 # ==========================================
 # 申請関連（Employee Action / Role Change共通）
 # ==========================================
@@ -293,6 +308,8 @@ CALENDAR_UPDATE_SUCCESS_WITH_CONNECTION = "カレンダー設定を更新し、
 CALENDAR_UPDATE_FAILED_CONNECTION = "カレンダー設定は更新されましたが、接続テストに失敗しました。設定を確認してください。"
 CALENDAR_DELETE_SUCCESS = "カレンダー連携を解除しました。"
 CALENDAR_SYNC_SUCCESS = "{synced}件のイベントを同期しました。{failed}件が失敗しました。"
+CALENDAR_FEED_NOT_FOUND = "カレンダーの購読URLが無効です。"
+CALENDAR_FEED_TOKEN_NOT_FOUND = "購読URLは発行されていません。"
 
 # ==========================================
 # ダッシュボード関連 (dashboard.py)
@@ -12,6 +12,9 @@ from .enums import (
 from .office import Office, OfficeStaff, OfficeAuditLog
 from .billing import Billing
 from .webhook_event import WebhookEvent
+from .cleanup_checkpoint import CleanupCheckpoint
+from .recipient_import_job import RecipientImportJob
+from .attempt_counter import AttemptCounter
 from .staff import Staff, PasswordResetToken, PasswordResetAuditLog
 from .staff_profile import AuditLog, EmailChangeRequest, PasswordHistory
 from .mfa import MFABackupCode, MFAAuditLog
@@ -25,6 +28,7 @@ from .role_change_request import RoleChangeRequest
 from .employee_action_request import EmployeeActionRequest
 from .approval_request import ApprovalRequest
 from .calendar_account import OfficeCalendarAccount, StaffCalendarAccount
+from .calendar_feed_token import CalendarFeedToken
 from .calendar_events import (
     CalendarEvent, NotificationPattern,
     CalendarEventSeries, CalendarEventInstance
@@ -25,7 +25,7 @@ class FamilyOfServiceRecipients(Base):
     """家族構成"""
     __tablename__ = 'family_of_service_recipients'
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    welfare_recipient_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('welfare_recipients.id'))
+    welfare_recipient_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('welfare_recipients.id', ondelete='CASCADE'))
     name: Mapped[str] = mapped_column(Text)
     relationship: Mapped[str] = mapped_column(Text)
     household: Mapped[Household] = mapped_column(SQLAlchemyEnum(Household))
@@ -44,7 +44,7 @@ class WelfareServicesUsed(Base):
     """過去のサービス利用歴"""
     __tablename__ = 'welfare_services_used'
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    welfare_recipient_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('welfare_recipients.id'))
+    welfare_recipient_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('welfare_recipients.id', ondelete='CASCADE'))
     office_name: Mapped[str] = mapped_column(Text)
     starting_day: Mapped[datetime.date]
     amount_used: Mapped[str] = mapped_column(Text)
@@ -61,7 +61,7 @@ class MedicalMatters(Base):
     """医療に関する基本情報"""
     __tablename__ = 'medical_matters'
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    welfare_recipient_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('welfare_recipients.id'), unique=True)
+    welfare_recipient_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('welfare_recipients.id', ondelete='CASCADE'), unique=True)
     medical_care_insurance: Mapped[MedicalCareInsurance] = mapped_column(SQLAlchemyEnum(MedicalCareInsurance))
     medical_care_insurance_other_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     aiding: Mapped[AidingType] = mapped_column(SQLAlchemyEnum(AidingType))
@@ -80,7 +80,7 @@ class HistoryOfHospitalVisits(Base):
     """通院歴"""
     __tablename__ = 'history_of_hospital_visits'
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    medical_matters_id: Mapped[int] = mapped_column(ForeignKey('medical_matters.id'))
+    medical_matters_id: Mapped[int] = mapped_column(ForeignKey('medical_matters.id', ondelete='CASCADE'))
     disease: Mapped[str] = mapped_column(Text)
     frequency_of_hospital_visits: Mapped[str] = mapped_column(Text)
     symptoms: Mapped[str] = mapped_column(Text)
@@ -103,7 +103,7 @@ class EmploymentRelated(Base):
     """就労関係"""
     __tablename__ = 'employment_related'
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    welfare_recipient_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('welfare_recipients.id'), unique=True)
+    welfare_recipient_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('welfare_recipients.id', ondelete='CASCADE'), unique=True)
     created_by_staff_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('staffs.id'))
     work_conditions: Mapped[WorkConditions] = mapped_column(SQLAlchemyEnum(WorkConditions))
     regular_or_part_time_job: Mapped[bool] = mapped_column(Boolean)
@@ -136,7 +136,7 @@ class IssueAnalysis(Base):
     """課題分析"""
     __tablename__ = 'issue_analyses'
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    welfare_recipient_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('welfare_recipients.id'), unique=True)
+    welfare_recipient_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('welfare_recipients.id', ondelete='CASCADE'), unique=True)
     created_by_staff_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('staffs.id'))
     what_i_like_to_do: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     im_not_good_at: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -0,0 +1,52 @@
+"""
+AttemptCounterモデル: 試行回数制限の固定窓カウンタ
+"""
+from datetime import datetime
+
+from sqlalchemy import String, Integer, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class AttemptCounter(Base):
+    """
+    試行回数制限（パスワード変更・2段階認証・リセットトークン確認など）のカウンタ
+
+    (scope, subject) ごとに1行だけを持ち、窓の終了時刻を過ぎた後の
+    最初の試行でカウントを1からやり直す（固定窓）。
+    監査ログを数える方式と違い、判定は主キー1行の参照・更新で完結する。
+    テーブルはUNLOGGED（クラッシュ時に消えても許容できるデータ）。
+    """
+    __tablename__ = "attempt_counters"
+
+    scope: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        comment="制限の種類 (例: password_change, mfa_verify)"
+    )
+    subject: Mapped[str] = mapped_column(
+        String(255),
+        primary_key=True,
+        comment="制限の対象 (スタッフIDやクライアントIP)"
+    )
+    count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="現在の窓内の試行回数"
+    )
+    window_expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="現在の窓の終了時刻"
+    )
+
+    __table_args__ = (
+        Index("idx_attempt_counters_window_expires_at", "window_expires_at"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<AttemptCounter(scope={self.scope}, subject={self.subject}, "
+            f"count={self.count}, window_expires_at={self.window_expires_at})>"
+        )
@@ -7,6 +7,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.tracing import current_traceparent
 from app.db.base import Base
 from app.models.enums import (
     CalendarEventType, CalendarSyncStatus,
@@ -108,6 +109,28 @@ class CalendarEvent(Base):
 
     last_error_message: Mapped[Optional[str]] = mapped_column(Text)
 
+    # 同期キュー（crud.calendar_event.claim_pending_sync_events）
+    sync_attempts: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False
+    )
+
+    next_sync_attempt_at: Mapped[Optional[datetime.datetime]] = mapped_column(
+        DateTime(timezone=True)
+    )
+
+    sync_lease_expires_at: Mapped[Optional[datetime.datetime]] = mapped_column(
+        DateTime(timezone=True)
+    )
+
+    # 作成時のトレース（W3C traceparent）。同期ジョブのスパンからリンクする
+    trace_parent: Mapped[Optional[str]] = mapped_column(
+        String(55),
+        default=current_traceparent
+    )
+
     # タイムスタンプ
     created_at: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True),
@@ -158,6 +181,12 @@ class CalendarEvent(Base):
             unique=True,
             postgresql_where="support_plan_status_id IS NOT NULL AND (sync_status = 'pending' OR sync_status = 'synced' OR sync_status = 'local_only')"
         ),
+        # 同期キューのクレーム用（同期待ち・再試行待ちの行だけを事業所順に辿る）
+        Index(
+            "idx_calendar_events_sync_queue",
+            "office_id", "created_at",
+            postgresql_where="sync_status IN ('pending', 'failed')"
+        ),
     )
 
 
@@ -317,10 +346,9 @@ class CalendarEventSeries(Base):
 
     google_rrule: Mapped[Optional[str]] = mapped_column(Text)
 
-    # Google Calendar情報
-    google_calendar_id: Mapped[str] = mapped_column(
-        String(255),
-        nullable=False
+    # Google Calendar情報（未連携の事業所ではNULL、インスタンスはアプリ内のみ）
+    google_calendar_id: Mapped[Optional[str]] = mapped_column(
+        String(255)
     )
 
     google_master_event_id: Mapped[Optional[str]] = mapped_column(String(255))
@@ -384,6 +412,19 @@ class CalendarEventSeries(Base):
         Index("idx_calendar_event_series_event_type", "event_type"),
         Index("idx_calendar_event_series_deadline_date", "base_deadline_date"),
         Index("idx_calendar_event_series_status", "series_status"),
+        # 期限 × 通知パターンで1シリーズ（展開時のUPSERTの競合対象）
+        Index(
+            "uq_calendar_event_series_cycle_pattern",
+            "support_plan_cycle_id", "event_type", "notification_pattern_id",
+            unique=True,
+            postgresql_where="support_plan_cycle_id IS NOT NULL"
+        ),
+        Index(
+            "uq_calendar_event_series_status_pattern",
+            "support_plan_status_id", "event_type", "notification_pattern_id",
+            unique=True,
+            postgresql_where="support_plan_status_id IS NOT NULL"
+        ),
     )
 
 
@@ -464,6 +505,22 @@ class CalendarEventInstance(Base):
         DateTime(timezone=True)
     )
 
+    # 同期キュー（crud.calendar_event_series.claim_pending_instances）
+    sync_attempts: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False
+    )
+
+    next_sync_attempt_at: Mapped[Optional[datetime.datetime]] = mapped_column(
+        DateTime(timezone=True)
+    )
+
+    sync_lease_expires_at: Mapped[Optional[datetime.datetime]] = mapped_column(
+        DateTime(timezone=True)
+    )
+
     # タイムスタンプ
     created_at: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True),
@@ -492,4 +549,14 @@ class CalendarEventInstance(Base):
             "reminder_sent",
             postgresql_where="reminder_sent = FALSE"
         ),
+        Index(
+            "uq_calendar_event_instances_series_days",
+            "event_series_id", "days_before_deadline",
+            unique=True
+        ),
+        Index(
+            "idx_calendar_event_instances_sync_queue",
+            "event_datetime",
+            postgresql_where="sync_status IN ('pending', 'failed')"
+        ),
     )
@@ -0,0 +1,46 @@
+"""
+CalendarFeedTokenモデル: 期限カレンダー購読URL（.ics フィード）のトークン
+"""
+import datetime
+import uuid
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, String, UUID, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class CalendarFeedToken(Base):
+    """
+    事業所の期限カレンダーを購読するためのトークン
+
+    カレンダーアプリは認証ヘッダーを付けられないため、購読URLにトークンを含める。
+    - 1事業所につき1件（再発行で置き換え、削除で無効化）
+    - DBには生のトークンではなくSHA-256ハッシュのみ保存する
+    """
+    __tablename__ = "calendar_feed_tokens"
+
+    office_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("offices.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    token_hash: Mapped[str] = mapped_column(
+        String(64),  # SHA-256ハッシュ（64文字の16進数）
+        unique=True,
+        nullable=False
+    )
+    created_by: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("staffs.id", ondelete="SET NULL"),
+        nullable=True
+    )
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<CalendarFeedToken(office_id={self.office_id}, created_at={self.created_at})>"
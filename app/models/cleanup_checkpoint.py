@@ -0,0 +1,50 @@
+"""
+CleanupCheckpointモデル: 物理削除バッチの再開位置管理
+"""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String, DateTime, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class CleanupCheckpoint(Base):
+    """
+    物理削除クリーンアップのチェックポイント
+
+    テーブル（フェーズ）ごとに、最後に処理したキーセット位置
+    (deleted_at, id) を保持する。時間予算を使い切って中断した場合、
+    次回の実行はこの位置の直後から再開する。
+    走査が末尾に到達した時点でカーソルはクリアされる。
+    """
+    __tablename__ = "cleanup_checkpoints"
+
+    name: Mapped[str] = mapped_column(
+        String(64),
+        primary_key=True,
+        comment="フェーズ名 (例: offices, staffs)"
+    )
+    cursor_deleted_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="最後に処理したレコードのdeleted_at"
+    )
+    cursor_id: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="最後に処理したレコードのID"
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<CleanupCheckpoint(name={self.name}, "
+            f"cursor_deleted_at={self.cursor_deleted_at}, cursor_id={self.cursor_id})>"
+        )
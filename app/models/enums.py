@@ -303,3 +303,11 @@ class InquiryPriority(str, enum.Enum):
     low = 'low'        # 低
     normal = 'normal'  # 通常
     high = 'high'      # 高
+
+
+class RecipientImportStatus(str, enum.Enum):
+    """利用者一括インポートジョブのステータス"""
+    pending = 'pending'      # 受付済み（未処理）
+    running = 'running'      # 処理中
+    completed = 'completed'  # 完了（行単位のエラーを含む場合あり）
+    failed = 'failed'        # ファイル全体の処理に失敗
@@ -122,6 +122,8 @@ class InquiryDetail(Base):
     __table_args__ = (
         # 複合インデックス: ステータス×作成日時（一覧表示の最適化）
         Index('ix_inquiry_details_status_created', 'status', 'created_at'),
+        # 複合インデックス: 作成日時×ID（ステータス指定なし一覧のキーセットページネーション）
+        Index('ix_inquiry_details_created_id', 'created_at', 'id'),
         # 複合インデックス: 担当者×ステータス（担当者別の未対応一覧）
         Index('ix_inquiry_details_assigned_status', 'assigned_staff_id', 'status'),
         # 複合インデックス: 優先度×ステータス（優先度別の対応状況）
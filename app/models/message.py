@@ -9,7 +9,7 @@ import datetime
 from typing import List, Optional, TYPE_CHECKING
 from sqlalchemy import (
     func, String, Text, DateTime, UUID, ForeignKey,
-    Boolean, Enum as SQLAlchemyEnum, UniqueConstraint, Index
+    Boolean, Enum as SQLAlchemyEnum, UniqueConstraint, Index, text
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -109,6 +109,19 @@ class Message(Base):
     __table_args__ = (
         Index('ix_messages_office_created', 'office_id', 'created_at'),
         Index('ix_messages_sender', 'sender_staff_id'),
+        # 問い合わせの件名・本文の部分一致検索用（pg_trgm、問い合わせのみの部分インデックス）
+        Index(
+            'ix_messages_inquiry_title_trgm', 'title',
+            postgresql_using='gin',
+            postgresql_ops={'title': 'gin_trgm_ops'},
+            postgresql_where=text("message_type = 'inquiry'"),
+        ),
+        Index(
+            'ix_messages_inquiry_content_trgm', 'content',
+            postgresql_using='gin',
+            postgresql_ops={'content': 'gin_trgm_ops'},
+            postgresql_where=text("message_type = 'inquiry'"),
+        ),
     )
 
 
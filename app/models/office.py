@@ -25,6 +25,14 @@ class Office(Base):
         # システム事務所検索用の複合インデックス（name + is_deleted）
         # get_or_create_system_office のクエリを高速化
         Index('ix_offices_name_is_deleted', 'name', 'is_deleted'),
+        # app_admin事務所一覧の (created_at, id) キーセットページネーション用
+        Index('ix_offices_created_id', 'created_at', 'id'),
+        # 事務所名の部分一致検索用（pg_trgm）
+        Index(
+            'ix_offices_name_trgm', 'name',
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
@@ -0,0 +1,86 @@
+"""
+RecipientImportJobモデル: 利用者一括インポートの進捗管理
+"""
+import uuid
+import datetime
+from typing import Optional
+
+from sqlalchemy import func, DateTime, UUID, ForeignKey, Integer, String, Enum as SQLAlchemyEnum
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.models.enums import RecipientImportStatus
+
+
+class RecipientImportJob(Base):
+    """
+    利用者一括インポートジョブ
+
+    CSV/Excelファイルからの利用者登録をチャンク単位でCOMMITし、
+    チャンクごとに処理済み件数とエラー行を更新する。
+    errors には行単位のエラーを格納する:
+    [{"row": 3, "errors": ["basic_info.birthDay: ..."]}, ...]
+    """
+    __tablename__ = 'recipient_import_jobs'
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=func.gen_random_uuid()
+    )
+    office_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey('offices.id', ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="インポート先事務所ID"
+    )
+    created_by: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey('staffs.id', ondelete="SET NULL"),
+        nullable=True,
+        comment="インポートを実行したスタッフID"
+    )
+    file_name: Mapped[Optional[str]] = mapped_column(
+        String(255),
+        nullable=True,
+        comment="アップロードされたファイル名"
+    )
+    status: Mapped[RecipientImportStatus] = mapped_column(
+        SQLAlchemyEnum(RecipientImportStatus),
+        default=RecipientImportStatus.pending,
+        nullable=False,
+        comment="ステータス: pending, running, completed, failed"
+    )
+    processed_rows: Mapped[int] = mapped_column(Integer, default=0, nullable=False, comment="処理済み行数")
+    succeeded_rows: Mapped[int] = mapped_column(Integer, default=0, nullable=False, comment="登録に成功した行数")
+    failed_rows: Mapped[int] = mapped_column(Integer, default=0, nullable=False, comment="エラーになった行数")
+    errors: Mapped[list] = mapped_column(
+        JSONB,
+        default=list,
+        nullable=False,
+        comment="行単位のエラー一覧"
+    )
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+    finished_at: Mapped[Optional[datetime.datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="処理完了日時"
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<RecipientImportJob(id={self.id}, status={self.status}, "
+            f"processed_rows={self.processed_rows})>"
+        )
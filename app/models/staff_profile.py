@@ -2,7 +2,7 @@
 import uuid
 import datetime
 from typing import Optional
-from sqlalchemy import func, String, DateTime, UUID, ForeignKey, Text, Boolean
+from sqlalchemy import func, String, DateTime, UUID, ForeignKey, Text, Boolean, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import JSONB
 
@@ -52,6 +52,21 @@ class AuditLog(Base):
         - terms_agreement: 利用規約同意記録
     """
     __tablename__ = 'audit_logs'
+    __table_args__ = (
+        # 一覧の (timestamp, id) キーセットページネーション用（テストデータ除外の部分インデックス）
+        Index(
+            'ix_audit_logs_live_timestamp_id', 'timestamp', 'id',
+            postgresql_where=text('is_test_data = false'),
+        ),
+        Index(
+            'ix_audit_logs_live_target_timestamp_id', 'target_type', 'timestamp', 'id',
+            postgresql_where=text('is_test_data = false'),
+        ),
+        Index(
+            'ix_audit_logs_live_office_target_timestamp_id', 'office_id', 'target_type', 'timestamp', 'id',
+            postgresql_where=text('is_test_data = false'),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     staff_id: Mapped[Optional[uuid.UUID]] = mapped_column(
@@ -28,7 +28,7 @@ class SupportPlanCycle(Base):
     """個別支援計画の1サイクル（約6ヶ月）"""
     __tablename__ = 'support_plan_cycles'
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    welfare_recipient_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('welfare_recipients.id'))
+    welfare_recipient_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('welfare_recipients.id', ondelete='CASCADE'))
     office_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey('offices.id', ondelete='CASCADE'),
@@ -59,7 +59,7 @@ class SupportPlanStatus(Base):
     """計画サイクル内の各ステップの進捗"""
     __tablename__ = 'support_plan_statuses'
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    plan_cycle_id: Mapped[int] = mapped_column(ForeignKey('support_plan_cycles.id'))
+    plan_cycle_id: Mapped[int] = mapped_column(ForeignKey('support_plan_cycles.id', ondelete='CASCADE'))
     welfare_recipient_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey('welfare_recipients.id', ondelete='CASCADE'),
@@ -94,7 +94,7 @@ class PlanDeliverable(Base):
     """計画サイクルに関連する成果物"""
     __tablename__ = 'plan_deliverables'
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    plan_cycle_id: Mapped[int] = mapped_column(ForeignKey('support_plan_cycles.id'))
+    plan_cycle_id: Mapped[int] = mapped_column(ForeignKey('support_plan_cycles.id', ondelete='CASCADE'))
     deliverable_type: Mapped[DeliverableType] = mapped_column(SQLAlchemyEnum(DeliverableType))
     file_path: Mapped[str] = mapped_column(Text)
     original_filename: Mapped[str] = mapped_column(Text)
@@ -57,19 +57,19 @@ class WelfareRecipient(Base):
         return f"{self.last_name_furigana} {self.first_name_furigana}"
 
     # Relationships
-    office_associations: Mapped[List["OfficeWelfareRecipient"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan")
-    support_plan_cycles: Mapped[List["SupportPlanCycle"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan")
-    support_plan_statuses: Mapped[List["SupportPlanStatus"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan")
-    detail: Mapped[Optional["ServiceRecipientDetail"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan")
-    disability_status: Mapped[Optional["DisabilityStatus"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan")
-    calendar_events: Mapped[List["CalendarEvent"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan")
-    calendar_event_series: Mapped[List["CalendarEventSeries"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan")
+    office_associations: Mapped[List["OfficeWelfareRecipient"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan", passive_deletes=True)
+    support_plan_cycles: Mapped[List["SupportPlanCycle"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan", passive_deletes=True)
+    support_plan_statuses: Mapped[List["SupportPlanStatus"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan", passive_deletes=True)
+    detail: Mapped[Optional["ServiceRecipientDetail"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan", passive_deletes=True)
+    disability_status: Mapped[Optional["DisabilityStatus"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan", passive_deletes=True)
+    calendar_events: Mapped[List["CalendarEvent"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan", passive_deletes=True)
+    calendar_event_series: Mapped[List["CalendarEventSeries"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan", passive_deletes=True)
     # アセスメント関連
-    family_members: Mapped[List["FamilyOfServiceRecipients"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan")
-    service_history: Mapped[List["WelfareServicesUsed"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan")
-    medical_matters: Mapped[Optional["MedicalMatters"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan")
-    employment_related: Mapped[Optional["EmploymentRelated"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan")
-    issue_analysis: Mapped[Optional["IssueAnalysis"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan")
+    family_members: Mapped[List["FamilyOfServiceRecipients"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan", passive_deletes=True)
+    service_history: Mapped[List["WelfareServicesUsed"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan", passive_deletes=True)
+    medical_matters: Mapped[Optional["MedicalMatters"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan", passive_deletes=True)
+    employment_related: Mapped[Optional["EmploymentRelated"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan", passive_deletes=True)
+    issue_analysis: Mapped[Optional["IssueAnalysis"]] = orm_relationship(back_populates="welfare_recipient", cascade="all, delete-orphan", passive_deletes=True)
     # assessment_sheets: Mapped[List["AssessmentSheetDeliverable"]] = orm_relationship(back_populates="welfare_recipient")
 
 
@@ -77,7 +77,7 @@ class OfficeWelfareRecipient(Base):
     """事業所と受給者の中間テーブル"""
     __tablename__ = 'office_welfare_recipients'
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    welfare_recipient_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('welfare_recipients.id'))
+    welfare_recipient_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('welfare_recipients.id', ondelete='CASCADE'))
     office_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('offices.id'))
     created_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -92,7 +92,7 @@ class ServiceRecipientDetail(Base):
     """受給者の詳細情報 (基本情報)"""
     __tablename__ = 'service_recipient_details'
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    welfare_recipient_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('welfare_recipients.id'), unique=True)
+    welfare_recipient_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('welfare_recipients.id', ondelete='CASCADE'), unique=True)
     address: Mapped[str] = mapped_column(Text)
     form_of_residence: Mapped[FormOfResidence] = mapped_column(SQLAlchemyEnum(FormOfResidence, name='form_of_residence'))
     form_of_residence_other_text: Mapped[Optional[str]] = mapped_column(Text)
@@ -111,7 +111,7 @@ class EmergencyContact(Base):
     """緊急連絡先"""
     __tablename__ = 'emergency_contacts'
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    service_recipient_detail_id: Mapped[int] = mapped_column(ForeignKey('service_recipient_details.id'))
+    service_recipient_detail_id: Mapped[int] = mapped_column(ForeignKey('service_recipient_details.id', ondelete='CASCADE'))
     first_name: Mapped[str] = mapped_column(String(255))
     last_name: Mapped[str] = mapped_column(String(255))
     first_name_furigana: Mapped[str] = mapped_column(String(255))
@@ -133,7 +133,7 @@ class DisabilityStatus(Base):
     """障害についての基本情報"""
     __tablename__ = 'disability_statuses'
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    welfare_recipient_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('welfare_recipients.id'), unique=True)
+    welfare_recipient_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('welfare_recipients.id', ondelete='CASCADE'), unique=True)
     disability_or_disease_name: Mapped[str] = mapped_column(Text)
     livelihood_protection: Mapped[LivelihoodProtection] = mapped_column(SQLAlchemyEnum(LivelihoodProtection, name='livelihood_protection'))
     special_remarks: Mapped[Optional[str]] = mapped_column(Text)
@@ -149,7 +149,7 @@ class DisabilityDetail(Base):
     """個別の障害・手帳・年金の詳細"""
     __tablename__ = 'disability_details'
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    disability_status_id: Mapped[int] = mapped_column(ForeignKey('disability_statuses.id'))
+    disability_status_id: Mapped[int] = mapped_column(ForeignKey('disability_statuses.id', ondelete='CASCADE'))
     category: Mapped[DisabilityCategory] = mapped_column(SQLAlchemyEnum(DisabilityCategory, name='disability_category'))
     grade_or_level: Mapped[Optional[str]] = mapped_column(Text)
     physical_disability_type: Mapped[Optional[PhysicalDisabilityType]] = mapped_column(SQLAlchemyEnum(PhysicalDisabilityType, name='physical_disability_type'))
@@ -9,8 +9,9 @@ import logging
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
+from app.core.metrics import track_job
 from app.tasks.billing_check import check_trial_expiration, check_scheduled_cancellation
-from app.db.session import AsyncSessionLocal
+from app.db.session import BatchSessionLocal
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +28,10 @@ async def scheduled_trial_check():
     - trial_end_date が過去で billing_status = 'free' のレコードを past_due に更新
     - trial_end_date が過去で billing_status = 'early_payment' のレコードを active に更新
     """
-    async with AsyncSessionLocal() as db:
+    async with BatchSessionLocal() as db:
         try:
-            count = await check_trial_expiration(db=db)
+            with track_job("billing_trial_check"):
+                count = await check_trial_expiration(db=db)
             logger.info(
                 f"[BILLING_SCHEDULER] Trial expiration check completed: "
                 f"{count} billing(s) updated"
@@ -48,9 +50,10 @@ async def scheduled_cancellation_check():
     実行頻度: 毎日 0:05 UTC
     処理内容: scheduled_cancel_at が過去で billing_status = 'canceling' のレコードを canceled に更新
     """
-    async with AsyncSessionLocal() as db:
+    async with BatchSessionLocal() as db:
         try:
-            count = await check_scheduled_cancellation(db=db)
+            with track_job("billing_cancellation_check"):
+                count = await check_scheduled_cancellation(db=db)
             logger.info(
                 f"[BILLING_SCHEDULER] Scheduled cancellation check completed: "
                 f"{count} billing(s) updated to canceled"
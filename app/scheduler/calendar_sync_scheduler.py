@@ -10,8 +10,10 @@ from typing import Optional
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
+from app.core.config import settings
+from app.core.metrics import track_job
 from app.services.calendar_service import calendar_service
-from app.db.session import AsyncSessionLocal
+from app.db.session import BatchSessionLocal
 
 
 logger = logging.getLogger(__name__)
@@ -44,19 +46,30 @@ class CalendarSyncScheduler:
         logger.info("=" * 80)
 
         try:
-            # 非同期セッションを作成
-            async with AsyncSessionLocal() as db:
-                # 全事業所の未同期イベントを同期
-                result = await calendar_service.sync_pending_events(
-                    db=db,
-                    office_id=None  # None = 全事業所
-                )
-
-                synced_count = result.get("synced", 0)
-                failed_count = result.get("failed", 0)
-
-                if failed_count > 0:
-                    logger.warning("イベント同期に失敗したレコードがあります")
+            with track_job("calendar_sync"):
+                # 非同期セッションを作成
+                async with BatchSessionLocal() as db:
+                    # 全事業所の未同期イベントを同期
+                    result = await calendar_service.sync_pending_events(
+                        db=db,
+                        office_id=None  # None = 全事業所
+                    )
+
+                    synced_count = result.get("synced", 0)
+                    failed_count = result.get("failed", 0)
+
+                    if failed_count > 0:
+                        logger.warning("イベント同期に失敗したレコードがあります")
+
+                    # 通知パターンのシリーズ・インスタンスを期限に合わせてから反映する
+                    if settings.CALENDAR_SERIES_SYNC_ENABLED:
+                        await calendar_service.materialize_event_series(db=db, office_id=None)
+                        instance_result = await calendar_service.sync_pending_instances(
+                            db=db,
+                            office_id=None
+                        )
+                        if instance_result.get("failed", 0) > 0:
+                            logger.warning("通知インスタンスの同期に失敗したレコードがあります")
 
         except Exception as e:
             logger.error("カレンダー同期ジョブでエラーが発生しました: %s", type(e).__name__)
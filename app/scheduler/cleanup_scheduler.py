@@ -10,8 +10,10 @@ from typing import Optional
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
+from app.core.metrics import track_job
+from app import crud
 from app.services.cleanup_service import cleanup_service
-from app.db.session import AsyncSessionLocal
+from app.db.session import BatchSessionLocal
 
 
 logger = logging.getLogger(__name__)
@@ -47,29 +49,46 @@ class CleanupScheduler:
         logger.info("=" * 80)
 
         try:
-            # 非同期セッションを作成
-            async with AsyncSessionLocal() as db:
-                # 論理削除されたレコードを物理削除
-                result = await cleanup_service.cleanup_soft_deleted_records(
-                    db=db,
-                    days_threshold=self.days_threshold
-                )
-
-                deleted_staff = result.get("deleted_staff_count", 0)
-                deleted_offices = result.get("deleted_office_count", 0)
-                errors = result.get("errors", [])
-
-                logger.info(
-                    f"物理削除完了: スタッフ={deleted_staff}件, "
-                    f"事務所={deleted_offices}件"
-                )
-
-                if errors:
-                    logger.error(f"{len(errors)}件のエラーが発生しました:")
-                    for error in errors:
-                        logger.error(f"  - {error}")
-                elif deleted_staff == 0 and deleted_offices == 0:
-                    logger.info("物理削除対象のレコードはありませんでした")
+            with track_job("cleanup"):
+                # 非同期セッションを作成
+                async with BatchSessionLocal() as db:
+                    # 論理削除されたレコードを物理削除
+                    result = await cleanup_service.cleanup_soft_deleted_records(
+                        db=db,
+                        days_threshold=self.days_threshold
+                    )
+
+                    deleted_staff = result.get("deleted_staff_count", 0)
+                    deleted_offices = result.get("deleted_office_count", 0)
+                    errors = result.get("errors", [])
+
+                    logger.info(
+                        f"物理削除完了: スタッフ={deleted_staff}件, "
+                        f"事務所={deleted_offices}件"
+                    )
+
+                    for table_name, stats in result.get("table_stats", {}).items():
+                        logger.info(
+                            f"  {table_name}: {stats['deleted']}件 "
+                            f"({stats['elapsed_seconds']}秒, {stats['rows_per_second']} rows/sec)"
+                        )
+
+                    if not result.get("completed", True):
+                        logger.warning(
+                            "時間予算を使い切ったため中断しました。次回実行時にチェックポイントから再開します"
+                        )
+
+                    if errors:
+                        logger.error(f"{len(errors)}件のエラーが発生しました:")
+                        for error in errors:
+                            logger.error(f"  - {error}")
+                    elif deleted_staff == 0 and deleted_offices == 0:
+                        logger.info("物理削除対象のレコードはありませんでした")
+
+                    # 窓が終了した試行回数カウンタを削除
+                    purged_counters = await crud.attempt_counter.purge_expired(db)
+                    await db.commit()
+                    logger.info(f"期限切れの試行回数カウンタ: {purged_counters}件削除")
 
         except Exception as e:
             logger.error("物理削除クリーンアップジョブでエラーが発生しました: %s", type(e).__name__)
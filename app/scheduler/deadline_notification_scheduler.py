@@ -9,8 +9,9 @@ import logging
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
+from app.core.metrics import track_job
 from app.tasks.deadline_notification import send_deadline_alert_emails
-from app.db.session import AsyncSessionLocal
+from app.db.session import BatchReadSessionLocal, BatchSessionLocal
 
 logger = logging.getLogger(__name__)
 
@@ -28,9 +29,11 @@ async def scheduled_send_alerts():
     - 該当事業所の全スタッフにメール送信
     - 通知設定でsystem_notification=trueのスタッフにWeb Push送信
     """
-    async with AsyncSessionLocal() as db:
+    # 全事業所の一括取得は読み取りレプリカ、監査ログ等の書き込みはプライマリ
+    async with BatchSessionLocal() as db, BatchReadSessionLocal() as read_db:
         try:
-            result = await send_deadline_alert_emails(db=db)
+            with track_job("deadline_notification"):
+                result = await send_deadline_alert_emails(db=db, read_db=read_db)
             logger.info(
                 f"[DEADLINE_NOTIFICATION_SCHEDULER] Deadline notification completed: "
                 f"Emails: {result['email_sent']}, Push: {result['push_sent']}, "
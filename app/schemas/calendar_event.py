@@ -41,6 +41,9 @@ class CalendarEventUpdate(BaseModel):
     sync_status: Optional[CalendarSyncStatus] = None
     last_sync_at: Optional[datetime] = None
     last_error_message: Optional[str] = None
+    sync_attempts: Optional[int] = None
+    next_sync_attempt_at: Optional[datetime] = None
+    sync_lease_expires_at: Optional[datetime] = None
 
 
 class CalendarEventResponse(CalendarEventBase):
@@ -65,3 +68,9 @@ class CalendarEventResponse(CalendarEventBase):
 class CalendarEventInDB(CalendarEventResponse):
     """DB内のカレンダーイベント"""
     model_config = ConfigDict(from_attributes=True)
+
+
+class CalendarFeedTokenResponse(BaseModel):
+    """期限カレンダー購読URL発行レスポンス"""
+    feed_url: str  # 購読URL（https）
+    webcal_url: str  # カレンダーアプリ登録用URL（webcal）
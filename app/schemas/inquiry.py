@@ -224,6 +224,8 @@ class InquiryListResponse(BaseModel):
     """問い合わせ一覧レスポンススキーマ"""
     inquiries: List[InquiryListItem]
     total: int
+    total_is_estimate: bool = Field(False, description="totalが推定値（count=estimated）かどうか")
+    next_cursor: Optional[str] = Field(None, description="次ページ取得用カーソル（これ以上ない場合はnull）")
 
 
 # ========================================
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 from typing import List, Optional
-from datetime import date
+from datetime import date, datetime
 from app.models.enums import (
     GenderType,
     FormOfResidence,
@@ -9,6 +9,7 @@ from app.models.enums import (
     ApplicationStatus,
     PhysicalDisabilityType,
     DisabilityCategory,
+    RecipientImportStatus,
 )
 import uuid
 from app.messages import ja
@@ -216,3 +217,24 @@ class UserRegistrationResponse(BaseModel):
     recipient_id: Optional[uuid.UUID] = None
     support_plan_created: bool = True
     request_id: Optional[uuid.UUID] = None  # For employee requests pending approval
+
+
+class RecipientImportRowError(BaseModel):
+    """Per-row validation or registration error in a bulk import"""
+    row: int  # ヘッダー行を1行目とした行番号
+    errors: List[str]
+
+
+class RecipientImportJobResponse(BaseModel):
+    """Progress and result of a bulk recipient import job"""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    status: RecipientImportStatus
+    file_name: Optional[str] = None
+    processed_rows: int
+    succeeded_rows: int
+    failed_rows: int
+    errors: List[RecipientImportRowError] = Field(default_factory=list)
+    created_at: datetime
+    finished_at: Optional[datetime] = None
@@ -9,18 +9,10 @@ from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.crud.crud_welfare_recipient import crud_welfare_recipient
+from app.crud.crud_welfare_recipient import WelfareRecipientBulkRow, crud_welfare_recipient
 from app.messages import ja
 from app.models.approval_request import ApprovalRequest
 from app.models.enums import ActionType, GenderType, ResourceType
-from app.models.welfare_recipient import (
-    DisabilityDetail,
-    DisabilityStatus,
-    EmergencyContact,
-    OfficeWelfareRecipient,
-    ServiceRecipientDetail,
-    WelfareRecipient,
-)
 
 logger = logging.getLogger(__name__)
 
@@ -133,32 +125,28 @@ class EmployeeActionExecutor:
                 form_data = request_data
 
         gender_value = basic_info.get("gender")
-        recipient = WelfareRecipient(
-            first_name=basic_info.get("firstName") or basic_info.get("first_name"),
-            last_name=basic_info.get("lastName") or basic_info.get("last_name"),
-            first_name_furigana=basic_info.get("firstNameFurigana") or basic_info.get("first_name_furigana"),
-            last_name_furigana=basic_info.get("lastNameFurigana") or basic_info.get("last_name_furigana"),
-            birth_day=_parse_birth_day(basic_info.get("birthDay") or basic_info.get("birth_day")),
-            gender=GenderType(gender_value) if gender_value else None,
+        row = WelfareRecipientBulkRow(
+            recipient={
+                "first_name": basic_info.get("firstName") or basic_info.get("first_name"),
+                "last_name": basic_info.get("lastName") or basic_info.get("last_name"),
+                "first_name_furigana": basic_info.get("firstNameFurigana") or basic_info.get("first_name_furigana"),
+                "last_name_furigana": basic_info.get("lastNameFurigana") or basic_info.get("last_name_furigana"),
+                "birth_day": _parse_birth_day(basic_info.get("birthDay") or basic_info.get("birth_day")),
+                "gender": GenderType(gender_value) if gender_value else None,
+            }
         )
-        db.add(recipient)
-        await db.flush()
-
-        recipient_id = recipient.id
-        await self._create_welfare_recipient_related_data(
-            db=db,
-            recipient_id=recipient_id,
-            request=request,
+        self._build_welfare_recipient_related_data(
+            row=row,
             request_data=request_data,
             form_data=form_data,
         )
 
-        association = OfficeWelfareRecipient(
+        # 利用者・事業所紐付け・関連データをテーブルごとに1文でINSERT（IDは事前採番）
+        recipient_id, = await crud_welfare_recipient.bulk_create_with_related(
+            db,
+            rows=[row],
             office_id=request.office_id,
-            welfare_recipient_id=recipient_id,
         )
-        db.add(association)
-        await db.flush()
 
         logger.info("Creating initial support plan for recipient")
         from app.services.welfare_recipient_service import WelfareRecipientService
@@ -176,22 +164,19 @@ class EmployeeActionExecutor:
             "resource_id": str(recipient_id),
         }
 
-    async def _create_welfare_recipient_related_data(
+    def _build_welfare_recipient_related_data(
         self,
         *,
-        db: AsyncSession,
-        recipient_id: UUID,
-        request: ApprovalRequest,
+        row: WelfareRecipientBulkRow,
         request_data: dict,
         form_data: dict,
     ) -> None:
-        logger.info("Creating related data for recipient")
+        logger.info("Building related data for recipient")
 
         contact_address = form_data.get("contactAddress", {})
         if not contact_address:
             contact_address = request_data.get("contact_address", {})
 
-        detail_id = None
         if contact_address and contact_address.get("address") and contact_address.get("tel"):
             form_of_residence_other_text = contact_address.get("formOfResidenceOtherText")
             if form_of_residence_other_text == "":
@@ -201,20 +186,16 @@ class EmployeeActionExecutor:
             if means_of_transportation_other_text == "":
                 means_of_transportation_other_text = None
 
-            detail = ServiceRecipientDetail(
-                welfare_recipient_id=recipient_id,
-                address=contact_address.get("address"),
-                form_of_residence=contact_address.get("formOfResidence"),
-                form_of_residence_other_text=form_of_residence_other_text,
-                means_of_transportation=contact_address.get("meansOfTransportation"),
-                means_of_transportation_other_text=means_of_transportation_other_text,
-                tel=contact_address.get("tel"),
-            )
-            db.add(detail)
-            await db.flush()
-            detail_id = detail.id
+            row.detail = {
+                "address": contact_address.get("address"),
+                "form_of_residence": contact_address.get("formOfResidence"),
+                "form_of_residence_other_text": form_of_residence_other_text,
+                "means_of_transportation": contact_address.get("meansOfTransportation"),
+                "means_of_transportation_other_text": means_of_transportation_other_text,
+                "tel": contact_address.get("tel"),
+            }
 
-        if detail_id:
+        if row.detail:
             emergency_contacts = form_data.get("emergencyContacts", [])
             if not emergency_contacts:
                 emergency_contacts = request_data.get("emergency_contacts", [])
@@ -227,30 +208,28 @@ class EmployeeActionExecutor:
                 if notes == "":
                     notes = None
 
-                db.add(
-                    EmergencyContact(
-                        service_recipient_detail_id=detail_id,
-                        first_name=contact_data.get("firstName") or contact_data.get("first_name"),
-                        last_name=contact_data.get("lastName") or contact_data.get("last_name"),
-                        first_name_furigana=(
+                row.emergency_contacts.append(
+                    {
+                        "first_name": contact_data.get("firstName") or contact_data.get("first_name"),
+                        "last_name": contact_data.get("lastName") or contact_data.get("last_name"),
+                        "first_name_furigana": (
                             contact_data.get("firstNameFurigana") or contact_data.get("first_name_furigana")
                         ),
-                        last_name_furigana=(
+                        "last_name_furigana": (
                             contact_data.get("lastNameFurigana") or contact_data.get("last_name_furigana")
                         ),
-                        relationship=contact_data.get("relationship"),
-                        tel=contact_data.get("tel"),
-                        address=address,
-                        notes=notes,
-                        priority=contact_data.get("priority"),
-                    )
+                        "relationship": contact_data.get("relationship"),
+                        "tel": contact_data.get("tel"),
+                        "address": address,
+                        "notes": notes,
+                        "priority": contact_data.get("priority"),
+                    }
                 )
 
         disability_info = form_data.get("disabilityInfo", {})
         if not disability_info:
             disability_info = request_data.get("disability_info", {})
 
-        disability_status_id = None
         if (
             disability_info
             and disability_info.get("disabilityOrDiseaseName")
@@ -260,22 +239,18 @@ class EmployeeActionExecutor:
             if special_remarks == "":
                 special_remarks = None
 
-            disability_status = DisabilityStatus(
-                welfare_recipient_id=recipient_id,
-                disability_or_disease_name=(
+            row.disability_status = {
+                "disability_or_disease_name": (
                     disability_info.get("disabilityOrDiseaseName")
                     or disability_info.get("disability_or_disease_name")
                 ),
-                livelihood_protection=(
+                "livelihood_protection": (
                     disability_info.get("livelihoodProtection") or disability_info.get("livelihood_protection")
                 ),
-                special_remarks=special_remarks,
-            )
-            db.add(disability_status)
-            await db.flush()
-            disability_status_id = disability_status.id
+                "special_remarks": special_remarks,
+            }
 
-        if disability_status_id:
+        if row.disability_status:
             disability_details = form_data.get("disabilityDetails", [])
             if not disability_details:
                 disability_details = request_data.get("disability_details", [])
@@ -297,17 +272,16 @@ class EmployeeActionExecutor:
                 if physical_disability_type_other_text == "":
                     physical_disability_type_other_text = None
 
-                db.add(
-                    DisabilityDetail(
-                        disability_status_id=disability_status_id,
-                        category=detail_data.get("category"),
-                        grade_or_level=grade_or_level,
-                        physical_disability_type=physical_disability_type,
-                        physical_disability_type_other_text=physical_disability_type_other_text,
-                        application_status=(
+                row.disability_details.append(
+                    {
+                        "category": detail_data.get("category"),
+                        "grade_or_level": grade_or_level,
+                        "physical_disability_type": physical_disability_type,
+                        "physical_disability_type_other_text": physical_disability_type_other_text,
+                        "application_status": (
                             detail_data.get("applicationStatus") or detail_data.get("application_status")
                         ),
-                    )
+                    }
                 )
 
     async def _update_welfare_recipient(
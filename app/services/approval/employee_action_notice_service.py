@@ -32,33 +32,30 @@ class EmployeeActionNoticeService:
         link_url = self.build_link_url(request_id)
         detail_info = self.extract_detail_from_request_data(request)
 
-        for approver_id in await self.get_approvers(db, office_id):
-            await crud_notice.create(
-                db,
-                obj_in=NoticeCreate(
-                    recipient_staff_id=approver_id,
-                    office_id=office_id,
-                    type=NoticeType.employee_action_pending.value,
-                    title=f"{requester_full_name}さんが{detail_info}リクエストしました。",
-                    content=f"{requester_full_name}さんが{detail_info}リクエストしました。",
-                    link_url=link_url,
-                ),
-                auto_commit=False,
+        notices = [
+            NoticeCreate(
+                recipient_staff_id=approver_id,
+                office_id=office_id,
+                type=NoticeType.employee_action_pending.value,
+                title=f"{requester_full_name}さんが{detail_info}リクエストしました。",
+                content=f"{requester_full_name}さんが{detail_info}リクエストしました。",
+                link_url=link_url,
             )
-
-        await crud_notice.create(
-            db,
-            obj_in=NoticeCreate(
+            for approver_id in await self.get_approvers(db, office_id)
+        ]
+        notices.append(
+            NoticeCreate(
                 recipient_staff_id=requester_staff_id,
                 office_id=office_id,
                 type=NoticeType.employee_action_request_sent.value,
                 title="作成、編集、削除リクエストを送信しました",
                 content=f"あなたの{detail_info}リクエストを送信しました。承認をお待ちください。",
                 link_url=link_url,
-            ),
-            auto_commit=False,
+            )
         )
 
+        await crud_notice.bulk_create(db, objs_in=notices)
+
         await crud_notice.delete_old_notices_over_limit(
             db,
             office_id=office_id,
@@ -186,56 +183,46 @@ class EmployeeActionNoticeService:
 
         await self._delete_existing_request_notices(db, link_url)
 
-        await crud_notice.create(
-            db,
-            obj_in=NoticeCreate(
+        notices = [
+            NoticeCreate(
                 recipient_staff_id=requester_staff_id,
                 office_id=office_id,
                 type=notice_type.value,
                 title=title,
                 content=f"あなたの{detail_info}リクエストが{requester_content_suffix}",
                 link_url=link_url,
-            ),
-            auto_commit=False,
-        )
-
-        for approver_id in await self.get_approvers(db, office_id):
-            await crud_notice.create(
-                db,
-                obj_in=NoticeCreate(
-                    recipient_staff_id=approver_id,
-                    office_id=office_id,
-                    type=notice_type.value,
-                    title=title,
-                    content=(
-                        f"{requester_full_name}さんの{detail_info}リクエストを"
-                        f"{approver_content_suffix}"
-                    ),
-                    link_url=link_url,
+            )
+        ]
+        notices.extend(
+            NoticeCreate(
+                recipient_staff_id=approver_id,
+                office_id=office_id,
+                type=notice_type.value,
+                title=title,
+                content=(
+                    f"{requester_full_name}さんの{detail_info}リクエストを"
+                    f"{approver_content_suffix}"
                 ),
-                auto_commit=False,
+                link_url=link_url,
             )
+            for approver_id in await self.get_approvers(db, office_id)
+        )
+
+        await crud_notice.bulk_create(db, objs_in=notices)
 
     async def _delete_existing_request_notices(
         self,
         db: AsyncSession,
         link_url: str,
     ) -> None:
-        delete_stmt = select(crud_notice.model).where(
-            crud_notice.model.link_url == link_url,
-            crud_notice.model.type.in_(
-                [
-                    NoticeType.employee_action_pending.value,
-                    NoticeType.employee_action_request_sent.value,
-                ]
-            ),
-        ).with_for_update()
-
-        delete_result = await db.execute(delete_stmt)
-        notices_to_delete = delete_result.scalars().all()
-
-        for notice in notices_to_delete:
-            await db.delete(notice)
+        await crud_notice.bulk_delete_by_link(
+            db,
+            link_url=link_url,
+            notice_types=[
+                NoticeType.employee_action_pending.value,
+                NoticeType.employee_action_request_sent.value,
+            ],
+        )
 
     def _get_resource_type(self, request: ApprovalRequest) -> ResourceType:
         return ResourceType(request.request_data.get("resource_type"))
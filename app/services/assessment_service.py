@@ -4,6 +4,7 @@
 利用者へのアクセス権限検証、全アセスメント情報の取得などを担当します。
 """
 
+from datetime import date
 from typing import Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,9 +16,7 @@ from app.models.staff import Staff
 from app.models.welfare_recipient import WelfareRecipient, OfficeWelfareRecipient
 from app.models.assessment import (
     FamilyOfServiceRecipients,
-    WelfareServicesUsed,
     MedicalMatters,
-    HistoryOfHospitalVisits,
     EmploymentRelated,
     IssueAnalysis,
 )
@@ -58,8 +57,6 @@ async def verify_recipient_access(
         HTTPException: 利用者が見つからない場合（404）
         HTTPException: アクセス権限がない場合（403）
     """
-    import logging
-    logger = logging.getLogger(__name__)
     # 利用者の取得
     stmt = select(WelfareRecipient).where(WelfareRecipient.id == recipient_id)
     result = await db.execute(stmt)
@@ -84,7 +81,20 @@ async def verify_recipient_access(
             detail="利用者が事業所に所属していません"
         )
 
-    recipient_office_id = office_recipient_association.office_id
+    _ensure_same_office(office_recipient_association.office_id, current_user)
+
+    return recipient
+
+
+def _ensure_same_office(recipient_office_id: UUID, current_user: Staff) -> None:
+    """
+    利用者の所属事業所と現在のユーザーの事業所が一致するか検証
+
+    Raises:
+        HTTPException: アクセス権限がない場合（403）
+    """
+    import logging
+    logger = logging.getLogger(__name__)
 
     # 現在のユーザーの所属事業所を取得
     # current_user.officeプロパティ経由でプライマリ事業所を取得
@@ -105,8 +115,6 @@ async def verify_recipient_access(
             detail="この利用者にアクセスする権限がありません"
         )
 
-    return recipient
-
 
 async def get_all_assessment_data(
     db: AsyncSession,
@@ -128,52 +136,39 @@ async def get_all_assessment_data(
         HTTPException: 利用者が見つからない場合（404）
         HTTPException: アクセス権限がない場合（403）
     """
-    # アクセス権限を検証
-    await verify_recipient_access(db, recipient_id, current_user)
-
-    # 家族構成を取得
-    stmt = select(FamilyOfServiceRecipients).where(
-        FamilyOfServiceRecipients.welfare_recipient_id == recipient_id
-    )
-    result = await db.execute(stmt)
-    family_members = result.scalars().all()
+    # 全アセスメント情報と所属事業所を1回のクエリで取得
+    aggregate = await crud.welfare_recipient.get_assessment_aggregate(db, recipient_id)
 
-    # サービス利用歴を取得（利用開始日の降順）
-    stmt = select(WelfareServicesUsed).where(
-        WelfareServicesUsed.welfare_recipient_id == recipient_id
-    ).order_by(WelfareServicesUsed.starting_day.desc())
-    result = await db.execute(stmt)
-    service_history = result.scalars().all()
+    # アクセス権限を検証（verify_recipient_access と同じ判定）
+    if aggregate is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="利用者が見つかりません"
+        )
+    recipient, recipient_office_id = aggregate
+    if recipient_office_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="利用者が事業所に所属していません"
+        )
+    _ensure_same_office(recipient_office_id, current_user)
 
-    # 医療基本情報を取得
-    stmt = select(MedicalMatters).where(
-        MedicalMatters.welfare_recipient_id == recipient_id
+    family_members = recipient.family_members
+    # サービス利用歴（利用開始日の降順）
+    service_history = sorted(
+        recipient.service_history, key=lambda sh: sh.starting_day, reverse=True
     )
-    result = await db.execute(stmt)
-    medical_info = result.scalar_one_or_none()
-
-    # 通院歴を取得（開始日の降順）
+    medical_info = recipient.medical_matters
+    # 通院歴（開始日の降順、未入力はPostgreSQLのDESCと同じく先頭）
     hospital_visits = []
     if medical_info:
-        stmt = select(HistoryOfHospitalVisits).where(
-            HistoryOfHospitalVisits.medical_matters_id == medical_info.id
-        ).order_by(HistoryOfHospitalVisits.date_started.desc())
-        result = await db.execute(stmt)
-        hospital_visits = result.scalars().all()
-
-    # 就労関係を取得
-    stmt = select(EmploymentRelated).where(
-        EmploymentRelated.welfare_recipient_id == recipient_id
-    )
-    result = await db.execute(stmt)
-    employment = result.scalar_one_or_none()
-
-    # 課題分析を取得
-    stmt = select(IssueAnalysis).where(
-        IssueAnalysis.welfare_recipient_id == recipient_id
-    )
-    result = await db.execute(stmt)
-    issue_analysis = result.scalar_one_or_none()
+        hospital_visits = sorted(
+            medical_info.hospital_visits,
+            key=lambda hv: (hv.date_started is None, hv.date_started or date.min),
+            reverse=True,
+        )
+    employment = recipient.employment_related
+    issue_analysis = recipient.issue_analysis
 
     # レスポンスを構築
     return AssessmentResponse(
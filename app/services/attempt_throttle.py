@@ -0,0 +1,128 @@
+"""
+試行回数制限（固定窓カウンタ）
+
+パスワード変更・メールアドレス変更・2段階認証コード検証・パスワードリセット
+トークン検証など、総当たりを防ぎたい操作の試行回数を (scope, subject) ごとの
+カウンタ1行で管理する。監査ログや申請テーブルを都度COUNTする方式と違い、
+判定は主キーの参照・UPSERT 1文で完結し、履歴が増えてもコストは変わらない。
+
+使い分け:
+- consume(): 試行を記録し、上限を超えていれば拒否する（成功・失敗に関わらず数える操作）
+- check() + record_failure(): 失敗した試行だけを数える操作
+
+窓が終了したカウンタは物理削除クリーンアップジョブでまとめて削除する。
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.messages import ja
+
+
+class RateLimitExceededError(Exception):
+    """レート制限超過エラー"""
+    pass
+
+
+class AttemptThrottle:
+    """
+    1種類の操作に対する試行回数制限
+
+    Args:
+        scope: 制限の種類（カウンタのキーの一部）
+        max_attempts: 窓内で許可する最大試行回数
+        window_seconds: 窓の長さ（秒）
+        message: 上限超過時のエラーメッセージ
+    """
+
+    def __init__(self, scope: str, max_attempts: int, window_seconds: int, message: str):
+        self.scope = scope
+        self.max_attempts = max_attempts
+        self.window_seconds = window_seconds
+        self.message = message
+
+    async def check(self, db: AsyncSession, subject: str) -> int:
+        """
+        記録せずに上限を確認
+
+        Returns:
+            現在の窓内の試行回数（0なら成功時のreset()は不要）
+
+        Raises:
+            RateLimitExceededError: 窓内の試行回数が上限に達している場合
+        """
+        count = await crud.attempt_counter.get_count(db, scope=self.scope, subject=subject)
+        if count >= self.max_attempts:
+            raise RateLimitExceededError(self.message)
+        return count
+
+    async def consume(self, db: AsyncSession, subject: str, *, auto_commit: bool = False) -> int:
+        """
+        試行を記録し、上限を超えていれば拒否（記録と判定を1文で行うため同時実行でも超過しない）
+
+        Returns:
+            記録後の試行回数
+
+        Raises:
+            RateLimitExceededError: 今回の試行で上限を超えた場合
+        """
+        count = await self._hit(db, subject, auto_commit=auto_commit)
+        if count > self.max_attempts:
+            raise RateLimitExceededError(self.message)
+        return count
+
+    async def record_failure(self, db: AsyncSession, subject: str, *, auto_commit: bool = True) -> int:
+        """
+        失敗した試行を記録
+
+        呼び出し側は直後に例外を送出してロールバックすることが多いため、
+        デフォルトでcommitして記録を確定させる。
+        """
+        return await self._hit(db, subject, auto_commit=auto_commit)
+
+    async def reset(self, db: AsyncSession, subject: str, *, auto_commit: bool = False) -> None:
+        """試行回数をクリア"""
+        await crud.attempt_counter.clear(
+            db, scope=self.scope, subject=subject, auto_commit=auto_commit
+        )
+
+    async def _hit(self, db: AsyncSession, subject: str, *, auto_commit: bool) -> int:
+        return await crud.attempt_counter.hit(
+            db,
+            scope=self.scope,
+            subject=subject,
+            window_seconds=self.window_seconds,
+            auto_commit=auto_commit,
+        )
+
+
+# パスワード変更: 成功・失敗に関わらず1時間に3回まで（スタッフ単位）
+password_change_throttle = AttemptThrottle(
+    scope="password_change",
+    max_attempts=3,
+    window_seconds=60 * 60,
+    message=ja.SERVICE_PASSWORD_CHANGE_ATTEMPTS_EXCEEDED,
+)
+
+# メールアドレス変更: 24時間に3回まで（スタッフ単位）
+email_change_throttle = AttemptThrottle(
+    scope="email_change",
+    max_attempts=3,
+    window_seconds=24 * 60 * 60,
+    message=ja.SERVICE_EMAIL_CHANGE_ATTEMPTS_EXCEEDED,
+)
+
+# 2段階認証コード検証: 失敗は15分に5回まで（スタッフ単位）
+mfa_verify_throttle = AttemptThrottle(
+    scope="mfa_verify",
+    max_attempts=5,
+    window_seconds=15 * 60,
+    message=ja.SERVICE_MFA_VERIFY_ATTEMPTS_EXCEEDED,
+)
+
+# パスワードリセットトークン検証: 失敗は1時間に20回まで（クライアントIP単位）
+password_reset_verify_throttle = AttemptThrottle(
+    scope="password_reset_verify",
+    max_attempts=20,
+    window_seconds=60 * 60,
+    message=ja.SERVICE_PASSWORD_RESET_VERIFY_ATTEMPTS_EXCEEDED,
+)
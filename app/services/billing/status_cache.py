@@ -0,0 +1,130 @@
+"""
+事業所ごとの課金ステータスキャッシュ
+
+require_active_billing が書き込みリクエストのたびに Billing を取得しないよう、
+office_id → BillingStatus をプロセス内に保持する。
+
+ステータスの書き込みは crud.billing（update / bulk_transition_status）に集約されており、
+そこで invalidate_on_commit() を呼び出す。キャッシュはセッションのCOMMIT後に破棄されるため、
+COMMIT前に別リクエストが古いステータスを読み直してキャッシュし直すことはない。
+
+他プロセス（別ワーカー・別インスタンス）での遷移は invalidate が届かないため、
+TTL を上限として古い値を使い続けないようにする。
+"""
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.models.enums import BillingStatus
+
+
+# COMMIT待ちの office_id を保持する Session.info のキー
+_PENDING_INFO_KEY = "billing_status_cache_pending"
+
+
+class BillingStatusCache:
+    """TTL付き・件数上限付きの office_id → BillingStatus キャッシュ"""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[UUID, tuple[BillingStatus, float]]" = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(self, office_id: UUID) -> Optional[BillingStatus]:
+        """有効期限内のステータスを返す。未登録・期限切れの場合はNone"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(office_id)
+            if entry is None:
+                return None
+
+            billing_status, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[office_id]
+                return None
+
+            self._entries.move_to_end(office_id)
+            return billing_status
+
+    def set(self, office_id: UUID, billing_status: BillingStatus) -> None:
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[office_id] = (billing_status, self._clock() + self.ttl_seconds)
+            self._entries.move_to_end(office_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, office_id: Optional[UUID]) -> None:
+        """課金ステータス遷移後に呼び出し、次回のチェックでDBから再取得させる"""
+        if office_id is None:
+            return
+
+        with self._lock:
+            self._entries.pop(office_id, None)
+
+    def invalidate_many(self, office_ids: Iterable[UUID]) -> None:
+        with self._lock:
+            for office_id in office_ids:
+                self._entries.pop(office_id, None)
+
+    def invalidate_on_commit(self, db, office_ids: Iterable[UUID]) -> None:
+        """
+        セッションのCOMMIT後に invalidate する（ROLLBACKされた場合は何もしない）
+
+        Args:
+            db: AsyncSession または Session
+            office_ids: ステータスを書き換えた事業所ID
+        """
+        session = getattr(db, "sync_session", db)
+        pending = session.info.get(_PENDING_INFO_KEY)
+        if pending is None:
+            pending = session.info[_PENDING_INFO_KEY] = set()
+
+            def _after_commit(_session) -> None:
+                self.invalidate_many(pending)
+                pending.clear()
+
+            def _after_soft_rollback(_session, previous_transaction) -> None:
+                # SAVEPOINTのROLLBACKでは外側がCOMMITされ得るため残す
+                if previous_transaction.parent is None:
+                    pending.clear()
+
+            event.listen(session, "after_commit", _after_commit)
+            event.listen(session, "after_soft_rollback", _after_soft_rollback)
+
+        pending.update(office_id for office_id in office_ids if office_id is not None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# アプリケーション全体で共有するキャッシュインスタンス
+billing_status_cache = BillingStatusCache(
+    ttl_seconds=settings.BILLING_STATUS_CACHE_TTL_SECONDS,
+    max_entries=settings.BILLING_STATUS_CACHE_MAX_ENTRIES,
+)
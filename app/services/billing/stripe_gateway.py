@@ -0,0 +1,148 @@
+"""Stripe external API boundary.
+
+stripe-python の同期SDK呼び出しを専用スレッドプールで実行し、
+async handler がHTTPSの往復中にイベントループを塞がないようにする。
+
+- スレッドプールは上限付き。RequestsClient はスレッドごとに Session を保持するため、
+  ワーカースレッド単位でコネクションが再利用される
+- タイムアウトとネットワークリトライ回数は設定値で制御する
+  （stripe-python のリトライは Idempotency-Key 付きで安全に再送される）
+- 呼び出しごとの所要時間・エラー件数を external_call_* メトリクスに記録する
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import stripe
+
+from app.core.config import settings
+from app.core.metrics import track_external_call
+
+_http_client_configured = False
+
+
+def configure_stripe_http_client(
+    *,
+    timeout_seconds: float,
+    max_network_retries: int,
+) -> None:
+    """stripe-python の共有HTTPクライアント（タイムアウト・リトライ）をプロセスで1度だけ設定する"""
+    global _http_client_configured
+    if _http_client_configured:
+        return
+
+    stripe.default_http_client = stripe.RequestsClient(timeout=timeout_seconds)
+    stripe.max_network_retries = max_network_retries
+    _http_client_configured = True
+
+
+class StripeGateway:
+    """Stripe API 呼び出しをワーカースレッドへ委譲する非同期ゲートウェイ"""
+
+    def __init__(
+        self,
+        *,
+        executor: Optional[ThreadPoolExecutor] = None,
+        max_workers: Optional[int] = None,
+    ):
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers or settings.STRIPE_API_MAX_WORKERS,
+            thread_name_prefix="stripe-api",
+        )
+
+    async def _call(
+        self,
+        operation: str,
+        func: Callable[..., Any],
+        *args: Any,
+        api_key: Optional[str] = None,
+        **params: Any,
+    ) -> Any:
+        # api_key 指定時はリクエスト単位で渡す（未指定時は stripe.api_key を使用）
+        if api_key:
+            params["api_key"] = api_key
+
+        loop = asyncio.get_running_loop()
+        with track_external_call("stripe", operation):
+            return await loop.run_in_executor(
+                self._executor,
+                functools.partial(func, *args, **params),
+            )
+
+    async def create_customer(
+        self,
+        *,
+        email: str,
+        name: str,
+        metadata: Dict[str, str],
+        api_key: Optional[str] = None,
+    ) -> Any:
+        return await self._call(
+            "customer.create",
+            stripe.Customer.create,
+            api_key=api_key,
+            email=email,
+            name=name,
+            metadata=metadata,
+        )
+
+    async def create_checkout_session(
+        self,
+        *,
+        api_key: Optional[str] = None,
+        **params: Any,
+    ) -> Any:
+        return await self._call(
+            "checkout.session.create",
+            stripe.checkout.Session.create,
+            api_key=api_key,
+            **params,
+        )
+
+    async def create_billing_portal_session(
+        self,
+        *,
+        customer: str,
+        return_url: str,
+        api_key: Optional[str] = None,
+    ) -> Any:
+        return await self._call(
+            "billing_portal.session.create",
+            stripe.billing_portal.Session.create,
+            api_key=api_key,
+            customer=customer,
+            return_url=return_url,
+        )
+
+    async def delete_subscription(
+        self,
+        subscription_id: str,
+        *,
+        api_key: Optional[str] = None,
+    ) -> Any:
+        return await self._call(
+            "subscription.delete",
+            stripe.Subscription.delete,
+            subscription_id,
+            api_key=api_key,
+        )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+
+
+_default_gateway: Optional[StripeGateway] = None
+
+
+def get_stripe_gateway() -> StripeGateway:
+    """アプリケーション全体で共有するStripeGatewayを返す"""
+    global _default_gateway
+    if _default_gateway is None:
+        configure_stripe_http_client(
+            timeout_seconds=settings.STRIPE_API_TIMEOUT_SECONDS,
+            max_network_retries=settings.STRIPE_API_MAX_NETWORK_RETRIES,
+        )
+        _default_gateway = StripeGateway()
+    return _default_gateway
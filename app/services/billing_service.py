@@ -23,6 +23,7 @@ from app import crud
 from app.models.enums import BillingStatus
 from app.messages import ja
 from app.services.billing.status_transition import BillingStatusTransitionService
+from app.services.billing.stripe_gateway import StripeGateway, get_stripe_gateway
 
 logger = logging.getLogger(__name__)
 
@@ -38,10 +39,16 @@ class BillingService:
     def __init__(
         self,
         status_transition_service: Optional[BillingStatusTransitionService] = None,
+        stripe_gateway: Optional[StripeGateway] = None,
     ):
         self.status_transition_service = (
             status_transition_service or BillingStatusTransitionService()
         )
+        self._stripe_gateway = stripe_gateway
+
+    @property
+    def stripe_gateway(self) -> StripeGateway:
+        return self._stripe_gateway or get_stripe_gateway()
 
     def _normalize_trial_end_date(self, trial_end_date: Optional[datetime]) -> Optional[datetime]:
         return self.status_transition_service.normalize_trial_end_date(trial_end_date)
@@ -168,8 +175,8 @@ class BillingService:
                 auto_commit=False
             )
 
-            stripe.api_key = stripe_secret_key
-            checkout_session = stripe.checkout.Session.create(
+            checkout_session = await self.stripe_gateway.create_checkout_session(
+                api_key=stripe_secret_key,
                 mode='subscription',
                 customer=stripe_customer_id,
                 line_items=[{
@@ -284,8 +291,8 @@ class BillingService:
             )
 
             # 1. Stripe APIでCustomerを作成（DB操作の前に実行）
-            stripe.api_key = stripe_secret_key
-            customer = stripe.Customer.create(
+            customer = await self.stripe_gateway.create_customer(
+                api_key=stripe_secret_key,
                 email=user_email,
                 name=office_name,
                 metadata={
@@ -306,7 +313,8 @@ class BillingService:
             )
 
             # 3. Checkout Sessionを作成（Stripe API）
-            checkout_session = stripe.checkout.Session.create(
+            checkout_session = await self.stripe_gateway.create_checkout_session(
+                api_key=stripe_secret_key,
                 mode='subscription',
                 customer=customer_id,
                 line_items=[{
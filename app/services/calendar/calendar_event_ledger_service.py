@@ -4,25 +4,91 @@ Google Calendarとの同期成否に関係なく、DB上の期限イベント台
 """
 
 import logging
+from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import select
+from sqlalchemy import or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.crud_office_calendar_account import crud_office_calendar_account
+from app.models.calendar_account import OfficeCalendarAccount
 from app.models.calendar_events import CalendarEvent
 from app.models.enums import (
     CalendarConnectionStatus,
     CalendarEventType,
     CalendarSyncStatus,
+    SupportPlanStep,
 )
+from app.models.support_plan_cycle import SupportPlanCycle, SupportPlanStatus
 from app.models.welfare_recipient import WelfareRecipient
 
 logger = logging.getLogger(__name__)
 
+JST = ZoneInfo("Asia/Tokyo")
+
+
+@dataclass(frozen=True)
+class CycleLedgerEntry:
+    """1サイクル分の台帳作成要求（create_cycle_events_bulk の入力）。
+
+    renewal_deadline は next_renewal_deadline がある場合、
+    assessment_incomplete / next_plan_start_date は対応するステータスIDがある場合に作成する。
+    """
+
+    office_id: UUID
+    welfare_recipient_id: UUID
+    cycle_id: int
+    cycle_number: int
+    plan_cycle_start_date: Optional[date]
+    next_renewal_deadline: Optional[date]
+    assessment_status_id: Optional[int] = None
+    monitoring_status_id: Optional[int] = None
+
+
+def _renewal_deadline_fields(recipient_name: str, cycle_number: int, next_renewal_deadline: date) -> dict:
+    event_start_date = date.today() + timedelta(days=150)
+    return {
+        "event_type": CalendarEventType.renewal_deadline,
+        "event_title": f"{recipient_name} 更新期限まで残り1ヶ月",
+        "event_description": f"個別支援計画の更新期限です（{cycle_number}回目）。\n期限: {next_renewal_deadline}",
+        "event_start_datetime": datetime.combine(event_start_date, time(9, 0), tzinfo=JST),
+        "event_end_datetime": datetime.combine(next_renewal_deadline, time(18, 0), tzinfo=JST),
+    }
+
+
+def _next_plan_start_date_fields(recipient_name: str, cycle_number: int, cycle_start_date: date) -> dict:
+    return {
+        "event_type": CalendarEventType.next_plan_start_date,
+        "event_title": f"{recipient_name} 次の個別支援計画の開始期限",
+        "event_description": f"次の個別支援計画の開始期限です（{cycle_number}回目）。",
+        "event_start_datetime": datetime.combine(cycle_start_date, time(9, 0), tzinfo=JST),
+        "event_end_datetime": datetime.combine(cycle_start_date + timedelta(days=7), time(18, 0), tzinfo=JST),
+    }
+
+
+def _assessment_incomplete_fields(recipient_name: str, cycle_start_date: date) -> dict:
+    return {
+        "event_type": CalendarEventType.assessment_incomplete,
+        "event_title": f"{recipient_name} アセスメント未完了",
+        "event_description": "アセスメントが未完了です。",
+        "event_start_datetime": datetime.combine(cycle_start_date, time(9, 0), tzinfo=JST),
+        "event_end_datetime": datetime.combine(cycle_start_date + timedelta(days=7), time(18, 0), tzinfo=JST),
+    }
+
+
+def _connected_calendar_id(account: Optional[OfficeCalendarAccount]) -> Optional[str]:
+    if (
+        account is not None
+        and account.connection_status == CalendarConnectionStatus.connected
+        and account.google_calendar_id
+    ):
+        return account.google_calendar_id
+    return None
+
 
 class CalendarEventLedgerService:
     """DB上の期限イベント台帳を作成・検索・削除するサービス。"""
@@ -50,15 +116,10 @@ class CalendarEventLedgerService:
             db=db,
             office_id=office_id,
         )
-        is_google_connected = (
-            account is not None
-            and account.connection_status == CalendarConnectionStatus.connected
-            and account.google_calendar_id
-        )
-        account_calendar_id = account.google_calendar_id if is_google_connected else None
+        account_calendar_id = _connected_calendar_id(account)
         sync_status = (
             CalendarSyncStatus.pending
-            if is_google_connected
+            if account_calendar_id
             else CalendarSyncStatus.local_only
         )
 
@@ -80,20 +141,18 @@ class CalendarEventLedgerService:
             logger.error("Support plan cycle not found")
             return []
 
-        jst = ZoneInfo("Asia/Tokyo")
-        event_start_date = date.today() + timedelta(days=150)
         event = CalendarEvent(
             office_id=office_id,
             welfare_recipient_id=welfare_recipient_id,
             support_plan_cycle_id=cycle_id,
-            event_type=CalendarEventType.renewal_deadline,
             google_calendar_id=account_calendar_id,
-            event_title=f"{recipient.last_name} {recipient.first_name} 更新期限まで残り1ヶ月",
-            event_description=f"個別支援計画の更新期限です（{cycle.cycle_number}回目）。\n期限: {next_renewal_deadline}",
-            event_start_datetime=datetime.combine(event_start_date, time(9, 0), tzinfo=jst),
-            event_end_datetime=datetime.combine(next_renewal_deadline, time(18, 0), tzinfo=jst),
             created_by_system=True,
             sync_status=sync_status,
+            **_renewal_deadline_fields(
+                f"{recipient.last_name} {recipient.first_name}",
+                cycle.cycle_number,
+                next_renewal_deadline,
+            ),
         )
         db.add(event)
         await db.flush()
@@ -129,15 +188,10 @@ class CalendarEventLedgerService:
             db=db,
             office_id=office_id,
         )
-        is_google_connected = (
-            account is not None
-            and account.connection_status == CalendarConnectionStatus.connected
-            and account.google_calendar_id
-        )
-        account_calendar_id = account.google_calendar_id if is_google_connected else None
+        account_calendar_id = _connected_calendar_id(account)
         sync_status = (
             CalendarSyncStatus.pending
-            if is_google_connected
+            if account_calendar_id
             else CalendarSyncStatus.local_only
         )
 
@@ -149,19 +203,18 @@ class CalendarEventLedgerService:
             logger.error("Welfare recipient not found")
             return []
 
-        jst = ZoneInfo("Asia/Tokyo")
         event = CalendarEvent(
             office_id=office_id,
             welfare_recipient_id=welfare_recipient_id,
             support_plan_status_id=status_id,
-            event_type=CalendarEventType.next_plan_start_date,
             google_calendar_id=account_calendar_id,
-            event_title=f"{recipient.last_name} {recipient.first_name} 次の個別支援計画の開始期限",
-            event_description=f"次の個別支援計画の開始期限です（{cycle_number}回目）。",
-            event_start_datetime=datetime.combine(cycle_start_date, time(9, 0), tzinfo=jst),
-            event_end_datetime=datetime.combine(cycle_start_date + timedelta(days=7), time(18, 0), tzinfo=jst),
             created_by_system=True,
             sync_status=sync_status,
+            **_next_plan_start_date_fields(
+                f"{recipient.last_name} {recipient.first_name}",
+                cycle_number,
+                cycle_start_date,
+            ),
         )
         db.add(event)
         await db.flush()
@@ -189,15 +242,10 @@ class CalendarEventLedgerService:
             db=db,
             office_id=office_id,
         )
-        is_google_connected = (
-            account is not None
-            and account.connection_status == CalendarConnectionStatus.connected
-            and account.google_calendar_id
-        )
-        account_calendar_id = account.google_calendar_id if is_google_connected else None
+        account_calendar_id = _connected_calendar_id(account)
         sync_status = (
             CalendarSyncStatus.pending
-            if is_google_connected
+            if account_calendar_id
             else CalendarSyncStatus.local_only
         )
 
@@ -209,25 +257,231 @@ class CalendarEventLedgerService:
             logger.error("Welfare recipient not found")
             return []
 
-        jst = ZoneInfo("Asia/Tokyo")
         event = CalendarEvent(
             office_id=office_id,
             welfare_recipient_id=welfare_recipient_id,
             support_plan_status_id=status_id,
-            event_type=CalendarEventType.assessment_incomplete,
             google_calendar_id=account_calendar_id,
-            event_title=f"{recipient.last_name} {recipient.first_name} アセスメント未完了",
-            event_description="アセスメントが未完了です。",
-            event_start_datetime=datetime.combine(cycle_start_date, time(9, 0), tzinfo=jst),
-            event_end_datetime=datetime.combine(cycle_start_date + timedelta(days=7), time(18, 0), tzinfo=jst),
             created_by_system=True,
             sync_status=sync_status,
+            **_assessment_incomplete_fields(
+                f"{recipient.last_name} {recipient.first_name}",
+                cycle_start_date,
+            ),
         )
         db.add(event)
         await db.flush()
 
         return [event.id]
 
+    async def create_cycle_events_bulk(
+        self,
+        db: AsyncSession,
+        entries: Sequence[CycleLedgerEntry],
+    ) -> list[UUID]:
+        """複数サイクル分の期限イベントをまとめて作成する。
+
+        カレンダーアカウント・利用者名・既存イベントをそれぞれ1クエリで解決し、
+        不足しているイベントを1文のINSERTで作成する。作成内容は
+        create_renewal_deadline_events などの単発版と同じ。
+        同時実行で既に作成済みのイベントは重複防止インデックスによりスキップされる。
+
+        Returns:
+            作成したイベントIDのリスト
+        """
+        if not entries:
+            return []
+
+        office_ids = {entry.office_id for entry in entries}
+        account_result = await db.execute(
+            select(OfficeCalendarAccount).where(OfficeCalendarAccount.office_id.in_(office_ids))
+        )
+        calendar_ids = {
+            account.office_id: _connected_calendar_id(account)
+            for account in account_result.scalars().all()
+        }
+
+        recipient_result = await db.execute(
+            select(WelfareRecipient.id, WelfareRecipient.last_name, WelfareRecipient.first_name)
+            .where(WelfareRecipient.id.in_({entry.welfare_recipient_id for entry in entries}))
+        )
+        recipient_names = {
+            recipient_id: f"{last_name} {first_name}"
+            for recipient_id, last_name, first_name in recipient_result.all()
+        }
+
+        cycle_ids = {entry.cycle_id for entry in entries}
+        status_ids = {
+            status_id
+            for entry in entries
+            for status_id in (entry.assessment_status_id, entry.monitoring_status_id)
+            if status_id is not None
+        }
+        existing_result = await db.execute(
+            select(
+                CalendarEvent.support_plan_cycle_id,
+                CalendarEvent.support_plan_status_id,
+                CalendarEvent.event_type,
+            ).where(
+                or_(
+                    CalendarEvent.support_plan_cycle_id.in_(cycle_ids),
+                    CalendarEvent.support_plan_status_id.in_(status_ids),
+                )
+            )
+        )
+        existing_keys = set()
+        for cycle_id, status_id, event_type in existing_result.all():
+            if cycle_id is not None:
+                existing_keys.add(("cycle", cycle_id, event_type))
+            if status_id is not None:
+                existing_keys.add(("status", status_id, event_type))
+
+        rows = []
+        for entry in entries:
+            recipient_name = recipient_names.get(entry.welfare_recipient_id)
+            if recipient_name is None:
+                logger.error("Welfare recipient not found")
+                continue
+
+            calendar_id = calendar_ids.get(entry.office_id)
+            base = {
+                "office_id": entry.office_id,
+                "welfare_recipient_id": entry.welfare_recipient_id,
+                "support_plan_cycle_id": None,
+                "support_plan_status_id": None,
+                "google_calendar_id": calendar_id,
+                "created_by_system": True,
+                "sync_status": CalendarSyncStatus.pending if calendar_id else CalendarSyncStatus.local_only,
+            }
+
+            if (
+                entry.assessment_status_id is not None
+                and entry.plan_cycle_start_date is not None
+                and ("status", entry.assessment_status_id, CalendarEventType.assessment_incomplete) not in existing_keys
+            ):
+                rows.append({
+                    **base,
+                    "support_plan_status_id": entry.assessment_status_id,
+                    **_assessment_incomplete_fields(recipient_name, entry.plan_cycle_start_date),
+                })
+
+            if (
+                entry.next_renewal_deadline is not None
+                and ("cycle", entry.cycle_id, CalendarEventType.renewal_deadline) not in existing_keys
+            ):
+                rows.append({
+                    **base,
+                    "support_plan_cycle_id": entry.cycle_id,
+                    **_renewal_deadline_fields(recipient_name, entry.cycle_number, entry.next_renewal_deadline),
+                })
+
+            if (
+                entry.monitoring_status_id is not None
+                and entry.plan_cycle_start_date is not None
+                and ("status", entry.monitoring_status_id, CalendarEventType.next_plan_start_date) not in existing_keys
+            ):
+                rows.append({
+                    **base,
+                    "support_plan_status_id": entry.monitoring_status_id,
+                    **_next_plan_start_date_fields(recipient_name, entry.cycle_number, entry.plan_cycle_start_date),
+                })
+
+        if not rows:
+            return []
+
+        result = await db.execute(
+            pg_insert(CalendarEvent)
+            .values(rows)
+            .on_conflict_do_nothing()
+            .returning(CalendarEvent.id)
+        )
+        return list(result.scalars().all())
+
+    async def backfill_office_events(
+        self,
+        db: AsyncSession,
+        office_id: UUID,
+    ) -> dict:
+        """Google Calendarを連携した事業所の台帳を同期対象にそろえる。
+
+        - 連携前に作られた local_only のイベントを同期待ち（pending）にする
+        - 最新サイクルで未完了のステップに対応するイベントが欠けていれば作成する
+
+        連携していない事業所では欠けているイベントの作成のみ行う（local_only）。
+
+        Returns:
+            {"promoted": pendingにした件数, "created": 作成した件数}
+        """
+        account = await crud_office_calendar_account.get_by_office_id(db=db, office_id=office_id)
+        calendar_id = _connected_calendar_id(account)
+
+        promoted = 0
+        if calendar_id:
+            result = await db.execute(
+                update(CalendarEvent)
+                .where(
+                    CalendarEvent.office_id == office_id,
+                    CalendarEvent.sync_status == CalendarSyncStatus.local_only,
+                )
+                .values(
+                    google_calendar_id=calendar_id,
+                    sync_status=CalendarSyncStatus.pending,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            promoted = result.rowcount
+
+        cycle_result = await db.execute(
+            select(SupportPlanCycle).where(
+                SupportPlanCycle.office_id == office_id,
+                SupportPlanCycle.is_latest_cycle == True,  # noqa: E712
+            )
+        )
+        cycles = list(cycle_result.scalars().all())
+        if not cycles:
+            return {"promoted": promoted, "created": 0}
+
+        status_result = await db.execute(
+            select(SupportPlanStatus.plan_cycle_id, SupportPlanStatus.step_type, SupportPlanStatus.id)
+            .where(
+                SupportPlanStatus.plan_cycle_id.in_([cycle.id for cycle in cycles]),
+                SupportPlanStatus.completed == False,  # noqa: E712
+                SupportPlanStatus.step_type.in_([
+                    SupportPlanStep.assessment,
+                    SupportPlanStep.final_plan_signed,
+                    SupportPlanStep.monitoring,
+                ]),
+            )
+        )
+        open_steps: dict[int, dict[SupportPlanStep, int]] = {}
+        for cycle_id, step_type, status_id in status_result.all():
+            open_steps.setdefault(cycle_id, {})[step_type] = status_id
+
+        entries = []
+        for cycle in cycles:
+            steps = open_steps.get(cycle.id, {})
+            entries.append(CycleLedgerEntry(
+                office_id=cycle.office_id,
+                welfare_recipient_id=cycle.welfare_recipient_id,
+                cycle_id=cycle.id,
+                cycle_number=cycle.cycle_number,
+                plan_cycle_start_date=cycle.plan_cycle_start_date,
+                # 更新期限イベントは本計画の署名完了で削除されるため、未完了の場合のみ
+                next_renewal_deadline=(
+                    cycle.next_renewal_deadline
+                    if SupportPlanStep.final_plan_signed in steps
+                    else None
+                ),
+                assessment_status_id=steps.get(SupportPlanStep.assessment),
+                # 開始期限イベントはモニタリングから作られた2回目以降のサイクルのみ
+                monitoring_status_id=(
+                    steps.get(SupportPlanStep.monitoring) if cycle.cycle_number > 1 else None
+                ),
+            ))
+
+        created = await self.create_cycle_events_bulk(db=db, entries=entries)
+        return {"promoted": promoted, "created": len(created)}
+
     async def get_event_by_cycle(
         self,
         db: AsyncSession,
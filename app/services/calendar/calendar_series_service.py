@@ -0,0 +1,63 @@
+"""Calendar event series materialization.
+
+通知パターン（NotificationPattern）から期限ごとのシリーズ・インスタンスを作成・更新する。
+各手順は crud.calendar_event_series の集合演算1文ずつで、件数に比例したループはない。
+"""
+
+from datetime import date, datetime
+from typing import Dict, Optional
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.crud_calendar_event_series import crud_calendar_event_series
+
+JST = ZoneInfo("Asia/Tokyo")
+
+
+class CalendarSeriesService:
+    """期限の変化をシリーズ・インスタンスへ差分反映するサービス。"""
+
+    async def materialize(
+        self,
+        db: AsyncSession,
+        *,
+        office_id: Optional[UUID] = None,
+        today: Optional[date] = None,
+        auto_commit: bool = True,
+    ) -> Dict[str, int]:
+        """
+        シリーズ・インスタンスを現在の期限に合わせる
+
+        1. 期限 × 有効な通知パターンのシリーズを作成・更新
+        2. 対象外になったシリーズを終了
+        3. 終了したシリーズ・通知日数から外れた日のインスタンスを取り消し
+        4. 今日以降の通知日のインスタンスを作成・更新
+        5. 通知日時を過ぎたインスタンスを完了にし、シリーズの件数・状態を集計
+
+        Google Calendarへの反映は GoogleCalendarSyncService.sync_pending_instances が行う。
+        """
+        today = today or datetime.now(JST).date()
+        result = {
+            "series_upserted": await crud_calendar_event_series.upsert_series(
+                db=db, today=today, office_id=office_id
+            ),
+            "series_finished": await crud_calendar_event_series.finish_inactive_series(
+                db=db, today=today, office_id=office_id
+            ),
+            "instances_cancelled": await crud_calendar_event_series.cancel_stale_instances(
+                db=db, office_id=office_id
+            ),
+            "instances_upserted": await crud_calendar_event_series.upsert_instances(
+                db=db, today=today, office_id=office_id
+            ),
+            "instances_completed": await crud_calendar_event_series.complete_past_instances(
+                db=db, office_id=office_id
+            ),
+        }
+        await crud_calendar_event_series.refresh_series_progress(db=db, office_id=office_id)
+
+        if auto_commit:
+            await db.commit()
+        return result
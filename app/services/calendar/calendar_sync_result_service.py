@@ -1,14 +1,22 @@
 """Calendar sync result persistence."""
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.crud.crud_calendar_event import crud_calendar_event
-from app.models.enums import CalendarSyncStatus
+from app.models.enums import CalendarSyncStatus, EventInstanceStatus
 from app.schemas.calendar_event import CalendarEventUpdate
 
 
+def retry_delay(attempts: int) -> timedelta:
+    """attempts回目の失敗後、次の再試行までの待ち時間（指数バックオフ）"""
+    seconds = settings.CALENDAR_SYNC_RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0))
+    return timedelta(seconds=min(seconds, settings.CALENDAR_SYNC_RETRY_MAX_SECONDS))
+
+
 class CalendarSyncResultService:
     """Google同期結果をDBイベントへ反映するサービス。"""
 
@@ -18,17 +26,53 @@ class CalendarSyncResultService:
             sync_status=CalendarSyncStatus.synced,
             last_sync_at=datetime.now(),
             last_error_message=None,
+            sync_attempts=0,
+            next_sync_attempt_at=None,
+            sync_lease_expires_at=None,
         )
         await crud_calendar_event.update(db=db, db_obj=event, obj_in=update_data)
 
     async def mark_failed(self, db: AsyncSession, event, message: str) -> None:
+        # 失敗したイベントは failed のまま、バックオフ後に同期キューから再試行される
+        attempts = (event.sync_attempts or 0) + 1
         update_data = CalendarEventUpdate(
             sync_status=CalendarSyncStatus.failed,
             last_error_message=message,
             last_sync_at=datetime.now(),
+            sync_attempts=attempts,
+            next_sync_attempt_at=datetime.now(timezone.utc) + retry_delay(attempts),
+            sync_lease_expires_at=None,
         )
         await crud_calendar_event.update(db=db, db_obj=event, obj_in=update_data)
 
+    def apply_instance_synced(self, instance, google_event_id: Optional[str]) -> None:
+        """
+        インスタンスの同期結果を反映する（コミットは呼び出し側でバッチ単位に行う）
+
+        取り消し済みのインスタンスはGoogle側から削除済みのため google_event_id を外す。
+        """
+        if instance.instance_status == EventInstanceStatus.cancelled:
+            instance.google_event_id = None
+            instance.sync_status = CalendarSyncStatus.cancelled
+        else:
+            instance.google_event_id = google_event_id
+            instance.instance_status = EventInstanceStatus.created
+            instance.sync_status = CalendarSyncStatus.synced
+        instance.last_sync_at = datetime.now(timezone.utc)
+        instance.last_error_message = None
+        instance.sync_attempts = 0
+        instance.next_sync_attempt_at = None
+        instance.sync_lease_expires_at = None
+
+    def apply_instance_failed(self, instance, message: str) -> None:
+        attempts = (instance.sync_attempts or 0) + 1
+        instance.sync_status = CalendarSyncStatus.failed
+        instance.last_error_message = message
+        instance.last_sync_at = datetime.now(timezone.utc)
+        instance.sync_attempts = attempts
+        instance.next_sync_attempt_at = datetime.now(timezone.utc) + retry_delay(attempts)
+        instance.sync_lease_expires_at = None
+
     async def mark_many_failed(self, db: AsyncSession, events: list, message: str) -> int:
         for event in events:
             await self.mark_failed(db=db, event=event, message=message)
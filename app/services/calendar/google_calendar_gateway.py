@@ -4,6 +4,7 @@ import inspect
 from datetime import datetime
 from typing import Type
 
+from app.core.metrics import track_external_call
 from app.services.google_calendar_client import GoogleCalendarClient
 
 
@@ -28,14 +29,37 @@ class GoogleCalendarGateway:
         start_datetime: datetime,
         end_datetime: datetime,
     ) -> str:
-        client = self.build_authenticated_client(service_account_json)
-        return client.create_event(
-            calendar_id=calendar_id,
-            title=title,
-            description=description,
-            start_datetime=start_datetime,
-            end_datetime=end_datetime,
-        )
+        with track_external_call("google_calendar", "create_event"):
+            client = self.build_authenticated_client(service_account_json)
+            return client.create_event(
+                calendar_id=calendar_id,
+                title=title,
+                description=description,
+                start_datetime=start_datetime,
+                end_datetime=end_datetime,
+            )
+
+    def update_event(
+        self,
+        *,
+        service_account_json: str,
+        calendar_id: str,
+        event_id: str,
+        title: str,
+        description: str,
+        start_datetime: datetime,
+        end_datetime: datetime,
+    ) -> None:
+        with track_external_call("google_calendar", "update_event"):
+            client = self.build_authenticated_client(service_account_json)
+            client.update_event(
+                calendar_id=calendar_id,
+                event_id=event_id,
+                title=title,
+                description=description,
+                start_datetime=start_datetime,
+                end_datetime=end_datetime,
+            )
 
     def delete_event(
         self,
@@ -44,10 +68,11 @@ class GoogleCalendarGateway:
         calendar_id: str,
         event_id: str,
     ) -> None:
-        client = self.build_authenticated_client(service_account_json)
-        result = client.delete_event(
-            calendar_id=calendar_id,
-            event_id=event_id,
-        )
+        with track_external_call("google_calendar", "delete_event"):
+            client = self.build_authenticated_client(service_account_json)
+            result = client.delete_event(
+                calendar_id=calendar_id,
+                event_id=event_id,
+            )
         if inspect.isawaitable(result):
             result.close()
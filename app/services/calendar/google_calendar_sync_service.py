@@ -1,17 +1,24 @@
 """Google Calendar sync orchestration."""
 
+from datetime import timedelta
 from typing import Dict, Optional
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.tracing import parse_traceparent, start_span
 from app.crud.crud_calendar_event import crud_calendar_event
-from app.models.enums import CalendarEventType
+from app.crud.crud_calendar_event_series import crud_calendar_event_series
+from app.models.enums import CalendarEventType, EventInstanceStatus
 from app.services.calendar.calendar_event_ledger_service import CalendarEventLedgerService
 from app.services.calendar.calendar_sync_result_service import CalendarSyncResultService
 from app.services.calendar.google_calendar_account_service import GoogleCalendarAccountService
 from app.services.calendar.google_calendar_gateway import GoogleCalendarGateway
 
+# 通知インスタンスをGoogle Calendarに置くときの予定の長さ
+INSTANCE_EVENT_DURATION = timedelta(hours=1)
+
 
 class GoogleCalendarSyncService:
     """Google Calendarへの同期と削除を隔離する互換サービス。"""
@@ -40,28 +47,43 @@ class GoogleCalendarSyncService:
         db: AsyncSession,
         office_id: Optional[UUID] = None,
     ) -> Dict[str, int]:
+        """
+        同期待ちイベントをバッチ単位でクレームして同期する
+
+        1回に確保するのは CALENDAR_SYNC_BATCH_SIZE 件までで、未処理の行がなくなるまで
+        クレームを繰り返す。クレーム済みの行は他のワーカーから取得されないため、
+        複数プロセスで同時に実行してよい。
+        """
         synced_count = 0
         failed_count = 0
+        processed_ids = set()
 
-        pending_events = await crud_calendar_event.get_pending_sync_events(db=db)
-        if office_id:
-            pending_events = [event for event in pending_events if event.office_id == office_id]
-
-        if not pending_events:
-            return {"synced": 0, "failed": 0}
-
-        events_by_office: Dict[UUID, list] = {}
-        for event in pending_events:
-            events_by_office.setdefault(event.office_id, []).append(event)
-
-        for current_office_id, events in events_by_office.items():
-            result = await self.sync_event_group(
+        while True:
+            events = await crud_calendar_event.claim_pending_sync_events(
                 db=db,
-                office_id=current_office_id,
-                events=events,
+                limit=settings.CALENDAR_SYNC_BATCH_SIZE,
+                lease_seconds=settings.CALENDAR_SYNC_LEASE_SECONDS,
+                max_attempts=settings.CALENDAR_SYNC_MAX_ATTEMPTS,
+                office_id=office_id,
             )
-            synced_count += result["synced"]
-            failed_count += result["failed"]
+            # 同じ実行内で処理済みの行しか返らない場合は打ち切る
+            events = [event for event in events if event.id not in processed_ids]
+            if not events:
+                break
+            processed_ids.update(event.id for event in events)
+
+            events_by_office: Dict[UUID, list] = {}
+            for event in events:
+                events_by_office.setdefault(event.office_id, []).append(event)
+
+            for current_office_id, office_events in events_by_office.items():
+                result = await self.sync_event_group(
+                    db=db,
+                    office_id=current_office_id,
+                    events=office_events,
+                )
+                synced_count += result["synced"]
+                failed_count += result["failed"]
 
         return {"synced": synced_count, "failed": failed_count}
 
@@ -96,14 +118,20 @@ class GoogleCalendarSyncService:
 
         for event in events:
             try:
-                google_event_id = self.gateway.create_event(
-                    service_account_json=service_account_json,
-                    calendar_id=event.google_calendar_id,
-                    title=event.event_title,
-                    description=event.event_description,
-                    start_datetime=event.event_start_datetime,
-                    end_datetime=event.event_end_datetime,
-                )
+                # イベントを作成したリクエストのトレースにリンクする
+                with start_span(
+                    "calendar.sync_event",
+                    attributes={"calendar_event.id": str(event.id)},
+                    links=[parse_traceparent(event.trace_parent)],
+                ):
+                    google_event_id = self.gateway.create_event(
+                        service_account_json=service_account_json,
+                        calendar_id=event.google_calendar_id,
+                        title=event.event_title,
+                        description=event.event_description,
+                        start_datetime=event.event_start_datetime,
+                        end_datetime=event.event_end_datetime,
+                    )
                 await self.sync_result_service.mark_synced(
                     db=db,
                     event=event,
@@ -120,6 +148,121 @@ class GoogleCalendarSyncService:
 
         return {"synced": synced_count, "failed": failed_count}
 
+    async def sync_pending_instances(
+        self,
+        db: AsyncSession,
+        office_id: Optional[UUID] = None,
+    ) -> Dict[str, int]:
+        """
+        通知インスタンスの同期待ちをバッチ単位でクレームしてGoogle Calendarに反映する
+
+        - cancelled: 登録済みならGoogle側から削除
+        - modified: 登録済みの予定を更新
+        - pending: 新規作成
+
+        結果はバッチごとに1回コミットする。
+        """
+        synced_count = 0
+        failed_count = 0
+        processed_ids = set()
+
+        while True:
+            instances = await crud_calendar_event_series.claim_pending_instances(
+                db=db,
+                limit=settings.CALENDAR_SYNC_BATCH_SIZE,
+                lease_seconds=settings.CALENDAR_SYNC_LEASE_SECONDS,
+                max_attempts=settings.CALENDAR_SYNC_MAX_ATTEMPTS,
+                office_id=office_id,
+            )
+            instances = [instance for instance in instances if instance.id not in processed_ids]
+            if not instances:
+                break
+            processed_ids.update(instance.id for instance in instances)
+
+            series_map = await crud_calendar_event_series.get_series_map(
+                db=db,
+                series_ids={instance.event_series_id for instance in instances},
+            )
+            instances_by_office: Dict[UUID, list] = {}
+            for instance in instances:
+                series = series_map[instance.event_series_id]
+                instances_by_office.setdefault(series.office_id, []).append(instance)
+
+            for current_office_id, office_instances in instances_by_office.items():
+                result = await self.sync_instance_group(
+                    db=db,
+                    office_id=current_office_id,
+                    instances=office_instances,
+                    series_map=series_map,
+                )
+                synced_count += result["synced"]
+                failed_count += result["failed"]
+
+            await db.commit()
+
+        return {"synced": synced_count, "failed": failed_count}
+
+    async def sync_instance_group(
+        self,
+        db: AsyncSession,
+        office_id: UUID,
+        instances: list,
+        series_map: dict,
+    ) -> Dict[str, int]:
+        try:
+            service_account_json = await self.account_service.get_connected_service_account_json(
+                db=db,
+                office_id=office_id,
+            )
+        except Exception as exc:
+            message = (
+                type(exc).__name__ if isinstance(exc, ValueError)
+                else f"カレンダー連携の認証に失敗しました: {type(exc).__name__}"
+            )
+            for instance in instances:
+                self.sync_result_service.apply_instance_failed(instance, message)
+            return {"synced": 0, "failed": len(instances)}
+
+        synced_count = 0
+        failed_count = 0
+        for instance in instances:
+            calendar_id = series_map[instance.event_series_id].google_calendar_id
+            try:
+                google_event_id = instance.google_event_id
+                if instance.instance_status == EventInstanceStatus.cancelled:
+                    if google_event_id:
+                        self.gateway.delete_event(
+                            service_account_json=service_account_json,
+                            calendar_id=calendar_id,
+                            event_id=google_event_id,
+                        )
+                elif google_event_id:
+                    self.gateway.update_event(
+                        service_account_json=service_account_json,
+                        calendar_id=calendar_id,
+                        event_id=google_event_id,
+                        title=instance.instance_title,
+                        description=instance.instance_description,
+                        start_datetime=instance.event_datetime,
+                        end_datetime=instance.event_datetime + INSTANCE_EVENT_DURATION,
+                    )
+                else:
+                    google_event_id = self.gateway.create_event(
+                        service_account_json=service_account_json,
+                        calendar_id=calendar_id,
+                        title=instance.instance_title,
+                        description=instance.instance_description,
+                        start_datetime=instance.event_datetime,
+                        end_datetime=instance.event_datetime + INSTANCE_EVENT_DURATION,
+                    )
+                self.sync_result_service.apply_instance_synced(instance, google_event_id)
+                synced_count += 1
+            except Exception as exc:
+                self.sync_result_service.apply_instance_failed(instance, str(exc) or type(exc).__name__)
+                failed_count += 1
+
+        return {"synced": synced_count, "failed": failed_count}
+
     async def delete_event_by_cycle(
         self,
         db: AsyncSession,
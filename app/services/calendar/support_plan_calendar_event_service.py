@@ -4,11 +4,12 @@
 """
 
 import logging
-from typing import Optional
+from typing import Optional, Sequence
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.enums import CalendarEventType, SupportPlanStep
+from app.services.calendar.calendar_event_ledger_service import CycleLedgerEntry
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +63,34 @@ class SupportPlanCalendarEventService:
             "monitoring_event_ids": monitoring_event_ids,
         }
 
+    async def create_cycle_events_bulk(
+        self,
+        *,
+        db: AsyncSession,
+        cycles: Sequence,
+        assessment_statuses: Optional[dict] = None,
+    ) -> list:
+        """複数サイクル分のイベントをまとめて作成する（利用者の一括登録用）。
+
+        assessment_statuses は cycle.id → アセスメントのステータス。
+        """
+        assessment_statuses = assessment_statuses or {}
+        entries = [
+            CycleLedgerEntry(
+                office_id=cycle.office_id,
+                welfare_recipient_id=cycle.welfare_recipient_id,
+                cycle_id=cycle.id,
+                cycle_number=cycle.cycle_number,
+                plan_cycle_start_date=cycle.plan_cycle_start_date,
+                next_renewal_deadline=cycle.next_renewal_deadline,
+                assessment_status_id=(
+                    assessment_statuses[cycle.id].id if cycle.id in assessment_statuses else None
+                ),
+            )
+            for cycle in cycles
+        ]
+        return await self.calendar_service.create_cycle_events_bulk(db=db, entries=entries)
+
     async def delete_completion_event(
         self,
         *,
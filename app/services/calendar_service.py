@@ -39,7 +39,11 @@ from app.services.google_calendar_client import (
     GoogleCalendarAuthenticationError,
     GoogleCalendarAPIError
 )
-from app.services.calendar.calendar_event_ledger_service import CalendarEventLedgerService
+from app.services.calendar.calendar_event_ledger_service import (
+    CalendarEventLedgerService,
+    CycleLedgerEntry,
+)
+from app.services.calendar.calendar_series_service import CalendarSeriesService
 from app.services.calendar.google_calendar_gateway import GoogleCalendarGateway
 from app.services.calendar.google_calendar_sync_service import GoogleCalendarSyncService
 from app.messages import ja
@@ -56,8 +60,10 @@ class CalendarService:
         event_ledger_service: Optional[CalendarEventLedgerService] = None,
         google_sync_service: Optional[GoogleCalendarSyncService] = None,
         google_gateway: Optional[GoogleCalendarGateway] = None,
+        series_service: Optional[CalendarSeriesService] = None,
     ):
         self.event_ledger_service = event_ledger_service or CalendarEventLedgerService()
+        self.series_service = series_service or CalendarSeriesService()
         self.google_gateway = google_gateway
         self.google_sync_service = google_sync_service or GoogleCalendarSyncService(
             gateway=google_gateway or self._google_gateway(),
@@ -456,6 +462,18 @@ class CalendarService:
             cycle_start_date=cycle_start_date,
         )
 
+    async def create_cycle_events_bulk(
+        self,
+        db: AsyncSession,
+        entries: list[CycleLedgerEntry],
+    ) -> list[UUID]:
+        """複数サイクル分の期限イベントをまとめて作成する。"""
+        return await self.event_ledger_service.create_cycle_events_bulk(db=db, entries=entries)
+
+    async def backfill_office_events(self, db: AsyncSession, office_id: UUID) -> dict:
+        """事業所の台帳を同期対象にそろえ、欠けている期限イベントを作成する。"""
+        return await self.event_ledger_service.backfill_office_events(db=db, office_id=office_id)
+
     async def create_next_plan_start_date_event(
         self,
         db: AsyncSession,
@@ -624,6 +642,26 @@ class CalendarService:
             office_id=office_id,
         )
 
+    async def materialize_event_series(
+        self,
+        db: AsyncSession,
+        office_id: Optional[UUID] = None
+    ) -> Dict[str, int]:
+        """通知パターンに基づくシリーズ・インスタンスを現在の期限に合わせる"""
+        return await self.series_service.materialize(db=db, office_id=office_id)
+
+    async def sync_pending_instances(
+        self,
+        db: AsyncSession,
+        office_id: Optional[UUID] = None
+    ) -> Dict[str, int]:
+        """通知インスタンスの作成・更新・取り消しをGoogle Calendarに反映する"""
+        self.google_sync_service.gateway = self._google_gateway()
+        return await self.google_sync_service.sync_pending_instances(
+            db=db,
+            office_id=office_id,
+        )
+
     async def delete_event_by_cycle(
         self,
         db: AsyncSession,
@@ -2,217 +2,713 @@
 物理削除クリーンアップサービス
 
 論理削除から30日経過したレコードを物理削除するバッチ処理
+
+- 事務所・スタッフはキーセット順 (deleted_at, id) のバッチで処理し、バッチごとにCOMMITする
+- 事務所配下の利用者・支援計画サイクル・カレンダーイベント・メッセージは
+  明示的に辿り、件数を絞ったDELETEで削除する（1つの巨大な事務所がロックを長時間保持しない）
+- 1回の実行には時間予算があり、使い切った場合はチェックポイントから次回再開する
+- テーブルごとの削除件数・処理時間・rows/sec を結果に含める
 """
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, and_
-from typing import Dict, Any
+from sqlalchemy import select, delete, and_, or_, tuple_, Delete
+from sqlalchemy.sql.elements import ColumnElement
+from typing import Callable, Dict, Any, List, Optional, Sequence
 import logging
+import time
+import uuid
 
+from app.core.config import settings
+from app.crud.crud_cleanup_checkpoint import crud_cleanup_checkpoint
 from app.models.staff import Staff
 from app.models.office import Office, OfficeStaff
+from app.models.archived_staff import ArchivedStaff
+from app.models.welfare_recipient import (
+    WelfareRecipient,
+    OfficeWelfareRecipient,
+    ServiceRecipientDetail,
+    EmergencyContact,
+    DisabilityStatus,
+    DisabilityDetail,
+)
+from app.models.support_plan_cycle import SupportPlanCycle, SupportPlanStatus, PlanDeliverable
+from app.models.calendar_events import CalendarEvent, CalendarEventSeries, CalendarEventInstance
+from app.models.message import Message, MessageRecipient
+from app.models.assessment import (
+    FamilyOfServiceRecipients,
+    WelfareServicesUsed,
+    MedicalMatters,
+    HistoryOfHospitalVisits,
+    EmploymentRelated,
+    IssueAnalysis,
+)
 
 logger = logging.getLogger(__name__)
 
+# チェックポイントのフェーズ名
+OFFICE_PHASE = "offices"
+STAFF_PHASE = "staffs"
+
+
+@dataclass
+class TableProgress:
+    """テーブルごとの削除進捗（COMMIT済みの件数のみ）"""
+    deleted: int = 0
+    statements: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.deleted / self.elapsed_seconds
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "deleted": self.deleted,
+            "statements": self.statements,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+class _CleanupRun:
+    """1回のクリーンアップ実行の状態（時間予算・進捗・エラー）"""
+
+    def __init__(
+        self,
+        *,
+        db: AsyncSession,
+        threshold_date: datetime,
+        batch_size: int,
+        time_budget_seconds: float,
+        clock: Callable[[], float],
+    ):
+        self.db = db
+        self.threshold_date = threshold_date
+        self.batch_size = batch_size
+        self.clock = clock
+        self.deadline = clock() + time_budget_seconds
+        self.stopped_by_budget = False
+        self.errors: List[str] = []
+        self.table_stats: Dict[str, TableProgress] = {}
+        self._pending: Dict[str, TableProgress] = {}
+
+    def budget_exhausted(self) -> bool:
+        if self.clock() >= self.deadline:
+            self.stopped_by_budget = True
+        return self.stopped_by_budget
+
+    async def delete(self, stmt: Delete) -> int:
+        """DELETEを実行し、テーブル単位で件数と処理時間を記録する（COMMITまで保留）"""
+        started = self.clock()
+        result = await self.db.execute(
+            stmt.execution_options(synchronize_session=False)
+        )
+        deleted = max(result.rowcount or 0, 0)
+
+        progress = self._pending.setdefault(stmt.table.name, TableProgress())
+        progress.deleted += deleted
+        progress.statements += 1
+        progress.elapsed_seconds += self.clock() - started
+        return deleted
+
+    async def commit(self) -> None:
+        await self.db.commit()
+        for table_name, pending in self._pending.items():
+            progress = self.table_stats.setdefault(table_name, TableProgress())
+            progress.deleted += pending.deleted
+            progress.statements += pending.statements
+            progress.elapsed_seconds += pending.elapsed_seconds
+        self._pending.clear()
+
+    async def rollback(self) -> None:
+        await self.db.rollback()
+        self._pending.clear()
+
 
 class CleanupService:
     """論理削除レコードの物理削除サービス"""
 
+    def __init__(
+        self,
+        *,
+        batch_size: Optional[int] = None,
+        time_budget_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.batch_size = batch_size or settings.CLEANUP_BATCH_SIZE
+        self.time_budget_seconds = (
+            time_budget_seconds
+            if time_budget_seconds is not None
+            else settings.CLEANUP_TIME_BUDGET_SECONDS
+        )
+        self._clock = clock
+
     async def cleanup_soft_deleted_records(
         self,
         db: AsyncSession,
-        days_threshold: int = 30
+        days_threshold: int = 30,
+        *,
+        batch_size: Optional[int] = None,
+        time_budget_seconds: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         論理削除から指定日数経過したレコードを物理削除
 
+        事務所 → スタッフ → 期限切れアーカイブの順に処理する。
+        事務所の作成者スタッフを先に削除すると offices.created_by の CASCADE で
+        事務所配下が一括削除されてしまうため、事務所を先に小分けで削除する。
+
         Args:
             db: データベースセッション
             days_threshold: 論理削除からの経過日数（デフォルト30日）
+            batch_size: 1バッチの件数（省略時はサービス設定値）
+            time_budget_seconds: 今回の実行で使う時間予算（省略時はサービス設定値）
 
         Returns:
-            削除結果のサマリー
+            削除結果のサマリー（completed=False の場合は次回実行で再開する）
         """
         threshold_date = datetime.now(timezone.utc) - timedelta(days=days_threshold)
+        run = _CleanupRun(
+            db=db,
+            threshold_date=threshold_date,
+            batch_size=batch_size or self.batch_size,
+            time_budget_seconds=(
+                time_budget_seconds
+                if time_budget_seconds is not None
+                else self.time_budget_seconds
+            ),
+            clock=self._clock,
+        )
 
         result = {
             "threshold_date": threshold_date,
             "deleted_staff_count": 0,
             "deleted_office_count": 0,
             "deleted_archive_count": 0,
-            "errors": []
+            "completed": False,
+            "table_stats": {},
+            "errors": run.errors
         }
 
         try:
-            # スタッフの物理削除
-            staff_count = await self._cleanup_staff(db, threshold_date)
-            result["deleted_staff_count"] = staff_count
+            # 事務所の物理削除（配下の利用者・カレンダー・メッセージを含む）
+            result["deleted_office_count"] = await self._cleanup_offices(run)
 
-            # 事務所の物理削除
-            office_count = await self._cleanup_offices(db, threshold_date)
-            result["deleted_office_count"] = office_count
+            # スタッフの物理削除
+            if not run.budget_exhausted():
+                result["deleted_staff_count"] = await self._cleanup_staff(run)
 
             # アーカイブの削除（法定保存期限切れ）
-            archive_count = await self._cleanup_expired_archives(db)
-            result["deleted_archive_count"] = archive_count
+            if not run.budget_exhausted():
+                result["deleted_archive_count"] = await self._cleanup_expired_archives(run)
 
             # 監査ログは記録しない（staff_idが必須のため）
             # ログはlogger経由で記録される
 
-            await db.commit()
-
-            logger.info(
-                f"Physical deletion completed: "
-                f"{staff_count} staff, {office_count} offices, "
-                f"{result['deleted_archive_count']} archives deleted"
-            )
-
         except Exception as e:
-            await db.rollback()
+            await run.rollback()
             error_msg = f"Cleanup failed: {type(e).__name__}"
             logger.error(error_msg)
-            result["errors"].append(error_msg)
+            run.errors.append(error_msg)
             raise
 
+        result["completed"] = not run.stopped_by_budget
+        result["table_stats"] = {
+            table_name: progress.as_dict()
+            for table_name, progress in run.table_stats.items()
+        }
+
+        for table_name, progress in run.table_stats.items():
+            logger.info(
+                f"Physical deletion progress: table={table_name}, "
+                f"deleted={progress.deleted}, elapsed={progress.elapsed_seconds:.2f}s, "
+                f"rows/sec={progress.rows_per_second:.1f}"
+            )
+        logger.info(
+            f"Physical deletion {'completed' if result['completed'] else 'paused (time budget exhausted)'}: "
+            f"{result['deleted_staff_count']} staff, {result['deleted_office_count']} offices, "
+            f"{result['deleted_archive_count']} archives deleted"
+        )
+
         return result
 
-    async def _cleanup_staff(
+    # ------------------------------------------------------------------
+    # キーセット走査
+    # ------------------------------------------------------------------
+
+    async def _iterate_keyset(
         self,
-        db: AsyncSession,
-        threshold_date: datetime
+        run: _CleanupRun,
+        *,
+        phase: str,
+        model: Any,
+        process_batch: Callable[[_CleanupRun, Sequence[Any]], Any],
     ) -> int:
         """
-        論理削除から指定日数経過したスタッフを物理削除
+        論理削除済みレコードを (deleted_at, id) 順のバッチで走査する
 
-        Args:
-            db: データベースセッション
-            threshold_date: 閾値日時（これより前に削除されたレコードを対象）
+        チェックポイントがあればその直後から再開し、末尾に到達したら
+        チェックポイントをクリアして先頭から1周だけ走査し直す
+        （前回スキップしたレコードや再開位置より前に追加されたレコードを拾うため）。
 
         Returns:
-            削除されたレコード数
+            process_batch が返した削除件数の合計
         """
-        # 削除対象のスタッフを取得
-        stmt = select(Staff).where(
-            and_(
-                Staff.is_deleted == True,
-                Staff.deleted_at.isnot(None),
-                Staff.deleted_at <= threshold_date
+        db = run.db
+        cursor = await crud_cleanup_checkpoint.get_cursor(db, name=phase)
+        wrapped = cursor is None
+        total = 0
+
+        while not run.budget_exhausted():
+            stmt = (
+                select(model.id, model.deleted_at)
+                .where(
+                    and_(
+                        model.is_deleted == True,
+                        model.deleted_at.isnot(None),
+                        model.deleted_at <= run.threshold_date
+                    )
+                )
+                .order_by(model.deleted_at, model.id)
+                .limit(run.batch_size)
             )
+            if cursor is not None:
+                stmt = stmt.where(
+                    tuple_(model.deleted_at, model.id)
+                    > tuple_(cursor[0], uuid.UUID(cursor[1]))
+                )
+            rows = (await db.execute(stmt)).all()
+
+            if not rows:
+                await crud_cleanup_checkpoint.clear_cursor(db, name=phase)
+                await run.commit()
+                if wrapped:
+                    break
+                wrapped = True
+                cursor = None
+                continue
+
+            batch_total = await process_batch(run, rows)
+            total += batch_total or 0
+
+            # 処理済み位置を保存（途中で時間予算切れになった事務所は保存されない）
+            last = rows[-1] if batch_total is not None else None
+            if last is not None:
+                cursor = (last.deleted_at, str(last.id))
+                await crud_cleanup_checkpoint.save_cursor(
+                    db,
+                    name=phase,
+                    cursor_deleted_at=cursor[0],
+                    cursor_id=cursor[1],
+                )
+                await run.commit()
+
+        return total
+
+    # ------------------------------------------------------------------
+    # スタッフ
+    # ------------------------------------------------------------------
+
+    async def _cleanup_staff(self, run: _CleanupRun) -> int:
+        """
+        論理削除から指定日数経過したスタッフを物理削除
+
+        Returns:
+            削除されたレコード数
+        """
+        return await self._iterate_keyset(
+            run,
+            phase=STAFF_PHASE,
+            model=Staff,
+            process_batch=self._delete_staff_batch,
         )
-        result = await db.execute(stmt)
-        staff_to_delete = result.scalars().all()
 
-        if not staff_to_delete:
-            return 0
+    async def _delete_staff_batch(
+        self,
+        run: _CleanupRun,
+        rows: Sequence[Any]
+    ) -> int:
+        """
+        スタッフ1バッチを削除してCOMMIT
 
-        # 監査ログに記録（物理削除前）
-        staff_ids_to_delete = []
-        for staff in staff_to_delete:
-            staff_ids_to_delete.append(staff.id)
+        バッチ全体が失敗した場合（他テーブルから参照されている等）は1件ずつ削除し直し、
+        削除できないスタッフはエラーとして記録してスキップする。
+        """
+        staff_ids = [row.id for row in rows]
+        for row in rows:
             logger.info(
                 "Physically deleting staff: id=%s, deleted_at=%s",
-                staff.id,
-                staff.deleted_at,
+                row.id,
+                row.deleted_at,
             )
 
-        # 関連するOfficeStaffレコードを先に削除
-        if staff_ids_to_delete:
-            office_staff_delete_stmt = delete(OfficeStaff).where(
-                OfficeStaff.staff_id.in_(staff_ids_to_delete)
+        try:
+            deleted = await self._delete_staff_rows(run, staff_ids)
+            await run.commit()
+            return deleted
+        except Exception as e:
+            await run.rollback()
+            logger.warning(
+                "Staff batch deletion failed, retrying one by one: %s",
+                type(e).__name__,
             )
-            await db.execute(office_staff_delete_stmt)
-
-        # 物理削除実行
-        delete_stmt = delete(Staff).where(
-            and_(
-                Staff.is_deleted == True,
-                Staff.deleted_at.isnot(None),
-                Staff.deleted_at <= threshold_date
+
+        deleted = 0
+        for staff_id in staff_ids:
+            try:
+                deleted += await self._delete_staff_rows(run, [staff_id])
+                await run.commit()
+            except Exception as e:
+                await run.rollback()
+                error_msg = f"Staff deletion skipped: id={staff_id}, error={type(e).__name__}"
+                logger.error(error_msg)
+                run.errors.append(error_msg)
+        return deleted
+
+    async def _delete_staff_rows(
+        self,
+        run: _CleanupRun,
+        staff_ids: List[uuid.UUID]
+    ) -> int:
+        # 関連するOfficeStaffレコードを先に削除
+        await run.delete(
+            delete(OfficeStaff).where(OfficeStaff.staff_id.in_(staff_ids))
+        )
+        return await run.delete(
+            delete(Staff).where(
+                and_(
+                    Staff.id.in_(staff_ids),
+                    Staff.is_deleted == True
+                )
             )
         )
-        delete_result = await db.execute(delete_stmt)
 
-        return delete_result.rowcount
+    # ------------------------------------------------------------------
+    # 事務所
+    # ------------------------------------------------------------------
 
-    async def _cleanup_offices(
-        self,
-        db: AsyncSession,
-        threshold_date: datetime
-    ) -> int:
+    async def _cleanup_offices(self, run: _CleanupRun) -> int:
         """
         論理削除から指定日数経過した事務所を物理削除
 
-        Args:
-            db: データベースセッション
-            threshold_date: 閾値日時（これより前に削除されたレコードを対象）
-
         Returns:
             削除されたレコード数
         """
-        # 削除対象の事務所を取得
-        stmt = select(Office).where(
-            and_(
-                Office.is_deleted == True,
-                Office.deleted_at.isnot(None),
-                Office.deleted_at <= threshold_date
-            )
+        return await self._iterate_keyset(
+            run,
+            phase=OFFICE_PHASE,
+            model=Office,
+            process_batch=self._delete_office_batch,
         )
-        result = await db.execute(stmt)
-        offices_to_delete = result.scalars().all()
 
-        if not offices_to_delete:
-            return 0
+    async def _delete_office_batch(
+        self,
+        run: _CleanupRun,
+        rows: Sequence[Any]
+    ) -> Optional[int]:
+        """
+        事務所を1件ずつ、配下のデータから順に削除する
 
-        # 監査ログに記録（物理削除前）
-        office_ids_to_delete = []
-        for office in offices_to_delete:
-            office_ids_to_delete.append(office.id)
+        Returns:
+            削除した事務所数。時間予算切れで途中終了した場合はNone
+            （チェックポイントを進めず、次回同じ事務所から再開する）
+        """
+        deleted = 0
+        for index, row in enumerate(rows):
             logger.info(
-                f"Physically deleting office: id={office.id}, "
-                f"name={office.name}, deleted_at={office.deleted_at}"
+                "Physically deleting office: id=%s, deleted_at=%s",
+                row.id,
+                row.deleted_at,
             )
+            try:
+                finished = await self._purge_office(run, row.id)
+            except Exception as e:
+                await run.rollback()
+                error_msg = f"Office deletion skipped: id={row.id}, error={type(e).__name__}"
+                logger.error(error_msg)
+                run.errors.append(error_msg)
+                continue
+
+            if not finished:
+                # 完了した事務所までの位置を保存して中断する
+                if index > 0:
+                    previous = rows[index - 1]
+                    await crud_cleanup_checkpoint.save_cursor(
+                        run.db,
+                        name=OFFICE_PHASE,
+                        cursor_deleted_at=previous.deleted_at,
+                        cursor_id=str(previous.id),
+                    )
+                    await run.commit()
+                return None
+            deleted += 1
+        return deleted
+
+    async def _purge_office(self, run: _CleanupRun, office_id: uuid.UUID) -> bool:
+        """
+        事務所1件を配下のデータから順に削除する（ステップごとにCOMMIT）
 
-        # 関連するOfficeStaffレコードを先に削除
-        if office_ids_to_delete:
-            office_staff_delete_stmt = delete(OfficeStaff).where(
-                OfficeStaff.office_id.in_(office_ids_to_delete)
+        途中で中断しても、削除済みの子レコードは再走査の対象にならないため
+        次回は残りから再開される。
+
+        Returns:
+            事務所まで削除できた場合True、時間予算切れで中断した場合False
+        """
+        # 1. この事務所にのみ所属する利用者（配下のサイクル・カレンダー・アセスメントごと）
+        while not run.budget_exhausted():
+            other_association = OfficeWelfareRecipient.__table__.alias("other_owr")
+            recipient_ids = (await run.db.execute(
+                select(OfficeWelfareRecipient.welfare_recipient_id)
+                .where(
+                    and_(
+                        OfficeWelfareRecipient.office_id == office_id,
+                        ~select(other_association.c.id)
+                        .where(
+                            and_(
+                                other_association.c.welfare_recipient_id
+                                == OfficeWelfareRecipient.welfare_recipient_id,
+                                other_association.c.office_id != office_id
+                            )
+                        )
+                        .exists()
+                    )
+                )
+                .order_by(OfficeWelfareRecipient.welfare_recipient_id)
+                .limit(run.batch_size)
+            )).scalars().all()
+            if not recipient_ids:
+                break
+            await self._delete_recipient_subtree(run, list(recipient_ids))
+            await run.commit()
+        if run.stopped_by_budget:
+            return False
+
+        # 他事務所と共有している利用者は紐付けのみ解除
+        await run.delete(
+            delete(OfficeWelfareRecipient).where(OfficeWelfareRecipient.office_id == office_id)
+        )
+        await run.commit()
+
+        # 2. 共有利用者のこの事務所での支援計画サイクル
+        while not run.budget_exhausted():
+            cycle_ids = (await run.db.execute(
+                select(SupportPlanCycle.id)
+                .where(SupportPlanCycle.office_id == office_id)
+                .order_by(SupportPlanCycle.id)
+                .limit(run.batch_size)
+            )).scalars().all()
+            if not cycle_ids:
+                break
+            await self._delete_cycles(run, SupportPlanCycle.id.in_(list(cycle_ids)))
+            await run.commit()
+        if run.stopped_by_budget:
+            return False
+
+        # 3. 事務所単位のカレンダー（シリーズ・インスタンス・イベント）
+        office_series = select(CalendarEventSeries.id).where(
+            CalendarEventSeries.office_id == office_id
+        )
+        for model, condition in (
+            (CalendarEventInstance, CalendarEventInstance.event_series_id.in_(office_series)),
+            (CalendarEventSeries, CalendarEventSeries.office_id == office_id),
+            (CalendarEvent, CalendarEvent.office_id == office_id),
+        ):
+            if not await self._delete_in_batches(run, model, condition):
+                return False
+
+        # 4. メッセージ（受信者 → 本体）
+        while not run.budget_exhausted():
+            message_ids = (await run.db.execute(
+                select(Message.id)
+                .where(Message.office_id == office_id)
+                .order_by(Message.id)
+                .limit(run.batch_size)
+            )).scalars().all()
+            if not message_ids:
+                break
+            await run.delete(
+                delete(MessageRecipient).where(MessageRecipient.message_id.in_(list(message_ids)))
             )
-            await db.execute(office_staff_delete_stmt)
-
-        # 物理削除実行
-        delete_stmt = delete(Office).where(
-            and_(
-                Office.is_deleted == True,
-                Office.deleted_at.isnot(None),
-                Office.deleted_at <= threshold_date
+            await run.delete(delete(Message).where(Message.id.in_(list(message_ids))))
+            await run.commit()
+        if run.stopped_by_budget:
+            return False
+
+        # 5. 所属関係と事務所本体（残りの小さな子テーブルはDBのCASCADEで削除）
+        await run.delete(delete(OfficeStaff).where(OfficeStaff.office_id == office_id))
+        await run.delete(
+            delete(Office).where(
+                and_(
+                    Office.id == office_id,
+                    Office.is_deleted == True
+                )
             )
         )
-        delete_result = await db.execute(delete_stmt)
+        await run.commit()
+        return True
 
-        return delete_result.rowcount
+    async def _delete_in_batches(
+        self,
+        run: _CleanupRun,
+        model: Any,
+        condition: ColumnElement[bool]
+    ) -> bool:
+        """
+        条件に一致する行を主キー順に batch_size 件ずつ削除する（バッチごとにCOMMIT）
 
-    async def _cleanup_expired_archives(
+        Returns:
+            全件削除できた場合True、時間予算切れで中断した場合False
+        """
+        while not run.budget_exhausted():
+            batch = (
+                select(model.id)
+                .where(condition)
+                .order_by(model.id)
+                .limit(run.batch_size)
+            )
+            deleted = await run.delete(delete(model).where(model.id.in_(batch)))
+            await run.commit()
+            if deleted < run.batch_size:
+                return True
+        return False
+
+    async def _delete_cycles(
         self,
-        db: AsyncSession
-    ) -> int:
+        run: _CleanupRun,
+        condition: ColumnElement[bool]
+    ) -> None:
+        """支援計画サイクルと配下（イベント・成果物・ステータス）を削除"""
+        cycle_ids = select(SupportPlanCycle.id).where(condition)
+        status_ids = select(SupportPlanStatus.id).where(
+            SupportPlanStatus.plan_cycle_id.in_(cycle_ids)
+        )
+        await run.delete(
+            delete(CalendarEvent).where(
+                or_(
+                    CalendarEvent.support_plan_cycle_id.in_(cycle_ids),
+                    CalendarEvent.support_plan_status_id.in_(status_ids)
+                )
+            )
+        )
+        await run.delete(
+            delete(PlanDeliverable).where(PlanDeliverable.plan_cycle_id.in_(cycle_ids))
+        )
+        await run.delete(
+            delete(SupportPlanStatus).where(SupportPlanStatus.plan_cycle_id.in_(cycle_ids))
+        )
+        await run.delete(delete(SupportPlanCycle).where(condition))
+
+    async def _delete_recipient_subtree(
+        self,
+        run: _CleanupRun,
+        recipient_ids: List[uuid.UUID]
+    ) -> None:
         """
-        法定保存期限が過ぎたアーカイブを削除
+        利用者のバッチを配下のデータごと削除する
 
-        Args:
-            db: データベースセッション
+        サブクエリで子テーブルを辿るため、利用者数に関わらずテーブルごとに1文で済む。
+        """
+        # カレンダー（シリーズ → インスタンス、個別イベント）
+        series_ids = select(CalendarEventSeries.id).where(
+            CalendarEventSeries.welfare_recipient_id.in_(recipient_ids)
+        )
+        await run.delete(
+            delete(CalendarEventInstance).where(CalendarEventInstance.event_series_id.in_(series_ids))
+        )
+        await run.delete(
+            delete(CalendarEventSeries).where(CalendarEventSeries.welfare_recipient_id.in_(recipient_ids))
+        )
+        await run.delete(
+            delete(CalendarEvent).where(CalendarEvent.welfare_recipient_id.in_(recipient_ids))
+        )
+
+        # 支援計画サイクル
+        await self._delete_cycles(
+            run,
+            SupportPlanCycle.welfare_recipient_id.in_(recipient_ids)
+        )
+
+        # アセスメント
+        medical_ids = select(MedicalMatters.id).where(
+            MedicalMatters.welfare_recipient_id.in_(recipient_ids)
+        )
+        await run.delete(
+            delete(HistoryOfHospitalVisits).where(HistoryOfHospitalVisits.medical_matters_id.in_(medical_ids))
+        )
+        for model in (
+            MedicalMatters,
+            FamilyOfServiceRecipients,
+            WelfareServicesUsed,
+            EmploymentRelated,
+            IssueAnalysis,
+        ):
+            await run.delete(delete(model).where(model.welfare_recipient_id.in_(recipient_ids)))
+
+        # 詳細情報・緊急連絡先
+        detail_ids = select(ServiceRecipientDetail.id).where(
+            ServiceRecipientDetail.welfare_recipient_id.in_(recipient_ids)
+        )
+        await run.delete(
+            delete(EmergencyContact).where(EmergencyContact.service_recipient_detail_id.in_(detail_ids))
+        )
+        await run.delete(
+            delete(ServiceRecipientDetail).where(ServiceRecipientDetail.welfare_recipient_id.in_(recipient_ids))
+        )
+
+        # 障害情報
+        disability_ids = select(DisabilityStatus.id).where(
+            DisabilityStatus.welfare_recipient_id.in_(recipient_ids)
+        )
+        await run.delete(
+            delete(DisabilityDetail).where(DisabilityDetail.disability_status_id.in_(disability_ids))
+        )
+        await run.delete(
+            delete(DisabilityStatus).where(DisabilityStatus.welfare_recipient_id.in_(recipient_ids))
+        )
+
+        # 事務所との紐付けと利用者本体
+        await run.delete(
+            delete(OfficeWelfareRecipient).where(OfficeWelfareRecipient.welfare_recipient_id.in_(recipient_ids))
+        )
+        await run.delete(delete(WelfareRecipient).where(WelfareRecipient.id.in_(recipient_ids)))
+
+    # ------------------------------------------------------------------
+    # アーカイブ
+    # ------------------------------------------------------------------
+
+    async def _cleanup_expired_archives(self, run: _CleanupRun) -> int:
+        """
+        法定保存期限が過ぎたアーカイブを削除（テストデータは除外）
 
         Returns:
             削除されたレコード数
         """
-        from app.crud.crud_archived_staff import crud_archived_staff as archived_staff
-
-        # 削除対象のアーカイブを取得
-        count = await archived_staff.delete_expired_archives(
-            db,
-            exclude_test_data=True
+        now = datetime.now(timezone.utc)
+        condition = and_(
+            ArchivedStaff.legal_retention_until <= now,
+            ArchivedStaff.is_test_data == False
         )
 
+        count = 0
+        while not run.budget_exhausted():
+            batch = (
+                select(ArchivedStaff.id)
+                .where(condition)
+                .order_by(ArchivedStaff.legal_retention_until, ArchivedStaff.id)
+                .limit(run.batch_size)
+            )
+            deleted = await run.delete(
+                delete(ArchivedStaff).where(ArchivedStaff.id.in_(batch))
+            )
+            await run.commit()
+            count += deleted
+            if deleted < run.batch_size:
+                break
+
         if count > 0:
             logger.info(
                 f"Expired archives cleanup: {count} archives deleted"
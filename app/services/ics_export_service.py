@@ -1,7 +1,27 @@
+import hashlib
 from datetime import date, datetime, timezone
+from typing import AsyncContextManager, AsyncIterator, Callable, Optional
 from uuid import UUID
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.crud_calendar_event import crud_calendar_event
 from app.models.calendar_events import CalendarEvent
+from app.models.enums import CalendarEventType
+
+# 出力形式を変更したら上げる（ETagが変わり、クライアントのキャッシュが無効になる）
+ICS_FORMAT_VERSION = "2"
+
+_FOLD_MAX_BYTES = 75
+
+_CALENDAR_HEADER = (
+    b"BEGIN:VCALENDAR\r\n"
+    b"VERSION:2.0\r\n"
+    b"PRODID:-//Keikakun//Deadline Calendar//JA\r\n"
+    b"CALSCALE:GREGORIAN\r\n"
+    b"METHOD:PUBLISH\r\n"
+)
+_CALENDAR_FOOTER = b"END:VCALENDAR\r\n"
 
 
 def _escape_ics_text(value: str | None) -> str:
@@ -22,73 +42,169 @@ def _format_ics_datetime(value: datetime) -> str:
     return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
 
 
-def _fold_ics_line(line: str) -> list[str]:
-    """RFC 5545 line folding. Keep this byte-aware for Japanese text."""
-    max_bytes = 75
+def _fold_ics_line(line: str) -> bytes:
+    """RFC 5545 line folding (CRLF付きのバイト列を返す)。
+
+    UTF-8のバイト列を75オクテットごとにスライスし、日本語の文字の途中で
+    切らないよう継続バイト(0b10xxxxxx)の位置なら文字の先頭まで戻して分割する。
+    継続行は先頭の空白1オクテットを含めて75オクテット以内。
+    """
     encoded = line.encode("utf-8")
-    if len(encoded) <= max_bytes:
-        return [line]
-
-    folded: list[str] = []
-    current = ""
-    current_len = 0
-    for char in line:
-        char_len = len(char.encode("utf-8"))
-        if current and current_len + char_len > max_bytes:
-            folded.append(current)
-            current = f" {char}"
-            current_len = 1 + char_len
-        else:
-            current += char
-            current_len += char_len
-    if current:
-        folded.append(current)
-    return folded
+    length = len(encoded)
+    if length <= _FOLD_MAX_BYTES:
+        return encoded + b"\r\n"
+
+    parts: list[bytes] = []
+    start = 0
+    limit = _FOLD_MAX_BYTES
+    while length - start > limit:
+        end = start + limit
+        while encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(encoded[start:end])
+        start = end
+        limit = _FOLD_MAX_BYTES - 1
+    parts.append(encoded[start:])
+    return b"\r\n ".join(parts) + b"\r\n"
+
+
+def _build_event_block(
+    *,
+    event_id: UUID,
+    event_type: CalendarEventType,
+    title: str | None,
+    description: str | None,
+    start: datetime,
+    end: datetime,
+    updated_at: datetime | None,
+    last_name: str | None,
+    first_name: str | None,
+) -> bytes:
+    description_parts = []
+    if description:
+        description_parts.append(description)
+    full_name = " ".join(part for part in [last_name, first_name] if part).strip()
+    if full_name:
+        description_parts.append(f"利用者: {full_name}")
+
+    # DTSTAMPは出力時刻ではなく最終更新日時にする（同じデータなら同じバイト列になり、ETagが安定する）
+    lines = (
+        "BEGIN:VEVENT",
+        f"UID:{event_id}@keikakun",
+        f"DTSTAMP:{_format_ics_datetime(updated_at or start)}",
+        f"DTSTART:{_format_ics_datetime(start)}",
+        f"DTEND:{_format_ics_datetime(end)}",
+        f"SUMMARY:{_escape_ics_text(title)}",
+        f"DESCRIPTION:{_escape_ics_text(chr(10).join(description_parts))}",
+        f"CATEGORIES:{_escape_ics_text(event_type.value)}",
+        "END:VEVENT",
+    )
+    return b"".join(_fold_ics_line(line) for line in lines)
 
 
 class IcsExportService:
     def build_calendar(self, *, events: list[CalendarEvent]) -> str:
-        generated_at = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-        lines = [
-            "BEGIN:VCALENDAR",
-            "VERSION:2.0",
-            "PRODID:-//Keikakun//Deadline Calendar//JA",
-            "CALSCALE:GREGORIAN",
-            "METHOD:PUBLISH",
-        ]
-
+        body = [_CALENDAR_HEADER]
         for event in events:
-            lines.extend(self._build_event_lines(event=event, generated_at=generated_at))
-
-        lines.append("END:VCALENDAR")
-        folded_lines: list[str] = []
-        for line in lines:
-            folded_lines.extend(_fold_ics_line(line))
-        return "\r\n".join(folded_lines) + "\r\n"
-
-    def _build_event_lines(self, *, event: CalendarEvent, generated_at: str) -> list[str]:
-        description_parts = []
-        if event.event_description:
-            description_parts.append(event.event_description)
-        if event.welfare_recipient:
-            full_name = " ".join(
-                part for part in [event.welfare_recipient.last_name, event.welfare_recipient.first_name] if part
-            ).strip()
-            if full_name:
-                description_parts.append(f"利用者: {full_name}")
-
-        description = "\n".join(description_parts)
-        return [
-            "BEGIN:VEVENT",
-            f"UID:{event.id}@keikakun",
-            f"DTSTAMP:{generated_at}",
-            f"DTSTART:{_format_ics_datetime(event.event_start_datetime)}",
-            f"DTEND:{_format_ics_datetime(event.event_end_datetime)}",
-            f"SUMMARY:{_escape_ics_text(event.event_title)}",
-            f"DESCRIPTION:{_escape_ics_text(description)}",
-            f"CATEGORIES:{_escape_ics_text(event.event_type.value)}",
-            "END:VEVENT",
-        ]
+            recipient = event.welfare_recipient
+            body.append(_build_event_block(
+                event_id=event.id,
+                event_type=event.event_type,
+                title=event.event_title,
+                description=event.event_description,
+                start=event.event_start_datetime,
+                end=event.event_end_datetime,
+                updated_at=event.updated_at,
+                last_name=recipient.last_name if recipient else None,
+                first_name=recipient.first_name if recipient else None,
+            ))
+        body.append(_CALENDAR_FOOTER)
+        return b"".join(body).decode("utf-8")
+
+    async def build_etag(
+        self,
+        db: AsyncSession,
+        *,
+        office_id: UUID,
+        from_date: date,
+        to_date: date,
+        event_type: Optional[CalendarEventType] = None,
+        recipient_id: Optional[UUID] = None,
+    ) -> str:
+        """出力条件と (件数, 最終更新日時) から強いETagを作る（本文は生成しない）"""
+        count, last_updated_at = await crud_calendar_event.get_deadline_feed_version(
+            db=db,
+            office_id=office_id,
+            from_date=from_date,
+            to_date=to_date,
+            event_type=event_type,
+            recipient_id=recipient_id,
+        )
+        key = "|".join([
+            ICS_FORMAT_VERSION,
+            str(office_id),
+            from_date.isoformat(),
+            to_date.isoformat(),
+            event_type.value if event_type else "",
+            str(recipient_id or ""),
+            str(count),
+            last_updated_at.isoformat() if last_updated_at else "",
+        ])
+        return f'"{hashlib.sha256(key.encode()).hexdigest()[:32]}"'
+
+    @staticmethod
+    def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+        """If-None-Match ヘッダーがETagに一致するか（弱い比較）"""
+        if not if_none_match:
+            return False
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip()
+            if candidate == "*" or candidate.removeprefix("W/") == etag:
+                return True
+        return False
+
+    async def stream_calendar(
+        self,
+        *,
+        session_factory: Callable[[], AsyncContextManager[AsyncSession]],
+        office_id: UUID,
+        from_date: date,
+        to_date: date,
+        event_type: Optional[CalendarEventType] = None,
+        recipient_id: Optional[UUID] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        .ics 本文をVEVENTのバッチ単位で生成する。
+
+        レスポンス送信中もカーソルを読み続けるため、リクエストのセッションではなく
+        session_factory から作ったセッションを使う。
+        """
+        yield _CALENDAR_HEADER
+        async with session_factory() as db:
+            result = await crud_calendar_event.stream_deadline_event_rows(
+                db=db,
+                office_id=office_id,
+                from_date=from_date,
+                to_date=to_date,
+                event_type=event_type,
+                recipient_id=recipient_id,
+            )
+            async for rows in result.partitions():
+                yield b"".join(
+                    _build_event_block(
+                        event_id=row.id,
+                        event_type=row.event_type,
+                        title=row.event_title,
+                        description=row.event_description,
+                        start=row.event_start_datetime,
+                        end=row.event_end_datetime,
+                        updated_at=row.updated_at,
+                        last_name=row.last_name,
+                        first_name=row.first_name,
+                    )
+                    for row in rows
+                )
+        yield _CALENDAR_FOOTER
 
     def build_filename(self, *, today: date) -> str:
         return f"keikakun-calendar-{today.strftime('%Y%m%d')}.ics"
@@ -0,0 +1,376 @@
+"""
+利用者一括インポートサービス
+
+CSV/Excelファイルを1行ずつ読み込み、チャンク単位で検証・登録する。
+- 検証: 各行を UserRegistrationRequest に変換し、行単位でエラーを収集する
+- 登録: チャンク内の有効な行を WelfareRecipientService の一括作成APIで登録し、チャンクごとにCOMMIT
+- 進捗: recipient_import_jobs にチャンクごとの処理件数とエラー行を記録する
+"""
+import codecs
+import csv
+import io
+import logging
+from datetime import datetime
+from itertools import islice
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app import crud
+from app.core.config import settings
+from app.core.exceptions import BadRequestException
+from app.messages import ja
+from app.models.enums import RecipientImportStatus
+from app.schemas.welfare_recipient import UserRegistrationRequest
+from app.services.welfare_recipient_service import WelfareRecipientService
+
+logger = logging.getLogger(__name__)
+
+# 列名 → (UserRegistrationRequest のセクション, フィールド名)
+# 英字の列名と日本語の列名のどちらでも受け付ける
+IMPORT_COLUMNS: Dict[str, Tuple[str, str]] = {
+    "last_name": ("basic_info", "lastName"),
+    "姓": ("basic_info", "lastName"),
+    "first_name": ("basic_info", "firstName"),
+    "名": ("basic_info", "firstName"),
+    "last_name_furigana": ("basic_info", "lastNameFurigana"),
+    "姓（ふりがな）": ("basic_info", "lastNameFurigana"),
+    "first_name_furigana": ("basic_info", "firstNameFurigana"),
+    "名（ふりがな）": ("basic_info", "firstNameFurigana"),
+    "birth_day": ("basic_info", "birthDay"),
+    "生年月日": ("basic_info", "birthDay"),
+    "gender": ("basic_info", "gender"),
+    "性別": ("basic_info", "gender"),
+    "address": ("contact_address", "address"),
+    "住所": ("contact_address", "address"),
+    "form_of_residence": ("contact_address", "formOfResidence"),
+    "居住形態": ("contact_address", "formOfResidence"),
+    "form_of_residence_other_text": ("contact_address", "formOfResidenceOtherText"),
+    "means_of_transportation": ("contact_address", "meansOfTransportation"),
+    "交通手段": ("contact_address", "meansOfTransportation"),
+    "means_of_transportation_other_text": ("contact_address", "meansOfTransportationOtherText"),
+    "tel": ("contact_address", "tel"),
+    "電話番号": ("contact_address", "tel"),
+    "disability_or_disease_name": ("disability_info", "disabilityOrDiseaseName"),
+    "障害・疾患名": ("disability_info", "disabilityOrDiseaseName"),
+    "livelihood_protection": ("disability_info", "livelihoodProtection"),
+    "生活保護": ("disability_info", "livelihoodProtection"),
+    "special_remarks": ("disability_info", "specialRemarks"),
+    "特記事項": ("disability_info", "specialRemarks"),
+    "emergency_contact_last_name": ("emergency_contact", "lastName"),
+    "emergency_contact_first_name": ("emergency_contact", "firstName"),
+    "emergency_contact_last_name_furigana": ("emergency_contact", "lastNameFurigana"),
+    "emergency_contact_first_name_furigana": ("emergency_contact", "firstNameFurigana"),
+    "emergency_contact_relationship": ("emergency_contact", "relationship"),
+    "emergency_contact_tel": ("emergency_contact", "tel"),
+    "disability_category": ("disability_detail", "category"),
+    "grade_or_level": ("disability_detail", "gradeOrLevel"),
+    "application_status": ("disability_detail", "applicationStatus"),
+}
+
+# 必須セクションのフィールド（いずれかの列名で存在する必要がある）
+REQUIRED_FIELDS: List[Tuple[str, str]] = [
+    ("basic_info", "lastName"),
+    ("basic_info", "firstName"),
+    ("basic_info", "lastNameFurigana"),
+    ("basic_info", "firstNameFurigana"),
+    ("basic_info", "birthDay"),
+    ("basic_info", "gender"),
+    ("contact_address", "address"),
+    ("contact_address", "formOfResidence"),
+    ("contact_address", "meansOfTransportation"),
+    ("contact_address", "tel"),
+    ("disability_info", "disabilityOrDiseaseName"),
+    ("disability_info", "livelihoodProtection"),
+]
+
+# 文字コード判定に使う先頭バイト数
+ENCODING_SNIFF_BYTES = 64 * 1024
+
+# (行番号, 列名→値)
+ImportRow = Tuple[int, Dict[str, Any]]
+
+
+def _detect_csv_encoding(file: BinaryIO) -> str:
+    """先頭をUTF-8として読めなければShift_JIS(cp932)とみなす（Excel保存のCSV対策）"""
+    sample = file.read(ENCODING_SNIFF_BYTES)
+    file.seek(0)
+    try:
+        # サンプル末尾で多バイト文字が分断されていても判定できるよう増分デコーダを使う
+        codecs.getincrementaldecoder("utf-8-sig")().decode(sample, final=False)
+        return "utf-8-sig"
+    except UnicodeDecodeError:
+        return "cp932"
+
+
+def _iter_csv_rows(file: BinaryIO) -> Iterator[List[Any]]:
+    encoding = _detect_csv_encoding(file)
+    text = io.TextIOWrapper(file, encoding=encoding, newline="")
+    yield from csv.reader(text)
+
+
+def _iter_xlsx_rows(file: BinaryIO) -> Iterator[List[Any]]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError as exc:
+        raise BadRequestException(ja.RECIPIENT_IMPORT_EXCEL_UNAVAILABLE) from exc
+
+    # read_only: シートをストリーミングで読み込み、全行をメモリに載せない
+    workbook = load_workbook(file, read_only=True, data_only=True)
+    try:
+        for values in workbook.active.iter_rows(values_only=True):
+            yield list(values)
+    finally:
+        workbook.close()
+
+
+def open_import_rows(file: BinaryIO, file_name: Optional[str]) -> Iterator[ImportRow]:
+    """
+    アップロードファイルを開き、ヘッダーを検証して行イテレータを返す
+
+    Raises:
+        BadRequestException: 未対応の形式、読み込み不可、必須列の不足
+    """
+    name = (file_name or "").lower()
+    if name.endswith(".csv"):
+        raw_rows = _iter_csv_rows(file)
+    elif name.endswith(".xlsx"):
+        raw_rows = _iter_xlsx_rows(file)
+    else:
+        raise BadRequestException(ja.RECIPIENT_IMPORT_UNSUPPORTED_FORMAT)
+
+    try:
+        header = next(raw_rows, None)
+    except (UnicodeDecodeError, csv.Error, ValueError, OSError) as exc:
+        raise BadRequestException(ja.RECIPIENT_IMPORT_INVALID_FILE) from exc
+    except BadRequestException:
+        raise
+    except Exception as exc:
+        # openpyxl は壊れたファイルに対して独自例外を送出する
+        logger.warning("Recipient import file could not be opened: %s", type(exc).__name__)
+        raise BadRequestException(ja.RECIPIENT_IMPORT_INVALID_FILE) from exc
+
+    columns = [str(h).strip() if h is not None else "" for h in (header or [])]
+    present = {IMPORT_COLUMNS[c] for c in columns if c in IMPORT_COLUMNS}
+    missing = [field for section, field in REQUIRED_FIELDS if (section, field) not in present]
+    if missing:
+        raise BadRequestException(ja.RECIPIENT_IMPORT_MISSING_COLUMNS.format(columns=", ".join(missing)))
+
+    def _rows() -> Iterator[ImportRow]:
+        # ヘッダー行を1行目とする
+        for row_number, values in enumerate(raw_rows, start=2):
+            row = {
+                column: value
+                for column, value in zip(columns, values)
+                if column in IMPORT_COLUMNS
+            }
+            yield row_number, row
+
+    return _rows()
+
+
+def _normalize(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        return value or None
+    if isinstance(value, datetime):
+        # Excelの日付セルは datetime で読み込まれる
+        return value.date()
+    if isinstance(value, float) and value.is_integer():
+        # Excelの数値セル（電話番号など）は float で読み込まれる
+        value = int(value)
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    return value
+
+
+def _is_blank(row: Dict[str, Any]) -> bool:
+    return all(_normalize(value) is None for value in row.values())
+
+
+def build_registration(row: Dict[str, Any]) -> UserRegistrationRequest:
+    """
+    1行分の値を UserRegistrationRequest に変換
+
+    Raises:
+        ValidationError: スキーマ検証に失敗した場合
+    """
+    sections: Dict[str, Dict[str, Any]] = {
+        "basic_info": {},
+        "contact_address": {},
+        "disability_info": {},
+        "emergency_contact": {},
+        "disability_detail": {},
+    }
+    for column, raw_value in row.items():
+        value = _normalize(raw_value)
+        if value is None:
+            continue
+        section, field = IMPORT_COLUMNS[column]
+        sections[section][field] = value
+
+    emergency_contact = sections.pop("emergency_contact")
+    disability_detail = sections.pop("disability_detail")
+    return UserRegistrationRequest.model_validate({
+        **sections,
+        "emergency_contacts": [emergency_contact] if emergency_contact else [],
+        "disability_details": [disability_detail] if disability_detail else [],
+    })
+
+
+def _format_validation_error(exc: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    ]
+
+
+class RecipientImportService:
+    """CSV/Excelからの利用者一括インポート"""
+
+    def __init__(self, chunk_size: Optional[int] = None, max_rows: Optional[int] = None):
+        self.chunk_size = chunk_size or settings.RECIPIENT_IMPORT_CHUNK_SIZE
+        self.max_rows = max_rows or settings.RECIPIENT_IMPORT_MAX_ROWS
+
+    async def import_recipients(
+        self,
+        db: AsyncSession,
+        *,
+        rows: Iterator[ImportRow],
+        office_id: UUID,
+        staff_id: UUID,
+        file_name: Optional[str] = None
+    ) -> UUID:
+        """
+        行イテレータから利用者を一括登録する
+
+        チャンクごとに「検証 → 一括登録 → 進捗記録 → COMMIT」を行うため、
+        処理中でもジョブを参照すれば進捗が確認でき、途中で失敗しても
+        COMMIT済みのチャンクは残る。
+
+        Args:
+            db: データベースセッション
+            rows: open_import_rows() が返す行イテレータ
+            office_id: 登録先事務所ID
+            staff_id: 実行スタッフID
+            file_name: ファイル名（ジョブに記録）
+
+        Returns:
+            インポートジョブID
+        """
+        job = await crud.recipient_import_job.create(
+            db, office_id=office_id, created_by=staff_id, file_name=file_name
+        )
+        job_id = job.id
+        processed = 0
+
+        try:
+            while True:
+                # ファイル読み込みはブロッキングI/Oのためスレッドプールで行う
+                raw_chunk = await run_in_threadpool(lambda: list(islice(rows, self.chunk_size)))
+                if not raw_chunk:
+                    break
+
+                chunk = [(row_number, row) for row_number, row in raw_chunk if not _is_blank(row)]
+                remaining = self.max_rows - processed
+                if len(chunk) > remaining:
+                    if remaining > 0:
+                        await self._process_chunk(db, job_id=job_id, office_id=office_id, chunk=chunk[:remaining])
+                    await crud.recipient_import_job.mark_finished(
+                        db,
+                        job_id=job_id,
+                        status=RecipientImportStatus.completed,
+                        errors=[{
+                            "row": chunk[remaining][0],
+                            "errors": [ja.RECIPIENT_IMPORT_ROW_LIMIT_EXCEEDED.format(limit=self.max_rows)],
+                        }],
+                    )
+                    await db.commit()
+                    return job_id
+
+                if chunk:
+                    await self._process_chunk(db, job_id=job_id, office_id=office_id, chunk=chunk)
+                    processed += len(chunk)
+
+            await crud.recipient_import_job.mark_finished(
+                db, job_id=job_id, status=RecipientImportStatus.completed
+            )
+            await db.commit()
+
+        except Exception as e:
+            logger.error("Recipient import job failed: %s", type(e).__name__)
+            await db.rollback()
+            await crud.recipient_import_job.mark_finished(
+                db,
+                job_id=job_id,
+                status=RecipientImportStatus.failed,
+                errors=[{"row": 0, "errors": [ja.RECIPIENT_IMPORT_JOB_FAILED]}],
+            )
+            await db.commit()
+
+        return job_id
+
+    async def _process_chunk(
+        self,
+        db: AsyncSession,
+        *,
+        job_id: UUID,
+        office_id: UUID,
+        chunk: List[ImportRow]
+    ) -> None:
+        """
+        1チャンクを検証・登録し、進捗と合わせてCOMMITする
+
+        有効な行はまとめて一括作成する。一括作成が失敗した場合はロールバックし、
+        行ごとにセーブポイントを切って create_recipient_with_initial_plan で登録し直して
+        失敗した行だけをエラーとして記録する。
+        """
+        errors: List[dict] = []
+        valid: List[Tuple[int, UserRegistrationRequest]] = []
+        for row_number, row in chunk:
+            try:
+                valid.append((row_number, build_registration(row)))
+            except ValidationError as exc:
+                errors.append({"row": row_number, "errors": _format_validation_error(exc)})
+
+        succeeded = 0
+        if valid:
+            try:
+                await WelfareRecipientService.create_recipients_with_initial_plans(
+                    db, [registration for _, registration in valid], office_id
+                )
+                succeeded = len(valid)
+            except Exception as e:
+                logger.warning("Recipient import chunk failed, retrying row by row: %s", type(e).__name__)
+                await db.rollback()
+                for row_number, registration in valid:
+                    try:
+                        async with db.begin_nested():
+                            await WelfareRecipientService.create_recipient_with_initial_plan(
+                                db=db,
+                                registration_data=registration,
+                                office_id=office_id
+                            )
+                        succeeded += 1
+                    except Exception as row_error:
+                        logger.info("Recipient import row failed: row=%s error=%s", row_number, type(row_error).__name__)
+                        errors.append({"row": row_number, "errors": [ja.RECIPIENT_IMPORT_ROW_FAILED]})
+
+        errors.sort(key=lambda error: error["row"])
+        await crud.recipient_import_job.record_chunk(
+            db,
+            job_id=job_id,
+            processed=len(chunk),
+            succeeded=succeeded,
+            failed=len(chunk) - succeeded,
+            errors=errors,
+        )
+        await db.commit()
+
+
+recipient_import_service = RecipientImportService()
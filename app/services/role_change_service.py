@@ -374,18 +374,18 @@ class RoleChangeService:
         # 1. 承認可能なスタッフ（manager/owner）に通知を作成
         approvers = await self._get_approvers(db, office_id, from_role)
 
-        # 各承認者に通知を作成
-        for approver_id in approvers:
-            # 基本メッセージ
-            base_content = f"{requester_full_name}さんが{from_role.value}から{requested_role.value}への変更をリクエストしました。"
-
-            # request_notesがあれば追加
-            if request_notes:
-                content = f"{base_content}\n\n【リクエスト理由】\n{request_notes}"
-            else:
-                content = base_content
-
-            notice_data = NoticeCreate(
+        # 基本メッセージ
+        base_content = f"{requester_full_name}さんが{from_role.value}から{requested_role.value}への変更をリクエストしました。"
+
+        # request_notesがあれば追加
+        if request_notes:
+            content = f"{base_content}\n\n【リクエスト理由】\n{request_notes}"
+        else:
+            content = base_content
+
+        # 各承認者への通知
+        notices = [
+            NoticeCreate(
                 recipient_staff_id=approver_id,
                 office_id=office_id,
                 type=NoticeType.role_change_pending.value,
@@ -393,18 +393,21 @@ class RoleChangeService:
                 content=content,
                 link_url=f"/role-change-requests/{request_id}"
             )
-            await crud_notice.create(db, obj_in=notice_data)
+            for approver_id in approvers
+        ]
 
         # 2. リクエスト作成者（送信者）にも通知を作成
-        requester_notice_data = NoticeCreate(
+        notices.append(NoticeCreate(
             recipient_staff_id=requester_staff_id,
             office_id=office_id,
             type=NoticeType.role_change_request_sent.value,
             title="役割、権限変更リクエストを送信しました",
             content=f"あなたの{from_role.value}から{requested_role.value}への変更リクエストを送信しました。承認をお待ちください。",
             link_url=f"/role-change-requests/{request_id}"
-        )
-        await crud_notice.create(db, obj_in=requester_notice_data)
+        ))
+
+        # 承認者数に関わらず1回のINSERTで作成
+        await crud_notice.bulk_create(db, objs_in=notices)
 
         # 3. 事務所の通知数が50件を超えた場合、古いものから削除
         await crud_notice.delete_old_notices_over_limit(db, office_id=office_id, limit=50)
@@ -441,7 +444,7 @@ class RoleChangeService:
             content=f"あなたの{from_role.value}から{requested_role.value}への変更リクエストが承認されました。",
             link_url=f"/role-change-requests/{request_id}"
         )
-        await crud_notice.create(db, obj_in=notice_data)
+        await crud_notice.bulk_create(db, objs_in=[notice_data])
 
         # 事務所の通知数が50件を超えた場合、古いものから削除
         await crud_notice.delete_old_notices_over_limit(db, office_id=office_id, limit=50)
@@ -478,7 +481,7 @@ class RoleChangeService:
             content=f"あなたの{from_role.value}から{requested_role.value}への変更リクエストが却下されました。",
             link_url=f"/role-change-requests/{request_id}"
         )
-        await crud_notice.create(db, obj_in=notice_data)
+        await crud_notice.bulk_create(db, objs_in=[notice_data])
 
         # 事務所の通知数が50件を超えた場合、古いものから削除
         await crud_notice.delete_old_notices_over_limit(db, office_id=office_id, limit=50)
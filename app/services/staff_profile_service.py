@@ -5,27 +5,29 @@ import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, func
-from passlib.context import CryptContext
+from sqlalchemy import select, delete
 from fastapi import HTTPException, status
 
 from app.models.staff import Staff
 from app.models.staff_profile import AuditLog, EmailChangeRequest as EmailChangeRequestModel, PasswordHistory
 from app.schemas.staff_profile import StaffNameUpdate, PasswordChange, EmailChangeRequest
-from app.core.security import verify_password, get_password_hash
+from app.core.security import (
+    pwd_context,  # noqa: F401 ハッシュ設定はapp.core.securityと共通（テストのpatch対象）
+    get_password_hash_async,
+    verify_password_async,
+    verify_password_any,
+)
 from app.core import mail
 from app.messages import ja
 from app.utils.privacy_utils import mask_email, mask_name
+from app.services.attempt_throttle import (
+    email_change_throttle,
+    password_change_throttle,
+)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 logger = logging.getLogger(__name__)
 
 
-class RateLimitExceededError(Exception):
-    """レート制限超過エラー"""
-    pass
-
-
 class StaffProfileService:
     """スタッフプロフィール管理サービス"""
 
@@ -131,8 +133,9 @@ class StaffProfileService:
                 detail=ja.STAFF_NOT_FOUND
             )
 
-        # レート制限チェック（1時間に3回まで）
-        await self._check_password_change_rate_limit(db, staff_id)
+        # レート制限チェック（成功・失敗に関わらず1時間に3回まで）
+        # 試行の記録はfinallyのコミットで確定する
+        await password_change_throttle.consume(db, str(staff_id))
 
         # パスワード変更のメインロジック（try-finallyで試行を記録）
         exception_to_raise = None
@@ -146,7 +149,7 @@ class StaffProfileService:
                 )
 
             # 現在のパスワード確認
-            if not pwd_context.verify(password_change.current_password, staff.hashed_password):
+            if not await verify_password_async(password_change.current_password, staff.hashed_password):
                 # 失敗回数をカウント（総当たり攻撃対策）
                 await self._increment_failed_password_attempts_sync(db, staff)
                 raise HTTPException(
@@ -161,7 +164,7 @@ class StaffProfileService:
             self._check_password_similarity(password_change.new_password, staff)
 
             # パスワードのハッシュ化
-            hashed_password = pwd_context.hash(password_change.new_password)
+            hashed_password = await get_password_hash_async(password_change.new_password)
 
             # データベース更新
             staff.hashed_password = hashed_password
@@ -203,7 +206,7 @@ class StaffProfileService:
         except Exception as e:
             exception_to_raise = e
         finally:
-            # 成功でも失敗でも試行を記録してコミット
+            # 成功でも失敗でも試行を監査ログに記録してコミット
             await self._log_password_change_attempt(db, staff_id)
             await db.commit()
 
@@ -251,7 +254,11 @@ class StaffProfileService:
         staff_id: str,
         new_password: str
     ) -> None:
-        """過去のパスワードとの重複チェック"""
+        """
+        過去のパスワードとの重複チェック
+
+        bcryptの照合は履歴の件数分を並列に実行し、一致した時点で打ち切る。
+        """
         # 過去3件のパスワード履歴を取得
         stmt = (
             select(PasswordHistory)
@@ -262,12 +269,11 @@ class StaffProfileService:
         result = await db.execute(stmt)
         history = result.scalars().all()
 
-        for record in history:
-            if pwd_context.verify(new_password, record.hashed_password):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="過去に使用したパスワードは使用できません。別のパスワードを設定してください。"
-                )
+        if await verify_password_any(new_password, [record.hashed_password for record in history]):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="過去に使用したパスワードは使用できません。別のパスワードを設定してください。"
+            )
 
     async def _cleanup_password_history(
         self,
@@ -346,9 +352,9 @@ class StaffProfileService:
         staff_id: str
     ) -> None:
         """
-        パスワード変更試行の記録（成功・失敗に関わらず）
+        パスワード変更試行の監査ログ記録（成功・失敗に関わらず）
 
-        現在のセッションで記録します。
+        現在のセッションで記録します。試行回数の制限には使用しません（password_change_throttleで判定）。
         finallyブロックで呼ばれるため、エラー発生時も確実にコミットされます。
         """
         audit_log = AuditLog(
@@ -361,46 +367,6 @@ class StaffProfileService:
         db.add(audit_log)
         await db.flush()
 
-    async def _check_password_change_rate_limit(
-        self,
-        db: AsyncSession,
-        staff_id: str,
-        max_attempts: int = 3,
-        time_window_hours: int = 1
-    ) -> None:
-        """
-        パスワード変更のレート制限チェック
-
-        Args:
-            db: データベースセッション
-            staff_id: スタッフID
-            max_attempts: 制限時間内の最大試行回数（デフォルト: 3回）
-            time_window_hours: 制限時間（時間単位、デフォルト: 1時間）
-
-        Raises:
-            RateLimitExceededError: レート制限を超えた場合
-        """
-        # 指定時間内のパスワード変更試行回数をカウント
-        time_threshold = datetime.now(timezone.utc) - timedelta(hours=time_window_hours)
-
-        stmt = (
-            select(func.count(AuditLog.id))
-            .where(
-                AuditLog.staff_id == staff_id,
-                AuditLog.action == "ATTEMPT_CHANGE_PASSWORD",
-                AuditLog.timestamp >= time_threshold
-            )
-        )
-        result = await db.execute(stmt)
-        attempt_count = result.scalar()
-
-        if attempt_count >= max_attempts:
-            raise RateLimitExceededError(
-                f"パスワード変更の試行回数が上限に達しました。"
-                f"{time_window_hours}時間後に再度お試しください。"
-            )
-
-
     async def request_email_change(
         self,
         db: AsyncSession,
@@ -431,28 +397,14 @@ class StaffProfileService:
             )
 
         # パスワード確認
-        if not pwd_context.verify(email_request.password, staff.hashed_password):
+        if not await verify_password_async(email_request.password, staff.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=ja.STAFF_CURRENT_PASSWORD_INCORRECT
             )
 
         # レート制限チェック（24時間以内に3回まで）
-        time_threshold = datetime.now(timezone.utc) - timedelta(hours=24)
-        stmt_count = (
-            select(func.count(EmailChangeRequestModel.id))
-            .where(
-                EmailChangeRequestModel.staff_id == staff_id,
-                EmailChangeRequestModel.created_at >= time_threshold
-            )
-        )
-        result_count = await db.execute(stmt_count)
-        request_count = result_count.scalar()
-
-        if request_count >= 3:
-            raise RateLimitExceededError(
-                "メールアドレスの変更回数が上限に達しています。24時間後に再度お試しください。"
-            )
+        await email_change_throttle.consume(db, str(staff_id))
 
         # 新しいメールアドレスの重複チェック
         stmt_email = select(Staff).where(Staff.email == email_request.new_email)
@@ -5,16 +5,16 @@ Welfare Recipient Service
 mini.mdの要件に基づいて、利用者情報と初期支援計画の一括作成を行います。
 """
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Sequence
 from uuid import UUID
 from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy import select, func
+from sqlalchemy import select, func, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
 import uuid
 
-from app.crud.crud_welfare_recipient import crud_welfare_recipient
+from app.crud.crud_welfare_recipient import crud_welfare_recipient, WelfareRecipientBulkRow
 from app.models.welfare_recipient import WelfareRecipient
 from app.models.support_plan_cycle import SupportPlanCycle, SupportPlanStatus
 from app.models.enums import SupportPlanStep, CYCLE_STEPS
@@ -36,6 +36,9 @@ import asyncio
 
 logger = logging.getLogger(__name__)
 
+# 一括作成で1回に処理する利用者数（バインドパラメータ上限を超えないように分割）
+BULK_CREATE_CHUNK_SIZE = 500
+
 class WelfareRecipientService:
     """
     利用者登録サービス
@@ -66,33 +69,14 @@ class WelfareRecipientService:
         try:
             # Pydanticによる型変換とバリデーションが完了しているため、手動バリデーションは不要
 
-            # 2. 利用者基本情報の作成
-            basic_info = registration_data.basic_info
-            welfare_recipient = WelfareRecipient(
-                first_name=basic_info.firstName,
-                last_name=basic_info.lastName,
-                first_name_furigana=basic_info.firstNameFurigana,
-                last_name_furigana=basic_info.lastNameFurigana,
-                birth_day=basic_info.birthDay,
-                gender=basic_info.gender
-            )
-            db.add(welfare_recipient)
-            await db.flush()  # IDを取得するためにflush
-
-            # IMPORTANT: flush()直後にIDを変数に保存する
-            # その後の処理（flush等）でオブジェクトがexpired状態になり、
-            # 再度welfare_recipient.idにアクセスするとgreenletエラーが発生するため
-            recipient_id = welfare_recipient.id
-            # 3. 関連データの作成
-            await crud_welfare_recipient.create_related_data(
-                db=db,
-                welfare_recipient=welfare_recipient,
-                registration_data=registration_data,
+            # 2-3. 利用者基本情報と関連データの作成（IDは事前採番し、テーブルごとに1文でINSERT）
+            recipient_id, = await crud_welfare_recipient.bulk_create_with_related(
+                db,
+                rows=[WelfareRecipientBulkRow.from_registration(registration_data)],
                 office_id=office_id
             )
 
             # 4. 初期支援計画の作成（mini.mdの要件）
-            # 既に保存したrecipient_idを使用（welfare_recipient.idに再アクセスしない）
             await WelfareRecipientService._create_initial_support_plan(db, recipient_id, office_id)
 
             # 5. IDを返す (コミット/ロールバックは呼び出し元で行う)
@@ -113,6 +97,48 @@ class WelfareRecipientService:
             # トランザクション管理は呼び出し元（エンドポイント層）で行うため、ここではrollbackしない
             raise
 
+    @staticmethod
+    async def create_recipients_with_initial_plans(
+        db: AsyncSession,
+        registrations: Sequence[UserRegistrationRequest],
+        office_id: UUID,
+        *,
+        chunk_size: int = BULK_CREATE_CHUNK_SIZE
+    ) -> List[UUID]:
+        """
+        複数の利用者と初期支援計画の一括作成 (非同期)
+
+        chunk_size 名ずつ、各テーブルを複数行INSERT 1文で作成する。
+        コミット/ロールバックは呼び出し元で行う。
+
+        Returns:
+            作成された利用者IDのリスト（registrationsと同じ順序）
+        """
+        recipient_ids: List[UUID] = []
+        try:
+            for start in range(0, len(registrations), chunk_size):
+                chunk = registrations[start:start + chunk_size]
+                chunk_ids = await crud_welfare_recipient.bulk_create_with_related(
+                    db,
+                    rows=[WelfareRecipientBulkRow.from_registration(r) for r in chunk],
+                    office_id=office_id
+                )
+                await WelfareRecipientService._create_initial_support_plans(
+                    db,
+                    welfare_recipient_ids=chunk_ids,
+                    office_id=office_id
+                )
+                recipient_ids.extend(chunk_ids)
+            return recipient_ids
+
+        except IntegrityError as e:
+            logger.error("create_recipients_with_initial_plans integrity error: %s", type(e).__name__)
+            raise BadRequestException("データの整合性エラーが発生しました。")
+
+        except SQLAlchemyError as e:
+            logger.error("create_recipients_with_initial_plans database error: %s", type(e).__name__)
+            raise InternalServerException("データベースエラーが発生しました")
+
     @staticmethod
     def _validate_registration_data(registration_data: UserRegistrationRequest) -> None:
         """
@@ -130,57 +156,94 @@ class WelfareRecipientService:
         サイクル番号に応じて作成するステップを変更する。
         カレンダーイベントも自動作成する。
         """
-        # 既存のサイクル数を取得して新しいサイクル番号を決定
-        count_stmt = select(func.count()).select_from(SupportPlanCycle).where(SupportPlanCycle.welfare_recipient_id == welfare_recipient_id)
-        existing_cycles_count = (await db.execute(count_stmt)).scalar_one()
-        new_cycle_number = existing_cycles_count + 1
-
-        cycle = SupportPlanCycle(
-            welfare_recipient_id=welfare_recipient_id,
-            office_id=office_id,
-            is_latest_cycle=True,
-            cycle_number=new_cycle_number,
-            plan_cycle_start_date=date.today(),
-            next_renewal_deadline=date.today() + timedelta(days=180)
+        await WelfareRecipientService._create_initial_support_plans(
+            db,
+            welfare_recipient_ids=[welfare_recipient_id],
+            office_id=office_id
         )
-        db.add(cycle)
-        await db.flush()  # cycle.id を取得するため
-
-        assessment_status = None
-        for i, step in enumerate(CYCLE_STEPS):
-            status = SupportPlanStatus(
-                plan_cycle_id=cycle.id,
-                welfare_recipient_id=welfare_recipient_id,
-                office_id=office_id,
-                step_type=step,
-                completed=False,
-                is_latest_status=(i == 0)  # 最初のステップを最新にする
-            )
-            db.add(status)
-            if step == SupportPlanStep.assessment:
-                assessment_status = status
 
-        await db.flush()
+    @staticmethod
+    async def _create_initial_support_plans(
+        db: AsyncSession,
+        *,
+        welfare_recipient_ids: Sequence[UUID],
+        office_id: UUID
+    ) -> None:
+        """
+        複数利用者の初期支援計画を作成する (非同期)。
+        サイクル・ステータスはそれぞれ複数行INSERT 1文で作成し、
+        カレンダーイベントも全利用者分をまとめてベストエフォートで作成する。
+        """
+        if not welfare_recipient_ids:
+            return
 
-        # カレンダーイベントを自動作成（ベストエフォート：失敗してもサイクル作成は継続）
+        # 既存のサイクル数を取得して新しいサイクル番号を決定
+        count_stmt = (
+            select(SupportPlanCycle.welfare_recipient_id, func.count())
+            .where(SupportPlanCycle.welfare_recipient_id.in_(welfare_recipient_ids))
+            .group_by(SupportPlanCycle.welfare_recipient_id)
+        )
+        existing_counts = dict((await db.execute(count_stmt)).all())
+
+        today = date.today()
+        cycle_result = await db.execute(
+            insert(SupportPlanCycle)
+            .values([
+                {
+                    "welfare_recipient_id": recipient_id,
+                    "office_id": office_id,
+                    "is_latest_cycle": True,
+                    "cycle_number": existing_counts.get(recipient_id, 0) + 1,
+                    "plan_cycle_start_date": today,
+                    "next_renewal_deadline": today + timedelta(days=180),
+                }
+                for recipient_id in welfare_recipient_ids
+            ])
+            .returning(
+                SupportPlanCycle.id,
+                SupportPlanCycle.welfare_recipient_id,
+                SupportPlanCycle.office_id,
+                SupportPlanCycle.cycle_number,
+                SupportPlanCycle.plan_cycle_start_date,
+                SupportPlanCycle.next_renewal_deadline,
+            )
+        )
+        cycles = cycle_result.all()
+
+        status_result = await db.execute(
+            insert(SupportPlanStatus)
+            .values([
+                {
+                    "plan_cycle_id": cycle.id,
+                    "welfare_recipient_id": cycle.welfare_recipient_id,
+                    "office_id": office_id,
+                    "step_type": step,
+                    "completed": False,
+                    "is_latest_status": (i == 0),  # 最初のステップを最新にする
+                }
+                for cycle in cycles
+                for i, step in enumerate(CYCLE_STEPS)
+            ])
+            .returning(SupportPlanStatus.id, SupportPlanStatus.plan_cycle_id, SupportPlanStatus.step_type)
+        )
+        assessment_statuses = {
+            status.plan_cycle_id: status
+            for status in status_result
+            if status.step_type == SupportPlanStep.assessment
+        }
+
+        # カレンダーイベントを一括作成（ベストエフォート：失敗してもサイクル作成は継続）
+        # 失敗時に利用者登録のトランザクションを巻き込まないようセーブポイント内で実行する
         try:
-            from sqlalchemy.exc import IntegrityError as SQLAlchemyIntegrityError
-
-            try:
-                await support_plan_calendar_event_service.create_cycle_events(
+            async with db.begin_nested():
+                await support_plan_calendar_event_service.create_cycle_events_bulk(
                     db=db,
-                    cycle=cycle,
-                    assessment_status=assessment_status,
+                    cycles=cycles,
+                    assessment_statuses=assessment_statuses,
                 )
-            except SQLAlchemyIntegrityError:
-                logger.warning("[DEBUG] Calendar deadline event already exists")
-            except Exception as e:
-                logger.warning("[DEBUG] Could not create calendar deadline events: %s", type(e).__name__)
-
         except Exception as e:
-            # カレンダーイベント作成の予期しないエラー
-            logger.error("[DEBUG] Unexpected error during calendar event creation: %s", type(e).__name__)
             # カレンダーイベント作成の失敗は利用者登録を妨げない
+            logger.warning("[DEBUG] Could not create calendar deadline events: %s", type(e).__name__)
 
     @staticmethod
     def _create_initial_support_plan_sync(db: Session, welfare_recipient_id: UUID) -> None:
@@ -29,6 +29,7 @@ from app.models.enums import StaffRole, RequestStatus, ApprovalResourceType, Bil
 from app.messages import ja
 from app.core.config import settings
 from app.schemas.billing import BillingUpdate
+from app.services.billing.stripe_gateway import get_stripe_gateway
 
 logger = logging.getLogger(__name__)
 
@@ -549,6 +550,8 @@ class WithdrawalService:
         事務所退会処理を実行
 
         事務所を論理削除し、所属スタッフを全員削除
+        スタッフのアーカイブ・監査ログ・論理削除は一括ステートメントで行い、
+        所属スタッフ数に比例した往復を発生させない
 
         Args:
             db: データベースセッション
@@ -577,20 +580,24 @@ class WithdrawalService:
             "type": office.type.value if office.type else None
         }
 
-        # 所属スタッフIDを取得
-        staff_ids = await crud_office.get_staff_ids_by_office(db, office_id)
+        # 所属スタッフを1クエリで取得（アーカイブ用に所属事務所もロード）
+        staffs = await crud_staff.get_by_office_id(
+            db,
+            office_id=office_id,
+            exclude_deleted=False
+        )
+        staff_ids = [staff.id for staff in staffs]
 
         # 所属スタッフの情報を取得（監査ログ用）
-        deleted_staff_info = []
-        for staff_id in staff_ids:
-            staff = await crud_staff.get(db, id=staff_id)
-            if staff:
-                deleted_staff_info.append({
-                    "id": str(staff.id),
-                    "email": staff.email,
-                    "full_name": staff.full_name,
-                    "role": staff.role.value
-                })
+        deleted_staff_info = [
+            {
+                "id": str(staff.id),
+                "email": staff.email,
+                "full_name": staff.full_name,
+                "role": staff.role.value
+            }
+            for staff in staffs
+        ]
 
         # 監査ログ記録（削除前に記録）
         await crud_audit_log.create_log(
@@ -624,55 +631,55 @@ class WithdrawalService:
         logger.info("Billing cancellation completed during office withdrawal")
 
         # 所属スタッフを全員論理削除（30日後に物理削除される予定）
-        archived_staff_ids = []
-        for staff_id in staff_ids:
-            # スタッフを取得（リレーションシップをロード）
-            staff = await crud_staff.get(db, id=staff_id)
-            if not staff:
-                logger.warning("Staff not found during office withdrawal")
-                continue
-
-            # 1. アーカイブ作成（法定保存義務対応）
-            archive = await crud_archived_staff.create_from_staff(
-                db,
-                staff=staff,
-                reason="office_withdrawal",
-                deleted_by=executor_id
-            )
-            await db.flush()
-            archived_staff_ids.append(str(archive.id))
+        # スタッフ数に関わらず、アーカイブ・監査ログ・論理削除はそれぞれ1ステートメント
+        # 1. アーカイブ一括作成（法定保存義務対応）
+        archives = await crud_archived_staff.bulk_create_from_staffs(
+            db,
+            staffs=staffs,
+            reason="office_withdrawal",
+            deleted_by=executor_id
+        )
+        archived_staff_ids = [
+            str(archives[staff_id][0]) for staff_id in staff_ids if staff_id in archives
+        ]
 
-            logger.info(
-                f"Archive created for office withdrawal: staff_id={staff_id}, "
-                f"archive_id={archive.id}, retention_until={archive.legal_retention_until}"
-            )
+        logger.info(
+            f"Archives created for office withdrawal: office_id={office_id}, "
+            f"archived_staff_count={len(archived_staff_ids)}"
+        )
 
-            # 2. 各スタッフの削除ログを記録
-            await crud_audit_log.create_log(
-                db,
-                actor_id=executor_id,
-                action="staff.soft_deleted",
-                target_type="staff",
-                target_id=staff_id,
-                office_id=office_id,
-                ip_address=ip_address,
-                user_agent=user_agent,
-                details={
-                    "reason": "office_withdrawal",
-                    "office_id": str(office_id),
-                    "archive_id": str(archive.id),
-                    "withdrawal_request_id": str(request.id),
-                    "deletion_type": "soft_delete",
-                    "note": "30日後に物理削除される予定、法定保存データは5年間保持"
+        # 2. 各スタッフの削除ログを一括記録
+        await crud_audit_log.create_logs_bulk(
+            db,
+            entries=[
+                {
+                    "actor_id": executor_id,
+                    "action": "staff.soft_deleted",
+                    "target_type": "staff",
+                    "target_id": staff_id,
+                    "office_id": office_id,
+                    "ip_address": ip_address,
+                    "user_agent": user_agent,
+                    "details": {
+                        "reason": "office_withdrawal",
+                        "office_id": str(office_id),
+                        "archive_id": str(archives[staff_id][0]),
+                        "withdrawal_request_id": str(request.id),
+                        "deletion_type": "soft_delete",
+                        "note": "30日後に物理削除される予定、法定保存データは5年間保持"
+                    },
                 }
-            )
+                for staff_id in staff_ids
+                if staff_id in archives
+            ]
+        )
 
-            # 3. スタッフを論理削除
-            await crud_staff.soft_delete(
-                db,
-                staff_id=staff_id,
-                deleted_by=executor_id
-            )
+        # 3. スタッフを一括論理削除
+        await crud_staff.bulk_soft_delete(
+            db,
+            staff_ids=staff_ids,
+            deleted_by=executor_id
+        )
 
         # 事務所を論理削除
         await crud_office.soft_delete(
@@ -887,13 +894,14 @@ class WithdrawalService:
                     "reason": "Stripe API key not configured"
                 }
 
-            # Stripe API key設定
-            stripe.api_key = settings.STRIPE_SECRET_KEY.get_secret_value()
-
-            # サブスクリプションをキャンセル
+            # サブスクリプションをキャンセル（Stripe APIはワーカースレッドで実行）
+            # APIキーはグローバルの stripe.api_key ではなく呼び出しごとに渡す
             # prorate=False: 日割り計算なし（即座にキャンセル）
             # invoice_now=False: 即座に請求書を発行しない
-            canceled_subscription = stripe.Subscription.delete(subscription_id)
+            canceled_subscription = await get_stripe_gateway().delete_subscription(
+                subscription_id,
+                api_key=settings.STRIPE_SECRET_KEY.get_secret_value(),
+            )
 
             logger.info("Stripe subscription canceled: status=%s", canceled_subscription.status)
 
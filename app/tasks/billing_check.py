@@ -3,9 +3,9 @@
 """
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Callable, Optional, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import select, ColumnElement
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud
@@ -17,6 +17,69 @@ logger = logging.getLogger(__name__)
 status_transition_service = BillingStatusTransitionService()
 
 
+TRIAL_EXPIRATION_SOURCE_STATUSES = (BillingStatus.free, BillingStatus.early_payment)
+SCHEDULED_CANCELLATION_SOURCE_STATUSES = (BillingStatus.canceling,)
+
+
+async def _apply_status_transitions(
+    db: AsyncSession,
+    *,
+    source_statuses: tuple[BillingStatus, ...],
+    determine_new_status: Callable[[BillingStatus], Optional[BillingStatus]],
+    conditions: Sequence[ColumnElement[bool]],
+    audit_action: str,
+    log_message: str,
+    log_level: int = logging.INFO,
+) -> int:
+    """
+    source_status ごとに1回の UPDATE ... RETURNING で遷移させ、
+    監査ログを1回の multi-row INSERT でまとめて記録する。
+
+    遷移先は BillingStatusTransitionService の判定結果を使う。
+    ステータスキャッシュは crud.billing がCOMMIT後に破棄する。
+
+    Returns:
+        遷移させた件数
+    """
+    audit_entries = []
+
+    for old_status in source_statuses:
+        new_status = determine_new_status(old_status)
+        if new_status is None:
+            continue
+
+        updated_rows = await crud.billing.bulk_transition_status(
+            db=db,
+            from_status=old_status,
+            to_status=new_status,
+            conditions=conditions,
+        )
+
+        for billing_id, office_id, is_test_data in updated_rows:
+            logger.log(
+                log_level,
+                f"{log_message}: office_id={office_id}, "
+                f"billing_id={billing_id}, "
+                f"{old_status.value} → {new_status.value}"
+            )
+            audit_entries.append({
+                "action": audit_action,
+                "target_type": "billing",
+                "target_id": billing_id,
+                "office_id": office_id,
+                "details": {
+                    "previous_status": old_status.value,
+                    "new_status": new_status.value,
+                },
+                "is_test_data": bool(is_test_data),
+            })
+
+    if audit_entries:
+        await crud.audit_log.create_logs_bulk(db=db, entries=audit_entries)
+
+    return len(audit_entries)
+
+
 async def check_trial_expiration(
     db: AsyncSession,
     dry_run: bool = False
@@ -25,12 +88,15 @@ async def check_trial_expiration(
     トライアル期間終了チェック（定期実行タスク）
 
     処理内容:
-    - trial_end_date < now かつ billing_status が 'free' または 'early_payment' のレコードを抽出
-    - billing_status を以下のように更新:
+    - trial_end_date < now かつ billing_status が 'free' または 'early_payment' のレコードを
+      遷移元status単位の UPDATE ... RETURNING で一括更新:
       - free → trial_expired（無料期間終了、未課金）
       - early_payment → active（無料期間終了、課金済み）
+    - 監査ログ（billing.trial_period_ended）を一括INSERT
     - 処理件数を返す
 
+    対象件数に関わらずステートメント数は一定（遷移元status数 + 監査ログ1回）。
+
     実行頻度: 毎日0:00 UTC（推奨）
 
     Args:
@@ -50,51 +116,39 @@ async def check_trial_expiration(
         >>> logger.info(f"Would update {expired_count} expired trials")
     """
     now = datetime.now(timezone.utc)
-
-    # トライアル期限切れのBillingを取得
-    # 条件:
-    # - billing_status in ('free', 'early_payment')
-    # - trial_end_date < now （期限切れ）
-    query = select(Billing).where(
-        Billing.billing_status.in_([BillingStatus.free, BillingStatus.early_payment]),
-        Billing.trial_end_date < now
-    )
-
-    result = await db.execute(query)
-    expired_billings = result.scalars().all()
+    conditions = [Billing.trial_end_date < now]
 
     if dry_run:
-        logger.info(
-            f"[DRY RUN] Would update {len(expired_billings)} expired trials"
-        )
-        return len(expired_billings)
-
-    # ステータス更新
-    updated_count = 0
-    for billing in expired_billings:
-        old_status = billing.billing_status
-
-        new_status = status_transition_service.determine_trial_expiration_status(
-            current_status=old_status,
-        )
-        if new_status is None:
-            continue
-
-        await crud.billing.update_status(
+        counts = await crud.billing.count_by_status(
             db=db,
-            billing_id=billing.id,
-            status=new_status,
-            auto_commit=False
+            statuses=TRIAL_EXPIRATION_SOURCE_STATUSES,
+            conditions=conditions,
+        )
+        target_count = sum(
+            count
+            for old_status, count in counts.items()
+            if status_transition_service.determine_trial_expiration_status(
+                current_status=old_status,
+            ) is not None
         )
-
         logger.info(
-            f"Trial expired: office_id={billing.office_id}, "
-            f"billing_id={billing.id}, "
-            f"trial_end_date={billing.trial_end_date}, "
-            f"{old_status.value} → {new_status.value}"
+            f"[DRY RUN] Would update {target_count} expired trials "
+            f"({', '.join(f'{s.value}={c}' for s, c in counts.items())})"
         )
-
-        updated_count += 1
+        return target_count
+
+    updated_count = await _apply_status_transitions(
+        db,
+        source_statuses=TRIAL_EXPIRATION_SOURCE_STATUSES,
+        determine_new_status=lambda current_status: (
+            status_transition_service.determine_trial_expiration_status(
+                current_status=current_status,
+            )
+        ),
+        conditions=conditions,
+        audit_action="billing.trial_period_ended",
+        log_message="Trial expired",
+    )
 
     # コミット
     if updated_count > 0:
@@ -112,8 +166,9 @@ async def check_scheduled_cancellation(
     スケジュールされたキャンセルの期限チェック（定期実行タスク）
 
     処理内容:
-    - scheduled_cancel_at < now かつ billing_status = 'canceling' のレコードを抽出
-    - billing_status を 'canceled' に更新
+    - scheduled_cancel_at < now かつ billing_status = 'canceling' のレコードを
+      UPDATE ... RETURNING で 'canceled' に一括更新
+    - 監査ログ（billing.scheduled_cancellation_expired）を一括INSERT
     - 処理件数を返す
 
     実行頻度: 毎日0:05 UTC（推奨）
@@ -135,49 +190,37 @@ async def check_scheduled_cancellation(
         >>> logger.info(f"Would update {canceled_count} scheduled cancellations")
     """
     now = datetime.now(timezone.utc)
-
-    # スケジュールキャンセルが過去日付のBillingを取得
-    query = select(Billing).where(
-        Billing.billing_status == BillingStatus.canceling,
+    conditions = [
         Billing.scheduled_cancel_at.isnot(None),
-        Billing.scheduled_cancel_at < now
-    )
-
-    result = await db.execute(query)
-    expired_cancellations = result.scalars().all()
+        Billing.scheduled_cancel_at < now,
+    ]
 
     if dry_run:
-        logger.info(
-            f"[DRY RUN] Would update {len(expired_cancellations)} expired scheduled cancellations"
-        )
-        return len(expired_cancellations)
-
-    # ステータス更新
-    updated_count = 0
-    for billing in expired_cancellations:
-        old_status = billing.billing_status
-        new_status = status_transition_service.determine_scheduled_cancellation_status(
-            current_status=old_status,
-        )
-        if new_status is None:
-            continue
-
-        await crud.billing.update_status(
+        counts = await crud.billing.count_by_status(
             db=db,
-            billing_id=billing.id,
-            status=new_status,
-            auto_commit=False
+            statuses=SCHEDULED_CANCELLATION_SOURCE_STATUSES,
+            conditions=conditions,
         )
-
-        logger.warning(
-            f"Scheduled cancellation expired (Webhook may have been missed): "
-            f"office_id={billing.office_id}, "
-            f"billing_id={billing.id}, "
-            f"scheduled_cancel_at={billing.scheduled_cancel_at}, "
-            f"{old_status.value} → {new_status.value}"
+        target_count = sum(counts.values())
+        logger.info(
+            f"[DRY RUN] Would update {target_count} expired scheduled cancellations"
         )
-
-        updated_count += 1
+        return target_count
+
+    # Webhookの取りこぼし時のみ対象が残るため、WARNINGで記録する
+    updated_count = await _apply_status_transitions(
+        db,
+        source_statuses=SCHEDULED_CANCELLATION_SOURCE_STATUSES,
+        determine_new_status=lambda current_status: (
+            status_transition_service.determine_scheduled_cancellation_status(
+                current_status=current_status,
+            )
+        ),
+        conditions=conditions,
+        audit_action="billing.scheduled_cancellation_expired",
+        log_message="Scheduled cancellation expired (Webhook may have been missed)",
+        log_level=logging.WARNING,
+    )
 
     # コミット
     if updated_count > 0:
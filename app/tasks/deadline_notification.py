@@ -8,7 +8,7 @@ import logging
 import asyncio
 import os
 from datetime import datetime, timezone, date
-from typing import List
+from typing import List, Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -29,6 +29,7 @@ from app.schemas.deadline_alert import DeadlineAlertItem
 from app.core.mail import send_deadline_alert_email
 from app.core.push import send_push_notification
 from app.core.config import settings
+from app.core.tracing import start_span
 from app.utils.holiday_utils import is_japanese_weekday_and_not_holiday
 from app.utils.privacy_utils import mask_email
 
@@ -368,7 +369,8 @@ async def _process_single_office(
 
 async def send_deadline_alert_emails(
     db: AsyncSession,
-    dry_run: bool = False
+    dry_run: bool = False,
+    read_db: Optional[AsyncSession] = None
 ) -> dict:
     """
     全事業所の期限アラートメール + Web Push通知を送信（閾値カスタマイズ対応）
@@ -384,6 +386,8 @@ async def send_deadline_alert_emails(
     Args:
         db: データベースセッション
         dry_run: Trueの場合は送信せず、送信予定件数のみ返す
+        read_db: 事業所・アラート・スタッフ・購読情報の一括取得に使うセッション
+            （読み取りレプリカ）。未指定時は db を使う
 
     Returns:
         dict: 送信結果
@@ -424,8 +428,11 @@ async def send_deadline_alert_emails(
         # 本番環境: 本番データのみ取得
         office_conditions.append(Office.is_test_data == False)
 
+    # 一括取得はレプリカで行う（書き込み: 監査ログ・失効した購読情報の削除は db）
+    read_db = read_db or db
+
     stmt = select(Office).where(*office_conditions)
-    result = await db.execute(stmt)
+    result = await read_db.execute(stmt)
     offices = result.scalars().all()
 
     logger.info(f"[DEADLINE_NOTIFICATION] Found {len(offices)} active offices")
@@ -436,7 +443,7 @@ async def send_deadline_alert_emails(
     # アラートを一括取得（2クエリ: 更新期限 + アセスメント）
     logger.info(f"[DEADLINE_NOTIFICATION] Fetching alerts for {len(office_ids)} offices (batch query)")
     alerts_by_office = await WelfareRecipientService.get_deadline_alerts_batch(
-        db=db,
+        db=read_db,
         office_ids=office_ids,
         threshold_days=30
     )
@@ -444,7 +451,7 @@ async def send_deadline_alert_emails(
     # スタッフを一括取得（1クエリ）
     logger.info(f"[DEADLINE_NOTIFICATION] Fetching staff for {len(office_ids)} offices (batch query)")
     staffs_by_office = await WelfareRecipientService.get_staffs_by_offices_batch(
-        db=db,
+        db=read_db,
         office_ids=office_ids
     )
 
@@ -452,7 +459,7 @@ async def send_deadline_alert_emails(
     staff_ids = [staff.id for staffs in staffs_by_office.values() for staff in staffs]
     logger.info(f"[DEADLINE_NOTIFICATION] Fetching push subscriptions for {len(staff_ids)} staff (batch query)")
     push_subscriptions_by_staff = await crud.push_subscription.get_by_staff_ids_batch(
-        db=db,
+        db=read_db,
         staff_ids=staff_ids
     )
 
@@ -491,15 +498,19 @@ async def send_deadline_alert_emails(
             }
         """
         async with office_semaphore:
-            return await _process_single_office(
-                db=db,
-                office=office,
-                alerts_by_office=alerts_by_office,
-                staffs_by_office=staffs_by_office,
-                push_subscriptions_by_staff=push_subscriptions_by_staff,
-                dry_run=dry_run,
-                rate_limit_semaphore=rate_limit_semaphore
-            )
+            with start_span(
+                "deadline_notification.office",
+                attributes={"office.id": str(office.id)},
+            ):
+                return await _process_single_office(
+                    db=db,
+                    office=office,
+                    alerts_by_office=alerts_by_office,
+                    staffs_by_office=staffs_by_office,
+                    push_subscriptions_by_staff=push_subscriptions_by_staff,
+                    dry_run=dry_run,
+                    rate_limit_semaphore=rate_limit_semaphore
+                )
 
     logger.info(
         f"[DEADLINE_NOTIFICATION] Starting parallel processing of {len(offices)} offices "
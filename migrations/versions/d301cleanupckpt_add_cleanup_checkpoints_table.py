@@ -0,0 +1,55 @@
+"""Add cleanup_checkpoints table for resumable physical deletion
+
+Revision ID: d301cleanupckpt
+Revises: c171deadlinecal
+Create Date: 2026-10-18
+
+Task: 物理削除クリーンアップをバッチ単位でCOMMITし、次回実行で再開できるようにする
+- name: フェーズ名（主キー）
+- cursor_deleted_at / cursor_id: 最後に処理したキーセット位置
+- updated_at: 最終更新日時
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd301cleanupckpt'
+down_revision: Union[str, None] = 'c171deadlinecal'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add cleanup_checkpoints table"""
+    op.create_table(
+        'cleanup_checkpoints',
+        sa.Column('name', sa.String(length=64), primary_key=True),
+        sa.Column('cursor_deleted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('cursor_id', sa.String(length=64), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('NOW()'), nullable=False),
+    )
+
+    # キーセット走査用のインデックス（論理削除済みレコードのみ）
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_offices_deleted_keyset
+        ON offices(deleted_at, id)
+        WHERE is_deleted = true
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_staffs_deleted_keyset
+        ON staffs(deleted_at, id)
+        WHERE is_deleted = true
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop cleanup_checkpoints table"""
+    op.execute("DROP INDEX IF EXISTS idx_staffs_deleted_keyset")
+    op.execute("DROP INDEX IF EXISTS idx_offices_deleted_keyset")
+    op.drop_table('cleanup_checkpoints')
@@ -0,0 +1,127 @@
+"""Declare ON DELETE CASCADE on the welfare recipient subtree
+
+Revision ID: e302recipcascade
+Revises: d301cleanupckpt
+Create Date: 2026-10-18
+
+Task: 利用者削除をDELETE 1文で完結させる
+- 利用者配下（事務所紐付け・詳細・障害情報・支援計画・アセスメント・カレンダー）の
+  外部キーを ON DELETE CASCADE で張り直す
+- 既存の制約名は環境により異なるため、pg_constraint から列単位で検索して削除する
+- NOT VALID で追加してCOMMITし、VALIDATE は autocommit_block で別トランザクションとして実行する
+  （VALIDATE は SHARE UPDATE EXCLUSIVE ロックのため、検証中も書き込みを止めない）
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e302recipcascade'
+down_revision: Union[str, None] = 'd301cleanupckpt'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (テーブル, 列, 参照先テーブル, downgrade時のON DELETE句)
+RECIPIENT_SUBTREE_FOREIGN_KEYS = [
+    ("office_welfare_recipients", "welfare_recipient_id", "welfare_recipients", ""),
+    ("service_recipient_details", "welfare_recipient_id", "welfare_recipients", "ON DELETE CASCADE"),
+    ("emergency_contacts", "service_recipient_detail_id", "service_recipient_details", "ON DELETE CASCADE"),
+    ("disability_statuses", "welfare_recipient_id", "welfare_recipients", "ON DELETE CASCADE"),
+    ("disability_details", "disability_status_id", "disability_statuses", "ON DELETE CASCADE"),
+    ("support_plan_cycles", "welfare_recipient_id", "welfare_recipients", ""),
+    ("support_plan_statuses", "plan_cycle_id", "support_plan_cycles", ""),
+    ("support_plan_statuses", "welfare_recipient_id", "welfare_recipients", "ON DELETE CASCADE"),
+    ("plan_deliverables", "plan_cycle_id", "support_plan_cycles", ""),
+    ("family_of_service_recipients", "welfare_recipient_id", "welfare_recipients", "ON DELETE CASCADE"),
+    ("welfare_services_used", "welfare_recipient_id", "welfare_recipients", "ON DELETE CASCADE"),
+    ("medical_matters", "welfare_recipient_id", "welfare_recipients", "ON DELETE CASCADE"),
+    ("history_of_hospital_visits", "medical_matters_id", "medical_matters", "ON DELETE CASCADE"),
+    ("employment_related", "welfare_recipient_id", "welfare_recipients", "ON DELETE CASCADE"),
+    ("issue_analyses", "welfare_recipient_id", "welfare_recipients", "ON DELETE CASCADE"),
+    ("calendar_events", "welfare_recipient_id", "welfare_recipients", "ON DELETE CASCADE"),
+    ("calendar_event_series", "welfare_recipient_id", "welfare_recipients", "ON DELETE CASCADE"),
+    ("calendar_event_instances", "event_series_id", "calendar_event_series", "ON DELETE CASCADE"),
+]
+
+
+def _drop_foreign_keys(table: str, column: str, referenced_table: str) -> None:
+    """列に張られている参照先テーブルへの外部キーを名前に依らず削除する"""
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            r record;
+        BEGIN
+            FOR r IN
+                SELECT con.conname
+                FROM pg_constraint con
+                JOIN pg_class rel ON rel.oid = con.conrelid
+                JOIN pg_attribute att
+                  ON att.attrelid = con.conrelid AND att.attnum = ANY(con.conkey)
+                WHERE con.contype = 'f'
+                  AND rel.relname = '{table}'
+                  AND att.attname = '{column}'
+                  AND con.confrelid = '{referenced_table}'::regclass
+            LOOP
+                EXECUTE format('ALTER TABLE %I DROP CONSTRAINT %I', '{table}', r.conname);
+            END LOOP;
+        END $$;
+        """
+    )
+
+
+def _constraint_name(table: str, column: str) -> str:
+    return f"{table}_{column}_fkey"
+
+
+def _add_foreign_key(table: str, column: str, referenced_table: str, on_delete: str) -> None:
+    """既存行を検証せずに外部キーを追加する（検証は _validate_foreign_keys で行う）"""
+    op.execute(
+        f"""
+        ALTER TABLE {table}
+        ADD CONSTRAINT {_constraint_name(table, column)}
+        FOREIGN KEY ({column}) REFERENCES {referenced_table}(id) {on_delete}
+        NOT VALID
+        """
+    )
+
+
+def _validate_foreign_keys() -> None:
+    """NOT VALID で追加した外部キーを、追加をCOMMITした後に1つずつ検証する"""
+    with op.get_context().autocommit_block():
+        for table, column, _, _ in RECIPIENT_SUBTREE_FOREIGN_KEYS:
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {_constraint_name(table, column)}")
+
+
+def upgrade() -> None:
+    """Recreate recipient subtree foreign keys with ON DELETE CASCADE"""
+    for table, column, referenced_table, _ in RECIPIENT_SUBTREE_FOREIGN_KEYS:
+        _drop_foreign_keys(table, column, referenced_table)
+        _add_foreign_key(table, column, referenced_table, "ON DELETE CASCADE")
+    _validate_foreign_keys()
+
+    # CASCADE時の子テーブル走査用インデックス
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_plan_deliverables_plan_cycle_id
+        ON plan_deliverables(plan_cycle_id)
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_office_welfare_recipients_recipient_id
+        ON office_welfare_recipients(welfare_recipient_id)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Restore previous ON DELETE behaviour"""
+    op.execute("DROP INDEX IF EXISTS idx_office_welfare_recipients_recipient_id")
+    op.execute("DROP INDEX IF EXISTS idx_plan_deliverables_plan_cycle_id")
+
+    for table, column, referenced_table, previous_on_delete in RECIPIENT_SUBTREE_FOREIGN_KEYS:
+        _drop_foreign_keys(table, column, referenced_table)
+        _add_foreign_key(table, column, referenced_table, previous_on_delete)
+    _validate_foreign_keys()
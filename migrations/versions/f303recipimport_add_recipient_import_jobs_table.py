@@ -0,0 +1,56 @@
+"""Add recipient_import_jobs table for bulk recipient import
+
+Revision ID: f303recipimport
+Revises: e302recipcascade
+Create Date: 2026-10-18
+
+Task: CSV/Excelからの利用者一括インポートの進捗を管理する
+- status: pending / running / completed / failed
+- processed_rows / succeeded_rows / failed_rows: チャンクごとに加算
+- errors: 行単位のエラー（JSONB配列）
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'f303recipimport'
+down_revision: Union[str, None] = 'e302recipcascade'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add recipient_import_jobs table"""
+    op.create_table(
+        'recipient_import_jobs',
+        sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False),
+        sa.Column('office_id', sa.UUID(), nullable=False),
+        sa.Column('created_by', sa.UUID(), nullable=True),
+        sa.Column('file_name', sa.String(length=255), nullable=True),
+        sa.Column(
+            'status',
+            sa.Enum('pending', 'running', 'completed', 'failed', name='recipientimportstatus'),
+            nullable=False,
+        ),
+        sa.Column('processed_rows', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('succeeded_rows', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('failed_rows', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('errors', postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default=sa.text("'[]'::jsonb")),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('NOW()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('NOW()'), nullable=False),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['office_id'], ['offices.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['created_by'], ['staffs.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_recipient_import_jobs_office_id', 'recipient_import_jobs', ['office_id'])
+
+
+def downgrade() -> None:
+    """Drop recipient_import_jobs table"""
+    op.drop_index('ix_recipient_import_jobs_office_id', table_name='recipient_import_jobs')
+    op.drop_table('recipient_import_jobs')
+    op.execute("DROP TYPE IF EXISTS recipientimportstatus")
@@ -0,0 +1,46 @@
+"""Add rate_limit_counters table shared by all app instances
+
+Revision ID: g304ratelimit
+Revises: f303recipimport
+Create Date: 2026-10-18
+
+Task: レート制限カウンタをプロセス間・インスタンス間で共有する
+- key: 制限キー（主キー）
+- count: 現在の固定窓内のカウント
+- expires_at: 窓の終了時刻（経過後の最初のINCRでリセット）
+- UNLOGGED: WALを書かないため更新が軽い（クラッシュ時に消えても許容できるデータ）
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'g304ratelimit'
+down_revision: Union[str, None] = 'f303recipimport'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add rate_limit_counters table"""
+    op.execute(
+        """
+        CREATE UNLOGGED TABLE IF NOT EXISTS rate_limit_counters (
+            key TEXT PRIMARY KEY,
+            count INTEGER NOT NULL,
+            expires_at TIMESTAMP WITH TIME ZONE NOT NULL
+        )
+        """
+    )
+    # 期限切れカウンタの掃除用
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_rate_limit_counters_expires_at
+        ON rate_limit_counters(expires_at)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop rate_limit_counters table"""
+    op.execute("DROP TABLE IF EXISTS rate_limit_counters")
@@ -0,0 +1,48 @@
+"""Add attempt_counters table for attempt throttling
+
+Revision ID: h305attemptthrottle
+Revises: g304ratelimit
+Create Date: 2026-10-18
+
+Task: パスワード変更などの試行回数制限を監査ログのCOUNTから専用カウンタに置き換える
+- (scope, subject): 制限の種類と対象（主キー）
+- count: 現在の固定窓内の試行回数
+- window_expires_at: 窓の終了時刻（経過後の最初の試行でリセット）
+- UNLOGGED: WALを書かないため更新が軽い（クラッシュ時に消えても許容できるデータ）
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'h305attemptthrottle'
+down_revision: Union[str, None] = 'g304ratelimit'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add attempt_counters table"""
+    op.execute(
+        """
+        CREATE UNLOGGED TABLE IF NOT EXISTS attempt_counters (
+            scope VARCHAR(64) NOT NULL,
+            subject VARCHAR(255) NOT NULL,
+            count INTEGER NOT NULL,
+            window_expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            PRIMARY KEY (scope, subject)
+        )
+        """
+    )
+    # 期限切れカウンタの掃除用
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_attempt_counters_window_expires_at
+        ON attempt_counters(window_expires_at)
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop attempt_counters table"""
+    op.execute("DROP TABLE IF EXISTS attempt_counters")
@@ -0,0 +1,62 @@
+"""Add inquiry search and keyset pagination indexes
+
+Revision ID: i306inquirysearch
+Revises: h305attemptthrottle
+Create Date: 2026-10-18
+
+Task: app_admin問い合わせ一覧の検索とページングをインデックスで処理する
+- ix_messages_inquiry_title_trgm / ix_messages_inquiry_content_trgm:
+  件名・本文の ILIKE '%..%' 用のtrigram GINインデックス（問い合わせのみの部分インデックス）
+- ix_inquiry_details_created_id: ステータス指定なし一覧の (created_at, id) キーセット用
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'i306inquirysearch'
+down_revision: Union[str, None] = 'h305attemptthrottle'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEX_UPGRADE_SQL = [
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_messages_inquiry_title_trgm
+    ON messages USING gin (title gin_trgm_ops)
+    WHERE message_type = 'inquiry'
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_messages_inquiry_content_trgm
+    ON messages USING gin (content gin_trgm_ops)
+    WHERE message_type = 'inquiry'
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_inquiry_details_created_id
+    ON inquiry_details (created_at, id)
+    """,
+]
+
+
+INDEX_DOWNGRADE_SQL = [
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_inquiry_details_created_id",
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_messages_inquiry_content_trgm",
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_messages_inquiry_title_trgm",
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside Alembic's default transaction.
+    with op.get_context().autocommit_block():
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for statement in INDEX_UPGRADE_SQL:
+            op.execute(statement)
+
+        op.execute("ANALYZE messages")
+        op.execute("ANALYZE inquiry_details")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for statement in INDEX_DOWNGRADE_SQL:
+            op.execute(statement)
@@ -0,0 +1,75 @@
+"""Add keyset pagination indexes for admin office list and audit logs
+
+Revision ID: j307adminkeyset
+Revises: i306inquirysearch
+Create Date: 2026-10-18
+
+Task: app_admin事務所一覧・監査ログ一覧をOFFSETではなくキーセットで取得する
+- ix_audit_logs_live_*: (timestamp, id) の降順走査用。フィルタの組み合わせ
+  （なし / target_type / office_id + target_type）ごとの複合インデックス。
+  一覧は常にテストデータを除外するため is_test_data = false の部分インデックスにする
+- ix_offices_created_id: 事務所一覧の (created_at, id) キーセット用
+- ix_offices_name_trgm: 事務所名の ILIKE '%..%' 用のtrigram GINインデックス
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'j307adminkeyset'
+down_revision: Union[str, None] = 'i306inquirysearch'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEX_UPGRADE_SQL = [
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_logs_live_timestamp_id
+    ON audit_logs (timestamp, id)
+    WHERE is_test_data = false
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_logs_live_target_timestamp_id
+    ON audit_logs (target_type, timestamp, id)
+    WHERE is_test_data = false
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_logs_live_office_target_timestamp_id
+    ON audit_logs (office_id, target_type, timestamp, id)
+    WHERE is_test_data = false
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_offices_created_id
+    ON offices (created_at, id)
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_offices_name_trgm
+    ON offices USING gin (name gin_trgm_ops)
+    """,
+]
+
+
+INDEX_DOWNGRADE_SQL = [
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_offices_name_trgm",
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_offices_created_id",
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_audit_logs_live_office_target_timestamp_id",
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_audit_logs_live_target_timestamp_id",
+    "DROP INDEX CONCURRENTLY IF EXISTS ix_audit_logs_live_timestamp_id",
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside Alembic's default transaction.
+    with op.get_context().autocommit_block():
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for statement in INDEX_UPGRADE_SQL:
+            op.execute(statement)
+
+        op.execute("ANALYZE audit_logs")
+        op.execute("ANALYZE offices")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for statement in INDEX_DOWNGRADE_SQL:
+            op.execute(statement)
@@ -0,0 +1,56 @@
+"""Add sync queue columns and partial index to calendar_events
+
+Revision ID: k308calendarsyncqueue
+Revises: j307adminkeyset
+Create Date: 2026-10-18
+
+Task: カレンダー同期待ちイベントを複数ワーカーでクレームして処理する
+- sync_attempts: 同期に失敗した回数
+- next_sync_attempt_at: 次に再試行してよい時刻（指数バックオフ）
+- sync_lease_expires_at: クレームの有効期限（異常終了したワーカーの行を再取得するため）
+- idx_calendar_events_sync_queue: 同期待ち・再試行待ちの行だけの部分インデックス
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'k308calendarsyncqueue'
+down_revision: Union[str, None] = 'j307adminkeyset'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'calendar_events',
+        sa.Column('sync_attempts', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.add_column(
+        'calendar_events',
+        sa.Column('next_sync_attempt_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        'calendar_events',
+        sa.Column('sync_lease_expires_at', sa.DateTime(timezone=True), nullable=True),
+    )
+
+    # CREATE INDEX CONCURRENTLY cannot run inside Alembic's default transaction.
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_calendar_events_sync_queue
+            ON calendar_events (office_id, created_at)
+            WHERE sync_status IN ('pending', 'failed')
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_calendar_events_sync_queue")
+
+    op.drop_column('calendar_events', 'sync_lease_expires_at')
+    op.drop_column('calendar_events', 'next_sync_attempt_at')
+    op.drop_column('calendar_events', 'sync_attempts')
@@ -0,0 +1,38 @@
+"""Add calendar_feed_tokens table
+
+Revision ID: l309calendarfeedtoken
+Revises: k308calendarsyncqueue
+Create Date: 2026-10-18
+
+Task: 期限カレンダーをカレンダーアプリから購読できるようにする
+- calendar_feed_tokens: 事業所ごとの購読URLトークン（SHA-256ハッシュのみ保存）
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'l309calendarfeedtoken'
+down_revision: Union[str, None] = 'k308calendarsyncqueue'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'calendar_feed_tokens',
+        sa.Column('office_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('token_hash', sa.String(length=64), nullable=False),
+        sa.Column('created_by', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['office_id'], ['offices.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['created_by'], ['staffs.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('office_id'),
+        sa.UniqueConstraint('token_hash'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('calendar_feed_tokens')
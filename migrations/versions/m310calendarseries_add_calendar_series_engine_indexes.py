@@ -0,0 +1,99 @@
+"""Prepare calendar_event_series / calendar_event_instances for set-based generation
+
+Revision ID: m310calendarseries
+Revises: l309calendarfeedtoken
+Create Date: 2026-10-18
+
+Task: 通知パターンから期限ごとのシリーズ・インスタンスをSQLでまとめて展開する
+- calendar_event_series.google_calendar_id: カレンダー未連携の事業所でも
+  アプリ内のみ（local_only）のシリーズを作れるようNULL許可にする
+- uq_calendar_event_series_cycle_pattern / uq_calendar_event_series_status_pattern:
+  期限（サイクル/ステータス）× 通知パターンで1シリーズ（UPSERTの競合対象）
+- uq_calendar_event_instances_series_days: シリーズ × 何日前で1インスタンス
+- calendar_event_instances の同期キュー列（calendar_events と同じ方式）
+- idx_calendar_event_instances_sync_queue: 同期待ち・再試行待ちの行だけの部分インデックス
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'm310calendarseries'
+down_revision: Union[str, None] = 'l309calendarfeedtoken'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEX_UPGRADE_SQL = [
+    """
+    CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_calendar_event_series_cycle_pattern
+    ON calendar_event_series (support_plan_cycle_id, event_type, notification_pattern_id)
+    WHERE support_plan_cycle_id IS NOT NULL
+    """,
+    """
+    CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_calendar_event_series_status_pattern
+    ON calendar_event_series (support_plan_status_id, event_type, notification_pattern_id)
+    WHERE support_plan_status_id IS NOT NULL
+    """,
+    """
+    CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_calendar_event_instances_series_days
+    ON calendar_event_instances (event_series_id, days_before_deadline)
+    """,
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_calendar_event_instances_sync_queue
+    ON calendar_event_instances (event_datetime)
+    WHERE sync_status IN ('pending', 'failed')
+    """,
+]
+
+
+INDEX_DOWNGRADE_SQL = [
+    "DROP INDEX CONCURRENTLY IF EXISTS idx_calendar_event_instances_sync_queue",
+    "DROP INDEX CONCURRENTLY IF EXISTS uq_calendar_event_instances_series_days",
+    "DROP INDEX CONCURRENTLY IF EXISTS uq_calendar_event_series_status_pattern",
+    "DROP INDEX CONCURRENTLY IF EXISTS uq_calendar_event_series_cycle_pattern",
+]
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'calendar_event_series',
+        'google_calendar_id',
+        existing_type=sa.String(length=255),
+        nullable=True,
+    )
+    op.add_column(
+        'calendar_event_instances',
+        sa.Column('sync_attempts', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.add_column(
+        'calendar_event_instances',
+        sa.Column('next_sync_attempt_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        'calendar_event_instances',
+        sa.Column('sync_lease_expires_at', sa.DateTime(timezone=True), nullable=True),
+    )
+
+    # CREATE INDEX CONCURRENTLY cannot run inside Alembic's default transaction.
+    with op.get_context().autocommit_block():
+        for statement in INDEX_UPGRADE_SQL:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for statement in INDEX_DOWNGRADE_SQL:
+            op.execute(statement)
+
+    op.drop_column('calendar_event_instances', 'sync_lease_expires_at')
+    op.drop_column('calendar_event_instances', 'next_sync_attempt_at')
+    op.drop_column('calendar_event_instances', 'sync_attempts')
+    op.execute("DELETE FROM calendar_event_series WHERE google_calendar_id IS NULL")
+    op.alter_column(
+        'calendar_event_series',
+        'google_calendar_id',
+        existing_type=sa.String(length=255),
+        nullable=False,
+    )
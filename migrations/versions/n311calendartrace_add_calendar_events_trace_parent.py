@@ -0,0 +1,30 @@
+"""Add trace_parent to calendar_events
+
+Revision ID: n311calendartrace
+Revises: m310calendarseries
+Create Date: 2026-10-18
+
+Task: リクエストで作った同期待ちイベントに W3C traceparent を保存し、
+同期ジョブのスパンから元のリクエストのトレースへリンクする（app/core/tracing.py）
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'n311calendartrace'
+down_revision: Union[str, None] = 'm310calendarseries'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'calendar_events',
+        sa.Column('trace_parent', sa.String(length=55), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('calendar_events', 'trace_parent')
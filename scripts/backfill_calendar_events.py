@@ -0,0 +1,98 @@
+"""
+カレンダー期限イベントのバックフィルスクリプト
+
+Google Calendarを新たに連携した事業所について、
+- 連携前に作成された local_only のイベントを同期待ち（pending）にする
+- 最新サイクルで未完了のステップに対応する期限イベントが欠けていれば一括作成する
+
+作成・更新されたイベントは次回のカレンダー同期バッチでGoogle Calendarに反映されます。
+
+使い方:
+1. 特定の事業所のみ:
+   docker exec keikakun_app-backend-1 python3 scripts/backfill_calendar_events.py --office-id <office_id>
+
+2. 連携済みの全事業所:
+   docker exec keikakun_app-backend-1 python3 scripts/backfill_calendar_events.py
+
+3. ドライラン（ロールバックして件数のみ表示）:
+   docker exec keikakun_app-backend-1 python3 scripts/backfill_calendar_events.py --dry-run
+"""
+import argparse
+import asyncio
+import sys
+from uuid import UUID
+
+sys.path.insert(0, '/app')
+
+from sqlalchemy import select
+
+from app.db.session import AsyncSessionLocal
+from app.models.calendar_account import OfficeCalendarAccount
+from app.models.enums import CalendarConnectionStatus
+from app.services.calendar_service import calendar_service
+
+
+async def run_backfill(office_id: UUID | None = None, dry_run: bool = False):
+    """
+    事業所ごとに台帳のバックフィルを実行
+
+    Args:
+        office_id: 対象の事業所ID（未指定時は連携済みの全事業所）
+        dry_run: Trueの場合は実行結果をロールバックする
+    """
+    async with AsyncSessionLocal() as db:
+        if office_id is not None:
+            office_ids = [office_id]
+        else:
+            result = await db.execute(
+                select(OfficeCalendarAccount.office_id).where(
+                    OfficeCalendarAccount.connection_status == CalendarConnectionStatus.connected
+                )
+            )
+            office_ids = list(result.scalars().all())
+
+        print(f"\n{'='*70}")
+        print("カレンダー期限イベントのバックフィル")
+        print(f"{'='*70}")
+        print(f"対象事業所: {len(office_ids)}件")
+        print(f"実行モード: {'🔍 ドライラン（テスト）' if dry_run else '🚀 本番実行'}")
+        print(f"{'='*70}\n")
+
+        total_promoted = 0
+        total_created = 0
+        for target_office_id in office_ids:
+            try:
+                result = await calendar_service.backfill_office_events(db=db, office_id=target_office_id)
+                if dry_run:
+                    await db.rollback()
+                else:
+                    await db.commit()
+            except Exception as e:
+                await db.rollback()
+                print(f"❌ {target_office_id}: {type(e).__name__}: {e}")
+                continue
+
+            total_promoted += result["promoted"]
+            total_created += result["created"]
+            print(f"   {target_office_id}: 同期待ちに変更 {result['promoted']}件 / 新規作成 {result['created']}件")
+
+        print("\n📊 実行結果:")
+        print(f"   同期待ちに変更: {total_promoted}件")
+        print(f"   新規作成: {total_created}件")
+        if dry_run:
+            print("\n💡 ドライランモードで実行されました（変更はロールバック済み）")
+        print(f"{'='*70}\n")
+
+
+async def main():
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description="カレンダー期限イベントのバックフィル")
+    parser.add_argument("--office-id", type=UUID, help="対象の事業所ID（未指定時は連携済みの全事業所）")
+    parser.add_argument("--dry-run", action="store_true", help="変更をロールバックして件数のみ表示")
+    args = parser.parse_args()
+
+    await run_backfill(office_id=args.office_id, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,147 @@
+"""
+HTTPミドルウェアのオーバーヘッドのマイクロベンチマーク
+
+main.py のミドルウェア（セキュリティヘッダー・CSRF・SQL計測）を、
+従来の @app.middleware("http")（BaseHTTPMiddleware）で書いた場合と素のASGIで書いた場合とで比べる。
+ネットワーク・DBは使わず、最小のエンドポイントをASGIで直接呼び出して1リクエストあたりの時間を測る。
+
+使い方:
+   docker exec keikakun_app-backend-1 python3 scripts/benchmark_middleware.py
+   docker exec keikakun_app-backend-1 python3 scripts/benchmark_middleware.py --requests 20000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi_csrf_protect import CsrfProtect
+from fastapi_csrf_protect.exceptions import CsrfProtectError
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.routing import Route
+
+from app import main
+from app.db.instrumentation import track_queries
+
+
+async def endpoint(request: Request):
+    return PlainTextResponse("ok")
+
+
+# --- 従来の書き方（BaseHTTPMiddleware）---
+
+async def legacy_security_headers(request: Request, call_next):
+    response = await call_next(request)
+    for header, value in main.SECURITY_HEADERS.items():
+        response.headers.setdefault(header, value)
+    return response
+
+
+async def legacy_csrf(request: Request, call_next):
+    if (
+        request.method in {"POST", "PUT", "PATCH", "DELETE"}
+        and request.url.path not in main.CSRF_EXEMPT_PATHS
+        and request.cookies.get("access_token")
+    ):
+        auth_header = request.headers.get("Authorization")
+        if not (auth_header and auth_header.startswith("Bearer ")):
+            try:
+                await CsrfProtect().validate_csrf(request)
+            except CsrfProtectError:
+                return JSONResponse(status_code=403, content={"detail": "forbidden"})
+    return await call_next(request)
+
+
+async def legacy_query_metrics(request: Request, call_next):
+    with track_queries() as stats:
+        response = await call_next(request)
+    response.headers.append("Server-Timing", f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"')
+    return response
+
+
+def build_apps():
+    routes = [Route("/ok", endpoint, methods=["GET", "POST"])]
+    return {
+        "no middleware": Starlette(routes=routes),
+        "BaseHTTPMiddleware": Starlette(
+            routes=routes,
+            middleware=[
+                Middleware(BaseHTTPMiddleware, dispatch=legacy_query_metrics),
+                Middleware(BaseHTTPMiddleware, dispatch=legacy_csrf),
+                Middleware(BaseHTTPMiddleware, dispatch=legacy_security_headers),
+            ],
+        ),
+        "pure ASGI": Starlette(
+            routes=routes,
+            middleware=[
+                Middleware(main.query_metrics_middleware),
+                Middleware(main.csrf_cookie_auth_middleware),
+                Middleware(main.security_headers_middleware),
+            ],
+        ),
+    }
+
+
+def make_scope(method: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": "/ok",
+        "raw_path": b"/ok",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"api.example.com"),
+            (b"authorization", b"Bearer benchmark"),
+            (b"cookie", b"access_token=benchmark"),
+        ],
+        "server": ("api.example.com", 443),
+        "client": ("127.0.0.1", 50000),
+    }
+
+
+async def run_requests(app, method: str, count: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    # ルーティング・ミドルウェアスタックの初期化分を除く
+    for _ in range(100):
+        await app(make_scope(method), receive, send)
+
+    started_at = time.perf_counter()
+    for _ in range(count):
+        await app(make_scope(method), receive, send)
+    return (time.perf_counter() - started_at) / count
+
+
+async def main_async(count: int) -> None:
+    apps = build_apps()
+    for method in ("GET", "POST"):
+        print(f"{method} x {count}")
+        baseline = None
+        for name, app in apps.items():
+            per_request = await run_requests(app, method, count)
+            baseline = per_request if baseline is None else baseline
+            print(
+                f"  {name:<20} {per_request * 1_000_000:8.1f} us/request "
+                f"(middleware overhead {max(per_request - baseline, 0) * 1_000_000:7.1f} us)"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.requests))
@@ -445,6 +445,77 @@ class TestExportCalendarIcs:
         assert "DTEND:20260810T180000Z" in body
         assert "他事業所イベント" not in body
 
+    async def test_export_ics_returns_304_when_etag_matches(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        owner_user_factory,
+        welfare_recipient_factory,
+    ):
+        owner = await owner_user_factory()
+        office = owner.office_associations[0].office
+        recipient = await welfare_recipient_factory(office_id=office.id)
+        cycle = SupportPlanCycle(office_id=office.id, welfare_recipient_id=recipient.id)
+        db_session.add(cycle)
+        await db_session.flush()
+        db_session.add(CalendarEvent(
+            office_id=office.id,
+            welfare_recipient_id=recipient.id,
+            support_plan_cycle_id=cycle.id,
+            event_type=CalendarEventType.renewal_deadline,
+            event_title="更新期限",
+            event_start_datetime=datetime(2026, 8, 10, 9, 0, tzinfo=timezone.utc),
+            event_end_datetime=datetime(2026, 8, 10, 18, 0, tzinfo=timezone.utc),
+            sync_status=CalendarSyncStatus.local_only,
+        ))
+        await db_session.flush()
+
+        headers = {"Authorization": f"Bearer {create_access_token(str(owner.id), timedelta(minutes=30))}"}
+        params = {"from_date": "2026-08-01", "to_date": "2026-08-31"}
+        response = await async_client.get("/api/v1/calendar/export.ics", params=params, headers=headers)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        response = await async_client.get(
+            "/api/v1/calendar/export.ics",
+            params=params,
+            headers={**headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+
+        # 期間が変わればETagも変わる
+        response = await async_client.get(
+            "/api/v1/calendar/export.ics",
+            params={"from_date": "2026-08-01", "to_date": "2026-09-30"},
+            headers={**headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    async def test_feed_token_serves_calendar_without_auth_header(
+        self,
+        async_client: AsyncClient,
+        owner_user_factory,
+    ):
+        owner = await owner_user_factory()
+        headers = {"Authorization": f"Bearer {create_access_token(str(owner.id), timedelta(minutes=30))}"}
+
+        response = await async_client.post("/api/v1/calendar/feed-token", headers=headers)
+        assert response.status_code == 201
+        data = response.json()
+        assert data["webcal_url"].startswith("webcal://")
+        feed_path = data["feed_url"].split("://", 1)[1].split("/", 1)[1]
+
+        response = await async_client.get(f"/{feed_path}")
+        assert response.status_code == 200
+        assert "BEGIN:VCALENDAR" in response.text
+
+        # 再発行すると古いURLは無効になる
+        await async_client.post("/api/v1/calendar/feed-token", headers=headers)
+        response = await async_client.get(f"/{feed_path}")
+        assert response.status_code == 404
+
     async def test_export_ics_rejects_more_than_one_year_range(
         self,
         async_client: AsyncClient,
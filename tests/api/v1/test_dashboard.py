@@ -132,6 +132,50 @@ class TestDashboardAPI:
         assert recipient_with_monitoring is not None
         assert recipient_with_monitoring["next_plan_start_date"] == 7
 
+    async def test_get_dashboard_query_count_does_not_grow_with_recipients(
+        self, async_client: AsyncClient, db_session: AsyncSession, dashboard_fixtures, assert_max_queries
+    ):
+        """利用者数が増えてもSQLの件数は変わらない（N+1の回帰検知）"""
+        staff = dashboard_fixtures['staff']
+        office = dashboard_fixtures['office']
+        app.dependency_overrides[get_current_user] = lambda: staff
+
+        with assert_max_queries(12) as baseline:
+            response = await async_client.get("/api/v1/dashboard/")
+        assert response.status_code == 200
+        assert response.headers["Server-Timing"].startswith("db;dur=")
+
+        for i in range(5):
+            recipient = WelfareRecipient(
+                first_name=f"次郎{i+1}",
+                last_name="佐藤",
+                first_name_furigana=f"じろう{i+1}",
+                last_name_furigana="さとう",
+                birth_day=date(1990, 1, 1),
+                gender=GenderType.male
+            )
+            db_session.add(recipient)
+            await db_session.flush()
+            db_session.add_all([
+                OfficeWelfareRecipient(welfare_recipient_id=recipient.id, office_id=office.id),
+                SupportPlanCycle(
+                    welfare_recipient_id=recipient.id,
+                    office_id=office.id,
+                    plan_cycle_start_date=date.today(),
+                    next_renewal_deadline=date.today() + timedelta(days=180),
+                    is_latest_cycle=True,
+                    cycle_number=1
+                ),
+            ])
+        await db_session.flush()
+
+        with assert_max_queries(baseline.count):
+            response = await async_client.get("/api/v1/dashboard/")
+        del app.dependency_overrides[get_current_user]
+
+        assert response.status_code == 200
+        assert len(response.json()["recipients"]) == 8
+
     async def test_get_dashboard_empty_recipients(self, async_client: AsyncClient, db_session: AsyncSession, service_admin_user_factory, office_factory):
         staff = await service_admin_user_factory(first_name="管理者", last_name="空の事業所", email="empty@example.com")
         office = await office_factory(creator=staff, name="空のテスト事業所")
@@ -3,6 +3,7 @@ import asyncio
 import os
 import sys
 from typing import AsyncGenerator, Generator, Optional
+from contextlib import asynccontextmanager, contextmanager
 import uuid
 from datetime import timedelta
 import logging
@@ -34,7 +35,14 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 from app.core.security import get_password_hash, create_access_token
 from app.core.config import settings
 from app.main import app
-from app.api.deps import get_db, get_current_user
+from app.db.instrumentation import install_query_instrumentation, track_queries
+from app.api.deps import (
+    get_db,
+    get_current_user,
+    get_read_db,
+    get_read_session_factory,
+    get_session_factory,
+)
 from app.models.staff import Staff
 from app.models.office import Office, OfficeStaff
 from app.models.enums import StaffRole, OfficeType, GenderType
@@ -203,6 +211,8 @@ async def engine() -> AsyncGenerator[AsyncEngine, None]:
         echo=False,             # SQLログを無効化（テスト時のノイズ削減）
         pool_use_lifo=True,     # LIFOで新しい接続を優先的に使用
     )
+    # assert_max_queries でSQL件数を数えられるようにする
+    install_query_instrumentation(async_engine)
     yield async_engine
     await async_engine.dispose()
 
@@ -260,13 +270,23 @@ async def async_client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient,
     async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
         yield db_session
 
+    @asynccontextmanager
+    async def shared_session() -> AsyncGenerator[AsyncSession, None]:
+        yield db_session
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: shared_session
+    app.dependency_overrides[get_read_session_factory] = lambda: shared_session
     async with AsyncClient(transport=ASGITransport(app=app), base_url="https://test", follow_redirects=True) as client:
         try:
             yield client
         finally:
             # tolerate either override key (avoid KeyError when function object differs)
             app.dependency_overrides.pop(get_db, None)
+            app.dependency_overrides.pop(get_read_db, None)
+            app.dependency_overrides.pop(get_session_factory, None)
+            app.dependency_overrides.pop(get_read_session_factory, None)
 
 
 @pytest_asyncio.fixture
@@ -924,6 +944,34 @@ def reset_limiter_state():
     limiter.reset()
 
 
+from app.crud.pagination import count_cache
+
+@pytest.fixture(autouse=True)
+def reset_count_cache():
+    """各テストはロールバックされるため、前のテストの件数キャッシュを持ち越さない"""
+    count_cache.clear()
+
+
+@pytest.fixture
+def assert_max_queries():
+    """
+    ブロック内で実行されたSQLが max_queries 件以下であることを検証する
+
+    使い方:
+        with assert_max_queries(8):
+            response = await async_client.get("/api/v1/dashboard/")
+    """
+    @contextmanager
+    def _assert_max_queries(max_queries: int):
+        with track_queries() as stats:
+            yield stats
+        assert stats.count <= max_queries, (
+            f"SQLの実行件数が上限を超えました（上限 {max_queries}）: {stats.summary()}"
+        )
+
+    return _assert_max_queries
+
+
 # --- カレンダー関連フィクスチャ ---
 
 @pytest_asyncio.fixture
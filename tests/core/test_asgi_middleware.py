@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+import app.main as main
+from app.core.auth_cookie import PRIMARY_STICKY_COOKIE_KEY
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _ok(request: Request):
+    return PlainTextResponse("ok")
+
+
+async def _framed(request: Request):
+    return PlainTextResponse("ok", headers={"X-Frame-Options": "SAMEORIGIN"})
+
+
+async def _write(request: Request):
+    request.state.db_wrote = True
+    return PlainTextResponse("written")
+
+
+def _app(*middleware, routes=None):
+    return Starlette(
+        routes=routes or [
+            Route("/ok", _ok, methods=["GET", "POST"]),
+            Route("/framed", _framed),
+            Route("/write", _write, methods=["POST"]),
+            Route("/api/v1/auth/logout", _ok, methods=["POST"]),
+        ],
+        middleware=[Middleware(factory) for factory in middleware],
+    )
+
+
+async def test_security_headers_are_added_without_overriding_endpoint_headers():
+    app = _app(main.security_headers_middleware)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        plain = await client.get("/ok")
+        framed = await client.get("/framed")
+
+    for header, value in main.SECURITY_HEADERS.items():
+        assert plain.headers[header] == value
+    assert framed.headers.get_list("X-Frame-Options") == ["SAMEORIGIN"]
+    assert framed.headers["X-Content-Type-Options"] == "nosniff"
+
+
+async def test_csrf_middleware_rejects_cookie_auth_state_changes_without_token():
+    app = _app(main.csrf_cookie_auth_middleware)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        client.cookies.set("access_token", "cookie-token")
+        rejected = await client.post("/ok")
+        exempt = await client.post("/api/v1/auth/logout")
+        bearer = await client.post("/ok", headers={"Authorization": "Bearer header-token"})
+        safe = await client.get("/ok")
+
+    assert rejected.status_code == 403
+    assert exempt.status_code == 200
+    assert bearer.status_code == 200
+    assert safe.status_code == 200
+
+
+async def test_primary_sticky_cookie_is_set_after_write(monkeypatch):
+    inner = _app()
+    assert main.primary_sticky_middleware(inner) is inner  # レプリカなしでは挟まない
+
+    monkeypatch.setattr(main, "HAS_READ_REPLICA", True)
+    app = _app(main.primary_sticky_middleware)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        written = await client.post("/write")
+        read = await client.get("/ok")
+
+    assert PRIMARY_STICKY_COOKIE_KEY in written.headers["set-cookie"]
+    assert "set-cookie" not in read.headers
+
+
+async def test_streaming_responses_are_not_buffered():
+    first_chunk_sent = asyncio.Event()
+
+    async def chunks():
+        yield b"BEGIN:VCALENDAR\r\n"
+        # 最初のチャンクがクライアントに届くまで次を生成しない（バッファされると終わらない）
+        await first_chunk_sent.wait()
+        yield b"END:VCALENDAR\r\n"
+
+    async def stream(request: Request):
+        return StreamingResponse(chunks(), media_type="text/calendar")
+
+    app = _app(
+        main.security_headers_middleware,
+        main.csrf_cookie_auth_middleware,
+        main.query_metrics_middleware,
+        routes=[Route("/export.ics", stream)],
+    )
+    body = []
+
+    async def receive():
+        await asyncio.sleep(10)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body" and message.get("body"):
+            body.append(message["body"])
+            first_chunk_sent.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/export.ics",
+        "raw_path": b"/export.ics",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"test")],
+        "server": ("test", 80),
+        "client": ("127.0.0.1", 12345),
+    }
+    await asyncio.wait_for(app(scope, receive, send), timeout=2)
+
+    assert body == [b"BEGIN:VCALENDAR\r\n", b"END:VCALENDAR\r\n"]
@@ -0,0 +1,56 @@
+from app.db.instrumentation import QueryStats, normalize_sql, track_queries
+
+
+def test_normalize_sql_replaces_literals_and_collapses_value_lists():
+    statement = """
+        SELECT staffs.id FROM staffs
+        WHERE staffs.email = 'a@example.com' AND staffs.id IN (%(id_1_1)s, %(id_1_2)s, %(id_1_3)s)
+        LIMIT 10
+    """
+
+    assert normalize_sql(statement) == (
+        "SELECT staffs.id FROM staffs WHERE staffs.email = ? AND staffs.id IN (?) LIMIT ?"
+    )
+
+
+def test_nested_tracking_adds_to_outer_stats():
+    with track_queries() as outer:
+        outer.record("SELECT ?", 0.002)
+        with track_queries() as inner:
+            inner.record("SELECT ?", 0.001)
+
+    assert inner.count == 1
+    assert outer.count == 2
+    assert outer.statements["SELECT ?"] == 2
+
+
+def test_repeated_statements_lists_candidates_for_n_plus_one():
+    stats = QueryStats()
+    for _ in range(3):
+        stats.record("SELECT * FROM support_plan_cycles WHERE welfare_recipient_id = ?", 0.001)
+    stats.record("SELECT * FROM offices", 0.001)
+
+    assert stats.repeated_statements(3) == [
+        ("SELECT * FROM support_plan_cycles WHERE welfare_recipient_id = ?", 3)
+    ]
+    assert "3x SELECT * FROM support_plan_cycles" in stats.summary()
+
+
+def test_installed_engine_records_statements_in_current_context():
+    from sqlalchemy import create_engine, text
+
+    from app.db.instrumentation import install_query_instrumentation
+
+    engine = create_engine("sqlite://")
+    install_query_instrumentation(engine)
+    install_query_instrumentation(engine)  # 二重登録しない
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+
+    assert stats.count == 2
+    assert stats.statements["SELECT ?"] == 2
+    assert stats.duration > 0
@@ -0,0 +1,71 @@
+import pytest
+
+from app.core.metrics import DB_POOL_CHECKOUT_WAIT_SECONDS, Histogram
+from app.db.pool import (
+    PoolConfig,
+    PoolSizing,
+    batch_pool_sizing,
+    request_pool_sizing,
+    timed_pool_class,
+)
+from app.db.session import async_engine, batch_async_engine
+
+
+def test_pool_config_from_env():
+    config = PoolConfig.from_env({
+        "DB_CONNECTION_BUDGET": "90",
+        "WEB_CONCURRENCY": "3",
+        "DB_APP_INSTANCES": "2",
+        "DB_PREPARE_THRESHOLD": "off",
+    })
+
+    assert config.connection_budget == 90
+    assert config.workers == 3
+    assert config.instances == 2
+    assert config.prepare_threshold is None
+    assert PoolConfig.from_env({}).prepare_threshold == 5
+
+
+def test_request_pool_sizing_fits_connection_budget():
+    config = PoolConfig(connection_budget=90, workers=3, instances=2, batch_pool_size=3)
+
+    sizing = request_pool_sizing(config)
+    per_process = sizing.pool_size + sizing.max_overflow + batch_pool_sizing(config).pool_size
+
+    # 全インスタンス・全ワーカーの最大接続数が予算内に収まる
+    assert per_process * config.workers * config.instances <= config.connection_budget
+    assert sizing.pool_size >= 1
+
+
+def test_request_pool_sizing_respects_explicit_values():
+    config = PoolConfig(pool_size=7, max_overflow=0)
+
+    assert request_pool_sizing(config) == PoolSizing(pool_size=7, max_overflow=0)
+
+
+def test_engines_use_timed_pools_without_per_checkout_ping():
+    assert async_engine.sync_engine.pool.__class__.__name__.endswith("[request]")
+    assert batch_async_engine.sync_engine.pool.__class__.__name__.endswith("[batch]")
+    assert batch_async_engine.sync_engine.pool._max_overflow == 0
+    assert async_engine.sync_engine.pool._pre_ping is False
+
+
+def test_histogram_collects_cumulative_buckets():
+    histogram = Histogram("test_seconds", "test", buckets=(0.1, 1.0), label_names=("engine",))
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value, "request")
+
+    buckets, total, count = histogram.collect()[("request",)]
+    assert buckets == (1, 2, 3)
+    assert total == pytest.approx(5.55)
+    assert count == 3
+
+    with pytest.raises(ValueError):
+        histogram.observe(1.0)
+
+
+def test_timed_pool_class_keeps_engine_label_across_recreate():
+    pool = batch_async_engine.sync_engine.pool
+    assert pool.recreate().__class__ is pool.__class__
+    assert timed_pool_class("batch").__name__ == "TimedAsyncAdaptedQueuePool[batch]"
+    assert DB_POOL_CHECKOUT_WAIT_SECONDS.label_names == ("engine",)
@@ -0,0 +1,64 @@
+import os
+import time
+
+import pytest
+from starlette.requests import Request
+
+from app.api.deps import get_read_session_factory
+from app.core.auth_cookie import PRIMARY_STICKY_COOKIE_KEY, build_primary_sticky_cookie_options
+from app.db.routing import prefers_primary
+from app.db.session import AsyncSessionLocal, ReadSessionLocal, async_engine, replica_async_engine
+
+
+def _request(cookie: str | None = None) -> Request:
+    headers = []
+    if cookie is not None:
+        headers.append((b"cookie", cookie.encode("latin-1")))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def test_prefers_primary_only_while_sticky_cookie_is_valid():
+    assert prefers_primary(_request()) is False
+    assert prefers_primary(_request(f"{PRIMARY_STICKY_COOKIE_KEY}={time.time() + 5}")) is True
+    assert prefers_primary(_request(f"{PRIMARY_STICKY_COOKIE_KEY}={time.time() - 1}")) is False
+    assert prefers_primary(_request(f"{PRIMARY_STICKY_COOKIE_KEY}=broken")) is False
+
+
+def test_read_session_factory_routes_to_primary_after_write():
+    assert get_read_session_factory(_request()) is ReadSessionLocal
+    sticky = _request(f"{PRIMARY_STICKY_COOKIE_KEY}={time.time() + 5}")
+    assert get_read_session_factory(sticky) is AsyncSessionLocal
+
+
+def test_build_primary_sticky_cookie_options(monkeypatch):
+    monkeypatch.delenv("ENVIRONMENT", raising=False)
+    monkeypatch.delenv("COOKIE_DOMAIN", raising=False)
+    monkeypatch.delenv("COOKIE_SAMESITE", raising=False)
+
+    options = build_primary_sticky_cookie_options(value="1700000005", max_age=5)
+
+    assert options == {
+        "key": PRIMARY_STICKY_COOKIE_KEY,
+        "value": "1700000005",
+        "httponly": True,
+        "secure": False,
+        "max_age": 5,
+        "samesite": "lax",
+    }
+
+
+@pytest.mark.skipif(
+    not os.getenv("TEST_DATABASE_REPLICA_URL"),
+    reason="TEST_DATABASE_REPLICA_URL が未設定（レプリカなしの構成）",
+)
+def test_replica_engine_is_separate_when_configured():
+    assert replica_async_engine is not async_engine
+    assert ReadSessionLocal.kw["bind"] is replica_async_engine
+
+
+@pytest.mark.skipif(
+    bool(os.getenv("TEST_DATABASE_REPLICA_URL")),
+    reason="レプリカ構成ではプライマリと別エンジンになる",
+)
+def test_read_sessions_fall_back_to_primary_without_replica():
+    assert replica_async_engine is async_engine
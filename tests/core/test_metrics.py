@@ -0,0 +1,108 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+from pydantic import SecretStr
+
+from app.core.config import settings
+from app.core.metrics import (
+    EXTERNAL_CALL_DURATION_SECONDS,
+    EXTERNAL_CALL_ERRORS_TOTAL,
+    HTTP_REQUEST_DURATION_SECONDS,
+    OVERFLOW_LABEL,
+    SCHEDULER_JOB_RUNS_TOTAL,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    track_external_call,
+    track_job,
+)
+from app.main import app
+
+
+def test_render_prometheus_text_format():
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("jobs_total", "Jobs", label_names=("job",)))
+    histogram = registry.register(
+        Histogram("latency_seconds", "Latency", buckets=(0.1, 1.0), label_names=("route",))
+    )
+    registry.register(Gauge("pool_in_use", "In use", label_names=("engine",), callback=lambda: {("request",): 3}))
+
+    counter.inc('say "hi"')
+    histogram.observe(0.5, "/items/{item_id}")
+
+    text = registry.render()
+
+    assert "# TYPE jobs_total counter" in text
+    assert 'jobs_total{job="say \\"hi\\""} 1' in text
+    assert 'latency_seconds_bucket{route="/items/{item_id}",le="0.1"} 0' in text
+    assert 'latency_seconds_bucket{route="/items/{item_id}",le="1"} 1' in text
+    assert 'latency_seconds_bucket{route="/items/{item_id}",le="+Inf"} 1' in text
+    assert 'latency_seconds_count{route="/items/{item_id}"} 1' in text
+    assert 'pool_in_use{engine="request"} 3' in text
+    with pytest.raises(ValueError):
+        registry.register(Counter("jobs_total", "Jobs"))
+
+
+def test_label_sets_beyond_max_series_are_folded_into_overflow():
+    counter = Counter("requests_total", "Requests", label_names=("route",), max_series=2)
+
+    for route in ("/a", "/b", "/c", "/d"):
+        counter.inc(route)
+
+    assert counter.collect() == {("/a",): 1.0, ("/b",): 1.0, (OVERFLOW_LABEL,): 2.0}
+
+
+def test_track_job_records_outcome():
+    SCHEDULER_JOB_RUNS_TOTAL.clear()
+
+    with track_job("test_job"):
+        pass
+    with pytest.raises(RuntimeError):
+        with track_job("test_job"):
+            raise RuntimeError("boom")
+
+    runs = SCHEDULER_JOB_RUNS_TOTAL.collect()
+    assert runs[("test_job", "success")] == 1
+    assert runs[("test_job", "failure")] == 1
+
+
+def test_track_external_call_records_latency_and_errors():
+    EXTERNAL_CALL_DURATION_SECONDS.clear()
+    EXTERNAL_CALL_ERRORS_TOTAL.clear()
+
+    with pytest.raises(TimeoutError):
+        with track_external_call("smtp", "send_message"):
+            raise TimeoutError()
+
+    assert EXTERNAL_CALL_DURATION_SECONDS.collect()[("smtp", "send_message")][2] == 1
+    assert EXTERNAL_CALL_ERRORS_TOTAL.collect() == {("smtp", "send_message", "TimeoutError"): 1.0}
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_uses_route_templates(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", None)
+    HTTP_REQUEST_DURATION_SECONDS.clear()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        await client.get("/")
+        await client.get("/no-such-path/12345")
+        response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    series = HTTP_REQUEST_DURATION_SECONDS.collect()
+    assert ("GET", "/", "2xx") in series
+    assert ("GET", "unmatched", "4xx") in series
+    assert "http_request_duration_seconds_bucket" in response.text
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_requires_token_when_configured(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", SecretStr("scrape-token"))
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        unauthorized = await client.get("/metrics")
+        authorized = await client.get("/metrics", headers={"Authorization": "Bearer scrape-token"})
+
+    assert unauthorized.status_code == 401
+    assert authorized.status_code == 200
@@ -0,0 +1,62 @@
+import time
+
+import pytest
+from passlib.context import CryptContext
+
+from app.core import security
+from app.core.security import (
+    verify_and_update_password,
+    verify_password_any,
+    verify_password_async,
+)
+
+pytestmark = pytest.mark.asyncio
+
+# テストでは低コストのハッシュを使う
+fast_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=4)
+
+
+async def test_verify_password_async_runs_in_worker_thread():
+    hashed = fast_context.hash("Secret123!")
+
+    assert await verify_password_async("Secret123!", hashed) is True
+    assert await verify_password_async("Wrong123!", hashed) is False
+
+
+async def test_verify_password_any_matches_any_history_entry():
+    hashes = [fast_context.hash(f"Old{i}Pass!") for i in range(3)]
+
+    assert await verify_password_any("Old2Pass!", hashes) is True
+    assert await verify_password_any("NewPass1!", hashes) is False
+    assert await verify_password_any("NewPass1!", []) is False
+
+
+async def test_verify_password_any_returns_on_first_match(monkeypatch):
+    calls = []
+
+    def fake_verify(secret, hashed):
+        calls.append(hashed)
+        if hashed == "slow":
+            time.sleep(0.5)
+        return hashed == "match"
+
+    monkeypatch.setattr(security.pwd_context, "verify", fake_verify)
+
+    started = time.monotonic()
+    assert await verify_password_any("secret", ["slow", "match"]) is True
+    assert time.monotonic() - started < 0.4
+    assert "match" in calls
+
+
+async def test_verify_and_update_password_rehashes_outdated_work_factor():
+    outdated = fast_context.hash("Secret123!")
+
+    is_valid, rehashed = await verify_and_update_password("Secret123!", outdated)
+
+    assert is_valid is True
+    assert rehashed is not None
+    assert security.pwd_context.verify("Secret123!", rehashed)
+    assert f"$2b${security.settings.PASSWORD_BCRYPT_ROUNDS:02d}$" in rehashed
+
+    is_valid, rehashed = await verify_and_update_password("Wrong123!", outdated)
+    assert (is_valid, rehashed) == (False, None)
@@ -0,0 +1,155 @@
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.core.metrics import track_external_call, track_job
+from app.core.tracing import (
+    BatchSpanProcessor,
+    FileSpanExporter,
+    SpanKind,
+    Tracer,
+    current_traceparent,
+    parse_traceparent,
+    tracer,
+)
+from app.main import app
+
+
+class InMemoryProcessor:
+    def __init__(self):
+        self.spans = []
+
+    def on_end(self, spans):
+        self.spans.extend(spans)
+
+    def shutdown(self):
+        pass
+
+
+@pytest.fixture
+def exported(monkeypatch):
+    """グローバルの tracer を有効にし、終了したスパンをメモリに集める"""
+    processor = InMemoryProcessor()
+    monkeypatch.setattr(tracer, "processor", processor)
+    monkeypatch.setattr(tracer, "sample_ratio", 1.0)
+    monkeypatch.setattr(tracer, "tail_sampling", False)
+    return processor.spans
+
+
+def test_parse_traceparent():
+    context = parse_traceparent("00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01")
+
+    assert context.trace_id == 0x4BF92F3577B34DA6A3CE929D0E0E4736
+    assert context.sampled is True
+    assert context.is_remote is True
+    assert context.traceparent == "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+    assert parse_traceparent("00-00000000000000000000000000000000-00f067aa0ba902b7-01") is None
+    assert parse_traceparent("broken") is None
+
+
+def test_child_spans_share_trace_and_record_errors():
+    processor = InMemoryProcessor()
+    local_tracer = Tracer(processor=processor)
+
+    with pytest.raises(ValueError):
+        with local_tracer.start_span("parent") as parent:
+            with local_tracer.start_span("child", kind=SpanKind.CLIENT):
+                raise ValueError("secret detail")
+
+    child, root = processor.spans
+    assert child.context.trace_id == parent.context.trace_id
+    assert child.parent == parent.context
+    assert child.error == "ValueError"
+    assert child.attributes["exception.type"] == "ValueError"
+    assert root.is_local_root
+
+
+def test_head_sampling_ratio_zero_records_nothing():
+    processor = InMemoryProcessor()
+    local_tracer = Tracer(processor=processor, sample_ratio=0.0)
+
+    with local_tracer.start_span("parent") as parent:
+        with local_tracer.start_span("child") as child:
+            pass
+
+    assert parent.recording is False
+    assert child.context.trace_id == parent.context.trace_id
+    assert processor.spans == []
+
+
+def test_tail_sampling_keeps_only_slow_or_errored_traces():
+    processor = InMemoryProcessor()
+    local_tracer = Tracer(processor=processor, sample_ratio=0.0, tail_sampling=True, tail_latency_ms=10_000)
+
+    with local_tracer.start_span("fast"):
+        with local_tracer.start_span("fast child"):
+            pass
+    assert processor.spans == []
+
+    with pytest.raises(RuntimeError):
+        with local_tracer.start_span("failing"):
+            with local_tracer.start_span("failing child"):
+                raise RuntimeError()
+    assert [span.name for span in processor.spans] == ["failing child", "failing"]
+
+    local_tracer.tail_latency_ms = 0
+    with local_tracer.start_span("slow"):
+        pass
+    assert processor.spans[-1].name == "slow"
+
+
+def test_jobs_start_new_traces_and_external_calls_are_client_spans(exported):
+    with tracer.start_span("request"):
+        with track_job("test_job"):
+            with track_external_call("smtp", "send_message"):
+                pass
+
+    call, job, request = exported
+    assert job.name == "job test_job"
+    assert job.parent is None
+    assert job.context.trace_id != request.context.trace_id
+    assert call.kind == SpanKind.CLIENT
+    assert call.parent == job.context
+
+
+def test_current_traceparent_only_while_recording(exported):
+    assert current_traceparent() is None
+    with tracer.start_span("request") as span:
+        assert current_traceparent() == span.context.traceparent
+
+
+def test_file_exporter_writes_otlp_json_lines(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    processor = BatchSpanProcessor(FileSpanExporter(str(path), service_name="test"), schedule_delay_seconds=0.01)
+    local_tracer = Tracer(processor=processor)
+
+    with local_tracer.start_span("parent", attributes={"count": 3}):
+        with local_tracer.start_span("child"):
+            pass
+    local_tracer.shutdown()
+
+    spans = [
+        span
+        for line in path.read_text().splitlines()
+        for span in json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    ]
+    assert {span["name"] for span in spans} == {"parent", "child"}
+    child = next(span for span in spans if span["name"] == "child")
+    parent = next(span for span in spans if span["name"] == "parent")
+    assert child["parentSpanId"] == parent["spanId"]
+    assert {"key": "count", "value": {"intValue": "3"}} in parent["attributes"]
+
+
+@pytest.mark.asyncio
+async def test_http_span_continues_incoming_trace(exported):
+    incoming = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/", headers={"traceparent": incoming})
+
+    span = next(span for span in exported if span.kind == SpanKind.SERVER)
+    assert span.name == "GET /"
+    assert span.context.trace_id == 0x4BF92F3577B34DA6A3CE929D0E0E4736
+    assert span.attributes["http.response.status_code"] == 200
+    assert f'traceparent;desc="{span.context.traceparent}"' in response.headers["server-timing"]
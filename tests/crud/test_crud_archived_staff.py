@@ -435,3 +435,87 @@ class TestCRUDArchivedStaff:
         assert archive.metadata_["original_email_domain"] == "company.co.jp"
         assert archive.metadata_["mfa_was_enabled"] is True
         assert archive.metadata_["is_email_verified"] is True
+
+    async def test_bulk_create_from_staffs(self, db_session):
+        """
+        複数スタッフのアーカイブを一括作成するテスト
+
+        要件:
+        - 1件ずつ作成した場合と同じ匿名化・事務所スナップショットが保存される
+        - original_staff_id からアーカイブIDを引ける
+        """
+        from app.crud.crud_staff import staff as crud_staff
+
+        owner = Staff(
+            id=uuid4(),
+            email=f"bulk-owner-{uuid4().hex[:8]}@example.com",
+            hashed_password="hashed",
+            full_name="一括 太郎",
+            role=StaffRole.owner,
+            created_at=datetime(2022, 3, 1, tzinfo=timezone.utc),
+            is_test_data=True
+        )
+        employee = Staff(
+            id=uuid4(),
+            email=f"bulk-employee-{uuid4().hex[:8]}@example.com",
+            hashed_password="hashed",
+            full_name="一括 花子",
+            role=StaffRole.employee,
+            created_at=datetime(2023, 4, 1, tzinfo=timezone.utc),
+            is_test_data=True
+        )
+        db_session.add_all([owner, employee])
+        await db_session.flush()
+
+        test_office = Office(
+            id=uuid4(),
+            name="一括アーカイブ事務所",
+            type="type_A_office",
+            created_by=owner.id,
+            last_modified_by=owner.id,
+            is_test_data=True
+        )
+        db_session.add(test_office)
+        db_session.add_all([
+            OfficeStaff(staff_id=owner.id, office_id=test_office.id, is_primary=True, is_test_data=True),
+            OfficeStaff(staff_id=employee.id, office_id=test_office.id, is_primary=True, is_test_data=True),
+        ])
+        await db_session.flush()
+
+        staffs = await crud_staff.get_by_office_id(
+            db_session,
+            office_id=test_office.id,
+            exclude_deleted=False
+        )
+        deleter_id = owner.id
+
+        # Execute
+        archives = await archived_staff.bulk_create_from_staffs(
+            db_session,
+            staffs=staffs,
+            reason="office_withdrawal",
+            deleted_by=deleter_id
+        )
+
+        # Assert
+        assert set(archives.keys()) == {owner.id, employee.id}
+        employee_archive = await archived_staff.get(
+            db_session,
+            archive_id=archives[employee.id][0]
+        )
+        assert employee_archive.office_id == test_office.id
+        assert employee_archive.office_name == "一括アーカイブ事務所"
+        assert employee_archive.anonymized_email.endswith("@deleted.local")
+        assert employee_archive.metadata_["deleted_by_staff_id"] == str(deleter_id)
+        assert employee_archive.legal_retention_until == archives[employee.id][1]
+
+        # 一括論理削除
+        updated_count = await crud_staff.bulk_soft_delete(
+            db_session,
+            staff_ids=[employee.id],
+            deleted_by=deleter_id
+        )
+        assert updated_count == 1
+        await db_session.refresh(employee)
+        assert employee.is_deleted is True
+        assert employee.deleted_by == deleter_id
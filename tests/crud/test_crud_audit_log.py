@@ -285,6 +285,19 @@ class TestAuditLogQuery:
 
         assert len(logs_page2) >= 2
 
+        # count_mode=None では件数を取得しない
+        logs_uncounted, uncounted_total = await crud_audit_log.get_logs(
+            db=db_session,
+            office_id=office.id,
+            skip=3,
+            limit=3,
+            include_test_data=True,
+            count_mode=None
+        )
+
+        assert uncounted_total is None
+        assert [log.id for log in logs_uncounted] == [log.id for log in logs_page2]
+
 
 class TestAuditLogCursorPagination:
     """カーソルベースページネーションのテスト"""
@@ -380,6 +393,57 @@ class TestAuditLogCursorPagination:
         assert len(logs1) >= 1
 
 
+    async def test_get_logs_keyset_walks_all_rows_with_same_timestamp(
+        self,
+        db_session: AsyncSession,
+        employee_user_factory,
+    ) -> None:
+        """
+        (timestamp, id) キーセットでは同一タイムスタンプのログも欠落・重複しない
+        """
+        employee = await employee_user_factory()
+        office = employee.office_associations[0].office
+
+        created_ids = set()
+        for i in range(5):
+            log = await crud_audit_log.create_log(
+                db=db_session,
+                actor_id=employee.id,
+                action=f"test.keyset{i}",
+                target_type="staff",
+                target_id=employee.id,
+                office_id=office.id
+            )
+            created_ids.add(log.id)
+
+        seen_ids = []
+        cursor = None
+        while True:
+            logs, cursor = await crud_audit_log.get_logs_keyset(
+                db=db_session,
+                office_id=office.id,
+                target_type="staff",
+                cursor=cursor,
+                limit=2,
+                include_test_data=True
+            )
+            seen_ids.extend(log.id for log in logs)
+            if cursor is None:
+                break
+
+        assert len(seen_ids) == len(set(seen_ids))
+        assert set(seen_ids) == created_ids
+
+        total, is_estimate = await crud_audit_log.count_logs(
+            db=db_session,
+            office_id=office.id,
+            target_type="staff",
+            include_test_data=True,
+            count_mode="auto"
+        )
+        assert (total, is_estimate) == (5, False)
+
+
 class TestAuditLogByTarget:
     """特定リソースの監査ログ取得テスト"""
 
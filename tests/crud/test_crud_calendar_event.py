@@ -592,3 +592,83 @@ async def test_get_pending_sync_events(
     logger.debug("Before all() assertion")
     assert all(event.sync_status == CalendarSyncStatus.pending for event in pending_events)
     logger.debug("=== test_get_pending_sync_events END ===")
+
+
+async def test_claim_pending_sync_events_leases_and_backs_off(
+    db_session: AsyncSession,
+    employee_user_factory
+) -> None:
+    """
+    同期キューのクレーム: リース中・再試行待ちの行は返さず、リース切れの行は再取得できる
+    """
+    from sqlalchemy import update
+    from app.models.calendar_events import CalendarEvent
+    from app.models.support_plan_cycle import SupportPlanCycle
+
+    staff = await employee_user_factory()
+    staff = await load_staff_with_office(db_session, staff)
+    office = staff.office_associations[0].office
+
+    recipient = await crud.welfare_recipient.create(db=db_session, obj_in={
+        "first_name": "八郎",
+        "last_name": "小林",
+        "first_name_furigana": "はちろう",
+        "last_name_furigana": "こばやし",
+        "birth_day": date(1990, 1, 1),
+        "gender": GenderType.male
+    })
+
+    events = {}
+    for sync_status, next_attempt in [
+        (CalendarSyncStatus.pending, None),
+        (CalendarSyncStatus.failed, timedelta(hours=1)),
+        (CalendarSyncStatus.synced, None),
+    ]:
+        cycle = SupportPlanCycle(
+            welfare_recipient_id=recipient.id,
+            office_id=office.id,
+            plan_cycle_start_date=date.today(),
+            next_renewal_deadline=date.today() + timedelta(days=150)
+        )
+        db_session.add(cycle)
+        await db_session.flush()
+        event = await crud.calendar_event.create(db=db_session, obj_in={
+            "office_id": office.id,
+            "welfare_recipient_id": recipient.id,
+            "support_plan_cycle_id": cycle.id,
+            "event_type": CalendarEventType.renewal_deadline,
+            "google_calendar_id": "test-calendar@example.com",
+            "event_title": f"{sync_status.value}イベント",
+            "event_start_datetime": datetime.now(),
+            "event_end_datetime": datetime.now() + timedelta(hours=1),
+            "sync_status": sync_status
+        })
+        if next_attempt is not None:
+            event.sync_attempts = 1
+            event.next_sync_attempt_at = datetime.now().astimezone() + next_attempt
+            await db_session.flush()
+        events[sync_status] = event
+
+    claim_kwargs = dict(limit=10, lease_seconds=300, max_attempts=3, office_id=office.id)
+
+    claimed = await crud.calendar_event.claim_pending_sync_events(db_session, **claim_kwargs)
+    assert [event.id for event in claimed] == [events[CalendarSyncStatus.pending].id]
+    assert claimed[0].sync_lease_expires_at is not None
+
+    # リース中の行は他のワーカーから取得されない
+    assert await crud.calendar_event.claim_pending_sync_events(db_session, **claim_kwargs) == []
+
+    # ワーカーが異常終了してリースが切れた行・再試行時刻を過ぎた行は再取得できる
+    await db_session.execute(
+        update(CalendarEvent)
+        .where(CalendarEvent.office_id == office.id)
+        .values(
+            sync_lease_expires_at=CalendarEvent.sync_lease_expires_at - timedelta(seconds=600),
+            next_sync_attempt_at=CalendarEvent.next_sync_attempt_at - timedelta(hours=2),
+        )
+    )
+    reclaimed = await crud.calendar_event.claim_pending_sync_events(db_session, **claim_kwargs)
+    assert {event.id for event in reclaimed} == {
+        events[CalendarSyncStatus.pending].id,
+        events[CalendarSyncStatus.failed].id,
+    }
@@ -0,0 +1,133 @@
+"""
+CalendarEventSeries / CalendarEventInstance CRUD（通知パターンの一括展開）のテスト
+"""
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.models.calendar_events import CalendarEventInstance, CalendarEventSeries, NotificationPattern
+from app.models.enums import CalendarEventType, CalendarSyncStatus, EventInstanceStatus, GenderType
+from app.models.support_plan_cycle import SupportPlanCycle
+from app.services.calendar.calendar_series_service import CalendarSeriesService
+from tests.utils import load_staff_with_office
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_materialize_expands_patterns_and_follows_deadline_changes(
+    db_session: AsyncSession,
+    employee_user_factory
+) -> None:
+    """
+    期限 × 採用する通知パターン（種別ごとのシステムデフォルト1つ）がシリーズ・インスタンスに展開され、
+    期限の変更は差分だけ反映、期限がなくなればシリーズごと取り消される
+    """
+    staff = await employee_user_factory()
+    staff = await load_staff_with_office(db_session, staff)
+    office = staff.office_associations[0].office
+
+    recipient = await crud.welfare_recipient.create(db=db_session, obj_in={
+        "first_name": "九郎",
+        "last_name": "中村",
+        "first_name_furigana": "くろう",
+        "last_name_furigana": "なかむら",
+        "birth_day": date(1990, 1, 1),
+        "gender": GenderType.male
+    })
+    pattern = NotificationPattern(
+        pattern_name=f"test_renewal_{uuid.uuid4().hex[:8]}",
+        event_type=CalendarEventType.renewal_deadline,
+        reminder_days_before=[30, 10, 1],
+        title_template="{recipient_name} 更新期限まで{days_before}日",
+        description_template="期限日: {deadline_date}",
+        is_system_default=True,
+    )
+    other_pattern = NotificationPattern(
+        pattern_name=f"test_renewal_other_{uuid.uuid4().hex[:8]}",
+        event_type=CalendarEventType.renewal_deadline,
+        reminder_days_before=[7, 1],
+        title_template="{recipient_name} 更新期限",
+    )
+    # 既存（シード）のデフォルトを外し、このテストのパターンだけを採用させる
+    await db_session.execute(
+        update(NotificationPattern)
+        .where(NotificationPattern.event_type == CalendarEventType.renewal_deadline)
+        .values(is_system_default=False)
+    )
+    today = date.today()
+    cycle = SupportPlanCycle(
+        welfare_recipient_id=recipient.id,
+        office_id=office.id,
+        plan_cycle_start_date=today,
+        next_renewal_deadline=today + timedelta(days=20),
+    )
+    db_session.add_all([pattern, other_pattern, cycle])
+    await db_session.flush()
+
+    service = CalendarSeriesService()
+
+    async def load_instances():
+        result = await db_session.execute(
+            select(CalendarEventInstance)
+            .join(CalendarEventSeries, CalendarEventSeries.id == CalendarEventInstance.event_series_id)
+            .where(
+                CalendarEventSeries.notification_pattern_id == pattern.id,
+                CalendarEventSeries.support_plan_cycle_id == cycle.id,
+            )
+            .order_by(CalendarEventInstance.days_before_deadline)
+            .execution_options(populate_existing=True)
+        )
+        return list(result.scalars().all())
+
+    await service.materialize(db_session, office_id=office.id, today=today, auto_commit=False)
+
+    series = (await db_session.execute(
+        select(CalendarEventSeries)
+        .where(CalendarEventSeries.notification_pattern_id == pattern.id)
+        .execution_options(populate_existing=True)
+    )).scalar_one()
+    assert series.series_title.startswith("中村 九郎")
+    assert series.base_deadline_date == today + timedelta(days=20)
+    assert series.series_status == CalendarSyncStatus.local_only
+    assert series.total_instances == 2
+
+    # デフォルト以外のパターンは展開されず、期限1件につきシリーズは1つ
+    series_count = await db_session.scalar(
+        select(func.count())
+        .select_from(CalendarEventSeries)
+        .where(CalendarEventSeries.support_plan_cycle_id == cycle.id)
+    )
+    assert series_count == 1
+
+    # 30日前は既に過ぎているため作成されない
+    instances = await load_instances()
+    assert [instance.days_before_deadline for instance in instances] == [1, 10]
+    assert instances[1].instance_title == "中村 九郎 更新期限まで10日"
+    assert all(instance.sync_status == CalendarSyncStatus.local_only for instance in instances)
+
+    # 変更がなければ何も更新しない
+    unchanged = await service.materialize(db_session, office_id=office.id, today=today, auto_commit=False)
+    assert unchanged["series_upserted"] == 0
+    assert unchanged["instances_upserted"] == 0
+
+    # 期限が延びると日時が動き、30日前のインスタンスが追加される
+    cycle.next_renewal_deadline = today + timedelta(days=40)
+    await db_session.flush()
+    await service.materialize(db_session, office_id=office.id, today=today, auto_commit=False)
+    instances = await load_instances()
+    assert [instance.days_before_deadline for instance in instances] == [1, 10, 30]
+    assert instances[0].event_datetime.date() == today + timedelta(days=39)
+
+    # 期限がなくなるとシリーズが終了し、未来のインスタンスは取り消される
+    cycle.next_renewal_deadline = None
+    await db_session.flush()
+    await service.materialize(db_session, office_id=office.id, today=today, auto_commit=False)
+    await db_session.refresh(series)
+    assert series.series_status == CalendarSyncStatus.cancelled
+    instances = await load_instances()
+    assert {instance.instance_status for instance in instances} == {EventInstanceStatus.cancelled}
+    assert series.total_instances == 0
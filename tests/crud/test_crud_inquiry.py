@@ -638,6 +638,54 @@ class TestCRUDInquiryRetrieve:
         assert non_existent is None
 
 
+    async def test_get_inquiries_cursor_pages_through_all_rows(self, db_session, setup_basic_data):
+        """
+        キーセットページネーションで全件を重複・欠落なく取得できる
+
+        同一トランザクション内で作成した問い合わせは created_at が同じになるため、
+        id による順序付けで境界が決まることも確認する
+        """
+        test_office, app_admin = setup_basic_data
+        created_ids = set()
+        for i in range(5):
+            inquiry = await crud_inquiry.create_inquiry(
+                db=db_session,
+                sender_staff_id=None,
+                office_id=test_office.id,
+                title=f"キーセット検索{i+1}",
+                content=f"内容{i+1}",
+                sender_name=f"ゲスト{i+1}",
+                sender_email=f"keyset{i+1}@example.com",
+                priority=InquiryPriority.normal,
+                admin_recipient_ids=[app_admin.id]
+            )
+            created_ids.add(inquiry.id)
+        await db_session.flush()
+
+        seen = []
+        cursor = None
+        while True:
+            inquiries, cursor = await crud_inquiry.get_inquiries_cursor(
+                db=db_session,
+                search="キーセット検索",
+                cursor=cursor,
+                limit=2
+            )
+            seen.extend(inquiry.id for inquiry in inquiries)
+            if cursor is None:
+                break
+
+        assert len(seen) == len(set(seen)) == 5
+        assert set(seen) == created_ids
+
+        total = await crud_inquiry.count_inquiries(db=db_session, search="キーセット検索")
+        assert total == 5
+        estimated = await crud_inquiry.count_inquiries(
+            db=db_session, search="キーセット検索", count_mode="estimated"
+        )
+        assert estimated >= 0
+
+
 class TestCRUDInquiryUpdate:
     """問い合わせ更新のテスト"""
 
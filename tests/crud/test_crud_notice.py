@@ -505,3 +505,89 @@ async def test_delete_old_notices_under_limit(
     notices_after = await crud.notice.get_by_office_id(db=db_session, office_id=office.id)
     assert len(notices_after) == 30
     assert deleted_count == 0
+
+
+async def test_bulk_create_notices(
+    db_session: AsyncSession,
+    office_factory,
+    employee_user_factory
+) -> None:
+    """
+    複数の通知を1回のINSERTで作成し、呼び出し側のトランザクションに参加する
+    """
+    from app.schemas.notice import NoticeCreate
+
+    staff = await employee_user_factory()
+    other_staff = await employee_user_factory()
+    office = staff.office_associations[0].office if staff.office_associations else None
+
+    notice_ids = await crud.notice.bulk_create(
+        db=db_session,
+        objs_in=[
+            NoticeCreate(
+                recipient_staff_id=recipient_id,
+                office_id=office.id,
+                type="employee_action_pending",
+                title="一括作成",
+                content="一括作成テスト",
+                link_url="/approval-requests/bulk-create"
+            )
+            for recipient_id in (staff.id, other_staff.id)
+        ]
+    )
+
+    assert len(notice_ids) == 2
+    staff_notices = await crud.notice.get_by_staff_id(db=db_session, staff_id=staff.id)
+    assert [n.id for n in staff_notices if n.title == "一括作成"] == [notice_ids[0]]
+    assert staff_notices[0].is_read is False
+
+    assert await crud.notice.bulk_create(db=db_session, objs_in=[]) == []
+
+
+async def test_bulk_delete_notices_by_link(
+    db_session: AsyncSession,
+    office_factory,
+    employee_user_factory,
+    monkeypatch
+) -> None:
+    """
+    link_urlとtypeで絞り込んだ通知を1回のDELETEで削除する
+    """
+    from app.schemas.notice import NoticeCreate
+
+    staff = await employee_user_factory()
+    office = staff.office_associations[0].office if staff.office_associations else None
+    link_url = "/approval-requests/bulk-delete"
+
+    await crud.notice.bulk_create(
+        db=db_session,
+        objs_in=[
+            NoticeCreate(
+                recipient_staff_id=staff.id,
+                office_id=office.id,
+                type=notice_type,
+                title=notice_type,
+                link_url=link_url
+            )
+            for notice_type in (
+                "employee_action_pending",
+                "employee_action_request_sent",
+                "employee_action_approved",
+            )
+        ]
+    )
+
+    async def fail_instance_delete(*args, **kwargs):
+        raise AssertionError("bulk_delete_by_link must use a set-based DELETE")
+
+    monkeypatch.setattr(db_session, "delete", fail_instance_delete)
+
+    deleted_count = await crud.notice.bulk_delete_by_link(
+        db=db_session,
+        link_url=link_url,
+        notice_types=["employee_action_pending", "employee_action_request_sent"]
+    )
+
+    remaining = await crud.notice.get_by_staff_id(db=db_session, staff_id=staff.id)
+    assert deleted_count == 2
+    assert [n.type for n in remaining if n.link_url == link_url] == ["employee_action_approved"]
@@ -142,4 +142,61 @@ async def test_create_recipient_with_related_data(db_session: AsyncSession) -> N
     assert full_recipient.disability_status is not None
     assert full_recipient.disability_status.disability_or_disease_name == "関連障害"
     assert len(full_recipient.disability_status.details) == 1
-    assert full_recipient.disability_status.details[0].grade_or_level == "A"
\ No newline at end of file
+    assert full_recipient.disability_status.details[0].grade_or_level == "A"
+
+async def test_bulk_delete_with_cascade_removes_recipient_subtree(
+    db_session: AsyncSession,
+    office_factory,
+    welfare_recipient_factory
+) -> None:
+    """
+    複数の利用者を1回のDELETEで削除し、支援計画サイクル・事務所紐付けも
+    ON DELETE CASCADE で削除されることを確認するテスト。
+    """
+    from sqlalchemy import select
+    from app.models.welfare_recipient import OfficeWelfareRecipient
+    from app.models.support_plan_cycle import SupportPlanCycle, SupportPlanStatus
+    from app.models.enums import SupportPlanStep
+
+    office = await office_factory()
+    recipients = [
+        await welfare_recipient_factory(office_id=office.id)
+        for _ in range(2)
+    ]
+    keep = await welfare_recipient_factory(office_id=office.id)
+
+    for recipient in recipients:
+        cycle = SupportPlanCycle(
+            welfare_recipient_id=recipient.id,
+            office_id=office.id,
+            is_latest_cycle=True,
+            is_test_data=True
+        )
+        db_session.add(cycle)
+        await db_session.flush()
+        db_session.add(SupportPlanStatus(
+            plan_cycle_id=cycle.id,
+            welfare_recipient_id=recipient.id,
+            office_id=office.id,
+            step_type=SupportPlanStep.assessment,
+            completed=False,
+            is_test_data=True
+        ))
+    await db_session.flush()
+
+    recipient_ids = [recipient.id for recipient in recipients]
+    deleted_count = await crud.welfare_recipient.bulk_delete_with_cascade(
+        db=db_session,
+        recipient_ids=recipient_ids,
+        auto_commit=False
+    )
+
+    assert deleted_count == 2
+    cycles = await db_session.execute(
+        select(SupportPlanCycle.id).where(SupportPlanCycle.welfare_recipient_id.in_(recipient_ids))
+    )
+    assert cycles.scalars().all() == []
+    associations = await db_session.execute(
+        select(OfficeWelfareRecipient.welfare_recipient_id).where(OfficeWelfareRecipient.office_id == office.id)
+    )
+    assert associations.scalars().all() == [keep.id]
@@ -0,0 +1,51 @@
+"""
+キーセットページネーション共通処理のテスト
+"""
+import datetime
+import uuid
+
+import pytest
+
+from app.crud.pagination import CountCache, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip_keeps_timezone_and_id():
+    created_at = datetime.datetime(2026, 10, 18, 9, 30, 15, 123456, tzinfo=datetime.timezone.utc)
+    row_id = uuid.uuid4()
+
+    cursor = encode_cursor(created_at, row_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, row_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "WyJ4Il0", "eyJhIjogMX0"])
+def test_decode_cursor_rejects_invalid_values(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_count_cache_expires_entries_after_ttl():
+    now = [0.0]
+    cache = CountCache(ttl_seconds=30, clock=lambda: now[0])
+
+    cache.set(("audit_logs", None), 42)
+    assert cache.get(("audit_logs", None)) == 42
+
+    now[0] = 30.0
+    assert cache.get(("audit_logs", None)) is None
+
+
+def test_count_cache_evicts_least_recently_used_and_can_be_disabled():
+    cache = CountCache(ttl_seconds=30, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+    disabled = CountCache(ttl_seconds=0)
+    disabled.set("a", 1)
+    assert disabled.get("a") is None
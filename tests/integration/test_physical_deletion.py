@@ -532,3 +532,142 @@ class TestPhysicalDeletion:
         result = await db.execute(stmt)
         physically_deleted_staff = result.scalar_one_or_none()
         assert physically_deleted_staff is None
+
+    async def test_office_subtree_deleted_in_batches(
+        self,
+        db: AsyncSession
+    ):
+        """
+        退会事務所の利用者・支援計画サイクルが小分けのバッチで削除され、
+        テーブルごとの進捗が返ることを確認
+        """
+        from datetime import date
+        from app.models.enums import GenderType
+        from app.models.welfare_recipient import WelfareRecipient, OfficeWelfareRecipient
+        from app.models.support_plan_cycle import SupportPlanCycle
+
+        admin = Staff(
+            first_name="管理者",
+            last_name="テスト",
+            full_name="テスト管理者",
+            email=f"admin.{uuid4().hex[:8]}@example.com",
+            hashed_password=get_password_hash("password"),
+            role=StaffRole.owner,
+            is_test_data=True
+        )
+        db.add(admin)
+        await db.flush()
+
+        office = Office(
+            name="バッチ削除テスト事務所",
+            type=OfficeType.type_A_office,
+            created_by=admin.id,
+            last_modified_by=admin.id,
+            is_test_data=True
+        )
+        db.add(office)
+        await db.flush()
+
+        recipient_ids = []
+        for i in range(3):
+            recipient = WelfareRecipient(
+                first_name=f"利用者{i}",
+                last_name="バッチ",
+                first_name_furigana="りようしゃ",
+                last_name_furigana="ばっち",
+                birth_day=date(1990, 1, 1),
+                gender=GenderType.male,
+                is_test_data=True
+            )
+            db.add(recipient)
+            await db.flush()
+            db.add(OfficeWelfareRecipient(
+                welfare_recipient_id=recipient.id,
+                office_id=office.id,
+                is_test_data=True
+            ))
+            db.add(SupportPlanCycle(
+                welfare_recipient_id=recipient.id,
+                office_id=office.id,
+                is_latest_cycle=True,
+                is_test_data=True
+            ))
+            recipient_ids.append(recipient.id)
+        await db.flush()
+
+        office_id = office.id
+        office.is_deleted = True
+        office.deleted_at = datetime.now(timezone.utc) - timedelta(days=31)
+        await db.commit()
+
+        cleanup_result = await cleanup_service.cleanup_soft_deleted_records(
+            db,
+            days_threshold=30,
+            batch_size=2
+        )
+
+        assert cleanup_result["deleted_office_count"] >= 1
+        assert cleanup_result["completed"] is True
+        assert len(cleanup_result["errors"]) == 0
+        assert cleanup_result["table_stats"]["welfare_recipients"]["deleted"] >= 3
+        assert cleanup_result["table_stats"]["support_plan_cycles"]["deleted"] >= 3
+        assert "rows_per_second" in cleanup_result["table_stats"]["welfare_recipients"]
+
+        result = await db.execute(select(Office).where(Office.id == office_id))
+        assert result.scalar_one_or_none() is None
+        result = await db.execute(
+            select(WelfareRecipient).where(WelfareRecipient.id.in_(recipient_ids))
+        )
+        assert result.scalars().all() == []
+
+    async def test_exhausted_time_budget_resumes_on_next_run(
+        self,
+        db: AsyncSession
+    ):
+        """
+        時間予算を使い切った実行は中断され、次回の実行で残りが削除されることを確認
+        """
+        from app.services.cleanup_service import CleanupService
+
+        staff = Staff(
+            first_name="予算",
+            last_name="テストユーザー",
+            full_name="予算テストユーザー",
+            email=f"budget.{uuid4().hex[:8]}@example.com",
+            hashed_password=get_password_hash("password"),
+            role=StaffRole.employee,
+            is_test_data=True
+        )
+        db.add(staff)
+        await db.flush()
+        staff_id = staff.id
+        staff.is_deleted = True
+        staff.deleted_at = datetime.now(timezone.utc) - timedelta(days=31)
+        staff.deleted_by = staff_id
+        await db.commit()
+
+        service = CleanupService(batch_size=50)
+
+        # 時間予算0: 何も削除せずに中断
+        paused = await service.cleanup_soft_deleted_records(
+            db,
+            days_threshold=30,
+            time_budget_seconds=0
+        )
+        assert paused["completed"] is False
+        assert paused["deleted_staff_count"] == 0
+
+        result = await db.execute(select(Staff).where(Staff.id == staff_id))
+        assert result.scalar_one_or_none() is not None
+
+        # 次回実行: 再開して削除
+        resumed = await service.cleanup_soft_deleted_records(
+            db,
+            days_threshold=30,
+            time_budget_seconds=600
+        )
+        assert resumed["completed"] is True
+        assert resumed["deleted_staff_count"] >= 1
+
+        result = await db.execute(select(Staff).where(Staff.id == staff_id))
+        assert result.scalar_one_or_none() is None
@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 from uuid import uuid4
 
+from app.core.config import settings
 from app.scheduler.calendar_sync_scheduler import CalendarSyncScheduler
 
 
@@ -70,6 +71,25 @@ class TestCalendarSyncScheduler:
             # アサーション: 例外は内部で処理される
             mock_service.sync_pending_events.assert_called_once()
 
+    async def test_series_sync_is_skipped_unless_enabled(self, monkeypatch):
+        """正常系: 通知シリーズの展開・同期は設定で有効にした場合のみ実行されること"""
+        scheduler = CalendarSyncScheduler()
+
+        with patch('app.scheduler.calendar_sync_scheduler.calendar_service') as mock_service:
+            mock_service.sync_pending_events = AsyncMock(return_value={"synced": 0, "failed": 0})
+            mock_service.materialize_event_series = AsyncMock()
+            mock_service.sync_pending_instances = AsyncMock(return_value={"synced": 0, "failed": 0})
+
+            monkeypatch.setattr(settings, "CALENDAR_SERIES_SYNC_ENABLED", False)
+            await scheduler.sync_all_pending_events()
+            mock_service.materialize_event_series.assert_not_called()
+            mock_service.sync_pending_instances.assert_not_called()
+
+            monkeypatch.setattr(settings, "CALENDAR_SERIES_SYNC_ENABLED", True)
+            await scheduler.sync_all_pending_events()
+            mock_service.materialize_event_series.assert_called_once()
+            mock_service.sync_pending_instances.assert_called_once()
+
     def test_start_scheduler(self):
         """正常系: スケジューラーが開始されること"""
         scheduler = CalendarSyncScheduler()
@@ -188,3 +188,115 @@ class TestSecurityBestPractices:
 
         untrusted_ip = "203.0.113.42"
         assert untrusted_ip not in trusted_ips
+
+
+class TestProxyAwareKeys:
+    """プロキシを考慮したレート制限キーのテスト"""
+
+    def _request(self, headers=None, cookies=None, host="10.0.0.1"):
+        mock_request = Mock(spec=Request)
+        mock_request.headers = headers or {}
+        mock_request.cookies = cookies or {}
+        mock_request.client = Mock()
+        mock_request.client.host = host
+        return mock_request
+
+    def test_client_ip_uses_rightmost_trusted_hop(self):
+        """偽装されたX-Forwarded-Forの左側は採用しない"""
+        from app.core.limiter import get_client_ip
+
+        request = self._request(headers={"x-forwarded-for": "1.1.1.1, 203.0.113.7"})
+
+        with patch("app.core.limiter.settings.RATE_LIMIT_TRUSTED_PROXY_HOPS", 1):
+            assert get_client_ip(request) == "203.0.113.7"
+        with patch("app.core.limiter.settings.RATE_LIMIT_TRUSTED_PROXY_HOPS", 0):
+            assert get_client_ip(request) == "10.0.0.1"
+
+    def test_staff_key_prefers_authenticated_staff(self):
+        from app.core.limiter import get_staff_or_ip_key
+        from app.core.security import create_access_token
+
+        token = create_access_token(subject="staff-123")
+        authenticated = self._request(cookies={"access_token": token})
+        anonymous = self._request(cookies={"access_token": "invalid"})
+
+        assert get_staff_or_ip_key(authenticated) == "staff:staff-123"
+        assert get_staff_or_ip_key(anonymous) == "ip:10.0.0.1"
+
+
+class TestLocalPrecheckStrategy:
+    """プロセス内事前判定付き固定窓ストラテジーのテスト（メモリストレージで代替）"""
+
+    @staticmethod
+    def _counting_storage():
+        """incrの呼び出し回数を数えるメモリストレージ（共有ストレージの代替）"""
+        from limits.storage import MemoryStorage
+
+        class CountingStorage(MemoryStorage):
+            incr_calls = 0
+
+            def incr(self, key, expiry, amount=1):
+                self.incr_calls += 1
+                return super().incr(key, expiry, amount=amount)
+
+        return CountingStorage()
+
+    def test_local_precheck_rejects_without_shared_round_trip(self):
+        from limits import parse
+        from app.core.rate_limit_storage import LocalPrecheckFixedWindowRateLimiter
+
+        storage = self._counting_storage()
+        strategy = LocalPrecheckFixedWindowRateLimiter(storage)
+        item = parse("3/minute")
+
+        assert [strategy.hit(item, "ip:1.2.3.4", "login") for _ in range(5)] == [True, True, True, False, False]
+        # 上限到達後はプロセス内で拒否され、共有ストレージに問い合わせない
+        assert storage.incr_calls == 3
+
+    def test_shared_counter_exceeded_blocks_locally_until_window_end(self):
+        from limits import parse
+        from app.core.rate_limit_storage import LocalPrecheckFixedWindowRateLimiter
+
+        storage = self._counting_storage()
+        item = parse("2/minute")
+        # 別インスタンスが上限まで消費済み
+        storage.incr(item.key_for("ip:1.2.3.4", "login"), item.get_expiry(), amount=2)
+        storage.incr_calls = 0
+        strategy = LocalPrecheckFixedWindowRateLimiter(storage)
+
+        assert strategy.hit(item, "ip:1.2.3.4", "login") is False
+        assert strategy.hit(item, "ip:1.2.3.4", "login") is False
+        assert storage.incr_calls == 1
+
+        strategy.clear(item, "ip:1.2.3.4", "login")
+        assert strategy.hit(item, "ip:1.2.3.4", "login") is True
+
+
+class TestPostgresStorageCircuitBreaker:
+    """共有ストレージ障害時に待たずにフォールバックできることのテスト（接続できないDBを指定）"""
+
+    def test_unreachable_storage_fails_fast_and_stops_querying(self):
+        import time
+
+        from app.core.rate_limit_storage import PostgresRateLimitStorage, RateLimitStorageUnavailable
+
+        storage = PostgresRateLimitStorage(
+            "postgresql+ratelimit://user:pw@127.0.0.1:1/db",
+            timeout=0.2,
+            circuit_open_seconds=60,
+        )
+        try:
+            started_at = time.monotonic()
+            with pytest.raises(Exception):
+                storage.incr("ip:1.2.3.4", 60)
+            assert time.monotonic() - started_at < 1
+
+            # 失敗後は接続を試みずに即座に失敗し、check() も問い合わせない
+            assert storage.circuit_open
+            started_at = time.monotonic()
+            with pytest.raises(RateLimitStorageUnavailable):
+                storage.incr("ip:1.2.3.4", 60)
+            assert storage.check() is False
+            assert time.monotonic() - started_at < 0.05
+        finally:
+            storage._pool.close()
@@ -378,21 +378,13 @@ async def test_rate_limiting_on_password_change(
 
     レート制限は成功・失敗に関わらず試行回数をカウントします
     """
-    from app.models.staff_profile import AuditLog
-    from datetime import datetime, timedelta
+    from app.services.attempt_throttle import password_change_throttle
 
     headers = {"Authorization": "Bearer fake-token"}
 
-    # 過去に3回パスワード変更を試行した履歴を作成（監査ログ）
-    for i in range(3):
-        audit_log = AuditLog(
-            staff_id=mock_current_user.id,
-            action="ATTEMPT_CHANGE_PASSWORD",  # 試行ログをカウント
-            old_value=None,
-            new_value=None,
-            timestamp=datetime.utcnow() - timedelta(minutes=10 * i)
-        )
-        db_session.add(audit_log)
+    # 過去1時間に3回パスワード変更を試行した状態を作成（試行回数カウンタ）
+    for _ in range(3):
+        await password_change_throttle.consume(db_session, str(mock_current_user.id))
 
     await db_session.flush()
 
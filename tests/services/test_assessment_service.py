@@ -347,6 +347,65 @@ class TestGetAllAssessmentData:
         assert assessment_data.issue_analysis is not None
         assert assessment_data.issue_analysis.what_i_like_to_do == "絵を描くこと"
 
+    async def test_get_all_data_keeps_counts_and_order_of_joined_collections(
+        self, db_session: AsyncSession, setup_recipient
+    ):
+        """正常系: 1回のJOINで取得しても重複せず、利用歴・通院歴は開始日の降順"""
+        from app.services.assessment_service import get_all_assessment_data
+
+        recipient, staff, _ = setup_recipient
+
+        for name in ["花子", "太郎"]:
+            db_session.add(FamilyOfServiceRecipients(
+                welfare_recipient_id=recipient.id,
+                name=name,
+                relationship="家族",
+                household=Household.same,
+                ones_health="良好",
+            ))
+        for starting_day in [date(2019, 4, 1), date(2021, 4, 1), date(2020, 4, 1)]:
+            db_session.add(WelfareServicesUsed(
+                welfare_recipient_id=recipient.id,
+                office_name="ABC事業所",
+                starting_day=starting_day,
+                amount_used="月80時間",
+                service_name="就労継続支援B型",
+            ))
+        medical_info = MedicalMatters(
+            welfare_recipient_id=recipient.id,
+            medical_care_insurance=MedicalCareInsurance.national_health_insurance,
+            aiding=AidingType.subsidized,
+            history_of_hospitalization_in_the_past_2_years=False,
+        )
+        db_session.add(medical_info)
+        await db_session.flush()
+        for disease, date_started in [("A", date(2018, 1, 1)), ("B", None), ("C", date(2022, 1, 1))]:
+            db_session.add(HistoryOfHospitalVisits(
+                medical_matters_id=medical_info.id,
+                disease=disease,
+                frequency_of_hospital_visits="月1回",
+                symptoms="なし",
+                medical_institution="さくら病院",
+                doctor="山田医師",
+                tel="03-1234-5678",
+                taking_medicine=False,
+                date_started=date_started,
+            ))
+        await db_session.flush()
+
+        stmt = select(Staff).where(Staff.id == staff.id).options(
+            selectinload(Staff.office_associations).selectinload(OfficeStaff.office)
+        )
+        staff = (await db_session.execute(stmt)).scalar_one()
+
+        assessment_data = await get_all_assessment_data(db_session, recipient.id, staff)
+
+        assert sorted(fm.name for fm in assessment_data.family_members) == ["太郎", "花子"]
+        assert [sh.starting_day for sh in assessment_data.service_history] == [
+            date(2021, 4, 1), date(2020, 4, 1), date(2019, 4, 1)
+        ]
+        assert [hv.disease for hv in assessment_data.hospital_visits] == ["B", "C", "A"]
+
     async def test_access_denied_for_different_office(
         self, db_session: AsyncSession, setup_recipient, setup_other_office_staff
     ):
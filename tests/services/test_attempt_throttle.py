@@ -0,0 +1,73 @@
+"""
+試行回数制限（固定窓カウンタ）のテスト
+"""
+import uuid
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.models.attempt_counter import AttemptCounter
+from app.services.attempt_throttle import AttemptThrottle, RateLimitExceededError
+
+pytestmark = pytest.mark.asyncio
+
+
+def _throttle() -> AttemptThrottle:
+    return AttemptThrottle(
+        scope=f"test_{uuid.uuid4().hex[:8]}",
+        max_attempts=3,
+        window_seconds=60,
+        message="上限に達しました",
+    )
+
+
+async def test_consume_rejects_attempts_over_limit(db_session: AsyncSession):
+    throttle = _throttle()
+
+    assert [await throttle.consume(db_session, "staff-1") for _ in range(3)] == [1, 2, 3]
+    with pytest.raises(RateLimitExceededError, match="上限に達しました"):
+        await throttle.consume(db_session, "staff-1")
+
+    # 対象が異なればカウンタは独立
+    assert await throttle.consume(db_session, "staff-2") == 1
+
+
+async def test_check_counts_only_recorded_failures(db_session: AsyncSession):
+    throttle = _throttle()
+
+    assert await throttle.check(db_session, "127.0.0.1") == 0
+    for _ in range(3):
+        await throttle.record_failure(db_session, "127.0.0.1", auto_commit=False)
+
+    with pytest.raises(RateLimitExceededError):
+        await throttle.check(db_session, "127.0.0.1")
+
+    await throttle.reset(db_session, "127.0.0.1")
+    assert await throttle.check(db_session, "127.0.0.1") == 0
+
+
+async def test_expired_window_restarts_count(db_session: AsyncSession):
+    throttle = _throttle()
+    for _ in range(3):
+        await throttle.consume(db_session, "staff-1")
+
+    # 窓の終了時刻を過去にする
+    await db_session.execute(
+        update(AttemptCounter)
+        .where(AttemptCounter.scope == throttle.scope)
+        .values(window_expires_at=AttemptCounter.window_expires_at - timedelta(seconds=120))
+    )
+
+    assert await throttle.check(db_session, "staff-1") == 0
+    assert await throttle.consume(db_session, "staff-1") == 1
+
+    await db_session.execute(
+        update(AttemptCounter)
+        .where(AttemptCounter.scope == throttle.scope)
+        .values(window_expires_at=AttemptCounter.window_expires_at - timedelta(seconds=120))
+    )
+    assert await crud.attempt_counter.purge_expired(db_session) >= 1
+
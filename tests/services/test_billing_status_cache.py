@@ -0,0 +1,157 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.models.enums import BillingStatus, StaffRole
+from app.services.billing.status_cache import BillingStatusCache
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cached_status_is_returned_until_ttl_expires():
+    clock = _FakeClock()
+    cache = BillingStatusCache(ttl_seconds=60, max_entries=10, clock=clock)
+    office_id = uuid.uuid4()
+
+    cache.set(office_id, BillingStatus.active)
+    clock.now += 59
+
+    assert cache.get(office_id) == BillingStatus.active
+
+    clock.now += 1
+
+    assert cache.get(office_id) is None
+    assert len(cache) == 0
+
+
+def test_invalidate_drops_entry_for_transitioned_office():
+    cache = BillingStatusCache(ttl_seconds=60, max_entries=10)
+    office_id = uuid.uuid4()
+    other_office_id = uuid.uuid4()
+    cache.set(office_id, BillingStatus.free)
+    cache.set(other_office_id, BillingStatus.free)
+
+    cache.invalidate(office_id)
+    cache.invalidate(None)
+
+    assert cache.get(office_id) is None
+    assert cache.get(other_office_id) == BillingStatus.free
+
+    cache.invalidate_many([other_office_id])
+
+    assert cache.get(other_office_id) is None
+
+
+def test_least_recently_used_entry_is_evicted_over_max_entries():
+    cache = BillingStatusCache(ttl_seconds=60, max_entries=2)
+    first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    cache.set(first, BillingStatus.active)
+    cache.set(second, BillingStatus.active)
+    cache.get(first)
+    cache.set(third, BillingStatus.active)
+
+    assert cache.get(first) == BillingStatus.active
+    assert cache.get(second) is None
+    assert cache.get(third) == BillingStatus.active
+
+
+def test_zero_ttl_disables_cache():
+    cache = BillingStatusCache(ttl_seconds=0, max_entries=10)
+    office_id = uuid.uuid4()
+
+    cache.set(office_id, BillingStatus.active)
+
+    assert cache.get(office_id) is None
+
+
+def test_invalidate_on_commit_waits_for_commit():
+    cache = BillingStatusCache(ttl_seconds=60, max_entries=10)
+    office_id = uuid.uuid4()
+    cache.set(office_id, BillingStatus.free)
+    session = Session()
+
+    session.begin()
+    cache.invalidate_on_commit(session, [office_id, None])
+    # COMMIT前は古い値のまま（他リクエストが再取得して古い値をキャッシュし直さない）
+    assert cache.get(office_id) == BillingStatus.free
+
+    session.commit()
+    assert cache.get(office_id) is None
+
+
+def test_invalidate_on_commit_is_discarded_on_rollback():
+    cache = BillingStatusCache(ttl_seconds=60, max_entries=10)
+    office_id = uuid.uuid4()
+    session = Session()
+
+    session.begin()
+    cache.invalidate_on_commit(session, [office_id])
+    session.rollback()
+    cache.set(office_id, BillingStatus.free)
+
+    session.begin()
+    session.commit()
+    assert cache.get(office_id) == BillingStatus.free
+
+
+def _staff_with_office(office_id: uuid.UUID):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        role=StaffRole.owner,
+        office_associations=[SimpleNamespace(office_id=office_id, is_primary=True)],
+    )
+
+
+@pytest.mark.asyncio
+async def test_require_active_billing_queries_billing_once_per_cached_office(monkeypatch):
+    cache = BillingStatusCache(ttl_seconds=60, max_entries=10)
+    monkeypatch.setattr("app.services.billing.status_cache.billing_status_cache", cache)
+
+    office_id = uuid.uuid4()
+    calls = []
+
+    async def fake_get_by_office_id(db, office_id):
+        calls.append(office_id)
+        return SimpleNamespace(billing_status=BillingStatus.active)
+
+    monkeypatch.setattr(deps.crud.billing, "get_by_office_id", fake_get_by_office_id)
+    staff = _staff_with_office(office_id)
+
+    assert await deps.require_active_billing(db=None, current_staff=staff) is staff
+    assert await deps.require_active_billing(db=None, current_staff=staff) is staff
+    assert calls == [office_id]
+
+
+@pytest.mark.asyncio
+async def test_require_active_billing_rechecks_after_invalidation(monkeypatch):
+    cache = BillingStatusCache(ttl_seconds=60, max_entries=10)
+    monkeypatch.setattr("app.services.billing.status_cache.billing_status_cache", cache)
+
+    office_id = uuid.uuid4()
+    current = {"status": BillingStatus.active}
+
+    async def fake_get_by_office_id(db, office_id):
+        return SimpleNamespace(billing_status=current["status"])
+
+    monkeypatch.setattr(deps.crud.billing, "get_by_office_id", fake_get_by_office_id)
+    staff = _staff_with_office(office_id)
+
+    await deps.require_active_billing(db=None, current_staff=staff)
+    current["status"] = BillingStatus.payment_failed
+    cache.invalidate(office_id)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await deps.require_active_billing(db=None, current_staff=staff)
+
+    assert exc_info.value.status_code == 402
@@ -75,8 +75,10 @@ async def test_google_sync_service_separates_account_resolution_and_result_updat
     db = object()
     office_id = uuid4()
     event = SimpleNamespace(
+        id=uuid4(),
         office_id=office_id,
         google_calendar_id="calendar-id",
+        trace_parent=None,
         event_title="title",
         event_description="description",
         event_start_datetime="start",
@@ -219,3 +221,16 @@ async def test_support_plan_calendar_event_service_hides_calendar_facade_calls()
             "event_type": CalendarEventType.next_plan_start_date,
         },
     )
+
+
+def test_retry_delay_doubles_until_cap(monkeypatch):
+    from datetime import timedelta
+
+    from app.services.calendar import calendar_sync_result_service
+
+    monkeypatch.setattr(calendar_sync_result_service.settings, "CALENDAR_SYNC_RETRY_BASE_SECONDS", 60)
+    monkeypatch.setattr(calendar_sync_result_service.settings, "CALENDAR_SYNC_RETRY_MAX_SECONDS", 300)
+
+    delays = [calendar_sync_result_service.retry_delay(attempts) for attempts in range(1, 6)]
+
+    assert delays == [timedelta(seconds=s) for s in (60, 120, 240, 300, 300)]
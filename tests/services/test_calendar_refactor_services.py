@@ -7,7 +7,10 @@ from app.models.calendar_events import CalendarEvent
 from app.models.enums import CalendarEventType, CalendarSyncStatus
 from app.models.support_plan_cycle import SupportPlanCycle, SupportPlanStatus
 from app.models.enums import SupportPlanStep
-from app.services.calendar.calendar_event_ledger_service import CalendarEventLedgerService
+from app.services.calendar.calendar_event_ledger_service import (
+    CalendarEventLedgerService,
+    CycleLedgerEntry,
+)
 from app.services.calendar.google_calendar_sync_service import GoogleCalendarSyncService
 from app.services.calendar_service import CalendarService
 
@@ -241,6 +244,67 @@ async def test_ledger_creates_local_only_next_plan_event_without_google_account(
     assert event.event_type == CalendarEventType.next_plan_start_date
 
 
+@pytest.mark.asyncio
+async def test_ledger_bulk_creates_missing_events_once(
+    db_session,
+    office_factory,
+    employee_user_factory,
+    welfare_recipient_factory,
+):
+    staff = await employee_user_factory(with_office=False)
+    office = await office_factory(creator=staff)
+    recipients = [await welfare_recipient_factory(office_id=office.id) for _ in range(3)]
+    entries = []
+    for recipient in recipients:
+        cycle = SupportPlanCycle(
+            office_id=office.id,
+            welfare_recipient_id=recipient.id,
+            cycle_number=1,
+            plan_cycle_start_date=date(2026, 8, 1),
+            next_renewal_deadline=date(2027, 1, 31),
+        )
+        db_session.add(cycle)
+        await db_session.flush()
+        status = SupportPlanStatus(
+            plan_cycle_id=cycle.id,
+            office_id=office.id,
+            welfare_recipient_id=recipient.id,
+            step_type=SupportPlanStep.assessment,
+        )
+        db_session.add(status)
+        await db_session.flush()
+        entries.append(CycleLedgerEntry(
+            office_id=office.id,
+            welfare_recipient_id=recipient.id,
+            cycle_id=cycle.id,
+            cycle_number=cycle.cycle_number,
+            plan_cycle_start_date=cycle.plan_cycle_start_date,
+            next_renewal_deadline=cycle.next_renewal_deadline,
+            assessment_status_id=status.id,
+        ))
+
+    ledger = CalendarEventLedgerService()
+    # 1件目のみ単発版で作成済み
+    await ledger.create_renewal_deadline_events(
+        db=db_session,
+        office_id=office.id,
+        welfare_recipient_id=entries[0].welfare_recipient_id,
+        cycle_id=entries[0].cycle_id,
+        next_renewal_deadline=entries[0].next_renewal_deadline,
+    )
+
+    event_ids = await ledger.create_cycle_events_bulk(db=db_session, entries=entries)
+
+    # アセスメント3件 + 更新期限2件（作成済みの1件は除く）
+    assert len(event_ids) == 5
+    events = [await db_session.get(CalendarEvent, event_id) for event_id in event_ids]
+    assert {event.sync_status for event in events} == {CalendarSyncStatus.local_only}
+    assert sum(event.event_type == CalendarEventType.renewal_deadline for event in events) == 2
+
+    # 再実行しても重複しない
+    assert await ledger.create_cycle_events_bulk(db=db_session, entries=entries) == []
+
+
 @pytest.mark.asyncio
 async def test_google_sync_ignores_local_only_events(
     db_session,
@@ -0,0 +1,31 @@
+"""
+.ics 出力（行の折り返し・ETag判定）のテスト
+"""
+from app.services.ics_export_service import _fold_ics_line, ics_export_service
+
+
+def test_fold_ics_line_keeps_short_line():
+    assert _fold_ics_line("SUMMARY:更新期限") == "SUMMARY:更新期限".encode("utf-8") + b"\r\n"
+
+
+def test_fold_ics_line_splits_on_utf8_character_boundaries():
+    line = "DESCRIPTION:" + "個別支援計画の更新期限です。" * 10
+
+    folded = _fold_ics_line(line)
+
+    physical_lines = folded.split(b"\r\n")[:-1]
+    assert len(physical_lines) > 1
+    assert len(physical_lines[0]) <= 75
+    assert all(part.startswith(b" ") and len(part) <= 75 for part in physical_lines[1:])
+    # 各行が単独でUTF-8としてデコードでき、連結すると元の行に戻る
+    assert "".join(part.decode("utf-8")[1 if i else 0:] for i, part in enumerate(physical_lines)) == line
+
+
+def test_etag_matches_if_none_match_header():
+    etag = '"abc"'
+
+    assert ics_export_service.etag_matches('"abc"', etag) is True
+    assert ics_export_service.etag_matches('W/"abc", "def"', etag) is True
+    assert ics_export_service.etag_matches("*", etag) is True
+    assert ics_export_service.etag_matches('"def"', etag) is False
+    assert ics_export_service.etag_matches(None, etag) is False
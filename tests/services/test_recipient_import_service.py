@@ -0,0 +1,102 @@
+"""
+利用者一括インポートサービスのテスト
+"""
+import io
+from datetime import date
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import BadRequestException
+from app.models.enums import RecipientImportStatus
+from app.models.recipient_import_job import RecipientImportJob
+from app.models.welfare_recipient import OfficeWelfareRecipient
+from app.services.recipient_import_service import (
+    RecipientImportService,
+    build_registration,
+    open_import_rows,
+)
+
+HEADER = (
+    "姓,名,姓（ふりがな）,名（ふりがな）,生年月日,性別,住所,居住形態,交通手段,電話番号,"
+    "障害・疾患名,生活保護\n"
+)
+
+
+def _row(first_name: str, birth_day: str = "1990-01-01") -> str:
+    return (
+        f"山田,{first_name},やまだ,たろう,{birth_day},male,東京都,home_with_family,"
+        "public_transport,0312345678,テスト障害,not_receiving\n"
+    )
+
+
+def _csv(*rows: str, encoding: str = "utf-8-sig") -> io.BytesIO:
+    return io.BytesIO((HEADER + "".join(rows)).encode(encoding))
+
+
+class TestOpenImportRows:
+
+    def test_reads_shift_jis_csv_with_row_numbers(self):
+        rows = list(open_import_rows(_csv(_row("太郎"), _row("次郎"), encoding="cp932"), "recipients.csv"))
+
+        assert [row_number for row_number, _ in rows] == [2, 3]
+        registration = build_registration(rows[0][1])
+        assert registration.basic_info.firstName == "太郎"
+        assert registration.basic_info.birthDay == date(1990, 1, 1)
+        assert registration.emergency_contacts == []
+
+    def test_rejects_missing_required_columns(self):
+        file = io.BytesIO("姓,名\n山田,太郎\n".encode("utf-8"))
+
+        with pytest.raises(BadRequestException):
+            open_import_rows(file, "recipients.csv")
+
+    def test_rejects_unsupported_extension(self):
+        with pytest.raises(BadRequestException):
+            open_import_rows(_csv(_row("太郎")), "recipients.txt")
+
+    def test_invalid_row_raises_validation_error(self):
+        rows = list(open_import_rows(_csv(_row("太郎", birth_day="不明")), "recipients.csv"))
+
+        with pytest.raises(ValidationError):
+            build_registration(rows[0][1])
+
+
+@pytest.mark.asyncio
+async def test_import_recipients_records_progress_and_row_errors(
+    db_session: AsyncSession,
+    office_factory,
+    employee_user_factory,
+):
+    office = await office_factory()
+    staff = await employee_user_factory(office=office)
+    service = RecipientImportService(chunk_size=2)
+    rows = open_import_rows(
+        _csv(_row("一郎"), _row("二郎", birth_day="不明"), ",,,,,,,,,,,\n", _row("三郎")),
+        "recipients.csv",
+    )
+
+    job_id = await service.import_recipients(
+        db_session,
+        rows=rows,
+        office_id=office.id,
+        staff_id=staff.id,
+        file_name="recipients.csv",
+    )
+
+    job = (await db_session.execute(
+        select(RecipientImportJob).where(RecipientImportJob.id == job_id)
+    )).scalar_one()
+    assert job.status == RecipientImportStatus.completed
+    assert job.processed_rows == 3
+    assert job.succeeded_rows == 2
+    assert job.failed_rows == 1
+    assert [error["row"] for error in job.errors] == [3]
+    assert job.finished_at is not None
+
+    associations = (await db_session.execute(
+        select(OfficeWelfareRecipient).where(OfficeWelfareRecipient.office_id == office.id)
+    )).scalars().all()
+    assert len(associations) == 2
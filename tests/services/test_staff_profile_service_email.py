@@ -11,7 +11,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
-from app.services.staff_profile_service import StaffProfileService, RateLimitExceededError
+from app.services.staff_profile_service import StaffProfileService
+from app.services.attempt_throttle import RateLimitExceededError
 from app.schemas.staff_profile import EmailChangeRequest as EmailChangeRequestSchema
 from app.models.staff import Staff
 from app.models.staff_profile import EmailChangeRequest as EmailChangeRequestModel, AuditLog
@@ -50,9 +51,9 @@ class TestEmailChangeRequestCreation:
         mock_staff_result = Mock()
         mock_staff_result.scalar_one_or_none = Mock(return_value=mock_staff)
 
-        # レート制限チェック（0件）
+        # レート制限チェック（今回が1回目の試行）
         mock_rate_limit_result = Mock()
-        mock_rate_limit_result.scalar = Mock(return_value=0)
+        mock_rate_limit_result.scalar = Mock(return_value=1)
 
         # メールアドレス重複チェック（重複なし）
         mock_email_check_result = Mock()
@@ -142,9 +143,9 @@ class TestEmailChangeRequestCreation:
         mock_staff_result = Mock()
         mock_staff_result.scalar_one_or_none = Mock(return_value=mock_staff)
 
-        # レート制限チェック（既に3回リクエスト済み）
+        # レート制限チェック（既に3回リクエスト済みで、今回が4回目の試行）
         mock_rate_limit_result = Mock()
-        mock_rate_limit_result.scalar = Mock(return_value=3)
+        mock_rate_limit_result.scalar = Mock(return_value=4)
 
         mock_db.execute.side_effect = [
             mock_staff_result,
@@ -181,9 +182,9 @@ class TestEmailChangeRequestCreation:
         mock_staff_result = Mock()
         mock_staff_result.scalar_one_or_none = Mock(return_value=mock_staff)
 
-        # レート制限チェック（0件）
+        # レート制限チェック（今回が1回目の試行）
         mock_rate_limit_result = Mock()
-        mock_rate_limit_result.scalar = Mock(return_value=0)
+        mock_rate_limit_result.scalar = Mock(return_value=1)
 
         # メールアドレス重複チェック（重複あり）
         mock_email_check_result = Mock()
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import stripe
+
+from app.services.billing.stripe_gateway import StripeGateway
+from tests.utils.fake_stripe_gateway import FakeStripeGateway
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_stripe_calls_run_outside_event_loop_thread():
+    gateway = StripeGateway(max_workers=2)
+    loop_thread = threading.get_ident()
+    call_threads = []
+
+    def fake_create(**params):
+        call_threads.append(threading.get_ident())
+        return Mock(id="cus_123")
+
+    with patch("stripe.Customer.create", side_effect=fake_create) as mock_create:
+        customer = await gateway.create_customer(
+            api_key="sk_test_123",
+            email="owner@example.com",
+            name="テスト事業所",
+            metadata={"office_id": "office-1"},
+        )
+
+    gateway.shutdown()
+    assert customer.id == "cus_123"
+    assert call_threads and call_threads[0] != loop_thread
+    assert mock_create.call_args.kwargs["api_key"] == "sk_test_123"
+    assert mock_create.call_args.kwargs["email"] == "owner@example.com"
+
+
+async def test_slow_stripe_call_does_not_block_other_coroutines():
+    gateway = StripeGateway(max_workers=2)
+
+    def slow_create(**params):
+        time.sleep(0.3)
+        return Mock(id="cs_123", url="https://checkout.stripe.test/cs_123")
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        for _ in range(5):
+            await asyncio.sleep(0.02)
+            ticks += 1
+
+    with patch("stripe.checkout.Session.create", side_effect=slow_create):
+        session, _ = await asyncio.gather(
+            gateway.create_checkout_session(mode="subscription"),
+            ticker(),
+        )
+
+    gateway.shutdown()
+    assert session.id == "cs_123"
+    assert ticks == 5
+
+
+async def test_delete_subscription_passes_subscription_id_positionally():
+    gateway = StripeGateway(max_workers=1)
+
+    with patch("stripe.Subscription.delete", return_value=Mock(status="canceled")) as mock_delete:
+        await gateway.delete_subscription("sub_123")
+
+    gateway.shutdown()
+    mock_delete.assert_called_once_with("sub_123")
+
+
+async def test_stripe_errors_propagate_to_caller():
+    gateway = StripeGateway(max_workers=1)
+
+    with patch("stripe.Customer.create", side_effect=stripe.error.StripeError("boom")):
+        with pytest.raises(stripe.error.StripeError):
+            await gateway.create_customer(email="a@example.com", name="n", metadata={})
+
+    gateway.shutdown()
+
+
+async def test_fake_gateway_records_calls_and_raises_configured_error():
+    gateway = FakeStripeGateway()
+
+    session = await gateway.create_checkout_session(mode="subscription", customer="cus_1")
+    gateway.fail_with = stripe.error.StripeError("declined")
+
+    with pytest.raises(stripe.error.StripeError):
+        await gateway.delete_subscription("sub_1")
+
+    assert session.url.endswith(session.id)
+    assert [call["method"] for call in gateway.calls] == [
+        "create_checkout_session",
+        "delete_subscription",
+    ]
@@ -116,6 +116,39 @@ class TestWelfareRecipientService:
         assert len(db_recipient.support_plan_cycles) == 1
         assert len(db_recipient.support_plan_cycles[0].statuses) > 0
 
+    async def test_create_recipients_with_initial_plans_batch(
+        self, db: AsyncSession, full_registration_data: UserRegistrationRequest, setup_staff_and_office
+    ):
+        """正常系: 一括作成APIでチャンクをまたいで全利用者と初期支援計画が作成されること"""
+        _, office = setup_staff_and_office
+        registrations = [full_registration_data] * 3
+
+        recipient_ids = await welfare_recipient_service.create_recipients_with_initial_plans(
+            db, registrations, office.id, chunk_size=2
+        )
+
+        assert len(recipient_ids) == 3
+        assert len(set(recipient_ids)) == 3
+
+        stmt = select(WelfareRecipient).where(WelfareRecipient.id.in_(recipient_ids)).options(
+            selectinload(WelfareRecipient.detail),
+            selectinload(WelfareRecipient.disability_status),
+            selectinload(WelfareRecipient.office_associations),
+            selectinload(WelfareRecipient.support_plan_cycles).selectinload(SupportPlanCycle.statuses)
+        )
+        recipients = (await db.execute(stmt)).scalars().all()
+
+        assert len(recipients) == 3
+        for recipient in recipients:
+            assert recipient.detail is not None
+            assert recipient.disability_status is not None
+            assert [a.office_id for a in recipient.office_associations] == [office.id]
+            assert len(recipient.support_plan_cycles) == 1
+            cycle = recipient.support_plan_cycles[0]
+            assert cycle.cycle_number == 1
+            assert len(cycle.statuses) == 5
+            assert [s.step_type for s in cycle.statuses if s.is_latest_status] == [SupportPlanStep.assessment]
+
 
 class TestCreateInitialSupportPlan:
     """初期支援計画作成ロジックのテスト"""
@@ -918,6 +918,7 @@ class TestOfficeWithdrawalBillingCancellation:
         """
         from app import crud
         from app.models.enums import BillingStatus
+        from app.core.config import settings
         from unittest.mock import patch, Mock
 
         office_id, owner_id, manager_id, employee_id = setup_office_with_staff
@@ -985,7 +986,10 @@ class TestOfficeWithdrawalBillingCancellation:
 
             # Stripe APIが呼ばれたことを確認
             assert mock_delete.called
-            mock_delete.assert_called_once_with(subscription_id)
+            mock_delete.assert_called_once_with(
+                subscription_id,
+                api_key=settings.STRIPE_SECRET_KEY.get_secret_value(),
+            )
 
         # 課金情報の変更を確認
         billing_after = await crud.billing.get(db, id=billing_id)
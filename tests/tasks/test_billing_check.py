@@ -780,3 +780,75 @@ class TestScheduledCancellationCheck:
         await db_session.refresh(billing)
         assert billing.billing_status == BillingStatus.canceled
         assert_updated_at_least(canceled_count, 1)
+
+
+@pytest.mark.asyncio
+class TestSetBasedBillingTransitions:
+    """一括遷移（UPDATE ... RETURNING）とドライラン・監査ログのテスト"""
+
+    async def test_dry_run_reports_same_count_without_updating(
+        self,
+        db_session,
+        office_factory
+    ):
+        """
+        ドライランは実行時と同じ対象件数を返し、billing_status を変更しない
+        """
+        office = await office_factory(session=db_session, is_test_data=True)
+        await db_session.commit()
+        billing = await crud.billing.create_for_office(
+            db=db_session,
+            office_id=office.id,
+            trial_days=180
+        )
+        await db_session.commit()
+        billing.trial_end_date = datetime.now(timezone.utc) - timedelta(days=1)
+        billing.billing_status = BillingStatus.free
+        await db_session.commit()
+
+        dry_run_count = await check_trial_expiration(db=db_session, dry_run=True)
+
+        await db_session.refresh(billing)
+        assert billing.billing_status == BillingStatus.free
+        assert_updated_at_least(dry_run_count, 1)
+
+        updated_count = await check_trial_expiration(db=db_session)
+
+        await db_session.refresh(billing)
+        assert billing.billing_status == BillingStatus.trial_expired
+        assert updated_count == dry_run_count
+
+    async def test_transitions_record_audit_logs_in_bulk(
+        self,
+        db_session,
+        office_factory
+    ):
+        """
+        遷移したBillingごとに監査ログが記録される（遷移前後のstatus付き）
+        """
+        office = await office_factory(session=db_session, is_test_data=True)
+        await db_session.commit()
+        billing = await crud.billing.create_for_office(
+            db=db_session,
+            office_id=office.id,
+            trial_days=180
+        )
+        await db_session.commit()
+        billing.billing_status = BillingStatus.canceling
+        billing.scheduled_cancel_at = datetime.now(timezone.utc) - timedelta(days=1)
+        await db_session.commit()
+
+        await check_scheduled_cancellation(db=db_session)
+
+        logs = await crud.audit_log.get_logs_by_target(
+            db=db_session,
+            target_type="billing",
+            target_id=billing.id,
+            include_test_data=True,
+        )
+        assert len(logs) == 1
+        assert logs[0].action == "billing.scheduled_cancellation_expired"
+        assert logs[0].office_id == office.id
+        assert logs[0].actor_role == "system"
+        assert logs[0].details["previous_status"] == BillingStatus.canceling.value
+        assert logs[0].details["new_status"] == BillingStatus.canceled.value
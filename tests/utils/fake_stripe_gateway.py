@@ -0,0 +1,45 @@
+"""StripeGateway のテスト用フェイク（ネットワークアクセスなし）"""
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+import stripe
+
+
+class FakeStripeGateway:
+    """
+    StripeGateway と同じインターフェースを持つインメモリ実装
+
+    呼び出しは calls に記録され、fail_with に例外を設定すると
+    次の呼び出しでその例外を送出する。
+    """
+
+    def __init__(self):
+        self.calls: List[Dict[str, Any]] = []
+        self.fail_with: Optional[stripe.error.StripeError] = None
+
+    def _record(self, method: str, **params: Any) -> None:
+        self.calls.append({"method": method, **params})
+        if self.fail_with is not None:
+            error, self.fail_with = self.fail_with, None
+            raise error
+
+    async def create_customer(self, **params: Any) -> Any:
+        self._record("create_customer", **params)
+        return SimpleNamespace(id=f"cus_fake_{uuid4().hex[:12]}")
+
+    async def create_checkout_session(self, **params: Any) -> Any:
+        self._record("create_checkout_session", **params)
+        session_id = f"cs_fake_{uuid4().hex[:12]}"
+        return SimpleNamespace(id=session_id, url=f"https://checkout.stripe.test/{session_id}")
+
+    async def create_billing_portal_session(self, **params: Any) -> Any:
+        self._record("create_billing_portal_session", **params)
+        return SimpleNamespace(url="https://billing.stripe.test/session")
+
+    async def delete_subscription(self, subscription_id: str, **params: Any) -> Any:
+        self._record("delete_subscription", subscription_id=subscription_id, **params)
+        return SimpleNamespace(id=subscription_id, status="canceled", canceled_at=1234567890)
+
+    def shutdown(self) -> None:
+        pass